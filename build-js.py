@@ -3,12 +3,15 @@
 """
 Build script to combine and minify JavaScript files
 Scans static/js for *.js files (excluding *.min.js and chart files)
+Emits a content-hashed bundle plus precompressed .gz siblings
 """
 
 import os
 import sys
 import subprocess
 import re
+import gzip
+import hashlib
 from pathlib import Path
 
 # Configuration
@@ -17,6 +20,17 @@ RELEASE_DIR = Path("static/js/release")
 OUTPUT_FILE = RELEASE_DIR / "app.min.js"
 INDEX_HTML = Path("static/index.html")
 
+# Length of the content hash in bundle names (app.<hash>.min.js); the server
+# marks names with such a hash as immutable
+HASH_LENGTH = 12
+
+# Unhashed assets referenced by index.html that also get .gz siblings
+PRECOMPRESS_FILES = [
+    Path("static/css/styles.css"),
+    Path("static/js/chart.min.js"),
+    Path("static/js/chartjs-plugin-annotation.min.js"),
+]
+
 # Files to exclude from bundling
 EXCLUDE_PATTERNS = [
     r".*\.min\.js$",          # Already minified files
@@ -98,21 +112,6 @@ def get_js_files():
     return ordered_files + remaining_files
 
 
-def get_version(args):
-    """Determine version from args or index.html"""
-    if len(args) > 1:
-        return args[1]
-    
-    # Try to extract from index.html
-    if INDEX_HTML.exists():
-        content = INDEX_HTML.read_text()
-        match = re.search(r'js/release/app\.min\.js\?v=([0-9]+\.[0-9]+\.[0-9]+)', content)
-        if match:
-            return match.group(1)
-    
-    return "0.5.0"
-
-
 def combine_files(js_files):
     """Combine all JS files into one"""
     combined = []
@@ -165,9 +164,40 @@ def minify(content, output_file):
         return False
 
 
-def update_index_html(version):
-    """Update index.html with new version"""
-    print("📝 Updating index.html with version...")
+def write_hashed_bundle(output_file):
+    """Copy the bundle to app.<hash>.min.js and remove bundles of older builds"""
+    content = output_file.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    hashed_file = output_file.with_name(f"app.{digest}.min.js")
+    hashed_file.write_bytes(content)
+    
+    for old_file in output_file.parent.glob("app.*.min.js*"):
+        if old_file.name not in (hashed_file.name, hashed_file.name + ".gz"):
+            print(f"  ✗ Removing stale {old_file.name}")
+            old_file.unlink()
+    
+    print(f"✅ Hashed bundle: {hashed_file}")
+    return hashed_file
+
+
+def precompress(files):
+    """Write a maximally compressed .gz sibling next to each file"""
+    print("🗜  Precompressing...")
+    for path in files:
+        if not path.exists():
+            print(f"  ⚠ Skipping missing {path}")
+            continue
+        content = path.read_bytes()
+        # mtime=0 keeps the output reproducible for identical input
+        compressed = gzip.compress(content, compresslevel=9, mtime=0)
+        gz_path = path.with_name(path.name + ".gz")
+        gz_path.write_bytes(compressed)
+        print(f"  ✓ {gz_path} ({len(content) / 1024:.2f} KB → {len(compressed) / 1024:.2f} KB)")
+
+
+def update_index_html(bundle_name):
+    """Point index.html at the hashed bundle"""
+    print("📝 Updating index.html with hashed bundle...")
     
     # Check if we're using dev/prod split
     dev_html = Path("static/index.html.dev")
@@ -179,7 +209,7 @@ def update_index_html(version):
         
         # Replace the entire JavaScript modules section with minified version
         pattern = r'<!-- JavaScript modules -->.*?</body>'
-        replacement = f'<!-- JavaScript modules -->\n    <script src="js/release/app.min.js?v={version}"></script>\n</body>'
+        replacement = f'<!-- JavaScript modules -->\n    <script src="js/release/{bundle_name}"></script>\n</body>'
         
         new_content = re.sub(pattern, replacement, content, flags=re.DOTALL)
         INDEX_HTML.write_text(new_content)
@@ -196,8 +226,8 @@ def update_index_html(version):
         content = backup.read_text()
         
         # Replace the script section
-        pattern = r'<!-- JavaScript modules -->.*?<script src="js/main\.js\?v=[^"]+"></script>'
-        replacement = f'<!-- JavaScript modules -->\n    <script src="js/release/app.min.js?v={version}"></script>'
+        pattern = r'<!-- JavaScript modules -->.*?<script src="js/(?:main\.js|release/app\.[^"]+)"></script>'
+        replacement = f'<!-- JavaScript modules -->\n    <script src="js/release/{bundle_name}"></script>'
         
         new_content = re.sub(pattern, replacement, content, flags=re.DOTALL)
         
@@ -209,10 +239,6 @@ def main():
     """Main build process"""
     print("🔨 Building JavaScript bundle...")
     
-    # Get version
-    version = get_version(sys.argv)
-    print(f"   Version: {version}")
-    
     # Create release directory
     RELEASE_DIR.mkdir(parents=True, exist_ok=True)
     
@@ -230,15 +256,13 @@ def main():
     if not minify(combined_content, OUTPUT_FILE):
         sys.exit(1)
     
-    # Update index.html
-    update_index_html(version)
+    # Content-hashed bundle, index.html pointing at it, .gz siblings
+    hashed_file = write_hashed_bundle(OUTPUT_FILE)
+    update_index_html(hashed_file.name)
+    precompress([hashed_file, INDEX_HTML, *PRECOMPRESS_FILES])
     
     print()
     print("🎉 Build process complete!")
-    print()
-    print("Usage examples:")
-    print("  ./build-js.py          # Use current version from index.html")
-    print("  ./build-js.py 0.6.0    # Specify new version")
 
 
 if __name__ == "__main__":
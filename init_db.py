@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import argparse
 import sqlite3
 import os
 
@@ -92,21 +93,135 @@ def create_schema(conn):
     ''')
     cursor.execute('CREATE INDEX idx_event_timestamp ON event(timestamp)')
     
+    create_rollup_schema(conn)
+    
+    conn.commit()
+
+
+def create_rollup_schema(conn):
+    """
+    Create derived rollup tables if they do not exist yet.
+    Safe to call on existing databases (used by server startup).
+    
+    Args:
+        conn: SQLite database connection
+    """
+    cursor = conn.cursor()
+    
+    # Hourly glucose rollup, keyed by UTC hour start ('YYYY-MM-DD HH:00:00').
+    # Kept current by the server's write paths; rebuild with --rebuild-rollups.
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS glucose_hourly (
+        hour DATETIME PRIMARY KEY,
+        level_sum REAL NOT NULL,
+        level_count INTEGER NOT NULL,
+        level_min REAL NOT NULL,
+        level_max REAL NOT NULL
+    ) WITHOUT ROWID
+    ''')
+    
+    # Weekly trapezoid aggregates per ISO week ('YYYY/Www') for the glucose and
+    # insulin series. Only closed weeks are stored; rows are filled lazily by
+    # the glucose chart and deleted when a write touches their week.
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS weekly_rollup (
+        series TEXT NOT NULL,
+        week TEXT NOT NULL,
+        reading_count INTEGER NOT NULL,
+        area REAL NOT NULL,
+        duration REAL NOT NULL,
+        first_timestamp DATETIME,
+        first_level REAL,
+        last_timestamp DATETIME,
+        last_level REAL,
+        PRIMARY KEY (series, week)
+    ) WITHOUT ROWID
+    ''')
+    
+    # Per-UTC-day predictor state ('YYYY-MM-DD'): glucose moments, insulin
+    # totals and the insulin/glucose ratio accumulator of doses on that day.
+    # Kept current by the server's write paths and backfilled on startup.
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS prediction_daily (
+        day TEXT PRIMARY KEY,
+        glucose_count INTEGER NOT NULL,
+        glucose_sum REAL NOT NULL,
+        glucose_sumsq REAL NOT NULL,
+        insulin_count INTEGER NOT NULL,
+        insulin_sum REAL NOT NULL,
+        insulin_max REAL,
+        pair_count INTEGER NOT NULL,
+        ratio_count INTEGER NOT NULL,
+        ratio_sum REAL NOT NULL
+    ) WITHOUT ROWID
+    ''')
+    
+    conn.commit()
+
+
+def rebuild_rollups(conn):
+    """
+    Recompute all rollup tables from the raw tables.
+    Needed after writing raw rows outside the server (CSV import, migrations).
+    
+    Args:
+        conn: SQLite database connection
+    """
+    create_rollup_schema(conn)
+    cursor = conn.cursor()
+    
+    cursor.execute('DELETE FROM glucose_hourly')
+    cursor.execute('''
+    INSERT INTO glucose_hourly (hour, level_sum, level_count, level_min, level_max)
+    SELECT strftime('%Y-%m-%d %H:00:00', timestamp), SUM(level), COUNT(*), MIN(level), MAX(level)
+    FROM glucose
+    GROUP BY 1
+    ''')
+    
+    # Weekly aggregates are recomputed on demand by the server
+    cursor.execute('DELETE FROM weekly_rollup')
+    
+    # Predictor state needs the server's dose pairing; it is rebuilt by the
+    # server on its next start
+    cursor.execute('DELETE FROM prediction_daily')
+    
     conn.commit()
 
 
-def init_database():
+def init_database(db_path=DB_PATH):
     """Initialize production database if it doesn't exist"""
-    if os.path.exists(DB_PATH):
-        print(f"Database {DB_PATH} already exists. Skipping creation.")
+    if os.path.exists(db_path):
+        print(f"Database {db_path} already exists. Skipping creation.")
         return
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(db_path)
     create_schema(conn)
     conn.close()
     
-    print(f"Database {DB_PATH} created successfully!")
+    print(f"Database {db_path} created successfully!")
+
+
+def rebuild_database_rollups(db_path=DB_PATH):
+    """Rebuild rollup tables of an existing database"""
+    if not os.path.exists(db_path):
+        print(f"Database {db_path} not found.")
+        return
+    
+    conn = sqlite3.connect(db_path)
+    rebuild_rollups(conn)
+    conn.close()
+    
+    print(f"Rollups of {db_path} rebuilt successfully!")
 
 
 if __name__ == '__main__':
-    init_database()
+    parser = argparse.ArgumentParser(description='Create the glucose database or rebuild its rollups.')
+    parser.add_argument('--db', default=DB_PATH, help=f'database path (default: {DB_PATH})')
+    parser.add_argument('--rebuild-rollups', action='store_true',
+                        help='recompute rollup tables of an existing database')
+    args = parser.parse_args()
+    
+    if args.rebuild_rollups:
+        rebuild_database_rollups(args.db)
+    else:
+        init_database(args.db)
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import asyncio
+import http.client
 import http.server
 import socketserver
 import json
@@ -10,23 +12,81 @@ import queue
 import logging
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor
+import threading
+import hashlib
+import base64
+import csv
+import secrets
+import zlib
+import io
+import html
+import re
+import email.utils
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, date, timedelta, timezone, time as dt_time
 from contextlib import contextmanager
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 import os
 import ssl
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from bisect import bisect_left, bisect_right
+
+from init_db import create_rollup_schema, rebuild_rollups
 
 PORT = int(os.environ.get('PORT', '8443'))  # Default HTTPS port for mTLS
 DB_PATH = os.environ.get('DB_PATH', 'glucose.db')
+# Read-only connections for queries, read-write connections for writes
 DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '5'))
+DB_READ_POOL_SIZE = int(os.environ.get('DB_READ_POOL_SIZE', str(DB_POOL_SIZE)))
+DB_WRITE_POOL_SIZE = int(os.environ.get('DB_WRITE_POOL_SIZE', '1'))
+DB_READ_TIMEOUT = int(os.environ.get('DB_READ_TIMEOUT', '30'))  # seconds
+DB_WRITE_TIMEOUT = int(os.environ.get('DB_WRITE_TIMEOUT', '10'))  # seconds
+# PRAGMA profile applied to new connections (see CONNECTION_PROFILES)
+DB_PROFILE = os.environ.get('DB_PROFILE', 'standard')
+
+# Group commit: single-record writes arriving within the window share one transaction
+GROUP_COMMIT = os.environ.get('GROUP_COMMIT', 'true').lower() == 'true'
+GROUP_COMMIT_WINDOW_MS = float(os.environ.get('GROUP_COMMIT_WINDOW_MS', '2'))
+GROUP_COMMIT_MAX_OPS = int(os.environ.get('GROUP_COMMIT_MAX_OPS', '256'))
 MAX_BODY_BYTES = int(os.environ.get('MAX_BODY_BYTES', str(64 * 1024)))  # 64 KB
 MAX_WORKERS = int(os.environ.get('MAX_WORKERS', '20'))
 REQUEST_TIMEOUT = int(os.environ.get('REQUEST_TIMEOUT', '30'))  # seconds
+# HTTP/1.1 keep-alive: idle wait for the next request, requests per connection
+KEEPALIVE_TIMEOUT = int(os.environ.get('KEEPALIVE_TIMEOUT', '5'))  # seconds
+KEEPALIVE_MAX_REQUESTS = int(os.environ.get('KEEPALIVE_MAX_REQUESTS', '100'))
 
 DEBUG_STATIC = os.environ.get('DEBUG_STATIC', 'false').lower() == 'true'
 
+# 'threading' (GlucoseServer) or 'asyncio' (AsyncGlucoseServer)
+SERVER_ENGINE = os.environ.get('SERVER_ENGINE', 'threading').lower()
+
+# Dashboard response cache bounds (entries and encoded JSON bytes)
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', '256'))
+RESPONSE_CACHE_MAX_BYTES = int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', str(8 * 1024 * 1024)))  # 8 MB
+
+# gzip for /api/* responses: bodies below GZIP_MIN_BYTES are sent as-is
+GZIP_MIN_BYTES = int(os.environ.get('GZIP_MIN_BYTES', '1024'))
+GZIP_LEVEL = int(os.environ.get('GZIP_LEVEL', '6'))  # 1 (fastest) .. 9 (smallest)
+
+# Static files are always revalidated (ETag / Last-Modified make that a cheap 304)
+STATIC_CACHE_CONTROL = os.environ.get('STATIC_CACHE_CONTROL', 'no-cache')
+
+# In-memory cache of static file contents (total budget / largest cached file)
+STATIC_CACHE_MAX_BYTES = int(os.environ.get('STATIC_CACHE_MAX_BYTES', str(16 * 1024 * 1024)))  # 16 MB
+STATIC_CACHE_MAX_FILE_BYTES = int(os.environ.get('STATIC_CACHE_MAX_FILE_BYTES', str(1024 * 1024)))  # 1 MB
+
+# Bulk ingest: rows per insert transaction, and reject details kept per request
+INGEST_BATCH_ROWS = int(os.environ.get('INGEST_BATCH_ROWS', '5000'))
+INGEST_MAX_REJECTS = int(os.environ.get('INGEST_MAX_REJECTS', '100'))
+
+# Audit list pagination: page size when ?cursor is given without ?limit, and the maximum allowed ?limit
+LIST_PAGE_DEFAULT = int(os.environ.get('LIST_PAGE_DEFAULT', '100'))
+LIST_PAGE_MAX = int(os.environ.get('LIST_PAGE_MAX', '1000'))
+
+# Rows fetched per cursor.fetchmany() (and written per chunk) by /api/export/*
+EXPORT_FETCH_ROWS = int(os.environ.get('EXPORT_FETCH_ROWS', '1000'))
+
 # Logging — all output (requests, errors, startup) unified on stdout
 class _CompactFormatter(logging.Formatter):
     converter = time.gmtime  # use UTC, not local time
@@ -60,12 +120,105 @@ CERTS_DIR = os.path.join(os.path.dirname(__file__), 'certs')
 CA_CERT_PATH = os.environ.get('CA_CERT', os.path.join(CERTS_DIR, 'ca', 'ca-cert.pem'))
 SERVER_CERT_PATH = os.environ.get('SERVER_CERT', os.path.join(CERTS_DIR, 'server', 'server-cert.pem'))
 SERVER_KEY_PATH = os.environ.get('SERVER_KEY', os.path.join(CERTS_DIR, 'server', 'server-key.pem'))
+# TLS 1.3 session tickets issued per full handshake (0 disables resumption)
+TLS_SESSION_TICKETS = int(os.environ.get('TLS_SESSION_TICKETS', '2'))
 
 
 # ============================================================================
 # Database Connection Pool
 # ============================================================================
 
+# Role-specific PRAGMAs applied to every new pooled connection, selected
+# by DB_PROFILE. WAL itself is enabled once in main() and persists in the file.
+CONNECTION_PROFILES = {
+    'standard': {
+        # Analytics scans read memory-mapped pages through a 64 MB page cache
+        'reader': {'cache_size': -64 * 1024, 'mmap_size': 256 * 1024 * 1024, 'temp_store': 'MEMORY'},
+        # WAL + NORMAL syncs at checkpoints rather than every commit; committed
+        # data survives an application crash, the last commits may not survive
+        # power loss
+        'writer': {'synchronous': 'NORMAL', 'busy_timeout': DB_WRITE_TIMEOUT * 1000,
+                   'cache_size': -16 * 1024, 'temp_store': 'MEMORY'},
+    },
+    'durable': {
+        'reader': {'cache_size': -64 * 1024, 'mmap_size': 256 * 1024 * 1024, 'temp_store': 'MEMORY'},
+        # Every commit (every group commit) is fsynced
+        'writer': {'synchronous': 'FULL', 'busy_timeout': DB_WRITE_TIMEOUT * 1000,
+                   'cache_size': -16 * 1024, 'temp_store': 'MEMORY'},
+    },
+    # SQLite defaults, smallest memory footprint
+    'minimal': {'reader': {}, 'writer': {}},
+}
+
+# PRAGMAs reported by ConnectionPool.settings()
+REPORTED_PRAGMAS = ('journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store',
+                    'busy_timeout', 'query_only')
+
+# Upper bounds (ms) of latency histogram buckets; a final +Inf bucket is implicit
+LATENCY_BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """Thread-safe histogram of millisecond observations with Prometheus-style `le` buckets."""
+
+    def __init__(self, bounds=LATENCY_BUCKETS_MS):
+        self.bounds = tuple(bounds)
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._sum = 0.0
+
+    def observe(self, value):
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self):
+        """Count, sum, cumulative buckets and bucket-bound estimates of p50/p95/p99."""
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative, running = [], 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+
+        def quantile(q):
+            if not running:
+                return None
+            index = next(i for i, c in enumerate(cumulative) if c >= q * running)
+            return self.bounds[index] if index < len(self.bounds) else '+Inf'
+
+        return {
+            'count': running,
+            'sum': round(total, 3),
+            'buckets': [[bound, c] for bound, c in zip((*self.bounds, '+Inf'), cumulative)],
+            'p50': quantile(0.5),
+            'p95': quantile(0.95),
+            'p99': quantile(0.99),
+        }
+
+
+# Route of the request the current thread is handling (set by GlucoseHandler),
+# attributed to pool checkouts
+request_context = threading.local()
+
+# Frames skipped when attributing a checkout to its call site
+_POOL_PLUMBING = frozenset({'connection', 'get_db_connection', 'get_read_connection', 'execute_query',
+                            '__enter__'})
+
+
+def _checkout_site():
+    """`qualname (file:line)` of the code that borrowed a connection, skipping pool plumbing."""
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_name in _POOL_PLUMBING:
+        frame = frame.f_back
+    if frame is None:
+        return 'unknown'
+    code = frame.f_code
+    name = getattr(code, 'co_qualname', code.co_name)  # co_qualname is Python 3.11+
+    return f'{name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})'
+
+
 class ConnectionPool:
     """
     Fixed-size SQLite connection pool backed by a Queue.
@@ -74,24 +227,80 @@ class ConnectionPool:
     check_same_thread=False is required because ThreadingTCPServer hands
     the same connection object to different threads over time (never
     concurrently — the Queue ensures exclusive access per checkout).
+
+    A read_only pool opens the file with a `mode=ro` URI and sets
+    `PRAGMA query_only`, so a write through it fails instead of taking
+    the database write lock. Readers run in autocommit mode: without
+    sqlite3's implicit BEGIN no reader returns to the pool inside a
+    transaction pinning an old snapshot.
+
+    `pragmas` (a CONNECTION_PROFILES role) are applied to each connection
+    as it is created.
+
+    Every checkout is instrumented: wait and hold time histograms, current
+    and peak connections in use, exhaustion count, hold time per call site,
+    and the call site/route of the longest hold (see stats()).
     """
 
-    def __init__(self, db_path, size, timeout=30):
+    def __init__(self, db_path, size, timeout=30, read_only=False, pragmas=None):
         self._db_path = db_path
+        self._size = size
         self._timeout = timeout
+        self._read_only = read_only
+        self._pragmas = dict(pragmas or {})
         self._pool = queue.Queue(maxsize=size)
         for _ in range(size):
             self._pool.put(self._new_connection())
+        self._stats_lock = threading.Lock()
+        self._wait_ms = Histogram()
+        self._hold_ms = Histogram()
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._checkouts = 0
+        self._exhausted = 0
+        self._sites = defaultdict(lambda: {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+        self._longest = None
+
+    @property
+    def role(self):
+        return 'reader' if self._read_only else 'writer'
 
     def _new_connection(self):
-        return sqlite3.connect(self._db_path, timeout=self._timeout, check_same_thread=False)
+        if self._read_only:
+            uri = f'file:{urllib.parse.quote(os.path.abspath(self._db_path))}?mode=ro'
+            conn = sqlite3.connect(uri, uri=True, timeout=self._timeout, check_same_thread=False,
+                                   isolation_level=None)
+            conn.execute('PRAGMA query_only = ON')
+        else:
+            conn = sqlite3.connect(self._db_path, timeout=self._timeout, check_same_thread=False)
+        for name, value in self._pragmas.items():
+            conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
+    def settings(self):
+        """Effective REPORTED_PRAGMAS values, read back from one pooled connection."""
+        with self.connection() as conn:
+            return {name: conn.execute(f'PRAGMA {name}').fetchone()[0] for name in REPORTED_PRAGMAS}
 
     @contextmanager
     def connection(self):
+        site = _checkout_site()
+        started = time.perf_counter()
         try:
             conn = self._pool.get(timeout=self._timeout)
         except queue.Empty:
-            raise RuntimeError('Database connection pool exhausted')
+            with self._stats_lock:
+                self._exhausted += 1
+            logger.warning("Database %s pool exhausted after %ds waiting at %s (route %s)",
+                           self.role, self._timeout, site, getattr(request_context, 'route', None))
+            raise RuntimeError(f'Database {self.role} pool exhausted '
+                               f'(no connection free within {self._timeout}s)')
+        acquired = time.perf_counter()
+        self._wait_ms.observe((acquired - started) * 1000)
+        with self._stats_lock:
+            self._checkouts += 1
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
         try:
             yield conn
         except Exception:
@@ -99,21 +308,69 @@ class ConnectionPool:
             raise
         finally:
             self._pool.put(conn)
+            self._record_hold(site, (time.perf_counter() - acquired) * 1000)
+
+    def _record_hold(self, site, hold_ms):
+        self._hold_ms.observe(hold_ms)
+        with self._stats_lock:
+            self._in_use -= 1
+            by_site = self._sites[site]
+            by_site['count'] += 1
+            by_site['total_ms'] += hold_ms
+            by_site['max_ms'] = max(by_site['max_ms'], hold_ms)
+            if self._longest is None or hold_ms > self._longest['hold_ms']:
+                self._longest = {
+                    'hold_ms': round(hold_ms, 3),
+                    'site': site,
+                    'route': getattr(request_context, 'route', None),
+                    'thread': threading.current_thread().name,
+                    'at': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),
+                }
+
+    def stats(self):
+        """Checkout instrumentation; call sites are ordered by total hold time."""
+        with self._stats_lock:
+            sites = sorted(self._sites.items(), key=lambda item: item[1]['total_ms'], reverse=True)
+            return {
+                'role': self.role,
+                'size': self._size,
+                'timeout_s': self._timeout,
+                'in_use': self._in_use,
+                'peak_in_use': self._peak_in_use,
+                'checkouts': self._checkouts,
+                'exhausted': self._exhausted,
+                'wait_ms': self._wait_ms.snapshot(),
+                'hold_ms': self._hold_ms.snapshot(),
+                'longest_hold': dict(self._longest) if self._longest else None,
+                'sites': {site: {'count': counts['count'],
+                                 'avg_ms': round(counts['total_ms'] / counts['count'], 3),
+                                 'max_ms': round(counts['max_ms'], 3)}
+                          for site, counts in sites},
+            }
 
 
+# Writer pool (read-write); reads use _db_read_pool when it exists
 _db_pool: ConnectionPool | None = None
+_db_read_pool: ConnectionPool | None = None
 
 
 @contextmanager
 def get_db_connection():
-    """Borrow a connection from the pool; return it automatically on exit."""
+    """Borrow a read-write connection from the writer pool; return it automatically on exit."""
     with _db_pool.connection() as conn:
         yield conn
 
 
+@contextmanager
+def get_read_connection():
+    """Borrow a read-only connection, so queries never wait behind writes for a connection."""
+    with (_db_read_pool or _db_pool).connection() as conn:
+        yield conn
+
+
 def execute_query(query, params=(), fetch_one=False, commit=False):
-    """Execute a query and return results or commit changes."""
-    with get_db_connection() as conn:
+    """Execute a query and return results or commit changes (writes use the writer pool)."""
+    with (get_db_connection() if commit else get_read_connection()) as conn:
         cursor = conn.cursor()
         cursor.execute(query, params)
 
@@ -128,6 +385,145 @@ def execute_query(query, params=(), fetch_one=False, commit=False):
         return result
 
 
+# ============================================================================
+# Group Commit Writer
+# ============================================================================
+
+class GroupCommitWriter:
+    """
+    Background thread that coalesces concurrent writes into shared commits.
+
+    Callers submit `work(cursor)` callables and wait on the returned
+    Future. The thread takes the first queued write, gathers what else
+    arrives within `window_ms` (at most `max_ops` writes) and runs them in
+    one BEGIN IMMEDIATE transaction, each under its own SAVEPOINT so a
+    failing write is rolled back alone. Futures resolve only after the
+    COMMIT, so a burst of N inserts costs one WAL sync instead of N.
+    """
+
+    def __init__(self, window_ms=GROUP_COMMIT_WINDOW_MS, max_ops=GROUP_COMMIT_MAX_OPS):
+        self._queue = queue.Queue()
+        self._window = window_ms / 1000
+        self._max_ops = max_ops
+        self._lock = threading.Lock()
+        self._groups = 0
+        self._writes = 0
+        self._largest = 0
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name='group-commit', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Refuse new writes, commit what is queued, then end the thread."""
+        with self._lock:
+            self._stopped = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def submit(self, work):
+        """Queue `work(cursor)`; the Future holds its result once committed.
+
+        Returns None once stop() has been called: nothing queued after the
+        stop marker would ever be committed.
+        """
+        future = Future()
+        with self._lock:
+            if self._stopped:
+                return None
+            self._queue.put((work, future))
+        return future
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                return
+            group = [first]
+            deadline = time.monotonic() + self._window
+            while len(group) < self._max_ops:
+                try:
+                    item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                group.append(item)
+            self._commit([(work, future) for work, future in group
+                          if future.set_running_or_notify_cancel()])
+
+    def _commit(self, group):
+        outcomes = []
+        try:
+            with get_db_connection() as conn:
+                conn.execute('BEGIN IMMEDIATE')
+                cursor = conn.cursor()
+                for work, future in group:
+                    cursor.execute('SAVEPOINT group_write')
+                    try:
+                        outcomes.append((future, work(cursor), None))
+                    except Exception as e:
+                        cursor.execute('ROLLBACK TO group_write')
+                        outcomes.append((future, None, e))
+                    cursor.execute('RELEASE group_write')
+                conn.commit()
+        except Exception as e:
+            logger.error("Group commit of %d writes failed: %s", len(group), e)
+            for _, future in group:
+                future.set_exception(e)
+            return
+        with self._lock:
+            self._groups += 1
+            self._writes += len(group)
+            self._largest = max(self._largest, len(group))
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def stats(self):
+        """Committed groups and writes, mean and largest group size, queue depth."""
+        with self._lock:
+            return {
+                'groups': self._groups,
+                'writes': self._writes,
+                'avg_group_size': round(self._writes / self._groups, 2) if self._groups else None,
+                'max_group_size': self._largest,
+                'queued': self._queue.qsize(),
+                'window_ms': self._window * 1000,
+                'max_ops': self._max_ops,
+            }
+
+
+# Started in main() when GROUP_COMMIT is enabled
+group_writer: GroupCommitWriter | None = None
+
+
+def run_write(work, *tables):
+    """Run `work(cursor)` as one committed write, bump `tables`, and return its result.
+
+    Goes through the group-commit writer when it runs, otherwise (also
+    once it is stopping) commits on a writer connection directly.
+    Exceptions raised by `work` (e.g. ValueError) reach the caller with
+    the write rolled back.
+    """
+    writer = group_writer
+    future = writer.submit(work) if writer is not None else None
+    if future is None:
+        with get_db_connection() as conn:
+            result = work(conn.cursor())
+            conn.commit()
+    else:
+        result = future.result()
+    data_versions.bump(*tables)
+    return result
+
+
 # ============================================================================
 # Timezone Helpers
 # ============================================================================
@@ -220,26 +616,56 @@ def calculate_cv(data):
     return (std_dev / time_weighted_mean) * 100
 
 
+class GlucoseSeries:
+    """
+    Time-ordered glucose readings with timestamps parsed once.
+
+    Window slicing bisects the raw timestamp strings (which sort
+    chronologically), so each window costs O(log n + k) instead of a full
+    re-scan of every row. Rows are expected in ascending timestamp order
+    (the dashboard queries use ORDER BY timestamp); unsorted input is
+    sorted on construction.
+    """
+
+    def __init__(self, rows):
+        rows = list(rows)
+        if any(rows[i - 1][0] > rows[i][0] for i in range(1, len(rows))):
+            rows.sort(key=lambda row: row[0])
+        self.timestamps = [ts for ts, _ in rows]
+        self.readings = [(datetime.fromisoformat(ts), level) for ts, level in rows]
+
+    def __len__(self):
+        return len(self.readings)
+
+    def window(self, window_start, window_end):
+        """Return (datetime, level) readings with window_start <= timestamp <= window_end."""
+        lo = bisect_left(self.timestamps, window_start)
+        hi = bisect_right(self.timestamps, window_end, lo)
+        return self.readings[lo:hi]
+
+
+def as_glucose_series(glucose_rows):
+    """Wrap (timestamp_str, level) rows in a GlucoseSeries unless already wrapped."""
+    if isinstance(glucose_rows, GlucoseSeries):
+        return glucose_rows
+    return GlucoseSeries(glucose_rows)
+
+
 def calculate_cv_data(glucose_rows, windows):
     """Calculate CV for each time window.
 
     Args:
-        glucose_rows: List of (timestamp_str, level) tuples
+        glucose_rows: List of (timestamp_str, level) tuples, or a GlucoseSeries
         windows: List of (label, start, end) tuples
 
     Returns:
         List of {'label': str, 'cv': float} dicts
     """
+    series = as_glucose_series(glucose_rows)
     result = []
 
     for label, window_start, window_end in windows:
-        window_data = []
-        for timestamp_str, level in glucose_rows:
-            if window_start <= timestamp_str <= window_end:
-                dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                window_data.append((dt, level))
-
-        cv = calculate_cv(window_data)
+        cv = calculate_cv(series.window(window_start, window_end))
         result.append({
             'label': label,
             'cv': round(cv, 2) if cv is not None else None
@@ -257,10 +683,40 @@ def calculate_risk_function(glucose_mg_dl):
     Returns:
         Risk function value
     """
-    import math
     return 1.509 * (math.log(glucose_mg_dl) ** 1.084 - 5.381)
 
 
+# Physiological range covered by the precomputed risk table (mg/dL, inclusive)
+RISK_TABLE_MIN = 10
+RISK_TABLE_MAX = 800
+
+
+@lru_cache(maxsize=4096)
+def _exact_risk_contributions(glucose_mg_dl):
+    """Evaluate (low_risk, high_risk) = 10·f(G)² split by the sign of f(G)."""
+    risk_score = calculate_risk_function(glucose_mg_dl)
+    if risk_score < 0:
+        return 10 * (risk_score ** 2), 0.0
+    if risk_score > 0:
+        return 0.0, 10 * (risk_score ** 2)
+    return 0.0, 0.0
+
+
+_RISK_TABLE = tuple(_exact_risk_contributions(g) for g in range(RISK_TABLE_MIN, RISK_TABLE_MAX + 1))
+
+
+def risk_contributions(glucose_mg_dl):
+    """Return the (low_risk, high_risk) contributions of one reading to LBGI/HBGI.
+
+    glucose.level is an INTEGER column, so in-range readings are a table
+    lookup; non-integer or out-of-range values fall back to the exact
+    (memoized) evaluation.
+    """
+    if isinstance(glucose_mg_dl, int) and RISK_TABLE_MIN <= glucose_mg_dl <= RISK_TABLE_MAX:
+        return _RISK_TABLE[glucose_mg_dl - RISK_TABLE_MIN]
+    return _exact_risk_contributions(glucose_mg_dl)
+
+
 def calculate_lbgi(data):
     """Calculate Low Blood Glucose Index (LBGI).
 
@@ -273,16 +729,7 @@ def calculate_lbgi(data):
     if len(data) < 1:
         return None
 
-    risk_scores = []
-    for _, glucose in data:
-        risk_score = calculate_risk_function(glucose)
-        if risk_score < 0:
-            low_risk = 10 * (risk_score ** 2)
-            risk_scores.append(low_risk)
-        else:
-            risk_scores.append(0)
-
-    return sum(risk_scores) / len(risk_scores) if risk_scores else None
+    return sum(risk_contributions(glucose)[0] for _, glucose in data) / len(data)
 
 
 def calculate_hbgi(data):
@@ -297,16 +744,7 @@ def calculate_hbgi(data):
     if len(data) < 1:
         return None
 
-    risk_scores = []
-    for _, glucose in data:
-        risk_score = calculate_risk_function(glucose)
-        if risk_score > 0:
-            high_risk = 10 * (risk_score ** 2)
-            risk_scores.append(high_risk)
-        else:
-            risk_scores.append(0)
-
-    return sum(risk_scores) / len(risk_scores) if risk_scores else None
+    return sum(risk_contributions(glucose)[1] for _, glucose in data) / len(data)
 
 
 def calculate_adrr(glucose_rows, windows):
@@ -345,95 +783,131 @@ def calculate_adrr(glucose_rows, windows):
     return sum(daily_risk_ranges) / len(daily_risk_ranges) if daily_risk_ranges else None
 
 
-def calculate_risk_metric_data(glucose_rows, windows, metric_type):
-    """Calculate LBGI or HBGI for each time window.
-
-    Args:
-        glucose_rows: List of (timestamp_str, level) tuples
-        windows: List of (label, start, end) tuples
-        metric_type: 'lbgi' or 'hbgi'
-
-    Returns:
-        List of {'label': str, 'value': float} dicts
-    """
-    result = []
-    metric_calculator = calculate_lbgi if metric_type == 'lbgi' else calculate_hbgi
-
-    for label, window_start, window_end in windows:
-        window_data = []
-        for timestamp_str, level in glucose_rows:
-            if window_start <= timestamp_str <= window_end:
-                dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                window_data.append((dt, level))
+# Window sets shared by /api/dashboard/cv-charts and /api/dashboard/risk-metrics:
+# (response key suffix, lookback days, window hours)
+DASHBOARD_WINDOW_SETS = (
+    ('7d_12h', 7, 12),
+    ('30d_48h', 30, 48),
+    ('30d_5d', 30, 120),
+)
 
-        value = metric_calculator(window_data)
-        result.append({
-            'label': label,
-            'value': round(value, 2) if value is not None else None
-        })
 
-    return result
+def calculate_window_metrics(data):
+    """Calculate mean, SD, CV, LBGI, HBGI and ADRR for one window in a single pass.
 
+    Looks up each reading's risk contributions once instead of once per metric.
+    Results follow the same rules as the individual calculators: mean, SD
+    and CV need at least 2 readings, LBGI/HBGI/ADRR need at least 1.
 
-def calculate_adrr_data(glucose_rows, windows):
-    """Calculate ADRR for each time window.
+    Args:
+        data: List of (datetime, glucose_level) tuples in ascending time order
 
-    ADRR per window = LBGI + HBGI computed directly on that window's readings.
-    This mirrors how calculate_lbgi/hbgi work and avoids incorrect UTC date-grouping
-    for sub-day windows that cross UTC midnight.
+    Returns:
+        Dict with 'mean', 'sd', 'cv', 'lbgi', 'hbgi' and 'adrr' (None when undefined)
+    """
+    count = 0
+    total_area = 0.0
+    total_time = 0.0
+    running_mean = 0.0
+    sum_sq_dev = 0.0
+    low_risk_sum = 0.0
+    high_risk_sum = 0.0
+    prev_time = prev_level = None
+
+    for timestamp, level in data:
+        count += 1
+        if prev_time is not None:
+            delta_t = (timestamp - prev_time).total_seconds()
+            total_area += (prev_level + level) / 2.0 * delta_t
+            total_time += delta_t
+        prev_time, prev_level = timestamp, level
+
+        # Welford's update for the (unweighted) population variance
+        delta = level - running_mean
+        running_mean += delta / count
+        sum_sq_dev += delta * (level - running_mean)
+
+        low_risk, high_risk = risk_contributions(level)
+        low_risk_sum += low_risk
+        high_risk_sum += high_risk
+
+    mean = sd = cv = lbgi = hbgi = adrr = None
+    if count >= 2:
+        mean = total_area / total_time if total_time > 0 else None
+        sd = (sum_sq_dev / count) ** 0.5
+        if mean:
+            cv = (sd / mean) * 100
+    if count >= 1:
+        lbgi = low_risk_sum / count
+        hbgi = high_risk_sum / count
+        adrr = lbgi + hbgi
+
+    return {'mean': mean, 'sd': sd, 'cv': cv, 'lbgi': lbgi, 'hbgi': hbgi, 'adrr': adrr}
+
+
+def calculate_window_metric_sets(glucose_rows, end_date, tz_name):
+    """Run calculate_window_metrics over every window in DASHBOARD_WINDOW_SETS.
 
     Args:
-        glucose_rows: List of (timestamp_str, level) tuples
-        windows: List of (label, start, end) tuples
+        glucose_rows: List of (timestamp_str, level) tuples, or a GlucoseSeries
+        end_date: End date (datetime.date) in the client's local timezone
+        tz_name: IANA timezone name of the client
 
     Returns:
-        List of {'label': str, 'value': float} dicts
+        Dict mapping window set name to a list of (label, metrics) tuples
     """
-    result = []
-
-    for label, window_start, window_end in windows:
-        window_data = [
-            (datetime.strptime(ts, '%Y-%m-%d %H:%M:%S'), level)
-            for ts, level in glucose_rows
-            if window_start <= ts <= window_end
+    series = as_glucose_series(glucose_rows)
+    metric_sets = {}
+    for name, days, window_hours in DASHBOARD_WINDOW_SETS:
+        metric_sets[name] = [
+            (label, calculate_window_metrics(series.window(window_start, window_end)))
+            for label, window_start, window_end in generate_cv_windows(end_date, days, window_hours, tz_name)
         ]
+    return metric_sets
 
-        lbgi = calculate_lbgi(window_data)
-        hbgi = calculate_hbgi(window_data)
-        adrr = (lbgi + hbgi) if (lbgi is not None and hbgi is not None) else None
-        result.append({
-            'label': label,
-            'value': round(adrr, 2) if adrr is not None else None
-        })
 
-    return result
+def fetch_window_glucose(cursor, end_dates, tz_name):
+    """Fetch one GlucoseSeries covering the 30-day metric windows ending on each of end_dates."""
+    start_30_days = (min(end_dates) - timedelta(days=30)).strftime('%Y-%m-%d')
+    utc_start, _ = to_utc_range(start_30_days, tz_name)
+    _, utc_end = to_utc_range(max(end_dates).strftime('%Y-%m-%d'), tz_name)
 
+    cursor.execute('''SELECT timestamp, level FROM glucose
+                      WHERE timestamp BETWEEN ? AND ?
+                      ORDER BY timestamp''', (utc_start, utc_end))
+    return GlucoseSeries(cursor.fetchall())
 
-def calculate_standard_deviation(data):
-    """Calculate standard deviation of glucose values."""
-    if len(data) < 2:
-        return None
 
-    values = [v for _, v in data]
-    mean = sum(values) / len(values)
-    variance = sum((v - mean) ** 2 for v in values) / len(values)
-    return variance ** 0.5
+def load_window_metric_sets(end_date, tz_name):
+    """Fetch the 30 days of glucose ending on end_date and compute all window metric sets."""
+    with get_read_connection() as conn:
+        series = fetch_window_glucose(conn.cursor(), [end_date], tz_name)
+    return calculate_window_metric_sets(series, end_date, tz_name)
 
 
-def calculate_cv(data):
-    """Calculate coefficient of variation (CV) as percentage."""
-    if len(data) < 2:
-        return None
+def cv_chart_payload(metric_sets):
+    """Shape window metric sets as the cv-charts response."""
+    return {
+        f'cv_{name}': metric_points(windows, 'cv', key='cv')
+        for name, windows in metric_sets.items()
+    }
 
-    time_weighted_mean = calculate_time_weighted_mean(data)
-    if time_weighted_mean is None or time_weighted_mean == 0:
-        return None
 
-    std_dev = calculate_standard_deviation(data)
-    if std_dev is None:
-        return None
+def risk_metrics_payload(metric_sets):
+    """Shape window metric sets as the risk-metrics response."""
+    return {
+        f'{metric}_{name}': metric_points(windows, metric)
+        for metric in ('lbgi', 'hbgi', 'adrr')
+        for name, windows in metric_sets.items()
+    }
 
-    return (std_dev / time_weighted_mean) * 100
+
+def metric_points(windows, metric, key='value'):
+    """Project (label, metrics) tuples onto [{'label': str, key: float}] chart points."""
+    return [
+        {'label': label, key: round(metrics[metric], 2) if metrics[metric] is not None else None}
+        for label, metrics in windows
+    ]
 
 
 def calculate_weekly_mean(rows):
@@ -459,73 +933,88 @@ def calculate_weekly_mean(rows):
     return result
 
 
-def calculate_weekly_mean_both(glucose_rows, insulin_rows):
-    """Group glucose and insulin data by week and calculate time-weighted mean for both."""
-    weekly_glucose = defaultdict(list)
-    weekly_insulin = defaultdict(list)
-    all_weeks = set()
+def iso_week_key(dt):
+    """Return the ISO week key ('YYYY/Www') of a datetime."""
+    iso_year, iso_week, _ = dt.isocalendar()
+    return f'{iso_year}/W{iso_week:02d}'
 
-    # Group glucose data by week
-    for timestamp_str, level in glucose_rows:
-        dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-        iso_year, iso_week, _ = dt.isocalendar()
-        week_key = f'{iso_year}/W{iso_week:02d}'
-        weekly_glucose[week_key].append((dt, level))
-        all_weeks.add(week_key)
 
-    # Group insulin data by week
-    for timestamp_str, level in insulin_rows:
-        dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-        iso_year, iso_week, _ = dt.isocalendar()
-        week_key = f'{iso_year}/W{iso_week:02d}'
-        weekly_insulin[week_key].append((dt, level))
-        all_weeks.add(week_key)
+def aggregate_week(readings):
+    """Summarize one week of readings for the weekly time-weighted mean.
 
-    result = []
-    for week_key in sorted(all_weeks):
-        glucose_mean = None
-        insulin_mean = None
+    Args:
+        readings: List of (datetime, level) tuples in ascending time order
+
+    Returns:
+        Dict with reading_count, area (trapezoid integral, level·seconds),
+        duration (seconds) and the first/last timestamp and level
+    """
+    total_area = 0.0
+    total_time = 0.0
+    for i in range(1, len(readings)):
+        t0, v0 = readings[i - 1]
+        t1, v1 = readings[i]
+        delta_t = (t1 - t0).total_seconds()
+        total_area += (v0 + v1) / 2.0 * delta_t
+        total_time += delta_t
+
+    first = readings[0] if readings else (None, None)
+    last = readings[-1] if readings else (None, None)
+    fmt = '%Y-%m-%d %H:%M:%S'
+    return {
+        'reading_count': len(readings),
+        'area': total_area,
+        'duration': total_time,
+        'first_timestamp': first[0].strftime(fmt) if first[0] else None,
+        'first_level': first[1],
+        'last_timestamp': last[0].strftime(fmt) if last[0] else None,
+        'last_level': last[1],
+    }
+
+
+def weekly_mean(aggregate):
+    """Time-weighted mean of a weekly aggregate (None below 2 readings or zero duration)."""
+    if not aggregate or aggregate['reading_count'] < 2 or aggregate['duration'] <= 0:
+        return None
+    return aggregate['area'] / aggregate['duration']
 
-        if week_key in weekly_glucose and len(weekly_glucose[week_key]) >= 2:
-            glucose_mean = calculate_time_weighted_mean(weekly_glucose[week_key])
 
-        if week_key in weekly_insulin and len(weekly_insulin[week_key]) >= 2:
-            insulin_mean = calculate_time_weighted_mean(weekly_insulin[week_key])
+def weekly_chart_points(weekly):
+    """Turn {week_key: {series: aggregate}} into sorted glucose-chart points.
 
+    Weeks without any glucose or insulin reading are omitted.
+    """
+    result = []
+    for week_key in sorted(weekly):
+        aggregates = weekly[week_key]
+        if not any(agg['reading_count'] for agg in aggregates.values()):
+            continue
+        glucose_mean = weekly_mean(aggregates.get('glucose'))
+        insulin_mean = weekly_mean(aggregates.get('insulin'))
         result.append({
             'week': week_key,
             'glucose_mean': round(glucose_mean, 2) if glucose_mean is not None else None,
             'insulin_mean': round(insulin_mean, 2) if insulin_mean is not None else None
         })
-
     return result
 
 
-def calculate_standard_deviation(data):
-    """Calculate standard deviation of glucose values."""
-    if len(data) < 2:
-        return None
-
-    values = [v for _, v in data]
-    mean = sum(values) / len(values)
-    variance = sum((v - mean) ** 2 for v in values) / len(values)
-    return variance ** 0.5
-
-
-def calculate_cv(data):
-    """Calculate coefficient of variation (CV) as percentage."""
-    if len(data) < 2:
-        return None
-
-    time_weighted_mean = calculate_time_weighted_mean(data)
-    if time_weighted_mean is None or time_weighted_mean == 0:
-        return None
+def _group_by_week(rows):
+    """Group (timestamp_str, level) rows into {week_key: [(datetime, level), ...]}."""
+    grouped = defaultdict(list)
+    for timestamp_str, level in rows:
+        dt = datetime.fromisoformat(timestamp_str)
+        grouped[iso_week_key(dt)].append((dt, level))
+    return grouped
 
-    std_dev = calculate_standard_deviation(data)
-    if std_dev is None:
-        return None
 
-    return (std_dev / time_weighted_mean) * 100
+def calculate_weekly_mean_both(glucose_rows, insulin_rows):
+    """Group glucose and insulin data by week and calculate time-weighted mean for both."""
+    weekly = defaultdict(dict)
+    for series, rows in (('glucose', glucose_rows), ('insulin', insulin_rows)):
+        for week_key, readings in _group_by_week(rows).items():
+            weekly[week_key][series] = aggregate_week(readings)
+    return weekly_chart_points(weekly)
 
 
 def generate_cv_windows(end_date, days, window_hours, tz_name):
@@ -573,32 +1062,6 @@ def generate_cv_windows(end_date, days, window_hours, tz_name):
 
     return list(reversed(windows))
 
-def calculate_cv_data(glucose_rows, windows):
-    """Calculate CV for each time window.
-
-    Args:
-        glucose_rows: List of (timestamp_str, level) tuples
-        windows: List of (label, start, end) tuples
-
-    Returns:
-        List of {'label': str, 'cv': float} dicts
-    """
-    result = []
-
-    for label, window_start, window_end in windows:
-        window_data = []
-        for timestamp_str, level in glucose_rows:
-            if window_start <= timestamp_str <= window_end:
-                dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                window_data.append((dt, level))
-
-        cv = calculate_cv(window_data)
-        result.append({
-            'label': label,
-            'cv': round(cv, 2) if cv is not None else None
-        })
-
-    return result
 
 
 def get_previous_time_window(tz_name: str) -> tuple:
@@ -627,66 +1090,91 @@ def get_previous_time_window(tz_name: str) -> tuple:
     return to_utc_str(prev_start_local), to_utc_str(prev_end_local)
 
 
-def process_time_window_summary(cursor, window_icon, date_str, window_start, window_end):
-    """Process and aggregate data for a 12-hour time window."""
-    # Get all intakes in this window (half-open: [window_start, window_end))
-    cursor.execute('''SELECT i.timestamp, i.nutrition_kcal, n.nutrition_name
-                     FROM intake i
-                     JOIN nutrition n ON i.nutrition_id = n.id
-                     WHERE i.timestamp >= ? AND i.timestamp < ?
-                     ORDER BY i.timestamp''',
-                  (window_start, window_end))
-    intakes = cursor.fetchall()
+def generate_summary_windows(start_date, end_date, tz_name):
+    """Generate the Day/Night windows of the summary timesheet.
+
+    Args:
+        start_date: First local date (YYYY-MM-DD)
+        end_date: Last local date (YYYY-MM-DD), inclusive
+        tz_name: IANA timezone name of the client
+
+    Returns:
+        List of (window_icon, date_str, window_start_utc, window_end_utc) tuples in
+        chronological order; boundaries are naive UTC datetimes, half-open.
+    """
+    windows = []
+    current_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+    last_date = datetime.strptime(end_date, '%Y-%m-%d').date()
 
-    # Always use window_start as reference time for glucose levels
-    window_start_dt = datetime.strptime(window_start, '%Y-%m-%d %H:%M:%S')
+    while current_date <= last_date:
+        date_str = current_date.strftime('%Y-%m-%d')
+
+        # Day window: 05:00-16:59 local → UTC
+        day_start_utc = local_5am_utc(current_date, tz_name).replace(tzinfo=None)
+        day_end_utc = day_start_utc + timedelta(hours=12)
+        windows.append(('☀️', date_str, day_start_utc, day_end_utc))
+
+        # Night window: 17:00 local to 05:00 next day local → UTC
+        night_end_utc = local_5am_utc(current_date + timedelta(days=1), tz_name).replace(tzinfo=None)
+        windows.append(('🌙', date_str, day_end_utc, night_end_utc))
+
+        current_date += timedelta(days=1)
+
+    return windows
+
+
+def _partition_rows(rows, windows):
+    """Split timestamp-sorted rows into per-window lists in one merge pass.
+
+    Args:
+        rows: Rows whose first column is a UTC timestamp string, ascending
+        windows: Non-overlapping (start_str, end_str) half-open windows, ascending
+
+    Returns:
+        List of row lists, one per window
+    """
+    partitions = []
+    i = 0
+    for window_start, window_end in windows:
+        while i < len(rows) and rows[i][0] < window_start:
+            i += 1
+        j = i
+        while j < len(rows) and rows[j][0] < window_end:
+            j += 1
+        partitions.append(rows[i:j])
+        i = j
+    return partitions
+
+
+def summarize_window(window_icon, date_str, intakes, insulin_rows, events, supplements, glucose_levels):
+    """Build one summary timesheet row from the records inside a 12-hour window.
+
+    Args:
+        intakes: (timestamp, nutrition_kcal, nutrition_name) rows, ascending
+        insulin_rows: (timestamp, level) rows, ascending
+        events: (timestamp, event_name) rows, ascending
+        supplements: (timestamp, supplement_name, supplement_amount) rows, ascending
+        glucose_levels: Dict of hourly glucose buckets ('+0' .. '+11')
+
+    Returns:
+        Summary dict, or None when the window has no intake, insulin, event or supplement
+    """
+    if not (intakes or insulin_rows or events or supplements):
+        return None
 
     if intakes:
         first_intake_time = intakes[0][0]
 
         # Aggregate nutrition data
         total_kcal = sum(row[1] for row in intakes)
-        nutrition_items = [f"{row[2]} ({row[1]:.1f} kcal)" for row in intakes]
-        nutrition_str = ', '.join(nutrition_items)
+        nutrition_str = ', '.join(f"{row[2]} ({row[1]:.1f} kcal)" for row in intakes)
     else:
         first_intake_time = None
         total_kcal = 0
         nutrition_str = ''
 
-    # Get insulin dose in this window (half-open: [window_start, window_end))
-    cursor.execute('''SELECT timestamp, level FROM insulin
-                     WHERE timestamp >= ? AND timestamp < ?
-                     ORDER BY timestamp DESC LIMIT 1''',
-                  (window_start, window_end))
-    insulin_row = cursor.fetchone()
-    dose_time = insulin_row[0] if insulin_row else None
-    dosage = insulin_row[1] if insulin_row else None
-
-    # Get glucose levels based on window start time
-    glucose_levels = get_glucose_levels_from_window_start(cursor, window_start_dt)
-
-    # Get events in window (half-open: [window_start, window_end))
-    cursor.execute('''SELECT event_name FROM event
-                     WHERE timestamp >= ? AND timestamp < ?
-                     ORDER BY timestamp''',
-                  (window_start, window_end))
-    events = cursor.fetchall()
-    grouped_events = ', '.join([e[0] for e in events]) if events else ''
-
-    # Get supplements in window (half-open: [window_start, window_end))
-    cursor.execute('''SELECT s.supplement_name, si.supplement_amount
-                     FROM supplement_intake si
-                     JOIN supplements s ON si.supplement_id = s.id
-                     WHERE si.timestamp >= ? AND si.timestamp < ?
-                     ORDER BY si.timestamp''',
-                  (window_start, window_end))
-    supplements = cursor.fetchall()
-    grouped_supplements = ', '.join([f"{s[0]} {s[1]}" for s in supplements]) if supplements else ''
-
-    # Check if there's any data in this window
-    has_data = intakes or insulin_row or events or supplements
-    if not has_data:
-        return None
+    # Latest insulin dose in the window
+    dose_time, dosage = insulin_rows[-1] if insulin_rows else (None, None)
 
     return {
         'am_pm': window_icon,
@@ -697,35 +1185,340 @@ def process_time_window_summary(cursor, window_icon, date_str, window_start, win
         'nutrition': nutrition_str,
         'glucose_levels': glucose_levels,
         'kcal_intake': total_kcal,
-        'grouped_supplements': grouped_supplements,
-        'grouped_events': grouped_events
+        'grouped_supplements': ', '.join(f"{s[1]} {s[2]}" for s in supplements),
+        'grouped_events': ', '.join(e[1] for e in events)
     }
 
 
-def get_glucose_levels_from_window_start(cursor, window_start_dt):
-    """Get average glucose levels in each 1-hour bucket from window start (0 to 11 hours)."""
-    glucose_levels = {}
-
-    for hour in range(12):
-        bucket_start = (window_start_dt + timedelta(hours=hour)).strftime('%Y-%m-%d %H:%M:%S')
-        bucket_end = (window_start_dt + timedelta(hours=hour + 1)).strftime('%Y-%m-%d %H:%M:%S')
-
-        cursor.execute('''SELECT AVG(level) FROM glucose
-                         WHERE timestamp >= ? AND timestamp < ?''',
-                      (bucket_start, bucket_end))
-        avg_row = cursor.fetchone()
-        glucose_levels[f'+{hour}'] = round(avg_row[0], 1) if avg_row[0] else None
-
-    return glucose_levels
+def build_summary_timesheet(cursor, start_date, end_date, tz_name):
+    """Build the summary timesheet for a local date range.
 
+    Fetches each table once for the whole range (one query per table) and
+    buckets the rows into Day/Night windows with a single merge pass,
+    instead of issuing per-window queries.
 
-def predict_next_window(lookback_days=30, tz_name='UTC'):
+    Returns:
+        List of summary dicts (see summarize_window), in chronological order
+    """
+    fmt = '%Y-%m-%d %H:%M:%S'
+    windows = generate_summary_windows(start_date, end_date, tz_name)
+    if not windows:
+        return []
+
+    bounds = [(start.strftime(fmt), end.strftime(fmt)) for _, _, start, end in windows]
+    range_params = (bounds[0][0], bounds[-1][1])
+
+    cursor.execute('''SELECT i.timestamp, i.nutrition_kcal, n.nutrition_name
+                     FROM intake i
+                     JOIN nutrition n ON i.nutrition_id = n.id
+                     WHERE i.timestamp >= ? AND i.timestamp < ?
+                     ORDER BY i.timestamp, i.id''', range_params)
+    intakes = _partition_rows(cursor.fetchall(), bounds)
+
+    cursor.execute('''SELECT timestamp, level FROM insulin
+                     WHERE timestamp >= ? AND timestamp < ?
+                     ORDER BY timestamp, id''', range_params)
+    insulin = _partition_rows(cursor.fetchall(), bounds)
+
+    cursor.execute('''SELECT timestamp, event_name FROM event
+                     WHERE timestamp >= ? AND timestamp < ?
+                     ORDER BY timestamp, id''', range_params)
+    events = _partition_rows(cursor.fetchall(), bounds)
+
+    cursor.execute('''SELECT si.timestamp, s.supplement_name, si.supplement_amount
+                     FROM supplement_intake si
+                     JOIN supplements s ON si.supplement_id = s.id
+                     WHERE si.timestamp >= ? AND si.timestamp < ?
+                     ORDER BY si.timestamp, si.id''', range_params)
+    supplements = _partition_rows(cursor.fetchall(), bounds)
+
+    glucose_levels = get_glucose_levels_for_windows(cursor, [start for _, _, start, _ in windows])
+
+    summary_data = []
+    for k, (window_icon, date_str, _, _) in enumerate(windows):
+        row = summarize_window(window_icon, date_str, intakes[k], insulin[k], events[k],
+                               supplements[k], glucose_levels[k])
+        if row:
+            summary_data.append(row)
+    return summary_data
+
+
+def get_glucose_levels_for_windows(cursor, window_start_dts):
+    """Get hourly average glucose buckets (+0 to +11) for several windows with one query.
+
+    When every window starts on a UTC hour boundary the buckets come from one
+    range scan of the glucose_hourly rollup. Windows offset from the hour
+    (e.g. half-hour timezones) fall back to one range scan of raw readings.
+
+    Args:
+        cursor: Database cursor
+        window_start_dts: Naive UTC window start datetimes
+
+    Returns:
+        List of {'+0': avg, ..., '+11': avg} dicts, one per window start
+    """
+    if not window_start_dts:
+        return []
+
+    fmt = '%Y-%m-%d %H:%M:%S'
+    range_params = (min(window_start_dts).strftime(fmt),
+                    (max(window_start_dts) + timedelta(hours=12)).strftime(fmt))
+
+    if all(dt.minute == 0 and dt.second == 0 for dt in window_start_dts):
+        cursor.execute('''SELECT hour, level_sum, level_count FROM glucose_hourly
+                         WHERE hour >= ? AND hour < ?
+                         ORDER BY hour''', range_params)
+    else:
+        cursor.execute('''SELECT timestamp, level, 1 FROM glucose
+                         WHERE timestamp >= ? AND timestamp < ?
+                         ORDER BY timestamp''', range_params)
+    rows = cursor.fetchall()
+    keys = [row[0] for row in rows]
+
+    result = []
+    for window_start_dt in window_start_dts:
+        bucket_sums = [0.0] * 12
+        bucket_counts = [0] * 12
+        lo = bisect_left(keys, window_start_dt.strftime(fmt))
+        hi = bisect_left(keys, (window_start_dt + timedelta(hours=12)).strftime(fmt), lo)
+        for timestamp, level_sum, level_count in rows[lo:hi]:
+            offset = int((datetime.fromisoformat(timestamp) - window_start_dt).total_seconds() // 3600)
+            bucket_sums[offset] += level_sum
+            bucket_counts[offset] += level_count
+
+        glucose_levels = {}
+        for hour in range(12):
+            avg = bucket_sums[hour] / bucket_counts[hour] if bucket_counts[hour] else None
+            glucose_levels[f'+{hour}'] = round(avg, 1) if avg else None
+        result.append(glucose_levels)
+
+    return result
+
+
+def get_glucose_levels_from_window_start(cursor, window_start_dt):
+    """Get average glucose levels in each 1-hour bucket from window start (0 to 11 hours)."""
+    return get_glucose_levels_for_windows(cursor, [window_start_dt])[0]
+
+
+# Maximum distance between an insulin dose and the glucose reading paired with it
+PAIRING_TOLERANCE = timedelta(hours=2)
+
+
+def pair_insulin_with_glucose(insulin_rows, glucose_rows, tolerance=PAIRING_TOLERANCE):
+    """Pair each insulin dose with the nearest glucose reading within `tolerance`.
+
+    Both inputs are (timestamp_str, level) rows in ascending time order. Each
+    dose is located among the glucose timestamps by bisect and only its two
+    neighbours are parsed and compared; on equal distance the earlier reading
+    wins. Doses with no reading inside the tolerance are left unpaired.
+
+    Args:
+        insulin_rows: Insulin (timestamp, level) rows, ascending
+        glucose_rows: Glucose (timestamp, level) rows, ascending
+        tolerance: Maximum time difference (timedelta)
+
+    Returns:
+        List of (insulin_timestamp, insulin_level, glucose_timestamp, glucose_level)
+    """
+    glucose_timestamps = [row[0] for row in glucose_rows]
+    pairs = []
+    for insulin_ts, insulin_level in insulin_rows:
+        idx = bisect_left(glucose_timestamps, insulin_ts)
+        insulin_time = datetime.fromisoformat(insulin_ts)
+        best = None
+        for candidate in (idx - 1, idx):
+            if 0 <= candidate < len(glucose_rows):
+                distance = abs(insulin_time - datetime.fromisoformat(glucose_timestamps[candidate]))
+                if distance <= tolerance and (best is None or distance < best[0]):
+                    best = (distance, candidate)
+        if best is not None:
+            glucose_ts, glucose_level = glucose_rows[best[1]]
+            pairs.append((insulin_ts, insulin_level, glucose_ts, glucose_level))
+    return pairs
+
+
+def _prediction_day_stats(cursor, start, end, glucose_floor=None):
+    """Predictor sums for readings and doses with start <= timestamp < end.
+
+    Doses are paired with glucose readings up to PAIRING_TOLERANCE outside
+    the range (never before `glucose_floor`), exactly as a pairing over the
+    whole lookback would.
+
+    Returns:
+        Dict with glucose_count/sum/sumsq, insulin_count/sum/max,
+        pair_count, ratio_count and ratio_sum
+    """
+    fmt = '%Y-%m-%d %H:%M:%S'
+    cursor.execute('''SELECT COUNT(*), COALESCE(SUM(level), 0), COALESCE(SUM(level * level), 0)
+                      FROM glucose WHERE timestamp >= ? AND timestamp < ?''', (start, end))
+    glucose_count, glucose_sum, glucose_sumsq = cursor.fetchone()
+
+    cursor.execute('''SELECT timestamp, level FROM insulin
+                      WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp''', (start, end))
+    insulin_rows = cursor.fetchall()
+
+    pairs = []
+    if insulin_rows:
+        pair_start = (datetime.fromisoformat(start) - PAIRING_TOLERANCE).strftime(fmt)
+        if glucose_floor is not None:
+            pair_start = max(pair_start, glucose_floor)
+        pair_end = (datetime.fromisoformat(end) + PAIRING_TOLERANCE).strftime(fmt)
+        cursor.execute('''SELECT timestamp, level FROM glucose
+                          WHERE timestamp >= ? AND timestamp <= ? ORDER BY timestamp''',
+                      (pair_start, pair_end))
+        pairs = pair_insulin_with_glucose(insulin_rows, cursor.fetchall())
+    ratios = [insulin / glucose for _, insulin, _, glucose in pairs if glucose > 0]
+
+    return {
+        'glucose_count': glucose_count,
+        'glucose_sum': glucose_sum,
+        'glucose_sumsq': glucose_sumsq,
+        'insulin_count': len(insulin_rows),
+        'insulin_sum': sum(row[1] for row in insulin_rows),
+        'insulin_max': max((row[1] for row in insulin_rows), default=None),
+        'pair_count': len(pairs),
+        'ratio_count': len(ratios),
+        'ratio_sum': sum(ratios),
+    }
+
+
+def _recent_glucose_rows(cursor, now, lookback_start):
+    """Glucose rows of the last 24 hours (ASC) and the last 2 rows of the lookback."""
+    recent_cutoff = max((now - timedelta(hours=24)).strftime('%Y-%m-%d %H:%M:%S'), lookback_start)
+    cursor.execute('''SELECT timestamp, level FROM glucose
+                      WHERE timestamp >= ? ORDER BY timestamp ASC''', (recent_cutoff,))
+    recent_glucose = cursor.fetchall()
+    cursor.execute('''SELECT timestamp, level FROM glucose
+                      WHERE timestamp >= ? ORDER BY timestamp DESC LIMIT 2''', (lookback_start,))
+    return recent_glucose, cursor.fetchall()[::-1]
+
+
+def _recent_calories(cursor, now):
+    """Calories of the last 5 intakes within 7 days, most recent first."""
+    intake_start = (now - timedelta(days=7)).strftime('%Y-%m-%d %H:%M:%S')
+    cursor.execute('''
+        SELECT n.kcal * i.nutrition_amount / n.weight as calories
+        FROM intake i
+        JOIN nutrition n ON i.nutrition_id = n.id
+        WHERE i.timestamp >= ?
+        ORDER BY i.timestamp DESC
+        LIMIT 5
+    ''', (intake_start,))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _prediction_inputs_incremental(cursor, now, lookback_start):
+    """Predictor inputs from the persisted prediction_daily state.
+
+    Whole UTC days come from prediction_daily. Only the partial first day of
+    the lookback (extended until doses there can no longer pair with readings
+    before lookback_start), the oldest 5 readings, the last 24 hours and
+    recent intake are read from raw tables.
+    """
+    fmt = '%Y-%m-%d %H:%M:%S'
+    edge_start = datetime.fromisoformat(lookback_start) + PAIRING_TOLERANCE
+    edge_end = datetime.combine(edge_start.date(), dt_time())
+    if edge_end < edge_start:
+        edge_end += timedelta(days=1)
+    stats = _prediction_day_stats(cursor, lookback_start, edge_end.strftime(fmt),
+                                  glucose_floor=lookback_start)
+
+    cursor.execute('''SELECT SUM(glucose_count), SUM(glucose_sum), SUM(glucose_sumsq),
+                             SUM(insulin_count), SUM(insulin_sum), MAX(insulin_max),
+                             SUM(pair_count), SUM(ratio_count), SUM(ratio_sum)
+                      FROM prediction_daily WHERE day >= ?''', (edge_end.strftime('%Y-%m-%d'),))
+    totals = cursor.fetchone()
+    for key, value in zip(('glucose_count', 'glucose_sum', 'glucose_sumsq', 'insulin_count',
+                           'insulin_sum', 'insulin_max', 'pair_count', 'ratio_count',
+                           'ratio_sum'), totals):
+        if value is None:
+            continue
+        if key == 'insulin_max':
+            stats[key] = value if stats[key] is None else max(stats[key], value)
+        else:
+            stats[key] += value
+
+    count = stats['glucose_count']
+    mean = stats['glucose_sum'] / count if count else None
+    variance = max(0.0, stats['glucose_sumsq'] / count - mean * mean) if count else None
+
+    cursor.execute('''SELECT level FROM glucose WHERE timestamp >= ?
+                      ORDER BY timestamp ASC LIMIT 5''', (lookback_start,))
+    oldest_glucose = [row[0] for row in cursor.fetchall()]
+    recent_glucose, last_glucose = _recent_glucose_rows(cursor, now, lookback_start)
+
+    return {
+        'glucose_count': count,
+        'glucose_mean': mean,
+        'glucose_std': math.sqrt(variance) if count else None,
+        'oldest_glucose': oldest_glucose,
+        'recent_glucose': recent_glucose,
+        'last_glucose': last_glucose,
+        'insulin_count': stats['insulin_count'],
+        'insulin_sum': stats['insulin_sum'],
+        'insulin_max': stats['insulin_max'],
+        'pair_count': stats['pair_count'],
+        'ratio_count': stats['ratio_count'],
+        'ratio_sum': stats['ratio_sum'],
+        'recent_calories': _recent_calories(cursor, now),
+    }
+
+
+def _prediction_inputs_full(cursor, now, lookback_start):
+    """Predictor inputs recomputed from every raw row in the lookback (verification path)."""
+    # Fetch historical glucose data in chronological order (ASC)
+    cursor.execute('''
+        SELECT timestamp, level
+        FROM glucose
+        WHERE timestamp >= ?
+        ORDER BY timestamp ASC
+    ''', (lookback_start,))
+    glucose_data = cursor.fetchall()
+
+    # Fetch historical insulin data in chronological order (ASC)
+    cursor.execute('''
+        SELECT timestamp, level
+        FROM insulin
+        WHERE timestamp >= ?
+        ORDER BY timestamp ASC
+    ''', (lookback_start,))
+    insulin_data = cursor.fetchall()
+
+    values = [row[1] for row in glucose_data]
+    mean = sum(values) / len(values) if values else None
+    std = math.sqrt(sum((x - mean) ** 2 for x in values) / len(values)) if values else None
+
+    recent_cutoff = (now - timedelta(hours=24)).strftime('%Y-%m-%d %H:%M:%S')
+    pairs = pair_insulin_with_glucose(insulin_data, glucose_data)
+    ratios = [insulin / glucose for _, insulin, _, glucose in pairs if glucose > 0]
+
+    return {
+        'glucose_count': len(glucose_data),
+        'glucose_mean': mean,
+        'glucose_std': std,
+        'oldest_glucose': values[:5],
+        'recent_glucose': [row for row in glucose_data if row[0] >= recent_cutoff],
+        'last_glucose': glucose_data[-2:],
+        'insulin_count': len(insulin_data),
+        'insulin_sum': sum(row[1] for row in insulin_data),
+        'insulin_max': max((row[1] for row in insulin_data), default=None),
+        'pair_count': len(pairs),
+        'ratio_count': len(ratios),
+        'ratio_sum': sum(ratios),
+        'recent_calories': _recent_calories(cursor, now),
+    }
+
+
+def predict_next_window(lookback_days=30, tz_name='UTC', full_recompute=False, cursor=None):
     """
     Predict next glucose level and insulin dose using statistical baseline.
 
     Args:
         lookback_days: Number of days of historical data to use (default: 30)
         tz_name: IANA timezone name of the client (for next window label)
+        full_recompute: Recompute statistics from raw rows instead of the
+            persisted prediction_daily state (for verification)
+        cursor: Database cursor to read with (default: a pooled connection)
 
     Returns:
         dict: Prediction results with glucose, insulin, confidence, and warnings
@@ -735,48 +1528,28 @@ def predict_next_window(lookback_days=30, tz_name='UTC'):
     now_local = now.astimezone(ZoneInfo(tz_name))
     lookback_start = (now - timedelta(days=lookback_days)).strftime('%Y-%m-%d %H:%M:%S')
 
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
+    gather = _prediction_inputs_full if full_recompute else _prediction_inputs_incremental
+    if cursor is not None:
+        inputs = gather(cursor, now, lookback_start)
+    else:
+        with get_read_connection() as conn:
+            inputs = gather(conn.cursor(), now, lookback_start)
 
-        # Fetch historical glucose data in chronological order (ASC)
-        # for time-weighted mean calculation
-        cursor.execute('''
-            SELECT timestamp, level
-            FROM glucose
-            WHERE timestamp >= ?
-            ORDER BY timestamp ASC
-        ''', (lookback_start,))
-        glucose_data = cursor.fetchall()
-
-        # Fetch historical insulin data in chronological order (ASC)
-        cursor.execute('''
-            SELECT timestamp, level
-            FROM insulin
-            WHERE timestamp >= ?
-            ORDER BY timestamp ASC
-        ''', (lookback_start,))
-        insulin_data = cursor.fetchall()
-
-        # Fetch recent intake data (last 7 days for calorie context)
-        intake_start = (now - timedelta(days=7)).strftime('%Y-%m-%d %H:%M:%S')
-        cursor.execute('''
-            SELECT i.timestamp, n.kcal * i.nutrition_amount / n.weight as calories
-            FROM intake i
-            JOIN nutrition n ON i.nutrition_id = n.id
-            WHERE i.timestamp >= ?
-            ORDER BY i.timestamp DESC
-        ''', (intake_start,))
-        intake_data = cursor.fetchall()
+    return _build_prediction(inputs, now_local, lookback_days)
 
+
+def _build_prediction(inputs, now_local, lookback_days):
+    """Turn predictor inputs (see _prediction_inputs_full) into the prediction response."""
     # Data quality checks
     warnings = []
-    if len(glucose_data) < 10:
+    data_points = inputs['glucose_count']
+    if data_points < 10:
         warnings.append("Insufficient data: Less than 10 glucose readings available")
         return {
             'next_window': _get_next_window_name(now_local),
             'prediction': None,
             'basis': {
-                'data_points': len(glucose_data),
+                'data_points': data_points,
                 'lookback_days': lookback_days
             },
             'warnings': warnings + ["Cannot generate prediction with insufficient data"],
@@ -785,17 +1558,15 @@ def predict_next_window(lookback_days=30, tz_name='UTC'):
 
     # 1. Calculate predicted glucose using time-weighted mean of recent data
     # Use last 24 hours of data for prediction
-    recent_cutoff = (now - timedelta(hours=24)).strftime('%Y-%m-%d %H:%M:%S')
-    recent_glucose = [(row[0], row[1]) for row in glucose_data if row[0] >= recent_cutoff]
+    recent_glucose = inputs['recent_glucose']
 
     if len(recent_glucose) < 2:
         # Fall back to last 2 readings if insufficient recent data
-        # Data is in ASC order, so last 2 are the most recent
-        recent_glucose = glucose_data[-2:] if len(glucose_data) >= 2 else glucose_data
+        recent_glucose = inputs['last_glucose']
 
     # Convert timestamp strings to datetime objects (data already in ASC order from SQL)
     recent_glucose_parsed = [
-        (datetime.strptime(ts, '%Y-%m-%d %H:%M:%S'), level)
+        (datetime.fromisoformat(ts), level)
         for ts, level in recent_glucose
     ]
     predicted_glucose = calculate_time_weighted_mean(recent_glucose_parsed)
@@ -806,10 +1577,9 @@ def predict_next_window(lookback_days=30, tz_name='UTC'):
         predicted_glucose = sum(row[1] for row in recent_glucose) / len(recent_glucose)
         warnings.append("Using simple average (insufficient time spread in data)")
 
-    # Calculate glucose statistics for full dataset
-    all_glucose_values = [row[1] for row in glucose_data]
-    avg_glucose = sum(all_glucose_values) / len(all_glucose_values)
-    glucose_std = math.sqrt(sum((x - avg_glucose) ** 2 for x in all_glucose_values) / len(all_glucose_values))
+    # Glucose statistics for the full lookback
+    avg_glucose = inputs['glucose_mean']
+    glucose_std = inputs['glucose_std']
 
     # Calculate CV for confidence assessment
     cv = (glucose_std / avg_glucose * 100) if avg_glucose > 0 else 100
@@ -821,34 +1591,20 @@ def predict_next_window(lookback_days=30, tz_name='UTC'):
     ]
 
     # 2. Calculate insulin recommendation
-    if len(insulin_data) > 0:
-        # Calculate insulin-to-glucose ratio
-        # Pair each insulin dose with nearest glucose reading
-        insulin_glucose_pairs = []
-        for insulin_ts, insulin_level in insulin_data:
-            insulin_time = datetime.strptime(insulin_ts, '%Y-%m-%d %H:%M:%S')
-
-            # Find closest glucose reading within 2 hours
-            for glucose_ts, glucose_level in glucose_data:
-                glucose_time = datetime.strptime(glucose_ts, '%Y-%m-%d %H:%M:%S')
-                time_diff = abs((insulin_time - glucose_time).total_seconds())
-
-                if time_diff <= 7200:  # 2 hours
-                    insulin_glucose_pairs.append((insulin_level, glucose_level))
-                    break
-
-        if insulin_glucose_pairs:
+    if inputs['insulin_count'] > 0:
+        # Insulin-to-glucose ratio of doses paired with their nearest glucose reading
+        if inputs['pair_count']:
             # Calculate average ratio
-            ratios = [insulin / glucose for insulin, glucose in insulin_glucose_pairs if glucose > 0]
-            avg_ratio = sum(ratios) / len(ratios) if ratios else 0
+            ratio_count = inputs['ratio_count']
+            avg_ratio = inputs['ratio_sum'] / ratio_count if ratio_count else 0
 
             # Apply ratio to predicted glucose
             recommended_insulin = predicted_glucose * avg_ratio
 
-            # Adjust for recent calorie intake (last 24 hours)
-            if len(intake_data) > 0:
-                recent_calories = sum(row[1] for row in intake_data[:5] if row[1])  # Last 5 meals
-                avg_calories = recent_calories / min(5, len(intake_data))
+            # Adjust for recent calorie intake (last 5 meals)
+            recent_calories = inputs['recent_calories']
+            if len(recent_calories) > 0:
+                avg_calories = sum(c for c in recent_calories if c) / len(recent_calories)
 
                 # If calories are high (>100 kcal), slightly increase insulin (up to 10%)
                 if avg_calories > 100:
@@ -856,10 +1612,10 @@ def predict_next_window(lookback_days=30, tz_name='UTC'):
                     recommended_insulin *= calorie_factor
 
             # Apply safety bounds
-            max_insulin = max([row[1] for row in insulin_data]) * 1.5 if insulin_data else 2.0
+            max_insulin = inputs['insulin_max'] * 1.5
             recommended_insulin = max(0, min(recommended_insulin, max_insulin))
 
-            avg_insulin = sum(row[1] for row in insulin_data) / len(insulin_data)
+            avg_insulin = inputs['insulin_sum'] / inputs['insulin_count']
         else:
             # No valid insulin-glucose pairs found
             warnings.append("Unable to calculate insulin recommendation: No paired data")
@@ -871,7 +1627,7 @@ def predict_next_window(lookback_days=30, tz_name='UTC'):
         avg_insulin = None
 
     # 3. Assess confidence level
-    confidence = _calculate_confidence(len(glucose_data), cv, glucose_std, all_glucose_values)
+    confidence = _calculate_confidence(data_points, cv, glucose_std, inputs['oldest_glucose'])
 
     # 4. Generate warnings
     if cv > 35:
@@ -898,16 +1654,75 @@ def predict_next_window(lookback_days=30, tz_name='UTC'):
             'confidence': confidence
         },
         'basis': {
-            'data_points': len(glucose_data),
+            'data_points': data_points,
             'lookback_days': lookback_days,
             'recent_cv': round(cv, 1),
             'avg_glucose': round(avg_glucose, 1),
-            'avg_insulin': round(avg_insulin, 2) if avg_insulin else None
+            'avg_insulin': round(avg_insulin, 2) if avg_insulin else None,
+            'paired_doses': inputs['pair_count']
         },
         'warnings': warnings
     }
 
 
+def prediction_error(exc):
+    """Response body for a prediction that raised `exc`."""
+    return {
+        'error': 'prediction_failed',
+        'message': str(exc),
+        'warnings': ['Unable to generate prediction due to error']
+    }
+
+
+def build_dashboard_bundle(tz_name, chart_range, summary_range, cv_end_date, risk_end_date,
+                           lookback_days=30):
+    """
+    Compute every dashboard section on one connection inside one read transaction.
+
+    The 30-day glucose range behind the CV and risk charts is fetched once
+    into a GlucoseSeries shared by both (and the window metrics are computed
+    once when both end on the same date). The glucose chart, summary and
+    prediction read their rollup tables in the same snapshot.
+
+    Args:
+        tz_name: IANA timezone name of the client
+        chart_range: (utc_start, utc_end) of the weekly glucose chart
+        summary_range: (start_date, end_date) local dates of the summary timesheet
+        cv_end_date: End date (datetime.date) of the CV charts
+        risk_end_date: End date (datetime.date) of the risk charts
+        lookback_days: Prediction lookback
+
+    Returns:
+        Dict with glucose_chart, summary, cv_charts, risk_metrics and prediction
+    """
+    with get_read_connection() as conn:
+        # Materializing weekly rollups writes, so it happens before the snapshot
+        ensure_weekly_rollups(conn, *chart_range)
+
+        conn.execute('BEGIN')
+        try:
+            cursor = conn.cursor()
+            end_dates = sorted({cv_end_date, risk_end_date})
+            glucose = fetch_window_glucose(cursor, end_dates, tz_name)
+            metric_sets = {end_date: calculate_window_metric_sets(glucose, end_date, tz_name)
+                           for end_date in end_dates}
+            try:
+                prediction = predict_next_window(lookback_days, tz_name, cursor=cursor)
+            except Exception as e:
+                logger.exception("Prediction error: %s", e)
+                prediction = prediction_error(e)
+            return {
+                'glucose_chart': read_glucose_chart(cursor, *chart_range),
+                'summary': build_summary_timesheet(cursor, *summary_range, tz_name),
+                'cv_charts': cv_chart_payload(metric_sets[cv_end_date]),
+                'risk_metrics': risk_metrics_payload(metric_sets[risk_end_date]),
+                'prediction': prediction,
+            }
+        finally:
+            # Read-only transaction: nothing to commit
+            conn.rollback()
+
+
 def _get_next_window_name(current_time):
     """Determine the name of the next time window."""
     hour = current_time.hour
@@ -921,23 +1736,1227 @@ def _get_next_window_name(current_time):
         return "Day (05:00-16:59)"
 
 
-def _calculate_confidence(data_points, cv, std_dev, values):
-    """Calculate confidence level for prediction."""
-    # Check for stable recent trend (last 5 readings)
-    if len(values) >= 5:
-        recent_values = values[:5]
-        recent_std = math.sqrt(sum((x - sum(recent_values)/len(recent_values)) ** 2 for x in recent_values) / len(recent_values))
-        stable_trend = recent_std < std_dev * 0.8
-    else:
-        stable_trend = False
+def _calculate_confidence(data_points, cv, std_dev, values):
+    """Calculate confidence level for prediction."""
+    # Check for stable recent trend (last 5 readings)
+    if len(values) >= 5:
+        recent_values = values[:5]
+        recent_std = math.sqrt(sum((x - sum(recent_values)/len(recent_values)) ** 2 for x in recent_values) / len(recent_values))
+        stable_trend = recent_std < std_dev * 0.8
+    else:
+        stable_trend = False
+
+    # Confidence criteria
+    if cv < 25 and data_points >= 30 and stable_trend:
+        return "High"
+    elif cv < 35 and data_points >= 14:
+        return "Medium"
+    else:
+        return "Low"
+
+
+# ============================================================================
+# Rollup Maintenance
+# ============================================================================
+
+def _hour_bucket(timestamp):
+    """Return the UTC hour start ('YYYY-MM-DD HH:00:00') containing a DB timestamp."""
+    return datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:00:00')
+
+
+def refresh_glucose_hourly(cursor, timestamps):
+    """Recompute the glucose_hourly buckets containing the given timestamps."""
+    for hour in {_hour_bucket(ts) for ts in timestamps if ts}:
+        hour_end = (datetime.fromisoformat(hour) + timedelta(hours=1)).strftime('%Y-%m-%d %H:%M:%S')
+        cursor.execute('DELETE FROM glucose_hourly WHERE hour = ?', (hour,))
+        cursor.execute('''INSERT INTO glucose_hourly
+                         (hour, level_sum, level_count, level_min, level_max)
+                         SELECT ?, SUM(level), COUNT(*), MIN(level), MAX(level)
+                         FROM glucose
+                         WHERE timestamp >= ? AND timestamp < ?
+                         HAVING COUNT(*) > 0''',
+                      (hour, hour, hour_end))
+
+
+# Series stored in weekly_rollup (each is also the name of its raw table)
+WEEKLY_SERIES = ('glucose', 'insulin')
+
+# Raw tables that feed rollup tables (glucose_hourly, weekly_rollup, prediction_daily)
+ROLLUP_SOURCE_TABLES = ('glucose', 'insulin')
+
+
+def invalidate_weekly_rollup(cursor, series, timestamps):
+    """Drop stored weekly aggregates of `series` for the weeks containing `timestamps`."""
+    for week_key in {iso_week_key(datetime.fromisoformat(ts)) for ts in timestamps if ts}:
+        cursor.execute('DELETE FROM weekly_rollup WHERE series = ? AND week = ?', (series, week_key))
+
+
+# Raw tables that feed the persisted predictor state
+PREDICTION_SOURCE_TABLES = ('glucose', 'insulin')
+
+
+def _prediction_days(table, timestamps):
+    """UTC days whose prediction_daily row depends on rows of `table` at `timestamps`.
+
+    A glucose reading can be the nearest pair of doses up to
+    PAIRING_TOLERANCE away, so it also touches the neighbouring days.
+    """
+    days = set()
+    for ts in timestamps:
+        if not ts:
+            continue
+        dt = datetime.fromisoformat(ts)
+        days.add(dt.date())
+        if table == 'glucose':
+            days.add((dt - PAIRING_TOLERANCE).date())
+            days.add((dt + PAIRING_TOLERANCE).date())
+    return days
+
+
+def refresh_prediction_daily(cursor, days):
+    """Recompute the prediction_daily rows of the given UTC dates."""
+    fmt = '%Y-%m-%d %H:%M:%S'
+    for day in days:
+        day_start = datetime.combine(day, dt_time())
+        stats = _prediction_day_stats(cursor, day_start.strftime(fmt),
+                                      (day_start + timedelta(days=1)).strftime(fmt))
+        cursor.execute('DELETE FROM prediction_daily WHERE day = ?', (day.isoformat(),))
+        if stats['glucose_count'] or stats['insulin_count']:
+            cursor.execute('''INSERT INTO prediction_daily
+                              (day, glucose_count, glucose_sum, glucose_sumsq,
+                               insulin_count, insulin_sum, insulin_max,
+                               pair_count, ratio_count, ratio_sum)
+                              VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                          (day.isoformat(), stats['glucose_count'], stats['glucose_sum'],
+                           stats['glucose_sumsq'], stats['insulin_count'], stats['insulin_sum'],
+                           stats['insulin_max'], stats['pair_count'], stats['ratio_count'],
+                           stats['ratio_sum']))
+
+
+def rebuild_prediction_daily(conn):
+    """Recompute prediction_daily for every day with glucose or insulin data."""
+    cursor = conn.cursor()
+    cursor.execute('''SELECT DISTINCT date(timestamp) FROM glucose
+                      UNION SELECT DISTINCT date(timestamp) FROM insulin''')
+    days = [date.fromisoformat(row[0]) for row in cursor.fetchall() if row[0]]
+    cursor.execute('DELETE FROM prediction_daily')
+    refresh_prediction_daily(cursor, days)
+    conn.commit()
+
+
+def refresh_derived_tables(cursor, table, timestamps):
+    """Bring the rollups derived from `table` up to date for rows at `timestamps`.
+
+    Must run on the writing connection before commit, so raw rows and
+    rollups change in the same transaction. `timestamps` should include
+    both the old and new timestamp of an updated row.
+    """
+    if table == 'glucose':
+        refresh_glucose_hourly(cursor, timestamps)
+    if table in WEEKLY_SERIES:
+        invalidate_weekly_rollup(cursor, table, timestamps)
+    if table in PREDICTION_SOURCE_TABLES:
+        refresh_prediction_daily(cursor, _prediction_days(table, timestamps))
+
+
+def _record_timestamp(cursor, table, record_id):
+    """Return the current timestamp of a record, or None if it does not exist."""
+    cursor.execute(f'SELECT timestamp FROM {table} WHERE id = ?', (record_id,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def _iso_weeks_between(start_dt, end_dt):
+    """Return (week_key, week_start, week_end) for every ISO week overlapping [start_dt, end_dt]."""
+    week_start = datetime.combine(start_dt.date() - timedelta(days=start_dt.weekday()), dt_time())
+    weeks = []
+    while week_start <= end_dt:
+        week_end = week_start + timedelta(days=7)
+        weeks.append((iso_week_key(week_start), week_start, week_end))
+        week_start = week_end
+    return weeks
+
+
+def _aggregate_weeks_from_raw(cursor, series, weeks, clip=None):
+    """Aggregate raw readings of `series` for the given weeks.
+
+    Contiguous weeks are read with one range query per run. `clip` is an
+    optional inclusive (utc_start, utc_end) string pair limiting the rows,
+    matching the chart's BETWEEN filter.
+
+    Returns:
+        {week_key: aggregate} for every requested week (empty weeks included)
+    """
+    fmt = '%Y-%m-%d %H:%M:%S'
+    runs = []
+    for week in weeks:
+        if runs and runs[-1][-1][2] == week[1]:
+            runs[-1].append(week)
+        else:
+            runs.append([week])
+
+    aggregates = {}
+    for run in runs:
+        query = f'''SELECT timestamp, level FROM {series}
+                    WHERE timestamp >= ? AND timestamp < ?'''
+        params = [run[0][1].strftime(fmt), run[-1][2].strftime(fmt)]
+        if clip:
+            query += ' AND timestamp BETWEEN ? AND ?'
+            params.extend(clip)
+        cursor.execute(query + ' ORDER BY timestamp', params)
+        grouped = _group_by_week(cursor.fetchall())
+        for week_key, _, _ in run:
+            aggregates[week_key] = aggregate_week(grouped.get(week_key, []))
+    return aggregates
+
+
+_WEEKLY_COLUMNS = ('reading_count', 'area', 'duration', 'first_timestamp',
+                   'first_level', 'last_timestamp', 'last_level')
+
+
+def _load_weekly_rollups(cursor, weeks):
+    """Load stored aggregates for the given weeks as {(series, week_key): aggregate}."""
+    if not weeks:
+        return {}
+    cursor.execute(f'''SELECT series, week, {', '.join(_WEEKLY_COLUMNS)} FROM weekly_rollup
+                     WHERE week BETWEEN ? AND ?''',
+                  (weeks[0][0], weeks[-1][0]))
+    wanted = {week_key for week_key, _, _ in weeks}
+    return {
+        (row[0], row[1]): dict(zip(_WEEKLY_COLUMNS, row[2:]))
+        for row in cursor.fetchall() if row[1] in wanted
+    }
+
+
+def _materialize_weekly_rollups(conn, weeks):
+    """Compute and store aggregates of closed weeks missing from weekly_rollup.
+
+    Runs under BEGIN IMMEDIATE so a concurrent write to one of these weeks
+    (which deletes its stored row) cannot interleave between the raw read
+    and the insert.
+    """
+    conn.execute('BEGIN IMMEDIATE')
+    cursor = conn.cursor()
+    materialized = {}
+    for series in WEEKLY_SERIES:
+        for week_key, aggregate in _aggregate_weeks_from_raw(cursor, series, weeks).items():
+            cursor.execute(f'''INSERT OR REPLACE INTO weekly_rollup
+                             (series, week, {', '.join(_WEEKLY_COLUMNS)})
+                             VALUES (?, ?, {', '.join('?' * len(_WEEKLY_COLUMNS))})''',
+                          (series, week_key, *(aggregate[c] for c in _WEEKLY_COLUMNS)))
+            materialized[(series, week_key)] = aggregate
+    conn.commit()
+    return materialized
+
+
+def _plan_chart_weeks(utc_start, utc_end, now):
+    """Split the ISO weeks of [utc_start, utc_end] into (stored_weeks, raw_weeks).
+
+    Stored weeks are closed (ended by `now`) and lie entirely inside the
+    range; the current week and weeks clipped by the range bounds are raw.
+    """
+    start_dt = datetime.fromisoformat(utc_start)
+    end_dt = datetime.fromisoformat(utc_end)
+    stored_weeks, raw_weeks = [], []
+    for week in _iso_weeks_between(start_dt, end_dt):
+        _, week_start, week_end = week
+        closed_and_covered = week_start >= start_dt and week_end <= end_dt and week_end <= now
+        (stored_weeks if closed_and_covered else raw_weeks).append(week)
+    return stored_weeks, raw_weeks
+
+
+def ensure_weekly_rollups(conn, utc_start, utc_end, now=None):
+    """Materialize the closed weeks of the chart range that weekly_rollup is missing.
+
+    `conn` (typically read-only) looks the weeks up; missing ones are
+    written through a writer connection.
+
+    Returns:
+        {(series, week_key): aggregate} for every stored week of the range
+    """
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    stored_weeks, _ = _plan_chart_weeks(utc_start, utc_end, now)
+    stored = _load_weekly_rollups(conn.cursor(), stored_weeks)
+    missing = [week for week in stored_weeks
+               if any((series, week[0]) not in stored for series in WEEKLY_SERIES)]
+    if missing:
+        with get_db_connection() as writer:
+            stored.update(_materialize_weekly_rollups(writer, missing))
+    return stored
+
+
+def read_glucose_chart(cursor, utc_start, utc_end, now=None, stored=None):
+    """Build the weekly chart from stored weeks plus raw readings; never writes.
+
+    Args:
+        cursor: Database cursor (may be inside a read transaction)
+        utc_start: Inclusive UTC start timestamp string
+        utc_end: Inclusive UTC end timestamp string
+        now: Naive UTC datetime deciding which weeks are closed (default: now)
+        stored: Aggregates from ensure_weekly_rollups(); loaded from the store
+            when omitted. Closed weeks still missing are aggregated from raw rows.
+
+    Returns:
+        List of {'week', 'glucose_mean', 'insulin_mean'} dicts
+    """
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    stored_weeks, raw_weeks = _plan_chart_weeks(utc_start, utc_end, now)
+    if stored is None:
+        stored = _load_weekly_rollups(cursor, stored_weeks)
+
+    weekly = defaultdict(dict)
+    for week in stored_weeks:
+        if all((series, week[0]) in stored for series in WEEKLY_SERIES):
+            for series in WEEKLY_SERIES:
+                weekly[week[0]][series] = stored[(series, week[0])]
+        else:
+            raw_weeks.append(week)
+    raw_weeks.sort(key=lambda week: week[1])
+
+    for series in WEEKLY_SERIES:
+        for week_key, aggregate in _aggregate_weeks_from_raw(
+                cursor, series, raw_weeks, clip=(utc_start, utc_end)).items():
+            weekly[week_key][series] = aggregate
+
+    return weekly_chart_points(weekly)
+
+
+def build_glucose_chart(utc_start, utc_end, now=None):
+    """Weekly time-weighted glucose/insulin means for readings in [utc_start, utc_end].
+
+    Closed ISO weeks lying entirely inside the range are read from the
+    weekly_rollup store (and materialized there the first time they are
+    needed). Only the current week and weeks clipped by the range bounds
+    are computed from raw readings, so a year-long chart is ~52 stored
+    rows plus one week of readings.
+
+    Args:
+        utc_start: Inclusive UTC start timestamp string
+        utc_end: Inclusive UTC end timestamp string
+        now: Naive UTC datetime deciding which weeks are closed (default: now)
+
+    Returns:
+        List of {'week', 'glucose_mean', 'insulin_mean'} dicts
+    """
+    with get_read_connection() as conn:
+        stored = ensure_weekly_rollups(conn, utc_start, utc_end, now)
+        return read_glucose_chart(conn.cursor(), utc_start, utc_end, now, stored=stored)
+
+
+def ensure_rollups():
+    """Create missing rollup tables and backfill them for pre-existing data."""
+    with get_db_connection() as conn:
+        create_rollup_schema(conn)
+        has_glucose = conn.execute('SELECT 1 FROM glucose LIMIT 1').fetchone()
+        has_hourly = conn.execute('SELECT 1 FROM glucose_hourly LIMIT 1').fetchone()
+        if has_glucose and not has_hourly:
+            logger.info("Backfilling glucose_hourly rollup from existing readings")
+            rebuild_rollups(conn)
+        has_insulin = conn.execute('SELECT 1 FROM insulin LIMIT 1').fetchone()
+        has_prediction = conn.execute('SELECT 1 FROM prediction_daily LIMIT 1').fetchone()
+        if (has_glucose or has_insulin) and not has_prediction:
+            logger.info("Backfilling prediction_daily state from existing readings")
+            rebuild_prediction_daily(conn)
+
+
+# ============================================================================
+# Response Cache
+# ============================================================================
+
+class DataVersions:
+    """Per-table data version counters, bumped by every DataAccess write."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions = defaultdict(int)
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """Call `callback(table)` after each bump (used for eager cache invalidation)."""
+        self._listeners.append(callback)
+
+    def bump(self, *tables):
+        with self._lock:
+            for table in tables:
+                self._versions[table] += 1
+        for table in tables:
+            for callback in self._listeners:
+                callback(table)
+
+    def snapshot(self, tables):
+        """Return the current versions of `tables` as a comparable tuple."""
+        with self._lock:
+            return tuple(self._versions[table] for table in tables)
+
+
+class ResponseCache:
+    """
+    In-process LRU cache of encoded JSON responses.
+
+    Entries are keyed by (endpoint, tz, normalized query params) and carry
+    the data versions of the tables they were computed from. A write bumps
+    its table's version, which evicts dependent entries; a lookup also
+    rejects an entry whose versions are stale, so a response computed
+    concurrently with a write is never served afterwards. Bounded by entry
+    count and total body bytes.
+    """
+
+    def __init__(self, versions, max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+                 max_bytes=RESPONSE_CACHE_MAX_BYTES):
+        self._versions = versions
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (body, deps, versions, expires_at)
+        self._bytes = 0
+        self._stats = defaultdict(lambda: {'hits': 0, 'misses': 0})
+        self._evictions = 0
+        self._invalidations = 0
+        versions.add_listener(self.invalidate)
+
+    @staticmethod
+    def make_key(endpoint, tz_name, query_params):
+        """Build a cache key; parameter order and the raw `tz` param do not matter.
+
+        The client's current date is part of the key because the dashboard
+        endpoints default their date ranges to it.
+        """
+        params = tuple(sorted((name, tuple(values)) for name, values in query_params.items()
+                              if name != 'tz'))
+        return (endpoint, tz_name, today_in_tz(tz_name).isoformat(), params)
+
+    def get(self, key):
+        """Return the cached body for `key`, or None on a miss."""
+        endpoint = key[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                body, deps, versions, expires_at = entry
+                fresh = expires_at is None or time.monotonic() < expires_at
+                if fresh and versions == self._versions.snapshot(deps):
+                    self._entries.move_to_end(key)
+                    self._stats[endpoint]['hits'] += 1
+                    return body
+                self._remove(key)
+            self._stats[endpoint]['misses'] += 1
+            return None
+
+    def put(self, key, body, deps, versions, ttl=None):
+        """Store `body` computed from `deps` at `versions` (snapshot taken before computing)."""
+        if len(body) > self._max_bytes:
+            return
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (body, deps, versions, expires_at)
+            self._bytes += len(body)
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, table):
+        """Drop every entry that depends on `table`."""
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if table in entry[1]]
+            for key in stale:
+                self._remove(key)
+            self._invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key):
+        body = self._entries.pop(key)[0]
+        self._bytes -= len(body)
+
+    def stats(self):
+        """Hit/miss counters overall and per endpoint, plus current size."""
+        with self._lock:
+            endpoints = {}
+            for endpoint, counts in sorted(self._stats.items()):
+                lookups = counts['hits'] + counts['misses']
+                endpoints[endpoint] = {**counts, 'hit_rate': round(counts['hits'] / lookups, 4)}
+            hits = sum(counts['hits'] for counts in self._stats.values())
+            lookups = hits + sum(counts['misses'] for counts in self._stats.values())
+            return {
+                'hits': hits,
+                'misses': lookups - hits,
+                'hit_rate': round(hits / lookups, 4) if lookups else None,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self._max_entries,
+                'max_bytes': self._max_bytes,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'endpoints': endpoints,
+            }
+
+
+# Raw tables each cached endpoint reads (directly or through rollups), and
+# a TTL in seconds for responses that also depend on the clock
+CACHED_ENDPOINTS = {
+    '/api/dashboard/glucose-chart': (('glucose', 'insulin'), None),
+    '/api/dashboard/summary': (('glucose', 'insulin', 'intake', 'nutrition', 'event',
+                                'supplement_intake', 'supplements'), None),
+    '/api/dashboard/cv-charts': (('glucose',), None),
+    '/api/dashboard/risk-metrics': (('glucose',), None),
+    '/api/dashboard/prediction': (('glucose', 'insulin', 'intake', 'nutrition'), 60),
+    '/api/dashboard/bundle': (('glucose', 'insulin', 'intake', 'nutrition', 'event',
+                               'supplement_intake', 'supplements'), 60),
+}
+
+data_versions = DataVersions()
+response_cache = ResponseCache(data_versions)
+
+# Data versions restart at 0 with the process; mixing in a per-process
+# token keeps version-derived ETags from matching across restarts
+_ETAG_EPOCH = secrets.token_hex(8)
+
+
+def version_etag(key, versions):
+    """Strong ETag for a response identified by cache `key` at data `versions`."""
+    digest = hashlib.sha1(repr((_ETAG_EPOCH, key, versions)).encode()).hexdigest()
+    return f'"v-{digest[:24]}"'
+
+
+def content_etag(body):
+    """Strong ETag derived from the response body bytes."""
+    return f'"c-{hashlib.sha1(body).hexdigest()[:24]}"'
+
+
+def gzip_etag(etag):
+    """ETag of the gzip-encoded representation of a response tagged `etag`."""
+    return f'{etag[:-1]}-gzip"'
+
+
+def _etag_base(tag):
+    """Strip the weak prefix and gzip suffix so all representations compare equal."""
+    tag = tag.strip().removeprefix('W/')
+    return tag.replace('-gzip"', '"') if tag.endswith('-gzip"') else tag
+
+
+def etag_matches(if_none_match, etag):
+    """Evaluate an If-None-Match header value against `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(_etag_base(tag) == _etag_base(etag) for tag in if_none_match.split(','))
+
+
+def accepts_gzip(accept_encoding):
+    """True if an Accept-Encoding header value allows gzip (honours q=0)."""
+    if not accept_encoding:
+        return False
+    qualities = {}
+    for part in accept_encoding.split(','):
+        coding, *params = [item.strip() for item in part.split(';')]
+        quality = 1.0
+        for param in params:
+            if param.startswith('q='):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+    for coding in ('gzip', 'x-gzip', '*'):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+def gzip_compress(body, level=GZIP_LEVEL):
+    """gzip-wrap `body` with zlib (wbits=31 selects the gzip container)."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress(body) + compressor.flush()
+
+
+# ============================================================================
+# Static Assets
+# ============================================================================
+
+# Build outputs named with a content hash (app.<12 hex>.min.js, see build-js.py)
+# never change under the same name
+HASHED_ASSET_PATTERN = re.compile(r'\.[0-9a-f]{12}\.')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def not_modified_since(if_modified_since, mtime):
+    """True if a file modified at `mtime` is unchanged since an If-Modified-Since value."""
+    if not if_modified_since:
+        return False
+    try:
+        since = email.utils.parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return int(mtime) <= since.timestamp()
+
+
+class StaticFileCache:
+    """
+    Bounded in-memory LRU of static file contents.
+
+    Entries are keyed by path and revalidated against the file's mtime and
+    size on every lookup, so edits on disk are picked up immediately.
+    Files larger than max_file_bytes are never cached.
+    """
+
+    def __init__(self, max_bytes=STATIC_CACHE_MAX_BYTES, max_file_bytes=STATIC_CACHE_MAX_FILE_BYTES):
+        self._max_bytes = max_bytes
+        self._max_file_bytes = max_file_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # path -> (mtime_ns, size, body)
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def read(self, path, st):
+        """Return the contents of `path` (whose os.stat() is `st`), or None if too large to cache."""
+        if st.st_size > self._max_file_bytes:
+            return None
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+                self._entries.move_to_end(path)
+                self._hits += 1
+                return entry[2]
+            self._misses += 1
+
+        with open(path, 'rb') as f:
+            body = f.read()
+
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self._bytes -= len(previous[2])
+            self._entries[path] = (st.st_mtime_ns, st.st_size, body)
+            self._bytes += len(body)
+            while self._bytes > self._max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+        return body
+
+    def stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else None,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self._max_bytes,
+            }
+
+
+static_cache = StaticFileCache()
+
+
+# ============================================================================
+# Batch Writes
+# ============================================================================
+
+# Batch resource name (as in the /api/<resource> paths) ->
+# (table, columns written by create/update, defaults for optional columns)
+BATCH_RESOURCES = {
+    'glucose': ('glucose', ('timestamp', 'level'), {}),
+    'insulin': ('insulin', ('timestamp', 'level'), {}),
+    'intake': ('intake', ('nutrition_id', 'timestamp', 'nutrition_amount'), {}),
+    'supplements': ('supplements', ('supplement_name', 'default_amount'), {'default_amount': 1}),
+    'supplement-intake': ('supplement_intake', ('timestamp', 'supplement_id', 'supplement_amount'), {}),
+    'event': ('event', ('timestamp', 'event_name', 'event_notes'), {'event_notes': ''}),
+    'nutrition': ('nutrition', ('nutrition_name', 'kcal', 'weight'), {}),
+}
+
+BATCH_OPS = ('create', 'update', 'delete')
+
+
+class BatchError(ValueError):
+    """A batch was rejected; `errors` maps operation index to message."""
+
+    def __init__(self, errors):
+        super().__init__('Batch rejected; no changes were applied')
+        self.errors = errors
+
+
+def parse_batch_operations(operations):
+    """
+    Validate batch operations and normalize them to (op, resource, record_id, values).
+
+    Each operation is {"op": "create"|"update"|"delete", "resource": <name>,
+    "id": <int, for update/delete>, "data": {...column values...}}. `values`
+    is the tuple of BATCH_RESOURCES columns (None for deletes).
+
+    Raises:
+        BatchError: listing every invalid operation
+    """
+    if not isinstance(operations, list) or not operations:
+        raise ValueError("'operations' must be a non-empty list")
+
+    parsed, errors = [], {}
+    for index, operation in enumerate(operations):
+        try:
+            if not isinstance(operation, dict):
+                raise ValueError('Operation must be an object')
+            op = operation.get('op')
+            if op not in BATCH_OPS:
+                raise ValueError(f"Invalid op: {op!r}")
+            resource = operation.get('resource')
+            if resource not in BATCH_RESOURCES:
+                raise ValueError(f"Unknown resource: {resource!r}")
+            _, columns, defaults = BATCH_RESOURCES[resource]
+
+            record_id = None
+            if op != 'create':
+                record_id = operation.get('id')
+                if not isinstance(record_id, int) or isinstance(record_id, bool):
+                    raise ValueError("'id' must be an integer")
+
+            values = None
+            if op != 'delete':
+                data = operation.get('data')
+                if not isinstance(data, dict):
+                    raise ValueError("'data' must be an object")
+                missing = [column for column in columns if column not in data and column not in defaults]
+                if missing:
+                    raise ValueError(f"Missing field(s): {', '.join(missing)}")
+                values = tuple(data.get(column, defaults.get(column)) for column in columns)
+                if resource == 'intake' and (not isinstance(values[0], int) or isinstance(values[0], bool)):
+                    raise ValueError("'nutrition_id' must be an integer")
+            parsed.append((op, resource, record_id, values))
+        except ValueError as e:
+            errors[index] = str(e)
+    if errors:
+        raise BatchError(errors)
+    return parsed
+
+
+def _batch_groups(parsed):
+    """Split parsed operations into runs of the same (op, resource), keeping order."""
+    groups = []
+    for index, (op, resource, record_id, values) in enumerate(parsed):
+        if groups and groups[-1][0] == (op, resource):
+            groups[-1][1].append((index, record_id, values))
+        else:
+            groups.append(((op, resource), [(index, record_id, values)]))
+    return groups
+
+
+def _intake_kcal(cursor, items):
+    """nutrition_kcal for each intake (index, record_id, values); unknown nutrition raises BatchError."""
+    nutrition_ids = sorted({values[0] for _, _, values in items})
+    placeholders = ', '.join('?' * len(nutrition_ids))
+    cursor.execute(f'SELECT id, kcal_per_gram FROM nutrition WHERE id IN ({placeholders})',
+                   nutrition_ids)
+    kcal_per_gram = dict(cursor.fetchall())
+    missing = {index: 'Nutrition not found' for index, _, values in items
+               if values[0] not in kcal_per_gram}
+    if missing:
+        raise BatchError(missing)
+    return [values[2] * kcal_per_gram[values[0]] for _, _, values in items]
+
+
+def apply_batch_group(cursor, op, resource, items):
+    """
+    Apply one run of same-kind operations with a single executemany.
+
+    Returns:
+        (per-item result dicts, timestamps touched in rollup source tables)
+    """
+    table, columns, _ = BATCH_RESOURCES[resource]
+    ids = [(record_id,) for _, record_id, _ in items]
+    old_timestamps = []
+    if op != 'create' and table in ROLLUP_SOURCE_TABLES:
+        old_timestamps = [ts for (record_id,) in ids
+                          if (ts := _record_timestamp(cursor, table, record_id)) is not None]
+
+    results = [{'status': 201 if op == 'create' else 200} for _ in items]
+    if op == 'delete':
+        cursor.executemany(f'DELETE FROM {table} WHERE id = ?', ids)
+        return results, old_timestamps
+
+    rows = [values for _, _, values in items]
+    if table == 'intake':
+        kcals = _intake_kcal(cursor, items)
+        rows = [values + (kcal,) for values, kcal in zip(rows, kcals)]
+        columns = columns + ('nutrition_kcal',)
+        if op == 'create':
+            for result, kcal in zip(results, kcals):
+                result['nutrition_kcal'] = kcal
+
+    if op == 'create':
+        placeholders = ', '.join('?' * len(columns))
+        cursor.executemany(f'INSERT INTO {table} ({", ".join(columns)}) VALUES ({placeholders})', rows)
+    else:
+        assignments = ', '.join(f'{column} = ?' for column in columns)
+        cursor.executemany(f'UPDATE {table} SET {assignments} WHERE id = ?',
+                           [row + record_id for row, record_id in zip(rows, ids)])
+
+    new_timestamps = []
+    if table in ROLLUP_SOURCE_TABLES:
+        new_timestamps = [values[columns.index('timestamp')] for values in rows]
+    return results, old_timestamps + new_timestamps
+
+
+# ============================================================================
+# Bulk Ingest
+# ============================================================================
+
+# Tables accepted by POST /api/ingest/<table>: timestamp + numeric level rows
+INGEST_TABLES = ('glucose', 'insulin')
+
+INGEST_READ_BYTES = 64 * 1024
+
+
+def iter_body_lines(rfile, headers, max_line_bytes=MAX_BODY_BYTES):
+    """
+    Yield the lines (bytes, without line endings) of a request body as it arrives.
+
+    Handles `Transfer-Encoding: chunked` as well as a Content-Length body;
+    at most one read block plus a partial line is held in memory.
+
+    Raises:
+        ValueError: malformed chunk framing, missing length, or an over-long line
+    """
+    if 'chunked' in headers.get('Transfer-Encoding', '').lower():
+        blocks = _iter_chunks(rfile)
+    elif headers.get('Content-Length') is not None:
+        blocks = _iter_fixed(rfile, int(headers['Content-Length']))
+    else:
+        raise ValueError('Content-Length or chunked Transfer-Encoding required')
+
+    pending = b''
+    for block in blocks:
+        pending += block
+        *lines, pending = pending.split(b'\n')
+        for line in lines:
+            yield line.rstrip(b'\r')
+        if len(pending) > max_line_bytes:
+            raise ValueError(f'Line too long (max {max_line_bytes} bytes)')
+    if pending.strip():
+        yield pending.rstrip(b'\r')
+
+
+def _iter_fixed(rfile, length):
+    while length > 0:
+        block = rfile.read(min(INGEST_READ_BYTES, length))
+        if not block:
+            raise ValueError('Request body ended early')
+        length -= len(block)
+        yield block
+
+
+def _iter_chunks(rfile):
+    while True:
+        size_line = rfile.readline(1024)
+        try:
+            size = int(size_line.split(b';')[0].strip(), 16)
+        except ValueError:
+            raise ValueError('Malformed chunk size')
+        if size == 0:
+            # Skip trailers up to the terminating blank line
+            while rfile.readline(1024).strip():
+                pass
+            return
+        yield from _iter_fixed(rfile, size)
+        rfile.readline(3)  # CRLF after the chunk data
+
+
+def parse_ingest_row(row):
+    """
+    Validate one ingest row ({"timestamp", "level"}) into (utc_timestamp, level).
+
+    ISO 8601 timestamps are accepted; ones with an offset are converted to
+    UTC, naive ones are taken as UTC.
+    """
+    if not isinstance(row, dict):
+        raise ValueError('Row must be an object')
+    try:
+        timestamp = datetime.fromisoformat(str(row['timestamp']).strip())
+        level = float(row['level'])
+    except KeyError as e:
+        raise ValueError(f'Missing field: {e.args[0]}')
+    except (TypeError, ValueError) as e:
+        raise ValueError(f'Invalid value: {e}')
+    if not math.isfinite(level) or level <= 0:
+        raise ValueError(f'Invalid level: {row["level"]}')
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc)
+    return timestamp.strftime('%Y-%m-%d %H:%M:%S'), level
+
+
+def iter_ingest_rows(lines, fmt):
+    """Yield (line_number, row dict or ValueError) from NDJSON or CSV (header row required) lines."""
+    if fmt == 'csv':
+        reader = csv.DictReader(line.decode('utf-8', errors='replace') for line in lines)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as e:
+            yield line_number, ValueError(f'Invalid JSON: {e}')
+
+
+def ingest_rows(table, rows, batch_rows=INGEST_BATCH_ROWS, max_rejects=INGEST_MAX_REJECTS):
+    """
+    Insert validated rows into `table` in bounded executemany batches.
+
+    Each batch of up to `batch_rows` rows is its own short transaction
+    (insert, rollup refresh, commit), so other writers are never blocked
+    for long and memory stays bounded however large the input is. Invalid
+    rows are skipped and reported.
+
+    Args:
+        table: One of INGEST_TABLES
+        rows: Iterable of (line_number, row dict or ValueError)
+
+    Returns:
+        Dict with received, inserted, rejected, batches and up to
+        `max_rejects` {'line', 'error'} reject details; 'aborted' holds the
+        error when the body stream broke off (rows read before it are kept)
+    """
+    report = {'table': table, 'received': 0, 'inserted': 0, 'rejected': 0, 'batches': 0, 'rejects': []}
+
+    def flush(batch):
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(f'INSERT INTO {table} (timestamp, level) VALUES (?, ?)', batch)
+            refresh_derived_tables(cursor, table, [timestamp for timestamp, _ in batch])
+            conn.commit()
+        data_versions.bump(table)
+        report['inserted'] += len(batch)
+        report['batches'] += 1
+
+    batch = []
+    try:
+        for line_number, row in rows:
+            report['received'] += 1
+            try:
+                if isinstance(row, ValueError):
+                    raise row
+                batch.append(parse_ingest_row(row))
+            except ValueError as e:
+                report['rejected'] += 1
+                if len(report['rejects']) < max_rejects:
+                    report['rejects'].append({'line': line_number, 'error': str(e)})
+                continue
+            if len(batch) >= batch_rows:
+                flush(batch)
+                batch = []
+    except (ValueError, OSError) as e:
+        # The stream itself is broken (framing, truncation, socket timeout or
+        # reset); keep what was read and report it
+        report['aborted'] = str(e) or type(e).__name__
+    if batch:
+        flush(batch)
+    return report
+
+
+# ============================================================================
+# List Pagination
+# ============================================================================
+
+def encode_list_cursor(timestamp, record_id):
+    """Opaque keyset cursor for the row (timestamp, id)."""
+    return base64.urlsafe_b64encode(json.dumps([timestamp, record_id]).encode()).decode().rstrip('=')
+
+
+def decode_list_cursor(cursor):
+    """Inverse of encode_list_cursor(); raises ValueError for a malformed cursor."""
+    try:
+        timestamp, record_id = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(timestamp, str) or not isinstance(record_id, int):
+        raise ValueError('Invalid cursor')
+    return timestamp, record_id
+
+
+def parse_page_params(query_params):
+    """(limit, cursor) from ?limit=&cursor=, or None when the request is unpaginated."""
+    if 'limit' not in query_params and 'cursor' not in query_params:
+        return None
+    try:
+        limit = int(query_params.get('limit', [LIST_PAGE_DEFAULT])[0])
+    except ValueError:
+        raise ValueError('limit must be an integer')
+    if limit < 1:
+        raise ValueError('limit must be positive')
+    return min(limit, LIST_PAGE_MAX), query_params.get('cursor', [None])[0]
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+# Export name (as in /api/export/<name>) -> (column names, query). Timestamped
+# tables are filtered like the list endpoints (BETWEEN ? AND ?); the master
+# tables are exported whole.
+EXPORT_QUERIES = {
+    'glucose': (('id', 'timestamp', 'level'),
+                '''SELECT id, timestamp, level FROM glucose
+                   WHERE timestamp BETWEEN ? AND ?
+                   ORDER BY timestamp'''),
+    'insulin': (('id', 'timestamp', 'level'),
+                '''SELECT id, timestamp, level FROM insulin
+                   WHERE timestamp BETWEEN ? AND ?
+                   ORDER BY timestamp'''),
+    'intake': (('id', 'timestamp', 'nutrition_id', 'nutrition_name', 'nutrition_amount', 'nutrition_kcal'),
+               '''SELECT i.id, i.timestamp, i.nutrition_id, n.nutrition_name,
+                         i.nutrition_amount, i.nutrition_kcal
+                  FROM intake i
+                  JOIN nutrition n ON i.nutrition_id = n.id
+                  WHERE i.timestamp BETWEEN ? AND ?
+                  ORDER BY i.timestamp'''),
+    'supplement-intake': (('id', 'timestamp', 'supplement_id', 'supplement_name', 'supplement_amount'),
+                          '''SELECT si.id, si.timestamp, si.supplement_id, s.supplement_name,
+                                    si.supplement_amount
+                             FROM supplement_intake si
+                             JOIN supplements s ON si.supplement_id = s.id
+                             WHERE si.timestamp BETWEEN ? AND ?
+                             ORDER BY si.timestamp'''),
+    'event': (('id', 'timestamp', 'event_name', 'event_notes'),
+              '''SELECT id, timestamp, event_name, event_notes
+                 FROM event
+                 WHERE timestamp BETWEEN ? AND ?
+                 ORDER BY timestamp'''),
+    'nutrition': (('id', 'nutrition_name', 'kcal', 'weight', 'kcal_per_gram'),
+                  'SELECT id, nutrition_name, kcal, weight, kcal_per_gram FROM nutrition ORDER BY id'),
+    'supplements': (('id', 'supplement_name', 'default_amount'),
+                    'SELECT id, supplement_name, default_amount FROM supplements ORDER BY id'),
+}
+
+EXPORT_CONTENT_TYPES = {'csv': 'text/csv; charset=utf-8', 'ndjson': 'application/x-ndjson'}
+
+
+def encode_export_rows(columns, row_batches, fmt):
+    """Yield encoded CSV (header first) or NDJSON bytes, one piece per batch of rows."""
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(columns)
+        yield buffer.getvalue().encode()
+        for rows in row_batches:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(rows)
+            yield buffer.getvalue().encode()
+    else:
+        for rows in row_batches:
+            yield ''.join(json.dumps(dict(zip(columns, row))) + '\n' for row in rows).encode()
+
+
+# ============================================================================
+# Request Metrics
+# ============================================================================
+
+# Upper bounds of response size histogram buckets (bytes)
+SIZE_BUCKETS_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+_API_RESOURCES = ('/api/glucose', '/api/insulin', '/api/intake', '/api/supplements',
+                  '/api/supplement-intake', '/api/event', '/api/nutrition')
+
+# Route labels; anything else is reported as `other` to bound label cardinality
+METRIC_ROUTES = frozenset({
+    '/', '/metrics', '/static/*', '/api/metrics', '/api/batch', '/api/intake/previous-window',
+    *_API_RESOURCES, *(f'{resource}/{{id}}' for resource in _API_RESOURCES),
+    *(f'/api/dashboard/{name}' for name in ('glucose-chart', 'summary', 'cv-charts', 'risk-metrics',
+                                            'prediction', 'bundle')),
+    *(f'/api/export/{name}' for name in EXPORT_QUERIES),
+    *(f'/api/ingest/{table}' for table in INGEST_TABLES),
+})
+
+# Method labels; any other request method (answered 501) is reported as `other`
+METRIC_METHODS = frozenset({'GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'OPTIONS'})
+
+
+def metrics_route(path):
+    """Map a request path to its route label (record ids become `{id}`)."""
+    if path.startswith('/static/'):
+        return '/static/*'
+    path = re.sub(r'/\d+$', '/{id}', path)
+    return path if path in METRIC_ROUTES else 'other'
+
+
+def metrics_method(command):
+    """Map a request method to its method label."""
+    return command if command in METRIC_METHODS else 'other'
+
+
+class _CountingWriter:
+    """Wraps a handler's wfile and counts the bytes written through it."""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self.bytes = 0
+
+    def write(self, data):
+        self.bytes += len(data)
+        return self._raw.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+
+class RequestMetrics:
+    """Per-route request counts by status, latency and response size histograms, in-flight gauge."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def _route(self, key):
+        route = self._routes.get(key)
+        if route is None:
+            route = self._routes[key] = {
+                'statuses': defaultdict(int),
+                'duration_ms': Histogram(),
+                'size_bytes': Histogram(SIZE_BUCKETS_BYTES),
+                'in_flight': 0,
+            }
+        return route
+
+    def begin(self, key):
+        with self._lock:
+            self._route(key)['in_flight'] += 1
+
+    def end(self, key, status, size, elapsed_ms):
+        """Close a request begun with begin(); one without a response is not counted."""
+        with self._lock:
+            route = self._route(key)
+            route['in_flight'] -= 1
+            if status is None:
+                return
+            route['statuses'][status] += 1
+        route['duration_ms'].observe(elapsed_ms)
+        route['size_bytes'].observe(size)
+
+    def snapshot(self):
+        """{(method, route): {'statuses', 'duration_ms', 'size_bytes', 'in_flight'}}"""
+        with self._lock:
+            return {key: {'statuses': dict(route['statuses']),
+                          'duration_ms': route['duration_ms'].snapshot(),
+                          'size_bytes': route['size_bytes'].snapshot(),
+                          'in_flight': route['in_flight']}
+                    for key, route in sorted(self._routes.items())}
+
+
+request_metrics = RequestMetrics()
+
+
+def executor_stats(executor):
+    """Queued work items, started threads and the limit of a ThreadPoolExecutor."""
+    # ThreadPoolExecutor exposes no public accessors for these
+    return {
+        'queued': executor._work_queue.qsize(),
+        'threads': len(executor._threads),
+        'max_workers': executor._max_workers,
+    }
 
-    # Confidence criteria
-    if cv < 25 and data_points >= 30 and stable_trend:
-        return "High"
-    elif cv < 35 and data_points >= 14:
-        return "Medium"
-    else:
-        return "Low"
+
+def _prometheus_labels(labels):
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _prometheus_number(value):
+    """Format a bound or sum exactly: integral values as ints, others via repr(float)."""
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class PrometheusText:
+    """Builds a Prometheus text exposition (format 0.0.4) document."""
+
+    def __init__(self):
+        self._lines = []
+        self._declared = set()
+
+    def _declare(self, name, kind, help_text):
+        if name not in self._declared:
+            self._declared.add(name)
+            self._lines.append(f'# HELP {name} {help_text}')
+            self._lines.append(f'# TYPE {name} {kind}')
+
+    def sample(self, name, kind, help_text, value, /, **labels):
+        self._declare(name, kind, help_text)
+        self._lines.append(f'{name}{_prometheus_labels(labels) if labels else ""} {value}')
+
+    def histogram(self, name, help_text, snapshot, /, scale=1, **labels):
+        """Add a Histogram.snapshot(); `scale` converts bounds and sum (e.g. ms -> s)."""
+        self._declare(name, 'histogram', help_text)
+        for bound, count in snapshot['buckets']:
+            le = bound if bound == '+Inf' else _prometheus_number(bound * scale)
+            self._lines.append(f'{name}_bucket{_prometheus_labels({**labels, "le": le})} {count}')
+        suffix = _prometheus_labels(labels) if labels else ''
+        self._lines.append(f'{name}_sum{suffix} {_prometheus_number(snapshot["sum"] * scale)}')
+        self._lines.append(f'{name}_count{suffix} {snapshot["count"]}')
+
+    def render(self):
+        return ('\n'.join(self._lines) + '\n').encode()
+
+
+def prometheus_metrics(executor=None):
+    """Render request, executor, pool, cache and TLS metrics in Prometheus text format."""
+    text = PrometheusText()
+    routes = request_metrics.snapshot()
+    # Samples of one metric must be contiguous, so loop per metric
+    for (method, route), metrics in routes.items():
+        for status, count in sorted(metrics['statuses'].items()):
+            text.sample('glucose_http_requests_total', 'counter', 'HTTP requests by route and status.',
+                        count, method=method, route=route, status=status)
+    for (method, route), metrics in routes.items():
+        text.histogram('glucose_http_request_duration_seconds', 'Time from parsed request to response end.',
+                       metrics['duration_ms'], scale=0.001, method=method, route=route)
+    for (method, route), metrics in routes.items():
+        text.histogram('glucose_http_response_size_bytes', 'Bytes written per response, headers included.',
+                       metrics['size_bytes'], method=method, route=route)
+    for (method, route), metrics in routes.items():
+        text.sample('glucose_http_requests_in_flight', 'gauge', 'Requests being handled.',
+                    metrics['in_flight'], method=method, route=route)
+
+    if executor is not None:
+        stats = executor_stats(executor)
+        text.sample('glucose_executor_queue_depth', 'gauge', 'Work items waiting for a handler thread.',
+                    stats['queued'])
+        text.sample('glucose_executor_threads', 'gauge', 'Handler threads started.', stats['threads'])
+        text.sample('glucose_executor_max_workers', 'gauge', 'Handler thread limit (MAX_WORKERS).',
+                    stats['max_workers'])
+
+    pools = [pool.stats() for pool in (_db_read_pool, _db_pool) if pool is not None]
+    for stats in pools:
+        text.histogram('glucose_db_pool_wait_seconds', 'Time waiting for a pooled connection.',
+                       stats['wait_ms'], scale=0.001, role=stats['role'])
+    for stats in pools:
+        text.histogram('glucose_db_pool_hold_seconds', 'Time a pooled connection was held.',
+                       stats['hold_ms'], scale=0.001, role=stats['role'])
+    for stats in pools:
+        text.sample('glucose_db_pool_in_use', 'gauge', 'Pooled connections checked out.',
+                    stats['in_use'], role=stats['role'])
+    for stats in pools:
+        text.sample('glucose_db_pool_size', 'gauge', 'Pooled connections.', stats['size'], role=stats['role'])
+    for stats in pools:
+        text.sample('glucose_db_pool_exhausted_total', 'counter', 'Checkouts that timed out.',
+                    stats['exhausted'], role=stats['role'])
+
+    cache = response_cache.stats()
+    text.sample('glucose_response_cache_hits_total', 'counter', 'Response cache hits.', cache['hits'])
+    text.sample('glucose_response_cache_misses_total', 'counter', 'Response cache misses.', cache['misses'])
+    handshakes = tls_handshakes.stats()
+    for kind in ('full', 'resumed'):
+        text.sample('glucose_tls_handshakes_total', 'counter', 'Completed TLS handshakes.',
+                    handshakes[kind]['count'], kind=kind)
+    return text.render()
 
 
 # ============================================================================
@@ -949,18 +2968,23 @@ class DataAccess:
 
     @staticmethod
     def create_glucose(timestamp, level):
-        execute_query('INSERT INTO glucose (timestamp, level) VALUES (?, ?)',
-                     (timestamp, level), commit=True)
+        def work(cursor):
+            cursor.execute('INSERT INTO glucose (timestamp, level) VALUES (?, ?)',
+                         (timestamp, level))
+            refresh_derived_tables(cursor, 'glucose', [timestamp])
+        run_write(work, 'glucose')
 
     @staticmethod
     def create_insulin(timestamp, level):
-        execute_query('INSERT INTO insulin (timestamp, level) VALUES (?, ?)',
-                     (timestamp, level), commit=True)
+        def work(cursor):
+            cursor.execute('INSERT INTO insulin (timestamp, level) VALUES (?, ?)',
+                         (timestamp, level))
+            refresh_derived_tables(cursor, 'insulin', [timestamp])
+        run_write(work, 'insulin')
 
     @staticmethod
     def create_intake(nutrition_id, timestamp, nutrition_amount):
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
+        def work(cursor):
             cursor.execute('SELECT kcal_per_gram FROM nutrition WHERE id = ?', (nutrition_id,))
             kcal_per_gram = cursor.fetchone()
 
@@ -972,51 +2996,64 @@ class DataAccess:
                             (nutrition_id, timestamp, nutrition_amount, nutrition_kcal)
                             VALUES (?, ?, ?, ?)''',
                          (nutrition_id, timestamp, nutrition_amount, nutrition_kcal))
-            conn.commit()
-        return nutrition_kcal
+            return nutrition_kcal
+        return run_write(work, 'intake')
 
     @staticmethod
     def create_supplement_master(supplement_name, default_amount=1):
-        execute_query('''INSERT INTO supplements
-                        (supplement_name, default_amount)
-                        VALUES (?, ?)''',
-                     (supplement_name, default_amount), commit=True)
+        run_write(lambda cursor: cursor.execute('''INSERT INTO supplements
+                                                (supplement_name, default_amount)
+                                                VALUES (?, ?)''',
+                                             (supplement_name, default_amount)),
+                  'supplements')
 
     @staticmethod
     def create_supplement_intake(timestamp, supplement_id, supplement_amount):
-        execute_query('''INSERT INTO supplement_intake
-                        (timestamp, supplement_id, supplement_amount)
-                        VALUES (?, ?, ?)''',
-                     (timestamp, supplement_id, supplement_amount), commit=True)
+        run_write(lambda cursor: cursor.execute('''INSERT INTO supplement_intake
+                                                (timestamp, supplement_id, supplement_amount)
+                                                VALUES (?, ?, ?)''',
+                                             (timestamp, supplement_id, supplement_amount)),
+                  'supplement_intake')
 
     @staticmethod
     def create_event(timestamp, event_name, event_notes=''):
-        execute_query('''INSERT INTO event
-                        (timestamp, event_name, event_notes)
-                        VALUES (?, ?, ?)''',
-                     (timestamp, event_name, event_notes), commit=True)
+        run_write(lambda cursor: cursor.execute('''INSERT INTO event
+                                                (timestamp, event_name, event_notes)
+                                                VALUES (?, ?, ?)''',
+                                             (timestamp, event_name, event_notes)),
+                  'event')
 
     @staticmethod
     def create_nutrition(nutrition_name, kcal, weight):
-        execute_query('''INSERT INTO nutrition
-                        (nutrition_name, kcal, weight)
-                        VALUES (?, ?, ?)''',
-                     (nutrition_name, kcal, weight), commit=True)
+        run_write(lambda cursor: cursor.execute('''INSERT INTO nutrition
+                                                (nutrition_name, kcal, weight)
+                                                VALUES (?, ?, ?)''',
+                                             (nutrition_name, kcal, weight)),
+                  'nutrition')
 
     @staticmethod
     def update_glucose(record_id, timestamp, level):
-        execute_query('UPDATE glucose SET timestamp = ?, level = ? WHERE id = ?',
-                     (timestamp, level, record_id), commit=True)
+        def work(cursor):
+            old_timestamp = _record_timestamp(cursor, 'glucose', record_id)
+            cursor.execute('UPDATE glucose SET timestamp = ?, level = ? WHERE id = ?',
+                         (timestamp, level, record_id))
+            if old_timestamp is not None:
+                refresh_derived_tables(cursor, 'glucose', [old_timestamp, timestamp])
+        run_write(work, 'glucose')
 
     @staticmethod
     def update_insulin(record_id, timestamp, level):
-        execute_query('UPDATE insulin SET timestamp = ?, level = ? WHERE id = ?',
-                     (timestamp, level, record_id), commit=True)
+        def work(cursor):
+            old_timestamp = _record_timestamp(cursor, 'insulin', record_id)
+            cursor.execute('UPDATE insulin SET timestamp = ?, level = ? WHERE id = ?',
+                         (timestamp, level, record_id))
+            if old_timestamp is not None:
+                refresh_derived_tables(cursor, 'insulin', [old_timestamp, timestamp])
+        run_write(work, 'insulin')
 
     @staticmethod
     def update_intake(record_id, nutrition_id, timestamp, nutrition_amount):
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
+        def work(cursor):
             cursor.execute('SELECT kcal_per_gram FROM nutrition WHERE id = ?', (nutrition_id,))
             kcal_per_gram = cursor.fetchone()
 
@@ -1028,39 +3065,83 @@ class DataAccess:
                             SET timestamp = ?, nutrition_id = ?, nutrition_amount = ?, nutrition_kcal = ?
                             WHERE id = ?''',
                          (timestamp, nutrition_id, nutrition_amount, nutrition_kcal, record_id))
-            conn.commit()
+        run_write(work, 'intake')
 
     @staticmethod
     def update_supplement_master(record_id, supplement_name, default_amount=1):
-        execute_query('''UPDATE supplements
-                        SET supplement_name = ?, default_amount = ?
-                        WHERE id = ?''',
-                     (supplement_name, default_amount, record_id), commit=True)
+        run_write(lambda cursor: cursor.execute('''UPDATE supplements
+                                                SET supplement_name = ?, default_amount = ?
+                                                WHERE id = ?''',
+                                             (supplement_name, default_amount, record_id)),
+                  'supplements')
 
     @staticmethod
     def update_supplement_intake(record_id, timestamp, supplement_id, supplement_amount):
-        execute_query('''UPDATE supplement_intake
-                        SET timestamp = ?, supplement_id = ?, supplement_amount = ?
-                        WHERE id = ?''',
-                     (timestamp, supplement_id, supplement_amount, record_id), commit=True)
+        run_write(lambda cursor: cursor.execute('''UPDATE supplement_intake
+                                                SET timestamp = ?, supplement_id = ?, supplement_amount = ?
+                                                WHERE id = ?''',
+                                             (timestamp, supplement_id, supplement_amount, record_id)),
+                  'supplement_intake')
 
     @staticmethod
     def update_event(record_id, timestamp, event_name, event_notes=''):
-        execute_query('''UPDATE event
-                        SET timestamp = ?, event_name = ?, event_notes = ?
-                        WHERE id = ?''',
-                     (timestamp, event_name, event_notes, record_id), commit=True)
+        run_write(lambda cursor: cursor.execute('''UPDATE event
+                                                SET timestamp = ?, event_name = ?, event_notes = ?
+                                                WHERE id = ?''',
+                                             (timestamp, event_name, event_notes, record_id)),
+                  'event')
 
     @staticmethod
     def update_nutrition(record_id, nutrition_name, kcal, weight):
-        execute_query('''UPDATE nutrition
-                        SET nutrition_name = ?, kcal = ?, weight = ?
-                        WHERE id = ?''',
-                     (nutrition_name, kcal, weight, record_id), commit=True)
+        run_write(lambda cursor: cursor.execute('''UPDATE nutrition
+                                                SET nutrition_name = ?, kcal = ?, weight = ?
+                                                WHERE id = ?''',
+                                             (nutrition_name, kcal, weight, record_id)),
+                  'nutrition')
 
     @staticmethod
     def delete_record(table, record_id):
-        execute_query(f'DELETE FROM {table} WHERE id = ?', (record_id,), commit=True)
+        def work(cursor):
+            old_timestamp = _record_timestamp(cursor, table, record_id) if table in ROLLUP_SOURCE_TABLES else None
+            cursor.execute(f'DELETE FROM {table} WHERE id = ?', (record_id,))
+            if old_timestamp is not None:
+                refresh_derived_tables(cursor, table, [old_timestamp])
+        run_write(work, table)
+
+    @staticmethod
+    def apply_batch(operations):
+        """
+        Apply heterogeneous create/update/delete operations in one transaction.
+
+        Consecutive operations of the same kind share one executemany; rollups
+        are refreshed once per table and the whole batch commits once. Any
+        invalid operation rolls back every change.
+
+        Returns:
+            List of per-operation result dicts, in request order
+
+        Raises:
+            BatchError: per-operation errors (nothing was applied)
+        """
+        parsed = parse_batch_operations(operations)
+        results = [None] * len(parsed)
+        touched = defaultdict(list)  # table -> timestamps for refresh_derived_tables
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            for (op, resource), items in _batch_groups(parsed):
+                try:
+                    group_results, timestamps = apply_batch_group(cursor, op, resource, items)
+                except sqlite3.IntegrityError as e:
+                    raise BatchError({index: f'Constraint failed: {e}' for index, _, _ in items})
+                for (index, _, _), result in zip(items, group_results):
+                    results[index] = result
+                touched[BATCH_RESOURCES[resource][0]].extend(timestamps)
+            for table, timestamps in touched.items():
+                if table in ROLLUP_SOURCE_TABLES:
+                    refresh_derived_tables(cursor, table, timestamps)
+            conn.commit()
+        data_versions.bump(*touched)
+        return results
 
     @staticmethod
     def get_nutrition_list():
@@ -1074,16 +3155,73 @@ class DataAccess:
         return [{'id': row[0], 'supplement_name': row[1], 'default_amount': row[2]} for row in rows]
 
     @staticmethod
-    def get_list_with_filter(query, start_date, end_date, tz_name='UTC', default_hours=24):
+    def list_filter(query, start_date, end_date, tz_name='UTC', default_hours=24):
+        """Bind a `BETWEEN ? AND ?` list query to local dates, or to the last `default_hours`.
+
+        Returns:
+            (query, params)
+        """
         if start_date and end_date:
             utc_start, _ = to_utc_range(start_date, tz_name)
             _, utc_end = to_utc_range(end_date, tz_name)
-            rows = execute_query(query, (utc_start, utc_end))
-        else:
-            cutoff = (datetime.now(timezone.utc) - timedelta(hours=default_hours)).strftime('%Y-%m-%d %H:%M:%S')
-            query = query.replace('BETWEEN ? AND ?', '>= ?')
-            rows = execute_query(query, (cutoff,))
-        return rows
+            return query, (utc_start, utc_end)
+        cutoff = (datetime.now(timezone.utc) - timedelta(hours=default_hours)).strftime('%Y-%m-%d %H:%M:%S')
+        return query.replace('BETWEEN ? AND ?', '>= ?'), (cutoff,)
+
+    @staticmethod
+    def get_list_with_filter(query, start_date, end_date, tz_name='UTC', default_hours=24):
+        return execute_query(*DataAccess.list_filter(query, start_date, end_date, tz_name, default_hours))
+
+    @staticmethod
+    def get_list_page(query, start_date, end_date, tz_name='UTC', limit=LIST_PAGE_DEFAULT,
+                      cursor=None, alias=''):
+        """
+        One keyset page of a list query, newest first.
+
+        `query` is a get_list_with_filter() query selecting id and timestamp
+        as its first two columns and ending in `ORDER BY <alias>timestamp DESC`.
+        Pages are ordered by (timestamp, id) DESC and continue strictly after
+        `cursor`, so each page is an index range scan of `limit` rows no
+        matter how deep it is, and concurrent inserts never shift it.
+
+        Returns:
+            (rows, next_cursor); next_cursor is None on the last page
+        """
+        query, params = DataAccess.list_filter(query, start_date, end_date, tz_name)
+        timestamp_column, id_column = f'{alias}timestamp', f'{alias}id'
+        order_by = f'ORDER BY {timestamp_column} DESC'
+        if cursor:
+            query = query.replace(order_by, f'AND ({timestamp_column}, {id_column}) < (?, ?)\n{order_by}')
+            params += decode_list_cursor(cursor)
+        query = query.replace(order_by, f'{order_by}, {id_column} DESC LIMIT ?')
+        rows = execute_query(query, params + (limit + 1,))
+        if len(rows) <= limit:
+            return rows, None
+        last = rows[limit - 1]
+        return rows[:limit], encode_list_cursor(last[1], last[0])
+
+    @staticmethod
+    def iter_export(name, start_date=None, end_date=None, tz_name='UTC', fetch_rows=EXPORT_FETCH_ROWS):
+        """
+        Yield batches of up to `fetch_rows` rows of an EXPORT_QUERIES export.
+
+        Rows come straight from cursor.fetchmany(), so memory stays constant
+        whatever the range; the pooled connection is held until the
+        generator is exhausted or closed. Dates filter like
+        get_list_with_filter() and are validated before this returns.
+        """
+        _, query = EXPORT_QUERIES[name]
+        params = ()
+        if 'BETWEEN ? AND ?' in query:
+            query, params = DataAccess.list_filter(query, start_date, end_date, tz_name)
+
+        def batches():
+            with get_read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                while rows := cursor.fetchmany(fetch_rows):
+                    yield rows
+        return batches()
 
 
 # ============================================================================
@@ -1092,9 +3230,101 @@ class DataAccess:
 
 class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
 
+    # Persistent connections: every response carries Content-Length (or is
+    # chunked / connection-delimited with Connection: close)
+    protocol_version = 'HTTP/1.1'
+
     # Close idle/slow connections after this many seconds (Slowloris mitigation)
     timeout = REQUEST_TIMEOUT
 
+    # Headers and body are separate writes; don't let Nagle hold the body
+    disable_nagle_algorithm = True
+
+    # Requests handled on this connection, including the current one
+    requests_served = 0
+
+    def handle(self):
+        """Serve requests on one connection until it closes, idles or hits its limit.
+
+        Follow-up requests are awaited for KEEPALIVE_TIMEOUT seconds; the
+        response to request number KEEPALIVE_MAX_REQUESTS says
+        `Connection: close`.
+        """
+        self.close_connection = True
+        while True:
+            self.requests_served += 1
+            self.handle_one_request()
+            if self.close_connection or not self._wait_for_next_request():
+                break
+
+    def handle_one_request(self):
+        """Handle one request, recording it in request_metrics once it has been parsed."""
+        if not isinstance(self.wfile, _CountingWriter):
+            self.wfile = _CountingWriter(self.wfile)
+        self.wfile.bytes = 0
+        self.response_status = None
+        self.metrics_key = None
+        try:
+            super().handle_one_request()
+        finally:
+            if self.metrics_key is not None:
+                request_metrics.end(self.metrics_key, self.response_status, self.wfile.bytes,
+                                    (time.perf_counter() - self.request_started) * 1000)
+            request_context.route = None
+
+    def parse_request(self):
+        """Parse the request line and headers; publish the route for metrics and pool attribution."""
+        if not super().parse_request():
+            return False
+        path = urllib.parse.urlparse(self.path).path
+        request_context.route = f'{self.command} {path}'
+        self.request_started = time.perf_counter()
+        self.metrics_key = (metrics_method(self.command), metrics_route(path))
+        request_metrics.begin(self.metrics_key)
+        return True
+
+    def _wait_for_next_request(self):
+        """Block up to KEEPALIVE_TIMEOUT for the next request; False if idle or closed."""
+        self.connection.settimeout(KEEPALIVE_TIMEOUT)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def send_response(self, code, message=None):
+        """Send the status line, announcing when the connection will close afterwards."""
+        self.response_status = code
+        super().send_response(code, message)
+        if self.requests_served >= KEEPALIVE_MAX_REQUESTS:
+            self.close_connection = True
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+
+    def send_error(self, code, message=None, explain=None):
+        """Send an HTML error page with Content-Length.
+
+        Unlike the stdlib version, a 404 for a bodiless GET/HEAD (e.g. a
+        missing /favicon.ico) keeps the connection; every other error
+        closes it, since the request may be malformed or its body unread.
+        """
+        if code != 404 or self.command not in ('GET', 'HEAD'):
+            self.close_connection = True
+        short, long = self.responses.get(code, ('???', '???'))
+        self.log_error("code %d, message %s", code, message or short)
+        body = (self.error_message_format % {
+            'code': code,
+            'message': html.escape(message or short, quote=False),
+            'explain': html.escape(explain or long, quote=False),
+        }).encode('UTF-8', 'replace')
+        self.send_response(code, message)
+        self.send_header('Content-Type', self.error_content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
     def guess_type(self, path):
         """Override to properly handle .dev extension as HTML."""
         if path.endswith('.html.dev'):
@@ -1106,27 +3336,148 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
         index_file = 'index.html.dev' if DEBUG_STATIC else 'index.html'
         self.send_response(301)
         self.send_header('Location', f'/static/{index_file}')
+        self.send_header('Content-Length', '0')
         self.end_headers()
         return None
 
-    def _set_headers(self, status=200, content_type='application/json'):
+    def _set_headers(self, status=200, content_type='application/json', extra_headers=None):
         self.send_response(status)
         self.send_header('Content-type', content_type)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type, If-None-Match')
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
         self.end_headers()
 
     def _send_json(self, data, status=200):
-        self._set_headers(status)
-        self.wfile.write(json.dumps(data).encode())
+        self._send_json_body(json.dumps(data).encode(), status)
+
+    def _send_json_body(self, body, status=200, etag=None):
+        """Send an encoded JSON body; successful GETs carry an ETag and honour If-None-Match."""
+        if self.command != 'GET' or status != 200:
+            self._write_body(body, status)
+            return
+        etag = etag or content_etag(body)
+        if self._send_not_modified(etag):
+            return
+        self._write_body(body, status, {'ETag': etag, 'Cache-Control': 'no-cache'})
+
+    def _write_body(self, body, status=200, extra_headers=None, content_type='application/json'):
+        """Send headers and body, gzip-encoding /api/* bodies the client accepts.
+
+        Bodies of at least GZIP_MIN_BYTES are compressed when Accept-Encoding
+        allows gzip; the ETag then gets a -gzip suffix so each representation
+        has its own strong validator. Content-Length is always set.
+        """
+        headers = dict(extra_headers or {})
+        if self.path.startswith('/api/'):
+            headers['Vary'] = 'Accept-Encoding'
+            if len(body) >= GZIP_MIN_BYTES and accepts_gzip(self.headers.get('Accept-Encoding')):
+                compressed = gzip_compress(body)
+                logger.info("gzip %s: %d -> %d bytes (ratio %.2f)",
+                            self.path, len(body), len(compressed), len(compressed) / len(body))
+                body = compressed
+                headers['Content-Encoding'] = 'gzip'
+                if 'ETag' in headers:
+                    headers['ETag'] = gzip_etag(headers['ETag'])
+        headers['Content-Length'] = str(len(body))
+        self._set_headers(status, content_type, headers)
+        self.wfile.write(body)
+
+    def _send_not_modified(self, etag, extra_headers=None):
+        """Send 304 and return True when the request's If-None-Match matches `etag`."""
+        if_none_match = self.headers.get('If-None-Match')
+        if not etag_matches(if_none_match, etag):
+            return False
+        # Echo the representation (plain or -gzip) the client holds
+        if if_none_match.strip() != '*':
+            etag = next(tag.strip() for tag in if_none_match.split(',')
+                        if _etag_base(tag) == _etag_base(etag))
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        for name, value in (extra_headers or {'Cache-Control': 'no-cache'}).items():
+            self.send_header(name, value)
+        if self.path.startswith('/api/'):
+            self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        return True
+
+    def _send_cached_json(self, endpoint, tz_name, query_params, compute):
+        """Send compute()'s result as JSON through the response cache (see CACHED_ENDPOINTS).
+
+        Endpoints without a TTL depend only on their tables' data versions,
+        so their ETag is derived from those and a matching If-None-Match is
+        answered before anything is computed or serialized.
+        """
+        deps, ttl = CACHED_ENDPOINTS[endpoint]
+        key = ResponseCache.make_key(endpoint, tz_name, query_params)
+        versions = data_versions.snapshot(deps)
+        etag = version_etag(key, versions) if ttl is None else None
+        if etag and self._send_not_modified(etag):
+            return
+        body = response_cache.get(key)
+        if body is None:
+            body = json.dumps(compute()).encode()
+            response_cache.put(key, body, deps, versions, ttl)
+        self._send_json_body(body, etag=etag)
+
+    def send_head(self):
+        """Serve a static file from the in-memory cache with validators.
+
+        A precompressed `.gz` sibling at least as new as the file is served
+        to clients that accept gzip. Content-hashed names are cacheable
+        forever; everything else is revalidated via ETag / Last-Modified.
+        """
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            return super().send_head()
+
+        st = os.stat(path)
+        content_type = self.guess_type(path)
+        cache_control = (IMMUTABLE_CACHE_CONTROL if HASHED_ASSET_PATTERN.search(os.path.basename(path))
+                         else STATIC_CACHE_CONTROL)
+        validators = {'Cache-Control': cache_control}
+        encoding_headers = {}
+        try:
+            gz_st = os.stat(path + '.gz')
+        except OSError:
+            gz_st = None
+        if gz_st is not None and gz_st.st_mtime_ns >= st.st_mtime_ns:
+            validators['Vary'] = 'Accept-Encoding'
+            if accepts_gzip(self.headers.get('Accept-Encoding')):
+                path, st = path + '.gz', gz_st
+                encoding_headers['Content-Encoding'] = 'gzip'
+
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        if self._send_not_modified(etag, validators):
+            return None
+        if 'If-None-Match' not in self.headers and not_modified_since(
+                self.headers.get('If-Modified-Since'), st.st_mtime):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            for name, value in validators.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return None
+
+        body = static_cache.read(path, st)
+        self.send_response(200)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(st.st_size))
+        self.send_header('Last-Modified', self.date_time_string(st.st_mtime))
+        self.send_header('ETag', etag)
+        for name, value in {**validators, **encoding_headers}.items():
+            self.send_header(name, value)
+        self.end_headers()
+        # Files too large for the cache are streamed from disk
+        return io.BytesIO(body) if body is not None else open(path, 'rb')
 
     def _send_error_json(self, error_msg, status=400):
-        self._set_headers(status)
-        self.wfile.write(json.dumps({'error': error_msg}).encode())
+        self._write_body(json.dumps({'error': error_msg}).encode(), status)
 
     def do_OPTIONS(self):
-        self._set_headers()
+        self._set_headers(extra_headers={'Content-Length': '0'})
 
     def log_message(self, format, *args):
         """Route HTTP request logs through the standard logger."""
@@ -1142,6 +3493,7 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
             if DEBUG_STATIC and path == '/static/index.html':
                 self.send_response(301)
                 self.send_header('Location', '/static/index.html.dev')
+                self.send_header('Content-Length', '0')
                 self.end_headers()
                 return
 
@@ -1159,27 +3511,48 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
                 '/api/dashboard/cv-charts': lambda: self.handle_get_cv_charts(query_params),
                 '/api/dashboard/risk-metrics': lambda: self.handle_get_risk_metrics(query_params),
                 '/api/dashboard/prediction': lambda: self.handle_get_prediction(query_params),
+                '/api/dashboard/bundle': lambda: self.handle_get_dashboard_bundle(query_params),
+                '/api/metrics': lambda: self._send_json({
+                    'response_cache': response_cache.stats(),
+                    'static_cache': static_cache.stats(),
+                    'tls_handshakes': tls_handshakes.stats(),
+                    'group_commit': group_writer.stats() if group_writer else None,
+                    'db_pools': {pool.role: pool.stats() for pool in (_db_read_pool, _db_pool) if pool},
+                }),
+                '/metrics': lambda: self._write_body(
+                    prometheus_metrics(getattr(self.server, '_executor', None)),
+                    content_type='text/plain; version=0.0.4; charset=utf-8'),
             }
 
             if path in route_handlers:
                 route_handlers[path]()
+            elif path.startswith('/api/export/'):
+                self.handle_get_export(path[len('/api/export/'):], query_params)
             else:
                 super().do_GET()
         except Exception as e:
             self._send_error_json(f'Server error: {str(e)}', 500)
 
     def do_POST(self):
+        if self.path.startswith('/api/ingest/'):
+            # Streamed: not subject to MAX_BODY_BYTES
+            self.handle_post_ingest()
+            return
         try:
             content_length = int(self.headers['Content-Length'])
             if content_length > MAX_BODY_BYTES:
+                # The body stays unread, so the connection cannot be reused
+                self.close_connection = True
                 self._send_error_json(f'Request body too large (max {MAX_BODY_BYTES} bytes)', 413)
                 return
             post_data = self.rfile.read(content_length)
             data = json.loads(post_data.decode('utf-8'))
         except (ValueError, json.JSONDecodeError) as e:
+            self.close_connection = True
             self._send_error_json(f'Invalid JSON: {str(e)}', 400)
             return
         except Exception as e:
+            self.close_connection = True
             self._send_error_json(f'Request error: {str(e)}', 400)
             return
 
@@ -1209,6 +3582,8 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
             elif self.path == '/api/nutrition':
                 DataAccess.create_nutrition(data['nutrition_name'], data['kcal'], data['weight'])
                 self._send_json({'success': True}, 201)
+            elif self.path == '/api/batch':
+                self.handle_post_batch(data)
             else:
                 self._send_error_json('Not found', 404)
         except ValueError as e:
@@ -1220,14 +3595,18 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
         try:
             content_length = int(self.headers['Content-Length'])
             if content_length > MAX_BODY_BYTES:
+                # The body stays unread, so the connection cannot be reused
+                self.close_connection = True
                 self._send_error_json(f'Request body too large (max {MAX_BODY_BYTES} bytes)', 413)
                 return
             raw_body = self.rfile.read(content_length)
             data = json.loads(raw_body.decode('utf-8'))
         except (ValueError, json.JSONDecodeError) as e:
+            self.close_connection = True
             self._send_error_json(f'Invalid JSON: {str(e)}', 400)
             return
         except Exception as e:
+            self.close_connection = True
             self._send_error_json(f'Request error: {str(e)}', 400)
             return
 
@@ -1295,25 +3674,44 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
     # API Endpoint Handlers
     # ========================================================================
 
-    def handle_get_list(self, table, query_params):
-        """Generic handler for listing records with date filter."""
+    def _send_list(self, query, query_params, to_record, alias=''):
+        """Send a list query's records: the whole date range, or one keyset page.
+
+        With ?limit= (and ?cursor= from the previous page) the response is
+        {"items": [...], "limit": n, "next_cursor": str|null}; without, it is
+        the plain array of every record in the range.
+        """
         tz_name = parse_tz(query_params, required=False)
         start_date = query_params.get('start_date', [None])[0]
         end_date = query_params.get('end_date', [None])[0]
 
+        try:
+            page = parse_page_params(query_params)
+            if page is not None:
+                limit, cursor = page
+                rows, next_cursor = DataAccess.get_list_page(query, start_date, end_date, tz_name,
+                                                             limit, cursor, alias)
+        except ValueError as e:
+            self._send_error_json(str(e), 400)
+            return
+
+        if page is None:
+            rows = DataAccess.get_list_with_filter(query, start_date, end_date, tz_name)
+            self._send_json([to_record(row) for row in rows])
+            return
+        self._send_json({'items': [to_record(row) for row in rows], 'limit': limit,
+                         'next_cursor': next_cursor})
+
+    def handle_get_list(self, table, query_params):
+        """Generic handler for listing records with date filter."""
         query = f'''SELECT id, timestamp, level FROM {table}
                    WHERE timestamp BETWEEN ? AND ?
                    ORDER BY timestamp DESC'''
 
-        rows = DataAccess.get_list_with_filter(query, start_date, end_date, tz_name)
-        records = [{'id': row[0], 'timestamp': row[1], 'level': row[2]} for row in rows]
-        self._send_json(records)
+        self._send_list(query, query_params,
+                        lambda row: {'id': row[0], 'timestamp': row[1], 'level': row[2]})
 
     def handle_get_intake_list(self, query_params):
-        tz_name = parse_tz(query_params, required=False)
-        start_date = query_params.get('start_date', [None])[0]
-        end_date = query_params.get('end_date', [None])[0]
-
         query = '''SELECT i.id, i.timestamp, i.nutrition_id, n.nutrition_name,
                          i.nutrition_amount, i.nutrition_kcal
                   FROM intake i
@@ -1321,17 +3719,13 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
                   WHERE i.timestamp BETWEEN ? AND ?
                   ORDER BY i.timestamp DESC'''
 
-        rows = DataAccess.get_list_with_filter(query, start_date, end_date, tz_name)
-        records = [{'id': row[0], 'timestamp': row[1], 'nutrition_id': row[2],
-                   'nutrition_name': row[3], 'nutrition_amount': row[4],
-                   'nutrition_kcal': row[5]} for row in rows]
-        self._send_json(records)
+        self._send_list(query, query_params,
+                        lambda row: {'id': row[0], 'timestamp': row[1], 'nutrition_id': row[2],
+                                     'nutrition_name': row[3], 'nutrition_amount': row[4],
+                                     'nutrition_kcal': row[5]},
+                        alias='i.')
 
     def handle_get_supplement_intake_list(self, query_params):
-        tz_name = parse_tz(query_params, required=False)
-        start_date = query_params.get('start_date', [None])[0]
-        end_date = query_params.get('end_date', [None])[0]
-
         query = '''SELECT si.id, si.timestamp, si.supplement_id, s.supplement_name,
                          si.supplement_amount
                   FROM supplement_intake si
@@ -1339,25 +3733,86 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
                   WHERE si.timestamp BETWEEN ? AND ?
                   ORDER BY si.timestamp DESC'''
 
-        rows = DataAccess.get_list_with_filter(query, start_date, end_date, tz_name)
-        records = [{'id': row[0], 'timestamp': row[1], 'supplement_id': row[2],
-                   'supplement_name': row[3], 'supplement_amount': row[4]} for row in rows]
-        self._send_json(records)
+        self._send_list(query, query_params,
+                        lambda row: {'id': row[0], 'timestamp': row[1], 'supplement_id': row[2],
+                                     'supplement_name': row[3], 'supplement_amount': row[4]},
+                        alias='si.')
 
     def handle_get_event_list(self, query_params):
-        tz_name = parse_tz(query_params, required=False)
-        start_date = query_params.get('start_date', [None])[0]
-        end_date = query_params.get('end_date', [None])[0]
-
         query = '''SELECT id, timestamp, event_name, event_notes
                   FROM event
                   WHERE timestamp BETWEEN ? AND ?
                   ORDER BY timestamp DESC'''
 
-        rows = DataAccess.get_list_with_filter(query, start_date, end_date, tz_name)
-        records = [{'id': row[0], 'timestamp': row[1], 'event_name': row[2],
-                   'event_notes': row[3]} for row in rows]
-        self._send_json(records)
+        self._send_list(query, query_params,
+                        lambda row: {'id': row[0], 'timestamp': row[1], 'event_name': row[2],
+                                     'event_notes': row[3]})
+
+    def _send_stream(self, pieces, content_type, extra_headers=None):
+        """Stream an iterable of byte strings without buffering the response.
+
+        HTTP/1.1 requests get `Transfer-Encoding: chunked` (one chunk per
+        piece) and keep their connection; HTTP/1.0 clients read until the
+        connection closes. An error after the headers went out can only be
+        signalled by closing the connection before the terminating chunk.
+        """
+        chunked = self.request_version == 'HTTP/1.1'
+        if not chunked:
+            self.close_connection = True
+        self.send_response(200)
+        self.send_header('Content-type', content_type)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        try:
+            for piece in pieces:
+                if not piece:
+                    continue
+                if chunked:
+                    self.wfile.write(b'%x\r\n%s\r\n' % (len(piece), piece))
+                else:
+                    self.wfile.write(piece)
+            if chunked:
+                self.wfile.write(b'0\r\n\r\n')
+        except Exception as e:
+            self.close_connection = True
+            logger.warning("Stream to %s aborted: %s", self.path, e)
+        finally:
+            if hasattr(pieces, 'close'):
+                pieces.close()
+
+    def handle_get_export(self, name, query_params):
+        """Handle GET /api/export/<name>?format=csv|ndjson - stream a table as CSV or NDJSON."""
+        if name not in EXPORT_QUERIES:
+            self._send_error_json('Not found', 404)
+            return
+        fmt = query_params.get('format', ['csv'])[0]
+        if fmt not in EXPORT_CONTENT_TYPES:
+            self._send_error_json(f'Invalid format: {fmt}', 400)
+            return
+        try:
+            tz_name = parse_tz(query_params, required=False)
+        except ValueError as e:
+            self._send_error_json(str(e), 400)
+            return
+        start_date = query_params.get('start_date', [None])[0]
+        end_date = query_params.get('end_date', [None])[0]
+
+        try:
+            batches = DataAccess.iter_export(name, start_date, end_date, tz_name)
+        except ValueError as e:
+            self._send_error_json(str(e), 400)
+            return
+        columns, _ = EXPORT_QUERIES[name]
+        try:
+            self._send_stream(encode_export_rows(columns, batches, fmt), EXPORT_CONTENT_TYPES[fmt],
+                              {'Content-Disposition': f'attachment; filename="{name}.{fmt}"'})
+        finally:
+            batches.close()  # returns the pooled connection
 
     def handle_get_previous_window_intake(self, query_params):
         try:
@@ -1367,7 +3822,7 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
             return
         prev_start, prev_end = get_previous_time_window(tz_name)
 
-        with get_db_connection() as conn:
+        with get_read_connection() as conn:
             cursor = conn.cursor()
 
             # Get intake records
@@ -1398,38 +3853,22 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
             'supplements': supplement_records
         })
 
-    def handle_get_glucose_chart(self, query_params):
-        tz_name = parse_tz(query_params, required=False)
+    @staticmethod
+    def _chart_range(query_params, tz_name, prefix=''):
+        """UTC (start, end) of the glucose chart; defaults to the current year."""
         today = today_in_tz(tz_name)
-        start_date = query_params.get('start_date', [f'{today.year}-01-01'])[0]
-        end_date = query_params.get('end_date', [f'{today.year}-12-31'])[0]
+        start_date = query_params.get(f'{prefix}start_date', [f'{today.year}-01-01'])[0]
+        end_date = query_params.get(f'{prefix}end_date', [f'{today.year}-12-31'])[0]
 
         utc_start, _ = to_utc_range(start_date, tz_name)
         _, utc_end = to_utc_range(end_date, tz_name)
+        return utc_start, utc_end
 
-        glucose_query = '''SELECT timestamp, level FROM glucose
-                          WHERE timestamp BETWEEN ? AND ?
-                          ORDER BY timestamp'''
-
-        insulin_query = '''SELECT timestamp, level FROM insulin
-                          WHERE timestamp BETWEEN ? AND ?
-                          ORDER BY timestamp'''
-
-        glucose_rows = execute_query(glucose_query, (utc_start, utc_end))
-        insulin_rows = execute_query(insulin_query, (utc_start, utc_end))
-
-        weekly_data = calculate_weekly_mean_both(glucose_rows, insulin_rows)
-        self._send_json(weekly_data)
-
-    def handle_get_summary(self, query_params):
-        try:
-            tz_name = parse_tz(query_params, required=True)
-        except ValueError as e:
-            self._send_error_json(str(e), 400)
-            return
-
+    @staticmethod
+    def _summary_range(query_params, tz_name, prefix=''):
+        """Local (start_date, end_date) of the summary; defaults to the current month."""
         today = today_in_tz(tz_name)
-        start_date = query_params.get('start_date', [f'{today.year}-{today.month:02d}-01'])[0]
+        start_date = query_params.get(f'{prefix}start_date', [f'{today.year}-{today.month:02d}-01'])[0]
 
         # Calculate last day of current month in client timezone
         if today.month == 12:
@@ -1438,72 +3877,100 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
             next_month = date(today.year, today.month + 1, 1)
             default_end = str(date(next_month.year, next_month.month, 1) - timedelta(days=1))
 
-        end_date = query_params.get('end_date', [default_end])[0]
-
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-
-            summary_data = []
-            current_dt = start_dt
+        end_date = query_params.get(f'{prefix}end_date', [default_end])[0]
+        return start_date, end_date
 
-            while current_dt <= end_dt:
-                date_str = current_dt.strftime('%Y-%m-%d')
-                current_date = current_dt.date()
+    @staticmethod
+    def _metrics_end_date(query_params, tz_name, name='end_date'):
+        """End date of the CV/risk windows; defaults to today."""
+        today = today_in_tz(tz_name)
+        end_date_str = query_params.get(name, [today.strftime('%Y-%m-%d')])[0]
+        return datetime.strptime(end_date_str, '%Y-%m-%d').date()
+
+    def handle_post_ingest(self):
+        """Handle POST /api/ingest/<table>[?format=ndjson|csv] - stream rows into glucose/insulin.
+
+        The body is read incrementally (chunked or Content-Length) and
+        inserted in INGEST_BATCH_ROWS batches; the response reports counts
+        and rejected rows. The format defaults from Content-Type.
+        """
+        parsed_url = urllib.parse.urlparse(self.path)
+        table = parsed_url.path[len('/api/ingest/'):]
+        # Until the body has been read to its end the connection cannot be reused
+        keep_alive, self.close_connection = not self.close_connection, True
+        if table not in INGEST_TABLES:
+            self._send_error_json('Not found', 404)
+            return
+        query_params = urllib.parse.parse_qs(parsed_url.query)
+        content_type = self.headers.get('Content-Type', '')
+        fmt = query_params.get('format', ['csv' if 'csv' in content_type else 'ndjson'])[0]
+        if fmt not in ('ndjson', 'csv'):
+            self._send_error_json(f'Invalid format: {fmt}', 400)
+            return
 
-                # Day window: 05:00-16:59 local → UTC
-                day_start_utc = local_5am_utc(current_date, tz_name)
-                day_end_utc = day_start_utc + timedelta(hours=12)
-                day_data = process_time_window_summary(cursor, '☀️', date_str,
-                                                      day_start_utc.strftime('%Y-%m-%d %H:%M:%S'),
-                                                      day_end_utc.strftime('%Y-%m-%d %H:%M:%S'))
-                if day_data:
-                    summary_data.append(day_data)
+        try:
+            lines = iter_body_lines(self.rfile, self.headers)
+            report = ingest_rows(table, iter_ingest_rows(lines, fmt))
+        except ValueError as e:
+            self._send_error_json(str(e), 400)
+            return
+        except Exception as e:
+            self._send_error_json(f'Server error: {str(e)}', 500)
+            return
+        logger.info("Ingested %d/%d %s rows in %d batches (%d rejected)", report['inserted'],
+                    report['received'], table, report['batches'], report['rejected'])
+        if 'aborted' in report:
+            # The rest of the body is unread
+            self._send_json({'error': f"Ingest aborted: {report['aborted']}", **report}, 400)
+            return
+        self.close_connection = not keep_alive
+        self._send_json({'success': True, **report})
 
-                # Night window: 17:00 local to 05:00 next day local → UTC
-                next_date = (current_dt + timedelta(days=1)).date()
-                night_end_utc = local_5am_utc(next_date, tz_name)
-                night_data = process_time_window_summary(cursor, '🌙', date_str,
-                                                        day_end_utc.strftime('%Y-%m-%d %H:%M:%S'),
-                                                        night_end_utc.strftime('%Y-%m-%d %H:%M:%S'))
-                if night_data:
-                    summary_data.append(night_data)
+    def handle_post_batch(self, data):
+        """Handle POST /api/batch - apply {"operations": [...]} in one transaction."""
+        try:
+            results = DataAccess.apply_batch(data.get('operations') if isinstance(data, dict) else None)
+        except BatchError as e:
+            self._send_json({
+                'error': str(e),
+                'results': [{'index': index, 'error': message}
+                            for index, message in sorted(e.errors.items())]
+            }, 400)
+            return
+        self._send_json({'success': True, 'results': results})
 
-                current_dt += timedelta(days=1)
+    def handle_get_glucose_chart(self, query_params):
+        tz_name = parse_tz(query_params, required=False)
+        utc_start, utc_end = self._chart_range(query_params, tz_name)
 
-        self._send_json(summary_data)
+        self._send_cached_json('/api/dashboard/glucose-chart', tz_name, query_params,
+                               lambda: build_glucose_chart(utc_start, utc_end))
 
-    def handle_get_cv_charts(self, query_params):
+    def handle_get_summary(self, query_params):
         try:
             tz_name = parse_tz(query_params, required=True)
         except ValueError as e:
             self._send_error_json(str(e), 400)
             return
 
-        today = today_in_tz(tz_name)
-        end_date_str = query_params.get('end_date', [today.strftime('%Y-%m-%d')])[0]
-        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+        start_date, end_date = self._summary_range(query_params, tz_name)
 
-        start_30_days = (end_date - timedelta(days=30)).strftime('%Y-%m-%d')
-        utc_start, _ = to_utc_range(start_30_days, tz_name)
-        _, utc_end = to_utc_range(end_date_str, tz_name)
+        def compute():
+            with get_read_connection() as conn:
+                return build_summary_timesheet(conn.cursor(), start_date, end_date, tz_name)
 
-        glucose_query = '''SELECT timestamp, level FROM glucose
-                          WHERE timestamp BETWEEN ? AND ?
-                          ORDER BY timestamp'''
-        glucose_rows = execute_query(glucose_query, (utc_start, utc_end))
+        self._send_cached_json('/api/dashboard/summary', tz_name, query_params, compute)
 
-        windows_7d_12h = generate_cv_windows(end_date, 7, 12, tz_name)
-        windows_30d_48h = generate_cv_windows(end_date, 30, 48, tz_name)
-        windows_30d_5d = generate_cv_windows(end_date, 30, 120, tz_name)
+    def handle_get_cv_charts(self, query_params):
+        try:
+            tz_name = parse_tz(query_params, required=True)
+        except ValueError as e:
+            self._send_error_json(str(e), 400)
+            return
 
-        self._send_json({
-            'cv_7d_12h': calculate_cv_data(glucose_rows, windows_7d_12h),
-            'cv_30d_48h': calculate_cv_data(glucose_rows, windows_30d_48h),
-            'cv_30d_5d': calculate_cv_data(glucose_rows, windows_30d_5d)
-        })
+        end_date = self._metrics_end_date(query_params, tz_name)
+        self._send_cached_json('/api/dashboard/cv-charts', tz_name, query_params,
+                               lambda: cv_chart_payload(load_window_metric_sets(end_date, tz_name)))
 
     def handle_get_risk_metrics(self, query_params):
         try:
@@ -1512,34 +3979,33 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
             self._send_error_json(str(e), 400)
             return
 
-        today = today_in_tz(tz_name)
-        end_date_str = query_params.get('end_date', [today.strftime('%Y-%m-%d')])[0]
-        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+        end_date = self._metrics_end_date(query_params, tz_name)
+        self._send_cached_json('/api/dashboard/risk-metrics', tz_name, query_params,
+                               lambda: risk_metrics_payload(load_window_metric_sets(end_date, tz_name)))
 
-        start_30_days = (end_date - timedelta(days=30)).strftime('%Y-%m-%d')
-        utc_start, _ = to_utc_range(start_30_days, tz_name)
-        _, utc_end = to_utc_range(end_date_str, tz_name)
+    def handle_get_dashboard_bundle(self, query_params):
+        """Handle GET /api/dashboard/bundle - every dashboard section in one response.
 
-        glucose_query = '''SELECT timestamp, level FROM glucose
-                          WHERE timestamp BETWEEN ? AND ?
-                          ORDER BY timestamp'''
-        glucose_rows = execute_query(glucose_query, (utc_start, utc_end))
+        Section parameters carry the section name as a prefix
+        (chart_start_date, summary_end_date, cv_end_date, risk_end_date, ...)
+        and default exactly like the individual endpoints.
+        """
+        try:
+            tz_name = parse_tz(query_params, required=True)
+        except ValueError as e:
+            self._send_error_json(str(e), 400)
+            return
 
-        windows_7d_12h = generate_cv_windows(end_date, 7, 12, tz_name)
-        windows_30d_48h = generate_cv_windows(end_date, 30, 48, tz_name)
-        windows_30d_5d = generate_cv_windows(end_date, 30, 120, tz_name)
+        chart_range = self._chart_range(query_params, tz_name, prefix='chart_')
+        summary_range = self._summary_range(query_params, tz_name, prefix='summary_')
+        cv_end_date = self._metrics_end_date(query_params, tz_name, 'cv_end_date')
+        risk_end_date = self._metrics_end_date(query_params, tz_name, 'risk_end_date')
+        lookback_days = int(query_params.get('lookback_days', [30])[0])
 
-        self._send_json({
-            'lbgi_7d_12h': calculate_risk_metric_data(glucose_rows, windows_7d_12h, 'lbgi'),
-            'lbgi_30d_48h': calculate_risk_metric_data(glucose_rows, windows_30d_48h, 'lbgi'),
-            'lbgi_30d_5d': calculate_risk_metric_data(glucose_rows, windows_30d_5d, 'lbgi'),
-            'hbgi_7d_12h': calculate_risk_metric_data(glucose_rows, windows_7d_12h, 'hbgi'),
-            'hbgi_30d_48h': calculate_risk_metric_data(glucose_rows, windows_30d_48h, 'hbgi'),
-            'hbgi_30d_5d': calculate_risk_metric_data(glucose_rows, windows_30d_5d, 'hbgi'),
-            'adrr_7d_12h': calculate_adrr_data(glucose_rows, windows_7d_12h),
-            'adrr_30d_48h': calculate_adrr_data(glucose_rows, windows_30d_48h),
-            'adrr_30d_5d': calculate_adrr_data(glucose_rows, windows_30d_5d)
-        })
+        self._send_cached_json('/api/dashboard/bundle', tz_name, query_params,
+                               lambda: build_dashboard_bundle(tz_name, chart_range, summary_range,
+                                                              cv_end_date, risk_end_date,
+                                                              lookback_days))
 
     def handle_get_prediction(self, query_params):
         """Handle GET /api/dashboard/prediction - Get glucose and insulin prediction."""
@@ -1550,17 +4016,17 @@ class GlucoseHandler(http.server.SimpleHTTPRequestHandler):
             return
 
         lookback_days = int(query_params.get('lookback_days', [30])[0])
+        full_recompute = query_params.get('recompute', ['false'])[0].lower() == 'true'
 
         try:
-            result = predict_next_window(lookback_days, tz_name)
-            self._send_json(result)
+            if full_recompute:
+                self._send_json(predict_next_window(lookback_days, tz_name, full_recompute=True))
+            else:
+                self._send_cached_json('/api/dashboard/prediction', tz_name, query_params,
+                                       lambda: predict_next_window(lookback_days, tz_name))
         except Exception as e:
             logger.exception("Prediction error: %s", e)
-            self._send_json({
-                'error': 'prediction_failed',
-                'message': str(e),
-                'warnings': ['Unable to generate prediction due to error']
-            }, status=500)
+            self._send_json(prediction_error(e), status=500)
 
 
 # ============================================================================
@@ -1605,20 +4071,101 @@ def create_ssl_context():
     # protocol, so set_ciphers() is not needed.
     context.minimum_version = ssl.TLSVersion.TLSv1_3
 
+    # Stateless session tickets let reconnecting clients resume without the
+    # asymmetric crypto of a full handshake. The verified client certificate
+    # travels inside the ticket; see check_resumed_certificate(). Ticket keys
+    # are per process, so tickets do not survive a restart.
+    context.num_tickets = TLS_SESSION_TICKETS
+
     # Check certificate expiration
     check_certificate_expiration(SERVER_CERT_PATH)
 
     return context
 
 
-def log_client_certificate(request, client_address):
-    """Log client certificate information."""
+def check_resumed_certificate(request):
+    """Re-check the client certificate of a resumed TLS session.
+
+    Resumption skips chain verification: the certificate verified by the
+    original full handshake is restored from the session ticket. Require
+    that it is present and has not expired since.
+    """
+    if not request.session_reused:
+        return
+    cert = request.getpeercert()
+    if not cert:
+        raise ssl.SSLCertVerificationError('resumed session has no client certificate')
+    if ssl.cert_time_to_seconds(cert['notAfter']) < time.time():
+        raise ssl.SSLCertVerificationError('client certificate of resumed session has expired')
+
+
+class HandshakeStats:
+    """Counters and timings of completed TLS handshakes, full vs resumed."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._kinds = {kind: {'count': 0, 'timed': 0, 'total_ms': 0.0, 'max_ms': 0.0}
+                       for kind in ('full', 'resumed')}
+        self._ciphers = defaultdict(int)
+        self._clients = defaultdict(lambda: {'full': 0, 'resumed': 0})
+        self._failures = 0
+
+    def record(self, resumed, cipher, cn, elapsed_ms=None):
+        kind = 'resumed' if resumed else 'full'
+        with self._lock:
+            counts = self._kinds[kind]
+            counts['count'] += 1
+            if elapsed_ms is not None:
+                counts['timed'] += 1
+                counts['total_ms'] += elapsed_ms
+                counts['max_ms'] = max(counts['max_ms'], elapsed_ms)
+            self._ciphers[cipher] += 1
+            self._clients[cn][kind] += 1
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+
+    def stats(self):
+        """Handshake counts, resumption rate and mean/max timings per kind."""
+        with self._lock:
+            kinds = {}
+            for kind, counts in self._kinds.items():
+                kinds[kind] = {
+                    'count': counts['count'],
+                    'avg_ms': round(counts['total_ms'] / counts['timed'], 3) if counts['timed'] else None,
+                    'max_ms': round(counts['max_ms'], 3),
+                }
+            total = kinds['full']['count'] + kinds['resumed']['count']
+            return {
+                **kinds,
+                'resumption_rate': round(kinds['resumed']['count'] / total, 4) if total else None,
+                'failures': self._failures,
+                'ciphers': dict(self._ciphers),
+                'clients': {cn: dict(counts) for cn, counts in sorted(self._clients.items())},
+            }
+
+
+tls_handshakes = HandshakeStats()
+
+
+def log_client_certificate(request, client_address, elapsed=None):
+    """Log client certificate information and record the handshake.
+
+    `elapsed` is the handshake duration in seconds when the caller timed it.
+    """
     try:
         cert = request.getpeercert()
         if cert:
             subject = dict(x[0] for x in cert['subject'])
             cn = subject.get('commonName', 'Unknown')
-            logger.info("Client connected: %s from %s", cn, client_address[0])
+            resumed = request.session_reused
+            cipher = request.cipher()[0]
+            elapsed_ms = elapsed * 1000 if elapsed is not None else None
+            tls_handshakes.record(resumed, cipher, cn, elapsed_ms)
+            logger.info("Client connected: %s from %s (%s handshake, %s%s)", cn, client_address[0],
+                        'resumed' if resumed else 'full', cipher,
+                        f', {elapsed_ms:.1f} ms' if elapsed_ms is not None else '')
     except Exception as e:
         logger.warning("Could not retrieve client certificate: %s", e)
 
@@ -1653,38 +4200,265 @@ class SecureGlucoseHandler(GlucoseHandler):
         # super().setup() applies REQUEST_TIMEOUT to the socket, so the
         # handshake is bounded by that timeout.
         super().setup()
+        started = time.perf_counter()
         try:
             self.request.do_handshake()
+            elapsed = time.perf_counter() - started
+            check_resumed_certificate(self.request)
         except (ssl.SSLError, OSError) as e:
+            tls_handshakes.record_failure()
             logger.warning("TLS handshake failed from %s: %s", self.client_address[0], e)
             e.skip_traceback = True
             raise
-        log_client_certificate(self.request, self.client_address)
+        log_client_certificate(self.request, self.client_address, elapsed)
 
 
-def main():
-    if not os.path.exists(DB_PATH):
-        logger.error("Database %s not found. Please run init_db.py first.", DB_PATH)
-        return
+# ============================================================================
+# asyncio Engine
+# ============================================================================
 
-    global _db_pool
-    _db_pool = ConnectionPool(DB_PATH, size=DB_POOL_SIZE)
+# Request head limit of http.server: a 64 KiB request line plus 100 header lines
+MAX_REQUEST_HEAD_BYTES = (http.client._MAXHEADERS + 1) * (http.client._MAXLINE + 1)
 
-    # Set WAL mode once at startup (it persists in the DB file)
-    with get_db_connection() as conn:
-        conn.execute('PRAGMA journal_mode=WAL')
 
+class _BridgeReader:
+    """
+    Blocking file-like view of an asyncio StreamReader for handler threads.
+
+    The event loop fills the buffer with the request head (and a small
+    body) before a handler runs; anything more (chunked or large bodies)
+    is pulled from the loop on demand. Bytes read past the current request
+    stay buffered for the next request on the connection.
+    """
+
+    def __init__(self, reader, loop, timeout):
+        self._reader = reader
+        self._loop = loop
+        self._timeout = timeout
+        self._buffer = bytearray()
+        self._eof = False
+
+    # -- event loop side --------------------------------------------------
+
+    async def fill(self, size=INGEST_READ_BYTES, timeout=None):
+        """Read up to `size` more bytes into the buffer; False at EOF."""
+        data = await asyncio.wait_for(self._reader.read(size),
+                                      self._timeout if timeout is None else timeout)
+        if not data:
+            self._eof = True
+            return False
+        self._buffer += data
+        return True
+
+    async def wait_for_request(self, idle_timeout=None):
+        """Buffer a full request head plus a Content-Length body up to MAX_BODY_BYTES.
+
+        The first byte is awaited for `idle_timeout` seconds (keep-alive),
+        the rest for the read timeout. Returns False when the client closed
+        the connection before sending a complete request head. A head over
+        MAX_REQUEST_HEAD_BYTES is left to the handler (which rejects it).
+        """
+        if not self._buffer and not await self.fill(timeout=idle_timeout):
+            return False
+        while b'\r\n\r\n' not in self._buffer:
+            if len(self._buffer) > MAX_REQUEST_HEAD_BYTES:
+                return True
+            if not await self.fill():
+                return False
+        head_end = self._buffer.index(b'\r\n\r\n') + 4
+        match = re.search(rb'(?im)^content-length:\s*(\d+)\s*$', bytes(self._buffer[:head_end]))
+        if match and int(match.group(1)) <= MAX_BODY_BYTES:
+            while len(self._buffer) < head_end + int(match.group(1)):
+                if not await self.fill():
+                    break
+        return True
+
+    # -- handler thread side ----------------------------------------------
+
+    def _fill_blocking(self):
+        if self._eof:
+            return False
+        future = asyncio.run_coroutine_threadsafe(self.fill(), self._loop)
+        try:
+            return future.result()
+        except asyncio.TimeoutError:
+            raise TimeoutError('Read timed out')
+
+    def read(self, size=-1):
+        while (size < 0 or len(self._buffer) < size) and self._fill_blocking():
+            pass
+        size = len(self._buffer) if size < 0 else min(size, len(self._buffer))
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def readline(self, limit=-1):
+        while True:
+            newline = self._buffer.find(b'\n')
+            if newline >= 0 or (0 <= limit <= len(self._buffer)) or not self._fill_blocking():
+                break
+        end = newline + 1 if newline >= 0 else len(self._buffer)
+        if limit >= 0:
+            end = min(end, limit)
+        data = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return data
+
+
+class _BridgeWriter:
+    """
+    Blocking file-like writer that hands data to an asyncio StreamWriter and waits for drain.
+
+    A client that stops reading fails the write after `timeout` seconds:
+    the transport is aborted and this and every later write raise, so the
+    handler gives up its executor thread (and any pooled connection).
+    """
+
+    def __init__(self, writer, loop, timeout):
+        self._writer = writer
+        self._loop = loop
+        self._timeout = timeout
+        self._aborted = False
+
+    async def _write(self, data):
+        self._writer.write(data)
+        try:
+            await asyncio.wait_for(self._writer.drain(), self._timeout)
+        except asyncio.TimeoutError:
+            self._writer.transport.abort()
+            raise
+
+    def write(self, data):
+        if self._aborted:
+            raise ConnectionAbortedError('Connection aborted')
+        future = asyncio.run_coroutine_threadsafe(self._write(bytes(data)), self._loop)
+        try:
+            future.result()
+        except asyncio.TimeoutError:
+            self._aborted = True
+            raise TimeoutError('Write timed out')
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+class _AsyncBridgeMixin:
+    """Runs exactly one request of a GlucoseHandler on bridged (rfile, wfile) streams.
+
+    Placed before the handler in the MRO: the connection (socket setup,
+    TLS handshake, keep-alive loop) belongs to the event loop, not to the
+    handler thread.
+    """
+
+    def setup(self):
+        self.rfile, self.wfile, self.requests_served = self.request
+        self.connection = None
+
+    def handle(self):
+        self.close_connection = True
+        self.handle_one_request()
+
+    def finish(self):
+        pass
+
+
+class AsyncGlucoseServer:
+    """
+    asyncio engine (SERVER_ENGINE=asyncio): connections are coroutines.
+
+    TLS handshakes, request heads, small bodies and idle keep-alive waits
+    are awaited on the event loop; only the handler itself (routing, SQLite,
+    JSON) runs on a bounded ThreadPoolExecutor of MAX_WORKERS threads, so
+    idle or slow clients do not hold a worker.
+    """
+
+    def __init__(self, handler_class, port, ssl_context=None, max_workers=MAX_WORKERS):
+        self._handler_class = type(f'Async{handler_class.__name__}', (_AsyncBridgeMixin, handler_class), {})
+        self._port = port
+        self._ssl_context = ssl_context
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='handler')
+
+    def _run_handler(self, rfile, wfile, requests_served, client_address):
+        """Executor side: handle one request; returns True to keep the connection open."""
+        handler = self._handler_class((rfile, wfile, requests_served), client_address, self)
+        return not handler.close_connection
+
+    async def handle_connection(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        client_address = writer.get_extra_info('peername')
+        ssl_object = writer.get_extra_info('ssl_object')
+        if ssl_object is not None:
+            try:
+                check_resumed_certificate(ssl_object)
+            except ssl.SSLError as e:
+                tls_handshakes.record_failure()
+                logger.warning("TLS handshake failed from %s: %s", client_address[0], e)
+                writer.close()
+                return
+            # asyncio performs the handshake itself, so it is not timed here
+            log_client_certificate(ssl_object, client_address)
+
+        rfile = _BridgeReader(reader, loop, REQUEST_TIMEOUT)
+        wfile = _BridgeWriter(writer, loop, REQUEST_TIMEOUT)
+        requests_served = 0
+        try:
+            while await rfile.wait_for_request(KEEPALIVE_TIMEOUT if requests_served else None):
+                requests_served += 1
+                keep_alive = await loop.run_in_executor(self._executor, self._run_handler, rfile,
+                                                        wfile, requests_served, client_address)
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, ConnectionError) as e:
+            logger.debug("Connection from %s closed: %s", client_address[0], e)
+        except Exception:
+            logger.exception("Unhandled exception processing request from %s", client_address[0])
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):
+                pass
+
+    async def serve_forever(self):
+        server = await asyncio.start_server(
+            self.handle_connection, host='', port=self._port, ssl=self._ssl_context,
+            ssl_handshake_timeout=REQUEST_TIMEOUT if self._ssl_context else None,
+            reuse_address=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self._executor.shutdown(wait=False)
+
+
+def run_server():
+    """Serve requests with the configured engine until interrupted."""
     GlucoseServer.allow_reuse_address = True
     GlucoseServer.daemon_threads = True
 
-    if MTLS_ENABLED:
-        # Check if certificate files exist
-        if not all(os.path.exists(p) for p in [CA_CERT_PATH, SERVER_CERT_PATH, SERVER_KEY_PATH]):
-            logger.error("mTLS is enabled but certificate files not found!")
-            logger.error("Run ./generate-certs.sh to generate certificates, "
-                         "or set MTLS_ENABLED=false to disable mTLS.")
-            return
+    # Check if certificate files exist
+    if MTLS_ENABLED and not all(os.path.exists(p) for p in [CA_CERT_PATH, SERVER_CERT_PATH, SERVER_KEY_PATH]):
+        logger.error("mTLS is enabled but certificate files not found!")
+        logger.error("Run ./generate-certs.sh to generate certificates, "
+                     "or set MTLS_ENABLED=false to disable mTLS.")
+        return
+
+    if SERVER_ENGINE == 'asyncio':
+        ssl_context = create_ssl_context() if MTLS_ENABLED else None
+        if MTLS_ENABLED:
+            logger.info("mTLS enabled - Server running at https://localhost:%d/ (asyncio engine)", PORT)
+        else:
+            logger.warning("mTLS is DISABLED - running in insecure mode!")
+            logger.info("Server running at http://localhost:%d/ (asyncio engine)", PORT)
+        logger.info("Static: %s",
+                    'index.html.dev (DEBUG_STATIC)' if DEBUG_STATIC else 'index.html')
+        # The handshake-logging SecureGlucoseHandler.setup() is replaced by the engine
+        handler_class = SecureGlucoseHandler if MTLS_ENABLED else GlucoseHandler
+        asyncio.run(AsyncGlucoseServer(handler_class, PORT, ssl_context).serve_forever())
+        return
 
+    if MTLS_ENABLED:
         # Create HTTPS server with mTLS (multi-threaded)
         with GlucoseServer(("", PORT), SecureGlucoseHandler) as httpd:
             ssl_context = create_ssl_context()
@@ -1712,5 +4486,47 @@ def main():
             httpd.serve_forever()
 
 
+def main():
+    if not os.path.exists(DB_PATH):
+        logger.error("Database %s not found. Please run init_db.py first.", DB_PATH)
+        return
+
+    if DB_PROFILE not in CONNECTION_PROFILES:
+        logger.error("Unknown DB_PROFILE %r (choose from: %s)", DB_PROFILE, ', '.join(CONNECTION_PROFILES))
+        return
+    profile = CONNECTION_PROFILES[DB_PROFILE]
+
+    global _db_pool, _db_read_pool, group_writer
+    _db_pool = ConnectionPool(DB_PATH, size=DB_WRITE_POOL_SIZE, timeout=DB_WRITE_TIMEOUT,
+                              pragmas=profile['writer'])
+
+    # Set WAL mode once at startup (it persists in the DB file); read-only
+    # connections are opened afterwards, while the writer keeps the WAL open
+    with get_db_connection() as conn:
+        conn.execute('PRAGMA journal_mode=WAL')
+    _db_read_pool = ConnectionPool(DB_PATH, size=DB_READ_POOL_SIZE, timeout=DB_READ_TIMEOUT,
+                                   read_only=True, pragmas=profile['reader'])
+    logger.info("Database pools: %d read-only (timeout %ds), %d writer (timeout %ds)",
+                DB_READ_POOL_SIZE, DB_READ_TIMEOUT, DB_WRITE_POOL_SIZE, DB_WRITE_TIMEOUT)
+    for pool in (_db_read_pool, _db_pool):
+        logger.info("Database %s profile %r: %s", pool.role, DB_PROFILE,
+                    ' '.join(f'{name}={value}' for name, value in pool.settings().items()))
+
+    ensure_rollups()
+
+    if GROUP_COMMIT:
+        group_writer = GroupCommitWriter().start()
+        logger.info("Group commit: window %.1f ms, up to %d writes per transaction",
+                    GROUP_COMMIT_WINDOW_MS, GROUP_COMMIT_MAX_OPS)
+
+    try:
+        run_server()
+    finally:
+        if group_writer is not None:
+            # Later writes commit directly; queued ones are drained by stop()
+            writer, group_writer = group_writer, None
+            writer.stop()
+
+
 if __name__ == '__main__':
     main()
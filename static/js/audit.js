@@ -1,24 +1,78 @@
 // Audit and Edit functionality
 
+// Rows per audit page; further pages load on demand ("Load more")
+const AUDIT_PAGE_SIZE = 100;
+
 /**
- * Load glucose audit/edit list
+ * Fetch one keyset page ({ items, next_cursor }) of an audit list.
+ * The first page (next = null) applies the section's date filter; later
+ * pages get the page's `next` ({ cursor, startDate, endDate }) so they keep
+ * that filter even if the inputs were edited since
  */
-async function loadGlucoseAudit() {
-    const startDate = document.getElementById('glucose-start-filter').value;
-    const endDate = document.getElementById('glucose-end-filter').value;
+async function fetchAuditPage(resource, filterPrefix, next) {
+    const startDate = next ? next.startDate : document.getElementById(`${filterPrefix}-start-filter`).value;
+    const endDate = next ? next.endDate : document.getElementById(`${filterPrefix}-end-filter`).value;
     
-    let url = `${API_BASE}/glucose?tz=${encodeURIComponent(getClientTz())}`;
+    let url = `${API_BASE}/${resource}?tz=${encodeURIComponent(getClientTz())}&limit=${AUDIT_PAGE_SIZE}`;
     if (startDate && endDate) {
         url += `&start_date=${startDate}&end_date=${endDate}`;
     }
+    if (next) {
+        url += `&cursor=${encodeURIComponent(next.cursor)}`;
+    }
     
     const response = await fetch(url);
-    const data = await response.json();
+    const page = await response.json();
+    page.next = page.next_cursor ? { cursor: page.next_cursor, startDate, endDate } : null;
+    return page;
+}
+
+/**
+ * Append a page of rows to an audit table, followed by a "Load more" row
+ * when the server reports another page
+ */
+function appendAuditRows(tbody, page, renderRow, bindRows, loadMore) {
+    const previousLoadMore = tbody.querySelector('.load-more-row');
+    if (previousLoadMore) {
+        previousLoadMore.remove();
+    }
     
+    const rows = document.createDocumentFragment();
+    page.items.forEach(record => rows.appendChild(renderRow(record)));
+    bindRows(rows);
+    tbody.appendChild(rows);
+    
+    if (page.next) {
+        const tr = document.createElement('tr');
+        tr.className = 'load-more-row';
+        const td = document.createElement('td');
+        td.colSpan = tbody.closest('table').querySelectorAll('thead th').length;
+        const btn = document.createElement('button');
+        btn.type = 'button';
+        btn.textContent = 'Load more';
+        btn.addEventListener('click', () => loadMore(page.next));
+        td.appendChild(btn);
+        tr.appendChild(td);
+        tbody.appendChild(tr);
+    }
+}
+
+/**
+ * Load glucose audit/edit list
+ */
+async function loadGlucoseAudit() {
+    document.getElementById('glucose-audit-body').innerHTML = '';
+    await appendGlucoseAuditPage(null);
+}
+
+/**
+ * Fetch and append one page of the glucose audit list
+ */
+async function appendGlucoseAuditPage(next) {
+    const page = await fetchAuditPage('glucose', 'glucose', next);
     const tbody = document.getElementById('glucose-audit-body');
-    tbody.innerHTML = '';
     
-    data.forEach(record => {
+    appendAuditRows(tbody, page, record => {
         const tr = document.createElement('tr');
         tr.innerHTML = `
             <td>${record.id}</td>
@@ -29,15 +83,15 @@ async function loadGlucoseAudit() {
                 <button class="delete-btn" data-id="${record.id}">Delete</button>
             </td>
         `;
-        tbody.appendChild(tr);
-    });
-
-    tbody.querySelectorAll('.edit-btn').forEach(btn => {
-        btn.addEventListener('click', () => editGlucose(btn.dataset.id, btn.dataset.ts, btn.dataset.level));
-    });
-    tbody.querySelectorAll('.delete-btn').forEach(btn => {
-        btn.addEventListener('click', () => deleteGlucose(btn.dataset.id));
-    });
+        return tr;
+    }, rows => {
+        rows.querySelectorAll('.edit-btn').forEach(btn => {
+            btn.addEventListener('click', () => editGlucose(btn.dataset.id, btn.dataset.ts, btn.dataset.level));
+        });
+        rows.querySelectorAll('.delete-btn').forEach(btn => {
+            btn.addEventListener('click', () => deleteGlucose(btn.dataset.id));
+        });
+    }, appendGlucoseAuditPage);
 }
 
 /**
@@ -88,21 +142,18 @@ async function deleteGlucose(id) {
  * Load insulin audit/edit list
  */
 async function loadInsulinAudit() {
-    const startDate = document.getElementById('insulin-start-filter').value;
-    const endDate = document.getElementById('insulin-end-filter').value;
-    
-    let url = `${API_BASE}/insulin?tz=${encodeURIComponent(getClientTz())}`;
-    if (startDate && endDate) {
-        url += `&start_date=${startDate}&end_date=${endDate}`;
-    }
-    
-    const response = await fetch(url);
-    const data = await response.json();
-    
+    document.getElementById('insulin-audit-body').innerHTML = '';
+    await appendInsulinAuditPage(null);
+}
+
+/**
+ * Fetch and append one page of the insulin audit list
+ */
+async function appendInsulinAuditPage(next) {
+    const page = await fetchAuditPage('insulin', 'insulin', next);
     const tbody = document.getElementById('insulin-audit-body');
-    tbody.innerHTML = '';
     
-    data.forEach(record => {
+    appendAuditRows(tbody, page, record => {
         const tr = document.createElement('tr');
         tr.innerHTML = `
             <td>${record.id}</td>
@@ -113,15 +164,15 @@ async function loadInsulinAudit() {
                 <button class="delete-btn" data-id="${record.id}">Delete</button>
             </td>
         `;
-        tbody.appendChild(tr);
-    });
-
-    tbody.querySelectorAll('.edit-btn').forEach(btn => {
-        btn.addEventListener('click', () => editInsulin(btn.dataset.id, btn.dataset.ts, btn.dataset.level));
-    });
-    tbody.querySelectorAll('.delete-btn').forEach(btn => {
-        btn.addEventListener('click', () => deleteInsulin(btn.dataset.id));
-    });
+        return tr;
+    }, rows => {
+        rows.querySelectorAll('.edit-btn').forEach(btn => {
+            btn.addEventListener('click', () => editInsulin(btn.dataset.id, btn.dataset.ts, btn.dataset.level));
+        });
+        rows.querySelectorAll('.delete-btn').forEach(btn => {
+            btn.addEventListener('click', () => deleteInsulin(btn.dataset.id));
+        });
+    }, appendInsulinAuditPage);
 }
 
 /**
@@ -172,21 +223,18 @@ async function deleteInsulin(id) {
  * Load intake (nutrition) audit list
  */
 async function loadIntakeAudit() {
-    const startDate = document.getElementById('intake-start-filter').value;
-    const endDate = document.getElementById('intake-end-filter').value;
-    
-    let url = `${API_BASE}/intake?tz=${encodeURIComponent(getClientTz())}`;
-    if (startDate && endDate) {
-        url += `&start_date=${startDate}&end_date=${endDate}`;
-    }
-    
-    const response = await fetch(url);
-    const data = await response.json();
-    
+    document.getElementById('intake-audit-body').innerHTML = '';
+    await appendIntakeAuditPage(null);
+}
+
+/**
+ * Fetch and append one page of the intake audit list
+ */
+async function appendIntakeAuditPage(next) {
+    const page = await fetchAuditPage('intake', 'intake', next);
     const tbody = document.getElementById('intake-audit-body');
-    tbody.innerHTML = '';
     
-    data.forEach(record => {
+    appendAuditRows(tbody, page, record => {
         const tr = document.createElement('tr');
         tr.innerHTML = `
             <td>${record.id}</td>
@@ -204,18 +252,18 @@ async function loadIntakeAudit() {
                 <button class="delete-btn" data-id="${record.id}">Delete</button>
             </td>
         `;
-        tbody.appendChild(tr);
-    });
-
-    tbody.querySelectorAll('.edit-btn').forEach(btn => {
-        btn.addEventListener('click', () => editIntake(
-            btn.dataset.id, btn.dataset.ts, btn.dataset.nid,
-            btn.dataset.name, btn.dataset.amount
-        ));
-    });
-    tbody.querySelectorAll('.delete-btn').forEach(btn => {
-        btn.addEventListener('click', () => deleteIntake(btn.dataset.id));
-    });
+        return tr;
+    }, rows => {
+        rows.querySelectorAll('.edit-btn').forEach(btn => {
+            btn.addEventListener('click', () => editIntake(
+                btn.dataset.id, btn.dataset.ts, btn.dataset.nid,
+                btn.dataset.name, btn.dataset.amount
+            ));
+        });
+        rows.querySelectorAll('.delete-btn').forEach(btn => {
+            btn.addEventListener('click', () => deleteIntake(btn.dataset.id));
+        });
+    }, appendIntakeAuditPage);
 }
 
 /**
@@ -326,21 +374,18 @@ async function deleteIntake(id) {
  * Load supplement intake audit list
  */
 async function loadSupplementIntakeAudit() {
-    const startDate = document.getElementById('supplement-intake-start-filter').value;
-    const endDate = document.getElementById('supplement-intake-end-filter').value;
-    
-    let url = `${API_BASE}/supplement-intake?tz=${encodeURIComponent(getClientTz())}`;
-    if (startDate && endDate) {
-        url += `&start_date=${startDate}&end_date=${endDate}`;
-    }
-    
-    const response = await fetch(url);
-    const data = await response.json();
-    
+    document.getElementById('supplement-intake-audit-body').innerHTML = '';
+    await appendSupplementIntakeAuditPage(null);
+}
+
+/**
+ * Fetch and append one page of the supplement intake audit list
+ */
+async function appendSupplementIntakeAuditPage(next) {
+    const page = await fetchAuditPage('supplement-intake', 'supplement-intake', next);
     const tbody = document.getElementById('supplement-intake-audit-body');
-    tbody.innerHTML = '';
     
-    data.forEach(record => {
+    appendAuditRows(tbody, page, record => {
         const tr = document.createElement('tr');
         tr.innerHTML = `
             <td>${record.id}</td>
@@ -351,12 +396,12 @@ async function loadSupplementIntakeAudit() {
                 <button class="delete-btn" data-id="${record.id}">Delete</button>
             </td>
         `;
-        tbody.appendChild(tr);
-    });
-
-    tbody.querySelectorAll('.delete-btn').forEach(btn => {
-        btn.addEventListener('click', () => deleteSupplementIntake(btn.dataset.id));
-    });
+        return tr;
+    }, rows => {
+        rows.querySelectorAll('.delete-btn').forEach(btn => {
+            btn.addEventListener('click', () => deleteSupplementIntake(btn.dataset.id));
+        });
+    }, appendSupplementIntakeAuditPage);
 }
 
 /**
@@ -381,21 +426,18 @@ async function deleteSupplementIntake(id) {
  * Load event audit list
  */
 async function loadEventAudit() {
-    const startDate = document.getElementById('event-start-filter').value;
-    const endDate = document.getElementById('event-end-filter').value;
-    
-    let url = `${API_BASE}/event?tz=${encodeURIComponent(getClientTz())}`;
-    if (startDate && endDate) {
-        url += `&start_date=${startDate}&end_date=${endDate}`;
-    }
-    
-    const response = await fetch(url);
-    const data = await response.json();
-    
+    document.getElementById('event-audit-body').innerHTML = '';
+    await appendEventAuditPage(null);
+}
+
+/**
+ * Fetch and append one page of the event audit list
+ */
+async function appendEventAuditPage(next) {
+    const page = await fetchAuditPage('event', 'event', next);
     const tbody = document.getElementById('event-audit-body');
-    tbody.innerHTML = '';
     
-    data.forEach(record => {
+    appendAuditRows(tbody, page, record => {
         const tr = document.createElement('tr');
         tr.innerHTML = `
             <td>${record.id}</td>
@@ -406,12 +448,12 @@ async function loadEventAudit() {
                 <button class="delete-btn" data-id="${record.id}">Delete</button>
             </td>
         `;
-        tbody.appendChild(tr);
-    });
-
-    tbody.querySelectorAll('.delete-btn').forEach(btn => {
-        btn.addEventListener('click', () => deleteEvent(btn.dataset.id));
-    });
+        return tr;
+    }, rows => {
+        rows.querySelectorAll('.delete-btn').forEach(btn => {
+            btn.addEventListener('click', () => deleteEvent(btn.dataset.id));
+        });
+    }, appendEventAuditPage);
 }
 
 /**
@@ -40,15 +40,39 @@ function getGlucoseColor(level) {
 }
 
 /**
- * Load all dashboard components
+ * Load all dashboard components with a single bundle request
  */
 async function loadDashboard() {
-    loadGlucoseChart();
-    loadSummary();
     loadNutritionList();
-    loadCVCharts();
-    loadRiskMetrics();
-    loadPrediction();
+    
+    const params = new URLSearchParams({
+        chart_start_date: document.getElementById('chart-start-date').value,
+        chart_end_date: document.getElementById('chart-end-date').value,
+        summary_start_date: document.getElementById('summary-start-date').value,
+        summary_end_date: document.getElementById('summary-end-date').value,
+        cv_end_date: document.getElementById('cv-end-date').value,
+        risk_end_date: document.getElementById('risk-end-date').value,
+        lookback_days: 30,
+        tz: getClientTz()
+    });
+    
+    try {
+        // One request and one server-side read for every section
+        const response = await fetch(`${API_BASE}/dashboard/bundle?${params}`);
+        
+        if (!response.ok) {
+            throw new Error('Failed to fetch dashboard bundle');
+        }
+        
+        const data = await response.json();
+        renderGlucoseChart(data.glucose_chart);
+        renderSummary(data.summary);
+        renderCVCharts(data.cv_charts);
+        renderRiskMetrics(data.risk_metrics);
+        renderPrediction(data.prediction);
+    } catch (err) {
+        console.error('Failed to load dashboard:', err);
+    }
 }
 
 /**
@@ -61,77 +85,83 @@ async function loadGlucoseChart() {
     try {
         const response = await fetch(`${API_BASE}/dashboard/glucose-chart?start_date=${startDate}&end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
         const data = await response.json();
-        
-        const ctx = document.getElementById('glucoseChart').getContext('2d');
-        
-        if (glucoseChart) {
-            glucoseChart.destroy();
-        }
-        
-        glucoseChart = new Chart(ctx, {
-            type: 'line',
-            data: {
-                labels: data.map(d => d.week),
-                datasets: [
-                    {
-                        label: 'Glucose (mg/dL)',
-                        data: data.map(d => d.glucose_mean),
-                        borderColor: '#667eea',
-                        backgroundColor: 'rgba(102, 126, 234, 0.1)',
-                        tension: 0.1,
-                        yAxisID: 'yAxisGlucose'
-                    },
-                    {
-                        label: 'Insulin (units)',
-                        data: data.map(d => d.insulin_mean),
-                        borderColor: '#f6993f',
-                        backgroundColor: 'rgba(246, 153, 63, 0.1)',
-                        tension: 0.1,
-                        yAxisID: 'yAxisInsulin'
-                    }
-                ]
-            },
-            options: {
-                responsive: true,
-                maintainAspectRatio: true,
-                interaction: {
-                    mode: 'index',
-                    intersect: false
+        renderGlucoseChart(data);
+    } catch (err) {
+        console.error('Failed to load glucose chart:', err);
+    }
+}
+
+/**
+ * Render glucose chart
+ */
+function renderGlucoseChart(data) {
+    const ctx = document.getElementById('glucoseChart').getContext('2d');
+
+    if (glucoseChart) {
+        glucoseChart.destroy();
+    }
+
+    glucoseChart = new Chart(ctx, {
+        type: 'line',
+        data: {
+            labels: data.map(d => d.week),
+            datasets: [
+                {
+                    label: 'Glucose (mg/dL)',
+                    data: data.map(d => d.glucose_mean),
+                    borderColor: '#667eea',
+                    backgroundColor: 'rgba(102, 126, 234, 0.1)',
+                    tension: 0.1,
+                    yAxisID: 'yAxisGlucose'
                 },
-                scales: {
-                    yAxisGlucose: {
-                        type: 'linear',
-                        position: 'left',
-                        beginAtZero: false,
-                        title: {
-                            display: true,
-                            text: 'Glucose (mg/dL)'
-                        }
-                    },
-                    yAxisInsulin: {
-                        type: 'linear',
-                        position: 'right',
-                        beginAtZero: false,
-                        title: {
-                            display: true,
-                            text: 'Insulin (units)'
-                        },
-                        grid: {
-                            drawOnChartArea: false
-                        }
+                {
+                    label: 'Insulin (units)',
+                    data: data.map(d => d.insulin_mean),
+                    borderColor: '#f6993f',
+                    backgroundColor: 'rgba(246, 153, 63, 0.1)',
+                    tension: 0.1,
+                    yAxisID: 'yAxisInsulin'
+                }
+            ]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: true,
+            interaction: {
+                mode: 'index',
+                intersect: false
+            },
+            scales: {
+                yAxisGlucose: {
+                    type: 'linear',
+                    position: 'left',
+                    beginAtZero: false,
+                    title: {
+                        display: true,
+                        text: 'Glucose (mg/dL)'
                     }
                 },
-                plugins: {
-                    legend: {
+                yAxisInsulin: {
+                    type: 'linear',
+                    position: 'right',
+                    beginAtZero: false,
+                    title: {
                         display: true,
-                        position: 'top'
+                        text: 'Insulin (units)'
+                    },
+                    grid: {
+                        drawOnChartArea: false
                     }
                 }
+            },
+            plugins: {
+                legend: {
+                    display: true,
+                    position: 'top'
+                }
             }
-        });
-    } catch (err) {
-        console.error('Failed to load glucose chart:', err);
-    }
+        }
+    });
 }
 
 /**
@@ -144,58 +174,64 @@ async function loadSummary() {
     try {
         const response = await fetch(`${API_BASE}/dashboard/summary?start_date=${startDate}&end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
         const data = await response.json();
-        
-        const tbody = document.getElementById('summaryBody');
-        tbody.innerHTML = '';
-        
-        data.forEach(row => {
-            if (row) {
-                const tr = document.createElement('tr');
-                
-                // Create cells
-                const cells = [
-                    { value: row.am_pm, isGlucose: false },
-                    { value: row.date, isGlucose: false },
-                    { value: row.dosage || '-', isGlucose: false },
-                    { value: row.glucose_levels['+0'] || '-', isGlucose: true },
-                    { value: row.glucose_levels['+1'] || '-', isGlucose: true },
-                    { value: row.glucose_levels['+2'] || '-', isGlucose: true },
-                    { value: row.glucose_levels['+3'] || '-', isGlucose: true },
-                    { value: row.glucose_levels['+4'] || '-', isGlucose: true },
-                    { value: row.glucose_levels['+5'] || '-', isGlucose: true },
-                    { value: row.glucose_levels['+6'] || '-', isGlucose: true },
-                    { value: row.glucose_levels['+7'] || '-', isGlucose: true },
-                    { value: row.glucose_levels['+8'] || '-', isGlucose: true },
-                    { value: row.glucose_levels['+9'] || '-', isGlucose: true },
-                    { value: row.glucose_levels['+10'] || '-', isGlucose: true },
-                    { value: row.glucose_levels['+11'] || '-', isGlucose: true },
-                    { value: row.kcal_intake.toFixed(1), isGlucose: false }
-                ];
-                
-                cells.forEach(cell => {
-                    const td = document.createElement('td');
-                    td.textContent = cell.value;
-                    
-                    if (cell.isGlucose && cell.value !== '-') {
-                        const colors = getGlucoseColor(cell.value);
-                        td.style.backgroundColor = colors.background;
-                        td.style.color = colors.color;
-                    }
-                    
-                    tr.appendChild(td);
-                });
-                
-                // Add click handler to show overlay
-                tr.addEventListener('click', () => showSummaryOverlay(row));
-                
-                tbody.appendChild(tr);
-            }
-        });
+        renderSummary(data);
     } catch (err) {
         console.error('Failed to load summary:', err);
     }
 }
 
+/**
+ * Render summary timesheet
+ */
+function renderSummary(data) {
+    const tbody = document.getElementById('summaryBody');
+    tbody.innerHTML = '';
+
+    data.forEach(row => {
+        if (row) {
+            const tr = document.createElement('tr');
+            
+            // Create cells
+            const cells = [
+                { value: row.am_pm, isGlucose: false },
+                { value: row.date, isGlucose: false },
+                { value: row.dosage || '-', isGlucose: false },
+                { value: row.glucose_levels['+0'] || '-', isGlucose: true },
+                { value: row.glucose_levels['+1'] || '-', isGlucose: true },
+                { value: row.glucose_levels['+2'] || '-', isGlucose: true },
+                { value: row.glucose_levels['+3'] || '-', isGlucose: true },
+                { value: row.glucose_levels['+4'] || '-', isGlucose: true },
+                { value: row.glucose_levels['+5'] || '-', isGlucose: true },
+                { value: row.glucose_levels['+6'] || '-', isGlucose: true },
+                { value: row.glucose_levels['+7'] || '-', isGlucose: true },
+                { value: row.glucose_levels['+8'] || '-', isGlucose: true },
+                { value: row.glucose_levels['+9'] || '-', isGlucose: true },
+                { value: row.glucose_levels['+10'] || '-', isGlucose: true },
+                { value: row.glucose_levels['+11'] || '-', isGlucose: true },
+                { value: row.kcal_intake.toFixed(1), isGlucose: false }
+            ];
+            
+            cells.forEach(cell => {
+                const td = document.createElement('td');
+                td.textContent = cell.value;
+                
+                if (cell.isGlucose && cell.value !== '-') {
+                    const colors = getGlucoseColor(cell.value);
+                    td.style.backgroundColor = colors.background;
+                    td.style.color = colors.color;
+                }
+                
+                tr.appendChild(td);
+            });
+            
+            // Add click handler to show overlay
+            tr.addEventListener('click', () => showSummaryOverlay(row));
+            
+            tbody.appendChild(tr);
+        }
+    });
+}
+
 /**
  * Show overlay with detailed information
  */
@@ -273,15 +309,21 @@ async function loadCVCharts() {
     try {
         const response = await fetch(`${API_BASE}/dashboard/cv-charts?end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
         const data = await response.json();
-        
-        renderCVChart('cvChart7d12h', data.cv_7d_12h, cvChart7d12h);
-        renderCVChart('cvChart30d48h', data.cv_30d_48h, cvChart30d48h);
-        renderCVChart('cvChart30d5d', data.cv_30d_5d, cvChart30d5d);
+        renderCVCharts(data);
     } catch (err) {
         console.error('Failed to load CV charts:', err);
     }
 }
 
+/**
+ * Render the CV charts
+ */
+function renderCVCharts(data) {
+    renderCVChart('cvChart7d12h', data.cv_7d_12h, cvChart7d12h);
+    renderCVChart('cvChart30d48h', data.cv_30d_48h, cvChart30d48h);
+    renderCVChart('cvChart30d5d', data.cv_30d_5d, cvChart30d5d);
+}
+
 /**
  * Render a single CV chart
  */
@@ -372,24 +414,6 @@ function renderCVChart(canvasId, data, chartInstance) {
     }
 }
 
-/**
- * Load and render CV charts
- */
-async function loadCVCharts() {
-    const endDate = document.getElementById('cv-end-date').value;
-    
-    try {
-        const response = await fetch(`${API_BASE}/dashboard/cv-charts?end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
-        const data = await response.json();
-        
-        renderCVChart('cvChart7d12h', data.cv_7d_12h, cvChart7d12h);
-        renderCVChart('cvChart30d48h', data.cv_30d_48h, cvChart30d48h);
-        renderCVChart('cvChart30d5d', data.cv_30d_5d, cvChart30d5d);
-    } catch (err) {
-        console.error('Failed to load CV charts:', err);
-    }
-}
-
 /**
  * Load and render risk metrics charts
  */
@@ -399,35 +423,41 @@ async function loadRiskMetrics() {
     try {
         const response = await fetch(`${API_BASE}/dashboard/risk-metrics?end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
         const data = await response.json();
-        
-        // Render LBGI charts (adjusted for cats)
-        renderRiskChart('lbgiChart7d12h', data.lbgi_7d_12h, lbgiChart7d12h, 'LBGI', 
-                       [3.5, 7], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
-        renderRiskChart('lbgiChart30d48h', data.lbgi_30d_48h, lbgiChart30d48h, 'LBGI',
-                       [3.5, 7], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
-        renderRiskChart('lbgiChart30d5d', data.lbgi_30d_5d, lbgiChart30d5d, 'LBGI',
-                       [3.5, 7], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
-        
-        // Render HBGI charts (adjusted for cats)
-        renderRiskChart('hbgiChart7d12h', data.hbgi_7d_12h, hbgiChart7d12h, 'HBGI',
-                       [6, 12], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
-        renderRiskChart('hbgiChart30d48h', data.hbgi_30d_48h, hbgiChart30d48h, 'HBGI',
-                       [6, 12], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
-        renderRiskChart('hbgiChart30d5d', data.hbgi_30d_5d, hbgiChart30d5d, 'HBGI',
-                       [6, 12], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
-        
-        // Render ADRR charts (adjusted for cats)
-        renderRiskChart('adrrChart7d12h', data.adrr_7d_12h, adrrChart7d12h, 'ADRR',
-                       [25, 50], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
-        renderRiskChart('adrrChart30d48h', data.adrr_30d_48h, adrrChart30d48h, 'ADRR',
-                       [25, 50], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
-        renderRiskChart('adrrChart30d5d', data.adrr_30d_5d, adrrChart30d5d, 'ADRR',
-                       [25, 50], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
+        renderRiskMetrics(data);
     } catch (err) {
         console.error('Failed to load risk metrics:', err);
     }
 }
 
+/**
+ * Render the risk metrics charts
+ */
+function renderRiskMetrics(data) {
+    // Render LBGI charts (adjusted for cats)
+    renderRiskChart('lbgiChart7d12h', data.lbgi_7d_12h, lbgiChart7d12h, 'LBGI', 
+                   [3.5, 7], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
+    renderRiskChart('lbgiChart30d48h', data.lbgi_30d_48h, lbgiChart30d48h, 'LBGI',
+                   [3.5, 7], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
+    renderRiskChart('lbgiChart30d5d', data.lbgi_30d_5d, lbgiChart30d5d, 'LBGI',
+                   [3.5, 7], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
+
+    // Render HBGI charts (adjusted for cats)
+    renderRiskChart('hbgiChart7d12h', data.hbgi_7d_12h, hbgiChart7d12h, 'HBGI',
+                   [6, 12], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
+    renderRiskChart('hbgiChart30d48h', data.hbgi_30d_48h, hbgiChart30d48h, 'HBGI',
+                   [6, 12], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
+    renderRiskChart('hbgiChart30d5d', data.hbgi_30d_5d, hbgiChart30d5d, 'HBGI',
+                   [6, 12], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
+
+    // Render ADRR charts (adjusted for cats)
+    renderRiskChart('adrrChart7d12h', data.adrr_7d_12h, adrrChart7d12h, 'ADRR',
+                   [25, 50], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
+    renderRiskChart('adrrChart30d48h', data.adrr_30d_48h, adrrChart30d48h, 'ADRR',
+                   [25, 50], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
+    renderRiskChart('adrrChart30d5d', data.adrr_30d_5d, adrrChart30d5d, 'ADRR',
+                   [25, 50], ['rgba(0, 255, 0, 0.3)', 'rgba(255, 255, 0, 0.3)', 'rgba(255, 0, 0, 0.3)']);
+}
+
 /**
  * Render a single risk metric chart
  */
@@ -546,13 +576,7 @@ async function loadPrediction() {
         }
         
         const data = await response.json();
-        
-        if (data.error) {
-            displayPredictionError(container, data);
-            return;
-        }
-        
-        displayPrediction(container, data);
+        renderPrediction(data);
     } catch (error) {
         console.error('Error loading prediction:', error);
         container.innerHTML = `
@@ -564,6 +588,20 @@ async function loadPrediction() {
     }
 }
 
+/**
+ * Render prediction result (or its error)
+ */
+function renderPrediction(data) {
+    const container = document.getElementById('predictionContent');
+    
+    if (data.error) {
+        displayPredictionError(container, data);
+        return;
+    }
+    
+    displayPrediction(container, data);
+}
+
 /**
  * Display prediction data
  */
@@ -183,41 +183,61 @@ async function handleIntakeSubmit(e) {
         return;
     }
     
-    let allSuccess = true;
-    let messages = [];
+    // Build one batch so the whole meal is a single request and transaction
+    const operations = [];
+    const labels = [];
     
-    // Submit nutrition items
     for (let i = 0; i < nutritionIds.length; i++) {
         if (nutritionIds[i]) {
-            const data = {
-                timestamp: timestamp,
-                nutrition_id: parseInt(nutritionIds[i]),
-                nutrition_amount: parseFloat(nutritionAmounts[i])
-            };
-            
-            const result = await submitData('/intake', data);
-            if (!result.success) {
-                allSuccess = false;
-                messages.push(`Nutrition Item ${i + 1}: ${result.message}`);
-            }
+            operations.push({
+                op: 'create',
+                resource: 'intake',
+                data: {
+                    timestamp: timestamp,
+                    nutrition_id: parseInt(nutritionIds[i]),
+                    nutrition_amount: parseFloat(nutritionAmounts[i])
+                }
+            });
+            labels.push(`Nutrition Item ${i + 1}`);
         }
     }
     
-    // Submit supplement items
     for (let i = 0; i < supplementIds.length; i++) {
         if (supplementIds[i]) {
-            const data = {
-                timestamp: timestamp,
-                supplement_id: parseInt(supplementIds[i]),
-                supplement_amount: parseFloat(supplementAmounts[i])
-            };
-            
-            const result = await submitData('/supplement-intake', data);
-            if (!result.success) {
-                allSuccess = false;
-                messages.push(`Supplement Item ${i + 1}: ${result.message}`);
+            operations.push({
+                op: 'create',
+                resource: 'supplement-intake',
+                data: {
+                    timestamp: timestamp,
+                    supplement_id: parseInt(supplementIds[i]),
+                    supplement_amount: parseFloat(supplementAmounts[i])
+                }
+            });
+            labels.push(`Supplement Item ${i + 1}`);
+        }
+    }
+    
+    let allSuccess = true;
+    let messages = [];
+    
+    try {
+        const response = await fetch(`${API_BASE}/batch`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ operations })
+        });
+        
+        if (!response.ok) {
+            const error = await response.json();
+            allSuccess = false;
+            messages = (error.results || []).map(r => `${labels[r.index]}: ${r.error}`);
+            if (messages.length === 0) {
+                messages.push(error.error || 'Submission failed');
             }
         }
+    } catch (err) {
+        allSuccess = false;
+        messages.push('Network error: ' + err.message);
     }
     
     resetButton(submitBtn);
@@ -228,7 +248,7 @@ async function handleIntakeSubmit(e) {
         loadIntakeAudit();
         loadSupplementIntakeAudit();
     } else {
-        showMessage('intake-message', false, 'Some items failed: ' + messages.join(', '));
+        showMessage('intake-message', false, 'Nothing was saved: ' + messages.join(', '));
     }
 }
 
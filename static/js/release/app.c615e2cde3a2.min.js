@@ -0,0 +1,1702 @@
+const API_BASE='/api';
+if(typeof module!=='undefined'&&module.exports){
+module.exports={API_BASE};
+}
+async function submitData(endpoint,data){
+try{
+const response=await fetch(API_BASE+endpoint,{
+method:'POST',
+headers:{'Content-Type':'application/json'},
+body:JSON.stringify(data)
+});
+if(response.ok){
+return{success:true,message:'Data submitted successfully!'};
+}else{
+const error=await response.json();
+return{success:false,message:error.error||'Submission failed'};
+}
+}catch(err){
+return{success:false,message:'Network error: '+err.message};
+}
+}
+function showMessage(elementId,success,message){
+const msgEl=document.getElementById(elementId);
+msgEl.className='message';
+msgEl.textContent=message;
+msgEl.classList.add(success?'success':'error');
+setTimeout(()=>msgEl.classList.add('show'),10);
+const timeout=success?5000:8000;
+setTimeout(()=>{
+msgEl.classList.remove('show');
+setTimeout(()=>{
+msgEl.textContent='';
+msgEl.className='message';
+},300);
+},timeout);
+}
+function getCurrentTimestamp(){
+const now=new Date();
+const year=now.getFullYear();
+const month=String(now.getMonth()+1).padStart(2,'0');
+const day=String(now.getDate()).padStart(2,'0');
+const hours=String(now.getHours()).padStart(2,'0');
+const minutes=String(now.getMinutes()).padStart(2,'0');
+return`${year}-${month}-${day}T${hours}:${minutes}`;
+}
+function toDbTimestamp(datetimeLocal){
+return new Date(datetimeLocal).toISOString().replace('T',' ').slice(0,19);
+}
+function initializeDateInputs(){
+const now=new Date();
+const year=now.getFullYear();
+const month=String(now.getMonth()+1).padStart(2,'0');
+const day=String(now.getDate()).padStart(2,'0');
+document.getElementById('chart-start-date').value=`${year}-01-01`;
+document.getElementById('chart-end-date').value=`${year}-12-31`;
+const lastDay=new Date(year,now.getMonth()+1,0).getDate();
+document.getElementById('summary-start-date').value=`${year}-${month}-01`;
+document.getElementById('summary-end-date').value=`${year}-${month}-${lastDay}`;
+document.getElementById('cv-end-date').value=`${year}-${month}-${day}`;
+document.getElementById('risk-end-date').value=`${year}-${month}-${day}`;
+}
+function setCurrentTimestamp(){
+const datetimeLocal=getCurrentTimestamp();
+document.querySelectorAll('input[type="datetime-local"]').forEach(input=>{
+if(!input.value){
+input.value=datetimeLocal;
+}
+});
+}
+function resetToNow(inputId){
+const input=document.getElementById(inputId);
+if(input){
+const timestamp=getCurrentTimestamp();
+input.value=timestamp;
+}
+}
+function setButtonLoading(button,loadingText='Submitting...'){
+button.dataset.originalText=button.textContent;
+button.textContent=loadingText;
+button.disabled=true;
+button.classList.add('submitting');
+}
+function resetButton(button){
+if(button.dataset.originalText){
+button.textContent=button.dataset.originalText;
+delete button.dataset.originalText;
+}
+button.disabled=false;
+button.classList.remove('submitting');
+}
+function utcDbToDate(ts){
+return new Date(ts.replace(' ','T')+'Z');
+}
+function toInputTimestamp(dbTimestamp){
+const d=utcDbToDate(dbTimestamp);
+const year=d.getFullYear();
+const month=String(d.getMonth()+1).padStart(2,'0');
+const day=String(d.getDate()).padStart(2,'0');
+const hours=String(d.getHours()).padStart(2,'0');
+const minutes=String(d.getMinutes()).padStart(2,'0');
+return`${year}-${month}-${day}T${hours}:${minutes}`;
+}
+function formatTimestamp(utcStr){
+return utcDbToDate(utcStr).toLocaleString();
+}
+function getClientTz(){
+return Intl.DateTimeFormat().resolvedOptions().timeZone;
+}
+function escapeHtml(text){
+const div=document.createElement('div');
+div.textContent=text;
+return div.innerHTML;
+}
+function initializeTabs(){
+document.querySelectorAll('.tab-btn').forEach(btn=>{
+btn.addEventListener('click',()=>{
+const targetTab=btn.getAttribute('data-tab');
+switchTab(targetTab);
+});
+});
+}
+function switchTab(targetTab){
+document.querySelectorAll('.tab-btn').forEach(b=>b.classList.remove('active'));
+document.querySelectorAll('.tab-content').forEach(c=>c.classList.remove('active'));
+document.querySelector(`[data-tab="${targetTab}"]`).classList.add('active');
+document.getElementById(targetTab).classList.add('active');
+loadTabData(targetTab);
+setTimeout(setCurrentTimestamp,100);
+}
+function loadTabData(tab){
+switch(tab){
+case'dashboard':
+loadDashboard();
+break;
+case'intake':
+loadNutritionOptions();
+loadSupplementOptions();
+loadIntakeAudit();
+loadSupplementIntakeAudit();
+autofillPreviousIntake();
+break;
+case'supplements':
+loadSupplementsList();
+break;
+case'nutrition':
+loadNutritionList();
+loadNutritionAudit();
+break;
+case'event':
+loadEventAudit();
+break;
+case'glucose':
+loadGlucoseAudit();
+break;
+case'insulin':
+loadInsulinAudit();
+break;
+}
+}
+let glucoseChart=null;
+let cvChart7d12h=null;
+let cvChart30d48h=null;
+let cvChart30d5d=null;
+let lbgiChart7d12h=null;
+let lbgiChart30d48h=null;
+let lbgiChart30d5d=null;
+let hbgiChart7d12h=null;
+let hbgiChart30d48h=null;
+let hbgiChart30d5d=null;
+let adrrChart7d12h=null;
+let adrrChart30d48h=null;
+let adrrChart30d5d=null;
+function getGlucoseColor(level){
+if(!level||level==='-')return{background:'',color:''};
+const glucose=parseFloat(level);
+if(glucose>=500){
+return{background:'#000000',color:'#FFFFFF'};
+}else if(glucose>=400){
+return{background:'#FF0000',color:'#FFFFFF'};
+}else if(glucose>=300){
+return{background:'#FF00FF',color:'#FFFFFF'};
+}else if(glucose>=200){
+return{background:'#FFB6FF',color:'#000000'};
+}else if(glucose>100){
+return{background:'#98fab2',color:'#000000'};
+}else if(glucose>=60){
+return{background:'#6eb882',color:'#000000'};
+}else{
+return{background:'#FFFF00',color:'#FF0000'};
+}
+}
+async function loadDashboard(){
+loadNutritionList();
+const params=new URLSearchParams({
+chart_start_date:document.getElementById('chart-start-date').value,
+chart_end_date:document.getElementById('chart-end-date').value,
+summary_start_date:document.getElementById('summary-start-date').value,
+summary_end_date:document.getElementById('summary-end-date').value,
+cv_end_date:document.getElementById('cv-end-date').value,
+risk_end_date:document.getElementById('risk-end-date').value,
+lookback_days:30,
+tz:getClientTz()
+});
+try{
+const response=await fetch(`${API_BASE}/dashboard/bundle?${params}`);
+if(!response.ok){
+throw new Error('Failed to fetch dashboard bundle');
+}
+const data=await response.json();
+renderGlucoseChart(data.glucose_chart);
+renderSummary(data.summary);
+renderCVCharts(data.cv_charts);
+renderRiskMetrics(data.risk_metrics);
+renderPrediction(data.prediction);
+}catch(err){
+console.error('Failed to load dashboard:',err);
+}
+}
+async function loadGlucoseChart(){
+const startDate=document.getElementById('chart-start-date').value;
+const endDate=document.getElementById('chart-end-date').value;
+try{
+const response=await fetch(`${API_BASE}/dashboard/glucose-chart?start_date=${startDate}&end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
+const data=await response.json();
+renderGlucoseChart(data);
+}catch(err){
+console.error('Failed to load glucose chart:',err);
+}
+}
+function renderGlucoseChart(data){
+const ctx=document.getElementById('glucoseChart').getContext('2d');
+if(glucoseChart){
+glucoseChart.destroy();
+}
+glucoseChart=new Chart(ctx,{
+type:'line',
+data:{
+labels:data.map(d=>d.week),
+datasets:[
+{
+label:'Glucose (mg/dL)',
+data:data.map(d=>d.glucose_mean),
+borderColor:'#667eea',
+backgroundColor:'rgba(102, 126, 234, 0.1)',
+tension:0.1,
+yAxisID:'yAxisGlucose'
+},
+{
+label:'Insulin (units)',
+data:data.map(d=>d.insulin_mean),
+borderColor:'#f6993f',
+backgroundColor:'rgba(246, 153, 63, 0.1)',
+tension:0.1,
+yAxisID:'yAxisInsulin'
+}
+]
+},
+options:{
+responsive:true,
+maintainAspectRatio:true,
+interaction:{
+mode:'index',
+intersect:false
+},
+scales:{
+yAxisGlucose:{
+type:'linear',
+position:'left',
+beginAtZero:false,
+title:{
+display:true,
+text:'Glucose (mg/dL)'
+}
+},
+yAxisInsulin:{
+type:'linear',
+position:'right',
+beginAtZero:false,
+title:{
+display:true,
+text:'Insulin (units)'
+},
+grid:{
+drawOnChartArea:false
+}
+}
+},
+plugins:{
+legend:{
+display:true,
+position:'top'
+}
+}
+}
+});
+}
+async function loadSummary(){
+const startDate=document.getElementById('summary-start-date').value;
+const endDate=document.getElementById('summary-end-date').value;
+try{
+const response=await fetch(`${API_BASE}/dashboard/summary?start_date=${startDate}&end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
+const data=await response.json();
+renderSummary(data);
+}catch(err){
+console.error('Failed to load summary:',err);
+}
+}
+function renderSummary(data){
+const tbody=document.getElementById('summaryBody');
+tbody.innerHTML='';
+data.forEach(row=>{
+if(row){
+const tr=document.createElement('tr');
+const cells=[
+{value:row.am_pm,isGlucose:false},
+{value:row.date,isGlucose:false},
+{value:row.dosage||'-',isGlucose:false},
+{value:row.glucose_levels['+0']||'-',isGlucose:true},
+{value:row.glucose_levels['+1']||'-',isGlucose:true},
+{value:row.glucose_levels['+2']||'-',isGlucose:true},
+{value:row.glucose_levels['+3']||'-',isGlucose:true},
+{value:row.glucose_levels['+4']||'-',isGlucose:true},
+{value:row.glucose_levels['+5']||'-',isGlucose:true},
+{value:row.glucose_levels['+6']||'-',isGlucose:true},
+{value:row.glucose_levels['+7']||'-',isGlucose:true},
+{value:row.glucose_levels['+8']||'-',isGlucose:true},
+{value:row.glucose_levels['+9']||'-',isGlucose:true},
+{value:row.glucose_levels['+10']||'-',isGlucose:true},
+{value:row.glucose_levels['+11']||'-',isGlucose:true},
+{value:row.kcal_intake.toFixed(1),isGlucose:false}
+];
+cells.forEach(cell=>{
+const td=document.createElement('td');
+td.textContent=cell.value;
+if(cell.isGlucose&&cell.value!=='-'){
+const colors=getGlucoseColor(cell.value);
+td.style.backgroundColor=colors.background;
+td.style.color=colors.color;
+}
+tr.appendChild(td);
+});
+tr.addEventListener('click',()=>showSummaryOverlay(row));
+tbody.appendChild(tr);
+}
+});
+}
+function showSummaryOverlay(row){
+const formatTime=(timestamp)=>{
+if(!timestamp||timestamp==='-')return'-';
+return utcDbToDate(timestamp).toTimeString().slice(0,5);
+};
+document.getElementById('overlay-dose-time').textContent=formatTime(row.dose_time);
+document.getElementById('overlay-intake-time').textContent=formatTime(row.intake_time);
+document.getElementById('overlay-nutritions').textContent=row.nutrition||'-';
+document.getElementById('overlay-supplements').textContent=row.grouped_supplements||'-';
+document.getElementById('overlay-events').textContent=row.grouped_events||'-';
+const overlay=document.getElementById('summaryOverlay');
+overlay.style.display='flex';
+}
+function hideSummaryOverlay(){
+const overlay=document.getElementById('summaryOverlay');
+overlay.style.display='none';
+}
+document.addEventListener('DOMContentLoaded',()=>{
+const overlay=document.getElementById('summaryOverlay');
+if(overlay){
+overlay.addEventListener('click',(e)=>{
+if(e.target===overlay){
+hideSummaryOverlay();
+}
+});
+}
+});
+async function loadNutritionList(){
+try{
+const response=await fetch(`${API_BASE}/nutrition`);
+const data=await response.json();
+const tbody=document.getElementById('nutritionListBody');
+tbody.innerHTML='';
+data.forEach(item=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+                <td>${item.id}</td>
+                <td>${item.nutrition_name}</td>
+                <td>${item.kcal}</td>
+                <td>${item.weight}</td>
+                <td>${item.kcal_per_gram.toFixed(4)}</td>
+            `;
+tbody.appendChild(tr);
+});
+}catch(err){
+console.error('Failed to load nutrition list:',err);
+}
+}
+async function loadCVCharts(){
+const endDate=document.getElementById('cv-end-date').value;
+try{
+const response=await fetch(`${API_BASE}/dashboard/cv-charts?end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
+const data=await response.json();
+renderCVCharts(data);
+}catch(err){
+console.error('Failed to load CV charts:',err);
+}
+}
+function renderCVCharts(data){
+renderCVChart('cvChart7d12h',data.cv_7d_12h,cvChart7d12h);
+renderCVChart('cvChart30d48h',data.cv_30d_48h,cvChart30d48h);
+renderCVChart('cvChart30d5d',data.cv_30d_5d,cvChart30d5d);
+}
+function renderCVChart(canvasId,data,chartInstance){
+const ctx=document.getElementById(canvasId).getContext('2d');
+if(chartInstance){
+chartInstance.destroy();
+}
+const maxCV=Math.max(...data.map(d=>d.cv||0),100);
+const chart=new Chart(ctx,{
+type:'line',
+data:{
+labels:data.map(d=>d.label),
+datasets:[{
+label:'CV (%)',
+data:data.map(d=>d.cv),
+borderColor:'#667eea',
+backgroundColor:'rgba(102, 126, 234, 0.1)',
+tension:0.1
+}]
+},
+options:{
+responsive:true,
+maintainAspectRatio:true,
+scales:{
+x:{
+ticks:{
+display:false
+},
+grid:{
+display:false
+}
+},
+y:{
+beginAtZero:true,
+max:Math.max(maxCV,40),
+title:{
+display:true,
+text:'CV (%)'
+}
+}
+},
+plugins:{
+legend:{
+display:false
+},
+annotation:{
+annotations:{
+greenBand:{
+type:'box',
+yMin:0,
+yMax:25,
+backgroundColor:'rgba(0, 255, 0, 0.3)',
+borderWidth:0,
+drawTime:'beforeDatasetsDraw'
+},
+yellowBand:{
+type:'box',
+yMin:25,
+yMax:35,
+backgroundColor:'rgba(255, 255, 0, 0.3)',
+borderWidth:0,
+drawTime:'beforeDatasetsDraw'
+},
+redBand:{
+type:'box',
+yMin:35,
+yMax:Math.max(maxCV,45),
+backgroundColor:'rgba(255, 0, 0, 0.3)',
+borderWidth:0,
+drawTime:'beforeDatasetsDraw'
+}
+}
+}
+}
+}
+});
+if(canvasId==='cvChart7d12h'){
+cvChart7d12h=chart;
+}else if(canvasId==='cvChart30d48h'){
+cvChart30d48h=chart;
+}else if(canvasId==='cvChart30d5d'){
+cvChart30d5d=chart;
+}
+}
+async function loadRiskMetrics(){
+const endDate=document.getElementById('risk-end-date').value;
+try{
+const response=await fetch(`${API_BASE}/dashboard/risk-metrics?end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
+const data=await response.json();
+renderRiskMetrics(data);
+}catch(err){
+console.error('Failed to load risk metrics:',err);
+}
+}
+function renderRiskMetrics(data){
+renderRiskChart('lbgiChart7d12h',data.lbgi_7d_12h,lbgiChart7d12h,'LBGI',
+[3.5,7],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('lbgiChart30d48h',data.lbgi_30d_48h,lbgiChart30d48h,'LBGI',
+[3.5,7],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('lbgiChart30d5d',data.lbgi_30d_5d,lbgiChart30d5d,'LBGI',
+[3.5,7],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('hbgiChart7d12h',data.hbgi_7d_12h,hbgiChart7d12h,'HBGI',
+[6,12],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('hbgiChart30d48h',data.hbgi_30d_48h,hbgiChart30d48h,'HBGI',
+[6,12],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('hbgiChart30d5d',data.hbgi_30d_5d,hbgiChart30d5d,'HBGI',
+[6,12],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('adrrChart7d12h',data.adrr_7d_12h,adrrChart7d12h,'ADRR',
+[25,50],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('adrrChart30d48h',data.adrr_30d_48h,adrrChart30d48h,'ADRR',
+[25,50],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('adrrChart30d5d',data.adrr_30d_5d,adrrChart30d5d,'ADRR',
+[25,50],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+}
+function renderRiskChart(canvasId,data,chartInstance,metricName,thresholds,colors){
+const ctx=document.getElementById(canvasId).getContext('2d');
+if(chartInstance){
+chartInstance.destroy();
+}
+const maxValue=Math.max(...data.map(d=>d.value||0),thresholds[1]*1.5);
+const chart=new Chart(ctx,{
+type:'line',
+data:{
+labels:data.map(d=>d.label),
+datasets:[{
+label:metricName,
+data:data.map(d=>d.value),
+borderColor:'#667eea',
+backgroundColor:'rgba(102, 126, 234, 0.1)',
+tension:0.1,
+spanGaps:true
+}]
+},
+options:{
+responsive:true,
+maintainAspectRatio:true,
+scales:{
+x:{
+ticks:{
+display:false
+},
+grid:{
+display:false
+}
+},
+y:{
+beginAtZero:true,
+max:maxValue,
+title:{
+display:true,
+text:metricName
+}
+}
+},
+plugins:{
+legend:{
+display:false
+},
+annotation:{
+annotations:{
+greenBand:{
+type:'box',
+yMin:0,
+yMax:thresholds[0],
+backgroundColor:colors[0],
+borderWidth:0,
+drawTime:'beforeDatasetsDraw'
+},
+yellowBand:{
+type:'box',
+yMin:thresholds[0],
+yMax:thresholds[1],
+backgroundColor:colors[1],
+borderWidth:0,
+drawTime:'beforeDatasetsDraw'
+},
+redBand:{
+type:'box',
+yMin:thresholds[1],
+yMax:maxValue,
+backgroundColor:colors[2],
+borderWidth:0,
+drawTime:'beforeDatasetsDraw'
+}
+}
+}
+}
+}
+});
+if(canvasId==='lbgiChart7d12h'){
+lbgiChart7d12h=chart;
+}else if(canvasId==='lbgiChart30d48h'){
+lbgiChart30d48h=chart;
+}else if(canvasId==='lbgiChart30d5d'){
+lbgiChart30d5d=chart;
+}else if(canvasId==='hbgiChart7d12h'){
+hbgiChart7d12h=chart;
+}else if(canvasId==='hbgiChart30d48h'){
+hbgiChart30d48h=chart;
+}else if(canvasId==='hbgiChart30d5d'){
+hbgiChart30d5d=chart;
+}else if(canvasId==='adrrChart7d12h'){
+adrrChart7d12h=chart;
+}else if(canvasId==='adrrChart30d48h'){
+adrrChart30d48h=chart;
+}else if(canvasId==='adrrChart30d5d'){
+adrrChart30d5d=chart;
+}
+}
+async function loadPrediction(){
+const container=document.getElementById('predictionContent');
+try{
+const response=await fetch(`${API_BASE}/dashboard/prediction?lookback_days=30&tz=${encodeURIComponent(getClientTz())}`);
+if(!response.ok){
+throw new Error('Failed to fetch prediction');
+}
+const data=await response.json();
+renderPrediction(data);
+}catch(error){
+console.error('Error loading prediction:',error);
+container.innerHTML=`
+            <div class="prediction-error">
+                <p><strong>Unable to load prediction</strong></p>
+                <p>${error.message}</p>
+            </div>
+        `;
+}
+}
+function renderPrediction(data){
+const container=document.getElementById('predictionContent');
+if(data.error){
+displayPredictionError(container,data);
+return;
+}
+displayPrediction(container,data);
+}
+function displayPrediction(container,data){
+const{prediction,next_window,basis,warnings}=data;
+if(!prediction){
+displayPredictionError(container,data);
+return;
+}
+const confidenceClass=`confidence-${prediction.confidence.toLowerCase()}`;
+const confidenceDots=getConfidenceDots(prediction.confidence);
+let html=`
+        <div class="prediction-box">
+            <div class="prediction-item">
+                <h3>📊 Predicted Glucose</h3>
+                <div class="prediction-value">${prediction.glucose} mg/dL</div>
+                <div class="prediction-range">Range: ${prediction.glucose_range[0]} - ${prediction.glucose_range[1]} mg/dL</div>
+            </div>
+            <div class="prediction-item">
+                <h3>💉 Recommended Insulin</h3>
+                <div class="prediction-value">
+                    ${prediction.insulin_recommended!==null?prediction.insulin_recommended+' units':'N/A'}
+                </div>
+                ${prediction.insulin_recommended===null?'<div class="prediction-range">Insufficient data</div>':''}
+            </div>
+        </div>
+        
+        <div class="prediction-confidence">
+            <div>Time Window: <strong>${next_window}</strong></div>
+            <div class="confidence-level ${confidenceClass}">
+                Confidence: ${prediction.confidence}
+            </div>
+            <div class="confidence-dots">${confidenceDots}</div>
+        </div>
+        
+        <div class="prediction-basis">
+            Based on ${basis.data_points} glucose readings over ${basis.lookback_days} days
+            ${basis.recent_cv!==null?`(CV: ${basis.recent_cv}%)`:''}
+        </div>
+    `;
+if(warnings&&warnings.length>0){
+html+=`
+            <div class="prediction-warnings">
+                <h4>⚠️ Warnings</h4>
+                <ul>
+                    ${warnings.map(w=>`<li>${escapeHtml(w)}</li>`).join('')}
+                </ul>
+            </div>
+        `;
+}
+html+=`
+        <div class="prediction-disclaimer">
+            This prediction is for informational purposes only. Always verify with actual glucose readings and consult your veterinarian for dosing decisions.
+        </div>
+    `;
+container.innerHTML=html;
+}
+function displayPredictionError(container,data){
+const warnings=data.warnings||['Unable to generate prediction'];
+container.innerHTML=`
+        <div class="prediction-error">
+            <p><strong>Cannot Generate Prediction</strong></p>
+            <p>${warnings.join('. ')}</p>
+            ${data.basis?`<p style="margin-top:10px; font-size:0.9em;">Data points available: ${data.basis.data_points}</p>`:''}
+        </div>
+    `;
+}
+function getConfidenceDots(confidence){
+switch(confidence){
+case'High':
+return'●●●●●';
+case'Medium':
+return'●●●○○';
+case'Low':
+return'●○○○○';
+default:
+return'○○○○○';
+}
+}
+async function loadNutritionOptions(){
+try{
+const response=await fetch(`${API_BASE}/nutrition`);
+const data=await response.json();
+const selects=document.querySelectorAll('.nutrition-select');
+selects.forEach(select=>{
+populateNutritionSelect(select,data);
+});
+}catch(err){
+console.error('Failed to load nutrition options:',err);
+}
+}
+async function loadNutritionOptionsForSelect(selectElement){
+try{
+const response=await fetch(`${API_BASE}/nutrition`);
+const data=await response.json();
+populateNutritionSelect(selectElement,data);
+}catch(err){
+console.error('Failed to load nutrition options:',err);
+}
+}
+function populateNutritionSelect(select,data){
+select.innerHTML='<option value="">Select nutrition...</option>';
+data.forEach(item=>{
+const option=document.createElement('option');
+option.value=item.id;
+option.textContent=`${item.nutrition_name} (${item.kcal_per_gram.toFixed(4)} kcal/g)`;
+select.appendChild(option);
+});
+}
+async function loadSupplementOptions(){
+try{
+const response=await fetch(`${API_BASE}/supplements`);
+const data=await response.json();
+const selects=document.querySelectorAll('.supplement-select');
+selects.forEach(select=>{
+populateSupplementSelect(select,data);
+});
+}catch(err){
+console.error('Failed to load supplement options:',err);
+}
+}
+async function loadSupplementOptionsForSelect(selectElement){
+try{
+const response=await fetch(`${API_BASE}/supplements`);
+const data=await response.json();
+populateSupplementSelect(selectElement,data);
+}catch(err){
+console.error('Failed to load supplement options:',err);
+}
+}
+function populateSupplementSelect(select,data){
+select.innerHTML='<option value="">Select supplement...</option>';
+data.forEach(item=>{
+const option=document.createElement('option');
+option.value=item.id;
+option.textContent=item.supplement_name;
+option.dataset.defaultAmount=item.default_amount;
+select.appendChild(option);
+});
+select.addEventListener('change',function(){
+const selectedOption=this.options[this.selectedIndex];
+const defaultAmount=selectedOption.dataset.defaultAmount;
+if(defaultAmount){
+const amountInput=this.closest('.supplement-item').querySelector('input[name="supplement_amount[]"]');
+amountInput.value=defaultAmount;
+}
+});
+}
+async function loadSupplementsList(){
+try{
+const response=await fetch(`${API_BASE}/supplements`);
+const data=await response.json();
+const container=document.getElementById('supplements-list');
+if(data.length===0){
+container.innerHTML='<p>No supplements found.</p>';
+return;
+}
+let html='<div class="table-wrapper"><table class="audit-table"><thead><tr><th>ID</th><th>Supplement Name</th><th>Default Amount</th><th>Actions</th></tr></thead><tbody>';
+data.forEach(item=>{
+html+=`
+                <tr>
+                    <td>${item.id}</td>
+                    <td>${escapeHtml(item.supplement_name)}</td>
+                    <td>${item.default_amount}</td>
+                    <td>
+                        <button class="edit-btn" data-id="${item.id}" data-name="${escapeHtml(item.supplement_name)}" data-amount="${item.default_amount}">Edit</button>
+                        <button class="delete-btn" data-id="${item.id}">Delete</button>
+                    </td>
+                </tr>
+            `;
+});
+html+='</tbody></table></div>';
+container.innerHTML=html;
+container.querySelectorAll('.edit-btn').forEach(btn=>{
+btn.addEventListener('click',()=>editSupplement(btn.dataset.id,btn.dataset.name,btn.dataset.amount));
+});
+container.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteSupplement(btn.dataset.id));
+});
+}catch(err){
+console.error('Failed to load supplements list:',err);
+}
+}
+async function autofillPreviousIntake(){
+try{
+const response=await fetch(`${API_BASE}/intake/previous-window?tz=${encodeURIComponent(getClientTz())}`);
+const data=await response.json();
+const nutritionData=data.nutrition||[];
+const supplementData=data.supplements||[];
+await populatePreviousNutritionItems(nutritionData);
+await populatePreviousSupplementItems(supplementData);
+}catch(err){
+console.error('Failed to autofill previous intake:',err);
+}
+}
+async function populatePreviousNutritionItems(nutritionData){
+const container=document.getElementById('nutrition-items-container');
+container.innerHTML='';
+nutritionItemCount=0;
+if(nutritionData.length===0){
+addEmptyNutritionItem(container);
+}else{
+for(const item of nutritionData){
+await addPreviousNutritionItem(container,item);
+}
+}
+updateNutritionRemoveButtons();
+}
+async function populatePreviousSupplementItems(supplementData){
+const container=document.getElementById('supplement-items-container');
+container.innerHTML='';
+supplementItemCount=0;
+if(supplementData.length===0){
+addEmptySupplementItem(container);
+}else{
+for(const item of supplementData){
+await addPreviousSupplementItem(container,item);
+}
+}
+updateSupplementRemoveButtons();
+}
+function addEmptyNutritionItem(container){
+nutritionItemCount=1;
+const newItem=document.createElement('div');
+newItem.className='nutrition-item';
+newItem.innerHTML=`
+        <h4>Nutrition Item 1</h4>
+        <label>Nutrition: 
+            <select name="nutrition_id[]" class="nutrition-select" required>
+                <option value="">Select nutrition...</option>
+            </select>
+        </label>
+        <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1"></label>
+        <button type="button" class="remove-nutrition-btn">Remove</button>
+    `;
+container.appendChild(newItem);
+loadNutritionOptionsForSelect(newItem.querySelector('.nutrition-select'));
+}
+async function addPreviousNutritionItem(container,item){
+nutritionItemCount++;
+const newItem=document.createElement('div');
+newItem.className='nutrition-item';
+newItem.innerHTML=`
+        <h4>Nutrition Item ${nutritionItemCount}</h4>
+        <label>Nutrition: 
+            <select name="nutrition_id[]" class="nutrition-select" required>
+                <option value="">Select nutrition...</option>
+            </select>
+        </label>
+        <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1" value="${item.nutrition_amount}"></label>
+        <button type="button" class="remove-nutrition-btn">Remove</button>
+    `;
+container.appendChild(newItem);
+await loadNutritionOptionsForSelect(newItem.querySelector('.nutrition-select'));
+newItem.querySelector('.nutrition-select').value=item.nutrition_id;
+}
+function addEmptySupplementItem(container){
+supplementItemCount=1;
+const newItem=document.createElement('div');
+newItem.className='supplement-item nutrition-item';
+newItem.innerHTML=`
+        <h4>Supplement Item 1</h4>
+        <label>Supplement: 
+            <select name="supplement_id[]" class="supplement-select" required>
+                <option value="">Select supplement...</option>
+            </select>
+        </label>
+        <label>Amount: <input type="number" name="supplement_amount[]" required min="0" step="0.1"></label>
+        <button type="button" class="remove-supplement-btn">Remove</button>
+    `;
+container.appendChild(newItem);
+loadSupplementOptionsForSelect(newItem.querySelector('.supplement-select'));
+}
+async function addPreviousSupplementItem(container,item){
+supplementItemCount++;
+const newItem=document.createElement('div');
+newItem.className='supplement-item nutrition-item';
+newItem.innerHTML=`
+        <h4>Supplement Item ${supplementItemCount}</h4>
+        <label>Supplement: 
+            <select name="supplement_id[]" class="supplement-select" required>
+                <option value="">Select supplement...</option>
+            </select>
+        </label>
+        <label>Amount: <input type="number" name="supplement_amount[]" required min="0" step="0.1" value="${item.supplement_amount}"></label>
+        <button type="button" class="remove-supplement-btn">Remove</button>
+    `;
+container.appendChild(newItem);
+await loadSupplementOptionsForSelect(newItem.querySelector('.supplement-select'));
+newItem.querySelector('.supplement-select').value=item.supplement_id;
+}
+let nutritionItemCount=1;
+let supplementItemCount=1;
+function initializeDynamicItems(){
+document.getElementById('add-nutrition-btn').addEventListener('click',addNutritionItem);
+document.getElementById('add-supplement-btn').addEventListener('click',addSupplementItem);
+document.getElementById('nutrition-items-container').addEventListener('click',e=>{
+if(e.target.matches('.remove-nutrition-btn')){
+e.target.closest('.nutrition-item').remove();
+renumberNutritionItems();
+}
+});
+document.getElementById('supplement-items-container').addEventListener('click',e=>{
+if(e.target.matches('.remove-supplement-btn')){
+e.target.closest('.supplement-item').remove();
+updateSupplementRemoveButtons();
+renumberSupplementItems();
+}
+});
+}
+function addNutritionItem(){
+nutritionItemCount++;
+const container=document.getElementById('nutrition-items-container');
+const newItem=document.createElement('div');
+newItem.className='nutrition-item';
+newItem.innerHTML=`
+        <h4>Nutrition Item ${nutritionItemCount}</h4>
+        <label>Nutrition: 
+            <select name="nutrition_id[]" class="nutrition-select" required>
+                <option value="">Select nutrition...</option>
+            </select>
+        </label>
+        <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1"></label>
+        <button type="button" class="remove-nutrition-btn">Remove</button>
+    `;
+container.appendChild(newItem);
+loadNutritionOptionsForSelect(newItem.querySelector('.nutrition-select'));
+updateNutritionRemoveButtons();
+}
+function addSupplementItem(){
+supplementItemCount++;
+const container=document.getElementById('supplement-items-container');
+const newItem=document.createElement('div');
+newItem.className='supplement-item nutrition-item';
+newItem.innerHTML=`
+        <h4>Supplement Item ${supplementItemCount}</h4>
+        <label>Supplement: 
+            <select name="supplement_id[]" class="supplement-select" required>
+                <option value="">Select supplement...</option>
+            </select>
+        </label>
+        <label>Amount: <input type="number" name="supplement_amount[]" required min="0" step="0.1"></label>
+        <button type="button" class="remove-supplement-btn">Remove</button>
+    `;
+container.appendChild(newItem);
+loadSupplementOptionsForSelect(newItem.querySelector('.supplement-select'));
+updateSupplementRemoveButtons();
+}
+function updateNutritionRemoveButtons(){
+const items=document.querySelectorAll('#nutrition-items-container .nutrition-item');
+items.forEach(item=>{
+const removeBtn=item.querySelector('.remove-nutrition-btn');
+removeBtn.style.display='inline-block';
+});
+}
+function updateSupplementRemoveButtons(){
+const items=document.querySelectorAll('#supplement-items-container .supplement-item');
+items.forEach(item=>{
+const removeBtn=item.querySelector('.remove-supplement-btn');
+removeBtn.style.display='inline-block';
+});
+}
+function renumberNutritionItems(){
+const items=document.querySelectorAll('#nutrition-items-container .nutrition-item');
+items.forEach((item,index)=>{
+item.querySelector('h4').textContent=`Nutrition Item ${index+1}`;
+});
+nutritionItemCount=items.length;
+}
+function renumberSupplementItems(){
+const items=document.querySelectorAll('#supplement-items-container .supplement-item');
+items.forEach((item,index)=>{
+item.querySelector('h4').textContent=`Supplement Item ${index+1}`;
+});
+supplementItemCount=items.length;
+}
+function initializeForms(){
+document.getElementById('glucoseForm').addEventListener('submit',async(e)=>{
+e.preventDefault();
+const submitBtn=e.target.querySelector('button[type="submit"]');
+setButtonLoading(submitBtn);
+const formData=new FormData(e.target);
+const data={
+timestamp:toDbTimestamp(formData.get('timestamp')),
+level:parseInt(formData.get('level'))
+};
+const result=await submitData('/glucose',data);
+resetButton(submitBtn);
+showMessage('glucose-message',result.success,result.message);
+if(result.success){
+e.target.reset();
+loadGlucoseAudit();
+}
+});
+document.getElementById('insulinForm').addEventListener('submit',async(e)=>{
+e.preventDefault();
+const submitBtn=e.target.querySelector('button[type="submit"]');
+setButtonLoading(submitBtn);
+const formData=new FormData(e.target);
+const data={
+timestamp:toDbTimestamp(formData.get('timestamp')),
+level:parseFloat(formData.get('level'))
+};
+const result=await submitData('/insulin',data);
+resetButton(submitBtn);
+showMessage('insulin-message',result.success,result.message);
+if(result.success){
+e.target.reset();
+loadInsulinAudit();
+}
+});
+document.getElementById('intakeForm').addEventListener('submit',handleIntakeSubmit);
+document.getElementById('supplementsForm').addEventListener('submit',async(e)=>{
+e.preventDefault();
+const submitBtn=e.target.querySelector('button[type="submit"]');
+setButtonLoading(submitBtn);
+const formData=new FormData(e.target);
+const data={
+supplement_name:formData.get('supplement_name'),
+default_amount:parseFloat(formData.get('default_amount'))
+};
+const result=await submitData('/supplements',data);
+resetButton(submitBtn);
+showMessage('supplements-message',result.success,result.message);
+if(result.success){
+e.target.reset();
+e.target.querySelector('input[name="default_amount"]').value='1';
+loadSupplementsList();
+}
+});
+document.getElementById('eventForm').addEventListener('submit',async(e)=>{
+e.preventDefault();
+const submitBtn=e.target.querySelector('button[type="submit"]');
+setButtonLoading(submitBtn);
+const formData=new FormData(e.target);
+const data={
+timestamp:toDbTimestamp(formData.get('timestamp')),
+event_name:formData.get('event_name'),
+event_notes:formData.get('event_notes')
+};
+const result=await submitData('/event',data);
+resetButton(submitBtn);
+showMessage('event-message',result.success,result.message);
+if(result.success){
+e.target.reset();
+loadEventAudit();
+}
+});
+document.getElementById('nutritionForm').addEventListener('submit',async(e)=>{
+e.preventDefault();
+const submitBtn=e.target.querySelector('button[type="submit"]');
+setButtonLoading(submitBtn);
+const formData=new FormData(e.target);
+const data={
+nutrition_name:formData.get('nutrition_name'),
+kcal:parseFloat(formData.get('kcal')),
+weight:parseFloat(formData.get('weight'))
+};
+const result=await submitData('/nutrition',data);
+resetButton(submitBtn);
+showMessage('nutrition-message',result.success,result.message);
+if(result.success){
+e.target.reset();
+loadNutritionList();
+loadNutritionAudit();
+}
+});
+}
+async function handleIntakeSubmit(e){
+e.preventDefault();
+const submitBtn=e.target.querySelector('button[type="submit"]');
+setButtonLoading(submitBtn);
+const formData=new FormData(e.target);
+const timestamp=toDbTimestamp(formData.get('timestamp'));
+if(window.currentEditingIntakeId){
+const nutritionId=formData.get('nutrition_id[]');
+const nutritionAmount=formData.get('nutrition_amount[]');
+if(!nutritionId){
+resetButton(submitBtn);
+showMessage('intake-message',false,'Please select a nutrition item');
+return;
+}
+const data={
+timestamp:timestamp,
+nutrition_id:parseInt(nutritionId),
+nutrition_amount:parseFloat(nutritionAmount)
+};
+try{
+const response=await fetch(`${API_BASE}/intake/${window.currentEditingIntakeId}`,{
+method:'PUT',
+headers:{'Content-Type':'application/json'},
+body:JSON.stringify(data)
+});
+resetButton(submitBtn);
+if(response.ok){
+showMessage('intake-message',true,'Record updated successfully!');
+cancelIntakeEdit();
+loadIntakeAudit();
+}else{
+const error=await response.json();
+showMessage('intake-message',false,error.error||'Update failed');
+}
+}catch(err){
+resetButton(submitBtn);
+showMessage('intake-message',false,'Network error: '+err.message);
+}
+return;
+}
+const nutritionIds=formData.getAll('nutrition_id[]');
+const nutritionAmounts=formData.getAll('nutrition_amount[]');
+const supplementIds=formData.getAll('supplement_id[]');
+const supplementAmounts=formData.getAll('supplement_amount[]');
+const filledNutrition=nutritionIds.filter(id=>id).length;
+const filledSupplements=supplementIds.filter(id=>id).length;
+if(filledNutrition+filledSupplements===0){
+resetButton(submitBtn);
+showMessage('intake-message',false,'Please add at least one nutrition or supplement item');
+return;
+}
+const operations=[];
+const labels=[];
+for(let i=0;i<nutritionIds.length;i++){
+if(nutritionIds[i]){
+operations.push({
+op:'create',
+resource:'intake',
+data:{
+timestamp:timestamp,
+nutrition_id:parseInt(nutritionIds[i]),
+nutrition_amount:parseFloat(nutritionAmounts[i])
+}
+});
+labels.push(`Nutrition Item ${i+1}`);
+}
+}
+for(let i=0;i<supplementIds.length;i++){
+if(supplementIds[i]){
+operations.push({
+op:'create',
+resource:'supplement-intake',
+data:{
+timestamp:timestamp,
+supplement_id:parseInt(supplementIds[i]),
+supplement_amount:parseFloat(supplementAmounts[i])
+}
+});
+labels.push(`Supplement Item ${i+1}`);
+}
+}
+let allSuccess=true;
+let messages=[];
+try{
+const response=await fetch(`${API_BASE}/batch`,{
+method:'POST',
+headers:{'Content-Type':'application/json'},
+body:JSON.stringify({operations})
+});
+if(!response.ok){
+const error=await response.json();
+allSuccess=false;
+messages=(error.results||[]).map(r=>`${labels[r.index]}: ${r.error}`);
+if(messages.length===0){
+messages.push(error.error||'Submission failed');
+}
+}
+}catch(err){
+allSuccess=false;
+messages.push('Network error: '+err.message);
+}
+resetButton(submitBtn);
+if(allSuccess){
+const totalItems=filledNutrition+filledSupplements;
+showMessage('intake-message',true,`Successfully submitted ${totalItems} item(s)!`);
+resetIntakeForm();
+loadIntakeAudit();
+loadSupplementIntakeAudit();
+}else{
+showMessage('intake-message',false,'Nothing was saved: '+messages.join(', '));
+}
+}
+function resetIntakeForm(){
+document.getElementById('intakeForm').reset();
+const nutritionContainer=document.getElementById('nutrition-items-container');
+nutritionContainer.innerHTML=`
+        <div class="nutrition-item">
+            <h4>Nutrition Item 1</h4>
+            <label>Nutrition: 
+                <select name="nutrition_id[]" class="nutrition-select" required>
+                    <option value="">Select nutrition...</option>
+                </select>
+            </label>
+            <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1"></label>
+            <button type="button" class="remove-nutrition-btn" style="display:none;">Remove</button>
+        </div>
+    `;
+const supplementContainer=document.getElementById('supplement-items-container');
+supplementContainer.innerHTML=`
+        <div class="supplement-item nutrition-item">
+            <h4>Supplement Item 1</h4>
+            <label>Supplement: 
+                <select name="supplement_id[]" class="supplement-select" required>
+                    <option value="">Select supplement...</option>
+                </select>
+            </label>
+            <label>Amount: <input type="number" name="supplement_amount[]" required min="0" step="0.1"></label>
+            <button type="button" class="remove-supplement-btn">Remove</button>
+        </div>
+    `;
+nutritionItemCount=1;
+supplementItemCount=1;
+document.getElementById('add-nutrition-btn').style.display='inline-block';
+document.getElementById('add-supplement-btn').style.display='inline-block';
+const submitBtn=document.querySelector('#intakeForm button[type="submit"]');
+submitBtn.textContent='Submit All';
+submitBtn.classList.remove('update-mode');
+const cancelBtn=document.getElementById('cancel-edit-btn');
+if(cancelBtn){
+cancelBtn.remove();
+}
+window.currentEditingIntakeId=null;
+loadNutritionOptions();
+loadSupplementOptions();
+}
+const AUDIT_PAGE_SIZE=100;
+async function fetchAuditPage(resource,filterPrefix,next){
+const startDate=next?next.startDate:document.getElementById(`${filterPrefix}-start-filter`).value;
+const endDate=next?next.endDate:document.getElementById(`${filterPrefix}-end-filter`).value;
+let url=`${API_BASE}/${resource}?tz=${encodeURIComponent(getClientTz())}&limit=${AUDIT_PAGE_SIZE}`;
+if(startDate&&endDate){
+url+=`&start_date=${startDate}&end_date=${endDate}`;
+}
+if(next){
+url+=`&cursor=${encodeURIComponent(next.cursor)}`;
+}
+const response=await fetch(url);
+const page=await response.json();
+page.next=page.next_cursor?{cursor:page.next_cursor,startDate,endDate}:null;
+return page;
+}
+function appendAuditRows(tbody,page,renderRow,bindRows,loadMore){
+const previousLoadMore=tbody.querySelector('.load-more-row');
+if(previousLoadMore){
+previousLoadMore.remove();
+}
+const rows=document.createDocumentFragment();
+page.items.forEach(record=>rows.appendChild(renderRow(record)));
+bindRows(rows);
+tbody.appendChild(rows);
+if(page.next){
+const tr=document.createElement('tr');
+tr.className='load-more-row';
+const td=document.createElement('td');
+td.colSpan=tbody.closest('table').querySelectorAll('thead th').length;
+const btn=document.createElement('button');
+btn.type='button';
+btn.textContent='Load more';
+btn.addEventListener('click',()=>loadMore(page.next));
+td.appendChild(btn);
+tr.appendChild(td);
+tbody.appendChild(tr);
+}
+}
+async function loadGlucoseAudit(){
+document.getElementById('glucose-audit-body').innerHTML='';
+await appendGlucoseAuditPage(null);
+}
+async function appendGlucoseAuditPage(next){
+const page=await fetchAuditPage('glucose','glucose',next);
+const tbody=document.getElementById('glucose-audit-body');
+appendAuditRows(tbody,page,record=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+            <td>${record.id}</td>
+            <td>${formatTimestamp(record.timestamp)}</td>
+            <td>${record.level}</td>
+            <td>
+                <button class="edit-btn" data-id="${record.id}" data-ts="${record.timestamp}" data-level="${record.level}">Edit</button>
+                <button class="delete-btn" data-id="${record.id}">Delete</button>
+            </td>
+        `;
+return tr;
+},rows=>{
+rows.querySelectorAll('.edit-btn').forEach(btn=>{
+btn.addEventListener('click',()=>editGlucose(btn.dataset.id,btn.dataset.ts,btn.dataset.level));
+});
+rows.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteGlucose(btn.dataset.id));
+});
+},appendGlucoseAuditPage);
+}
+async function editGlucose(id,timestamp,level){
+const newTimestamp=prompt('Enter new timestamp (local time, YYYY-MM-DDTHH:MM):',toInputTimestamp(timestamp));
+const newLevel=prompt('Enter new glucose level:',level);
+if(newTimestamp&&newLevel){
+const response=await fetch(`${API_BASE}/glucose/${id}`,{
+method:'PUT',
+headers:{'Content-Type':'application/json'},
+body:JSON.stringify({
+timestamp:toDbTimestamp(newTimestamp),
+level:parseInt(newLevel)
+})
+});
+if(response.ok){
+alert('Record updated successfully!');
+loadGlucoseAudit();
+}else{
+alert('Failed to update record');
+}
+}
+}
+async function deleteGlucose(id){
+if(confirm('Are you sure you want to delete this record?')){
+const response=await fetch(`${API_BASE}/glucose/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+alert('Record deleted successfully!');
+loadGlucoseAudit();
+}else{
+alert('Failed to delete record');
+}
+}
+}
+async function loadInsulinAudit(){
+document.getElementById('insulin-audit-body').innerHTML='';
+await appendInsulinAuditPage(null);
+}
+async function appendInsulinAuditPage(next){
+const page=await fetchAuditPage('insulin','insulin',next);
+const tbody=document.getElementById('insulin-audit-body');
+appendAuditRows(tbody,page,record=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+            <td>${record.id}</td>
+            <td>${formatTimestamp(record.timestamp)}</td>
+            <td>${record.level}</td>
+            <td>
+                <button class="edit-btn" data-id="${record.id}" data-ts="${record.timestamp}" data-level="${record.level}">Edit</button>
+                <button class="delete-btn" data-id="${record.id}">Delete</button>
+            </td>
+        `;
+return tr;
+},rows=>{
+rows.querySelectorAll('.edit-btn').forEach(btn=>{
+btn.addEventListener('click',()=>editInsulin(btn.dataset.id,btn.dataset.ts,btn.dataset.level));
+});
+rows.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteInsulin(btn.dataset.id));
+});
+},appendInsulinAuditPage);
+}
+async function editInsulin(id,timestamp,level){
+const newTimestamp=prompt('Enter new timestamp (local time, YYYY-MM-DDTHH:MM):',toInputTimestamp(timestamp));
+const newLevel=prompt('Enter new insulin level:',level);
+if(newTimestamp&&newLevel){
+const response=await fetch(`${API_BASE}/insulin/${id}`,{
+method:'PUT',
+headers:{'Content-Type':'application/json'},
+body:JSON.stringify({
+timestamp:toDbTimestamp(newTimestamp),
+level:parseFloat(newLevel)
+})
+});
+if(response.ok){
+alert('Record updated successfully!');
+loadInsulinAudit();
+}else{
+alert('Failed to update record');
+}
+}
+}
+async function deleteInsulin(id){
+if(confirm('Are you sure you want to delete this record?')){
+const response=await fetch(`${API_BASE}/insulin/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+alert('Record deleted successfully!');
+loadInsulinAudit();
+}else{
+alert('Failed to delete record');
+}
+}
+}
+async function loadIntakeAudit(){
+document.getElementById('intake-audit-body').innerHTML='';
+await appendIntakeAuditPage(null);
+}
+async function appendIntakeAuditPage(next){
+const page=await fetchAuditPage('intake','intake',next);
+const tbody=document.getElementById('intake-audit-body');
+appendAuditRows(tbody,page,record=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+            <td>${record.id}</td>
+            <td>${formatTimestamp(record.timestamp)}</td>
+            <td>${record.nutrition_name}</td>
+            <td>${record.nutrition_amount}</td>
+            <td>${record.nutrition_kcal.toFixed(1)}</td>
+            <td>
+                <button class="edit-btn"
+                    data-id="${record.id}"
+                    data-ts="${record.timestamp}"
+                    data-nid="${record.nutrition_id}"
+                    data-name="${escapeHtml(record.nutrition_name)}"
+                    data-amount="${record.nutrition_amount}">Edit</button>
+                <button class="delete-btn" data-id="${record.id}">Delete</button>
+            </td>
+        `;
+return tr;
+},rows=>{
+rows.querySelectorAll('.edit-btn').forEach(btn=>{
+btn.addEventListener('click',()=>editIntake(
+btn.dataset.id,btn.dataset.ts,btn.dataset.nid,
+btn.dataset.name,btn.dataset.amount
+));
+});
+rows.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteIntake(btn.dataset.id));
+});
+},appendIntakeAuditPage);
+}
+async function editIntake(id,timestamp,nutritionId,nutritionName,nutritionAmount){
+window.currentEditingIntakeId=id;
+const nutritionContainer=document.getElementById('nutrition-items-container');
+nutritionContainer.innerHTML=`
+        <div class="nutrition-item">
+            <h4>Nutrition Item 1</h4>
+            <label>Nutrition: 
+                <select name="nutrition_id[]" class="nutrition-select" required>
+                    <option value="">Select nutrition...</option>
+                </select>
+            </label>
+            <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1"></label>
+            <button type="button" class="remove-nutrition-btn" style="display:none;">Remove</button>
+        </div>
+    `;
+const supplementContainer=document.getElementById('supplement-items-container');
+supplementContainer.innerHTML='';
+document.getElementById('add-nutrition-btn').style.display='none';
+document.getElementById('add-supplement-btn').style.display='none';
+await loadNutritionOptions();
+const nutritionSelect=document.querySelector('.nutrition-select');
+nutritionSelect.value=nutritionId;
+const timestampInput=document.getElementById('intake-timestamp');
+timestampInput.value=toInputTimestamp(timestamp);
+const amountInput=document.querySelector('input[name="nutrition_amount[]"]');
+amountInput.value=nutritionAmount;
+const submitBtn=document.querySelector('#intakeForm button[type="submit"]');
+submitBtn.textContent='Update';
+submitBtn.classList.add('update-mode');
+if(!document.getElementById('cancel-edit-btn')){
+const cancelBtn=document.createElement('button');
+cancelBtn.type='button';
+cancelBtn.id='cancel-edit-btn';
+cancelBtn.textContent='Cancel Edit';
+cancelBtn.className='secondary-btn';
+cancelBtn.addEventListener('click',cancelIntakeEdit);
+submitBtn.parentNode.insertBefore(cancelBtn,submitBtn.nextSibling);
+}
+document.getElementById('intake').scrollIntoView({behavior:'smooth',block:'start'});
+}
+function cancelIntakeEdit(){
+window.currentEditingIntakeId=null;
+resetIntakeForm();
+document.getElementById('add-nutrition-btn').style.display='inline-block';
+document.getElementById('add-supplement-btn').style.display='inline-block';
+const submitBtn=document.querySelector('#intakeForm button[type="submit"]');
+submitBtn.textContent='Submit All';
+submitBtn.classList.remove('update-mode');
+const cancelBtn=document.getElementById('cancel-edit-btn');
+if(cancelBtn){
+cancelBtn.remove();
+}
+}
+async function deleteIntake(id){
+if(confirm('Are you sure you want to delete this record?')){
+const response=await fetch(`${API_BASE}/intake/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+alert('Record deleted successfully!');
+loadIntakeAudit();
+}else{
+alert('Failed to delete record');
+}
+}
+}
+async function loadSupplementIntakeAudit(){
+document.getElementById('supplement-intake-audit-body').innerHTML='';
+await appendSupplementIntakeAuditPage(null);
+}
+async function appendSupplementIntakeAuditPage(next){
+const page=await fetchAuditPage('supplement-intake','supplement-intake',next);
+const tbody=document.getElementById('supplement-intake-audit-body');
+appendAuditRows(tbody,page,record=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+            <td>${record.id}</td>
+            <td>${formatTimestamp(record.timestamp)}</td>
+            <td>${record.supplement_name}</td>
+            <td>${record.supplement_amount}</td>
+            <td>
+                <button class="delete-btn" data-id="${record.id}">Delete</button>
+            </td>
+        `;
+return tr;
+},rows=>{
+rows.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteSupplementIntake(btn.dataset.id));
+});
+},appendSupplementIntakeAuditPage);
+}
+async function deleteSupplementIntake(id){
+if(confirm('Are you sure you want to delete this record?')){
+const response=await fetch(`${API_BASE}/supplement-intake/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+alert('Record deleted successfully!');
+loadSupplementIntakeAudit();
+}else{
+alert('Failed to delete record');
+}
+}
+}
+async function loadEventAudit(){
+document.getElementById('event-audit-body').innerHTML='';
+await appendEventAuditPage(null);
+}
+async function appendEventAuditPage(next){
+const page=await fetchAuditPage('event','event',next);
+const tbody=document.getElementById('event-audit-body');
+appendAuditRows(tbody,page,record=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+            <td>${record.id}</td>
+            <td>${formatTimestamp(record.timestamp)}</td>
+            <td>${record.event_name}</td>
+            <td>${record.event_notes||''}</td>
+            <td>
+                <button class="delete-btn" data-id="${record.id}">Delete</button>
+            </td>
+        `;
+return tr;
+},rows=>{
+rows.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteEvent(btn.dataset.id));
+});
+},appendEventAuditPage);
+}
+async function deleteEvent(id){
+if(confirm('Are you sure you want to delete this record?')){
+const response=await fetch(`${API_BASE}/event/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+alert('Record deleted successfully!');
+loadEventAudit();
+}else{
+alert('Failed to delete record');
+}
+}
+}
+async function loadNutritionAudit(){
+const response=await fetch(`${API_BASE}/nutrition`);
+const data=await response.json();
+const tbody=document.getElementById('nutrition-audit-body');
+tbody.innerHTML='';
+data.forEach(record=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+            <td>${record.id}</td>
+            <td>${record.nutrition_name}</td>
+            <td>${record.kcal}</td>
+            <td>${record.weight}</td>
+            <td>${record.kcal_per_gram.toFixed(4)}</td>
+            <td>
+                <button class="delete-btn" data-id="${record.id}">Delete</button>
+            </td>
+        `;
+tbody.appendChild(tr);
+});
+tbody.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteNutritionItem(btn.dataset.id));
+});
+}
+async function deleteNutritionItem(id){
+if(confirm('Are you sure you want to delete this nutrition item?')){
+const response=await fetch(`${API_BASE}/nutrition/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+alert('Record deleted successfully!');
+loadNutritionAudit();
+loadNutritionList();
+}else{
+alert('Failed to delete record');
+}
+}
+}
+async function editSupplement(id,name,defaultAmount){
+const newName=prompt('Enter supplement name:',name);
+if(newName===null)return;
+const newAmount=prompt('Enter default amount:',defaultAmount);
+if(newAmount===null)return;
+try{
+const response=await fetch(`${API_BASE}/supplements/${id}`,{
+method:'PUT',
+headers:{'Content-Type':'application/json'},
+body:JSON.stringify({supplement_name:newName,default_amount:parseFloat(newAmount)})
+});
+if(response.ok){
+loadSupplementsList();
+}else{
+alert('Failed to update supplement');
+}
+}catch(err){
+console.error('Failed to update supplement:',err);
+alert('Failed to update supplement');
+}
+}
+async function deleteSupplement(id){
+if(!confirm('Are you sure you want to delete this supplement?')){
+return;
+}
+try{
+const response=await fetch(`${API_BASE}/supplements/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+loadSupplementsList();
+}else{
+alert('Failed to delete supplement');
+}
+}catch(err){
+console.error('Failed to delete supplement:',err);
+alert('Failed to delete supplement');
+}
+}
+function initializeApp(){
+initializeTabs();
+initializeForms();
+initializeDynamicItems();
+initializeDateInputs();
+document.getElementById('update-glucose-chart-btn').addEventListener('click',loadGlucoseChart);
+document.getElementById('update-cv-btn').addEventListener('click',loadCVCharts);
+document.getElementById('update-risk-btn').addEventListener('click',loadRiskMetrics);
+document.getElementById('update-summary-btn').addEventListener('click',loadSummary);
+document.getElementById('reset-glucose-ts-btn').addEventListener('click',()=>resetToNow('glucose-timestamp'));
+document.getElementById('reset-insulin-ts-btn').addEventListener('click',()=>resetToNow('insulin-timestamp'));
+document.getElementById('reset-intake-ts-btn').addEventListener('click',()=>resetToNow('intake-timestamp'));
+document.getElementById('reset-event-ts-btn').addEventListener('click',()=>resetToNow('event-timestamp'));
+document.getElementById('filter-glucose-btn').addEventListener('click',loadGlucoseAudit);
+document.getElementById('filter-insulin-btn').addEventListener('click',loadInsulinAudit);
+document.getElementById('filter-intake-btn').addEventListener('click',loadIntakeAudit);
+document.getElementById('filter-supplement-intake-btn').addEventListener('click',loadSupplementIntakeAudit);
+document.getElementById('filter-event-btn').addEventListener('click',loadEventAudit);
+loadDashboard();
+setCurrentTimestamp();
+}
+document.addEventListener('DOMContentLoaded',initializeApp);
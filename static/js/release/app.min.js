@@ -1 +1,1702 @@
-const e="/api";async function t(t,n){try{const a=await fetch(e+t,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(n)});if(a.ok)return{success:!0,message:"Data submitted successfully!"};return{success:!1,message:(await a.json()).error||"Submission failed"}}catch(e){return{success:!1,message:"Network error: "+e.message}}}function n(e,t,n){const a=document.getElementById(e);a.className="message",a.textContent=n,a.classList.add(t?"success":"error"),setTimeout(()=>a.classList.add("show"),10);setTimeout(()=>{a.classList.remove("show"),setTimeout(()=>{a.textContent="",a.className="message"},300)},t?5e3:8e3)}function a(){const e=new Date;return`${e.getFullYear()}-${String(e.getMonth()+1).padStart(2,"0")}-${String(e.getDate()).padStart(2,"0")}T${String(e.getHours()).padStart(2,"0")}:${String(e.getMinutes()).padStart(2,"0")}`}function o(e){return new Date(e).toISOString().replace("T"," ").slice(0,19)}function i(){const e=a();document.querySelectorAll('input[type="datetime-local"]').forEach(t=>{t.value||(t.value=e)})}function l(e){const t=document.getElementById(e);if(t){const e=a();t.value=e}}function s(e,t="Submitting..."){e.dataset.originalText=e.textContent,e.textContent=t,e.disabled=!0,e.classList.add("submitting")}function d(e){e.dataset.originalText&&(e.textContent=e.dataset.originalText,delete e.dataset.originalText),e.disabled=!1,e.classList.remove("submitting")}function r(e){return new Date(e.replace(" ","T")+"Z")}function c(e){const t=r(e);return`${t.getFullYear()}-${String(t.getMonth()+1).padStart(2,"0")}-${String(t.getDate()).padStart(2,"0")}T${String(t.getHours()).padStart(2,"0")}:${String(t.getMinutes()).padStart(2,"0")}`}function u(e){return r(e).toLocaleString()}function m(){return Intl.DateTimeFormat().resolvedOptions().timeZone}function p(e){const t=document.createElement("div");return t.textContent=e,t.innerHTML}function g(){document.querySelectorAll(".tab-btn").forEach(t=>{t.addEventListener("click",()=>{!function(t){document.querySelectorAll(".tab-btn").forEach(e=>e.classList.remove("active")),document.querySelectorAll(".tab-content").forEach(e=>e.classList.remove("active")),document.querySelector(`[data-tab="${t}"]`).classList.add("active"),document.getElementById(t).classList.add("active"),function(t){switch(t){case"dashboard":L();break;case"intake":H(),G(),ae(),ie(),async function(){try{const t=await fetch(`${e}/intake/previous-window?tz=${encodeURIComponent(m())}`),n=await t.json(),a=n.nutrition||[],o=n.supplements||[];await async function(e){const t=document.getElementById("nutrition-items-container");if(t.innerHTML="",P=0,0===e.length)!function(e){P=1;const t=document.createElement("div");t.className="nutrition-item",t.innerHTML='\n        <h4>Nutrition Item 1</h4>\n        <label>Nutrition: \n            <select name="nutrition_id[]" class="nutrition-select" required>\n                <option value="">Select nutrition...</option>\n            </select>\n        </label>\n        <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1"></label>\n        <button type="button" class="remove-nutrition-btn">Remove</button>\n    ',e.appendChild(t),R(t.querySelector(".nutrition-select"))}(t);else for(const n of e)await z(t,n);K()}(a),await async function(e){const t=document.getElementById("supplement-items-container");if(t.innerHTML="",W=0,0===e.length)!function(e){W=1;const t=document.createElement("div");t.className="supplement-item nutrition-item",t.innerHTML='\n        <h4>Supplement Item 1</h4>\n        <label>Supplement: \n            <select name="supplement_id[]" class="supplement-select" required>\n                <option value="">Select supplement...</option>\n            </select>\n        </label>\n        <label>Amount: <input type="number" name="supplement_amount[]" required min="0" step="0.1"></label>\n        <button type="button" class="remove-supplement-btn">Remove</button>\n    ',e.appendChild(t),j(t.querySelector(".supplement-select"))}(t);else for(const n of e)await Y(t,n);Q()}(o)}catch(e){console.error("Failed to autofill previous intake:",e)}}();break;case"supplements":O();break;case"nutrition":T(),se();break;case"event":le();break;case"glucose":te();break;case"insulin":ne()}}(t),setTimeout(i,100)}(t.getAttribute("data-tab"))})})}"undefined"!=typeof module&&module.exports&&(module.exports={API_BASE:e});let y=null,b=null,v=null,h=null,f=null,E=null,$=null,_=null,I=null,k=null,w=null,C=null,B=null;async function L(){S(),F(),T(),x(),M(),async function(){const t=document.getElementById("predictionContent");try{const n=await fetch(`${e}/dashboard/prediction?lookback_days=30&tz=${encodeURIComponent(m())}`);if(!n.ok)throw new Error("Failed to fetch prediction");const a=await n.json();if(a.error)return void D(t,a);!function(e,t){const{prediction:n,next_window:a,basis:o,warnings:i}=t;if(!n)return void D(e,t);const l=`confidence-${n.confidence.toLowerCase()}`,s=function(e){switch(e){case"High":return"●●●●●";case"Medium":return"●●●○○";case"Low":return"●○○○○";default:return"○○○○○"}}(n.confidence);let d=`\n        <div class="prediction-box">\n            <div class="prediction-item">\n                <h3>📊 Predicted Glucose</h3>\n                <div class="prediction-value">${n.glucose} mg/dL</div>\n                <div class="prediction-range">Range: ${n.glucose_range[0]} - ${n.glucose_range[1]} mg/dL</div>\n            </div>\n            <div class="prediction-item">\n                <h3>💉 Recommended Insulin</h3>\n                <div class="prediction-value">\n                    ${null!==n.insulin_recommended?n.insulin_recommended+" units":"N/A"}\n                </div>\n                ${null===n.insulin_recommended?'<div class="prediction-range">Insufficient data</div>':""}\n            </div>\n        </div>\n        \n        <div class="prediction-confidence">\n            <div>Time Window: <strong>${a}</strong></div>\n            <div class="confidence-level ${l}">\n                Confidence: ${n.confidence}\n            </div>\n            <div class="confidence-dots">${s}</div>\n        </div>\n        \n        <div class="prediction-basis">\n            Based on ${o.data_points} glucose readings over ${o.lookback_days} days\n            ${null!==o.recent_cv?`(CV: ${o.recent_cv}%)`:""}\n        </div>\n    `;i&&i.length>0&&(d+=`\n            <div class="prediction-warnings">\n                <h4>⚠️ Warnings</h4>\n                <ul>\n                    ${i.map(e=>`<li>${p(e)}</li>`).join("")}\n                </ul>\n            </div>\n        `);d+='\n        <div class="prediction-disclaimer">\n            This prediction is for informational purposes only. Always verify with actual glucose readings and consult your veterinarian for dosing decisions.\n        </div>\n    ',e.innerHTML=d}(t,a)}catch(e){console.error("Error loading prediction:",e),t.innerHTML=`\n            <div class="prediction-error">\n                <p><strong>Unable to load prediction</strong></p>\n                <p>${e.message}</p>\n            </div>\n        `}}()}async function S(){const t=document.getElementById("chart-start-date").value,n=document.getElementById("chart-end-date").value;try{const a=await fetch(`${e}/dashboard/glucose-chart?start_date=${t}&end_date=${n}&tz=${encodeURIComponent(m())}`),o=await a.json(),i=document.getElementById("glucoseChart").getContext("2d");y&&y.destroy(),y=new Chart(i,{type:"line",data:{labels:o.map(e=>e.week),datasets:[{label:"Glucose (mg/dL)",data:o.map(e=>e.glucose_mean),borderColor:"#667eea",backgroundColor:"rgba(102, 126, 234, 0.1)",tension:.1,yAxisID:"yAxisGlucose"},{label:"Insulin (units)",data:o.map(e=>e.insulin_mean),borderColor:"#f6993f",backgroundColor:"rgba(246, 153, 63, 0.1)",tension:.1,yAxisID:"yAxisInsulin"}]},options:{responsive:!0,maintainAspectRatio:!0,interaction:{mode:"index",intersect:!1},scales:{yAxisGlucose:{type:"linear",position:"left",beginAtZero:!1,title:{display:!0,text:"Glucose (mg/dL)"}},yAxisInsulin:{type:"linear",position:"right",beginAtZero:!1,title:{display:!0,text:"Insulin (units)"},grid:{drawOnChartArea:!1}}},plugins:{legend:{display:!0,position:"top"}}}})}catch(e){console.error("Failed to load glucose chart:",e)}}async function F(){const t=document.getElementById("summary-start-date").value,n=document.getElementById("summary-end-date").value;try{const a=await fetch(`${e}/dashboard/summary?start_date=${t}&end_date=${n}&tz=${encodeURIComponent(m())}`),o=await a.json(),i=document.getElementById("summaryBody");i.innerHTML="",o.forEach(e=>{if(e){const t=document.createElement("tr");[{value:e.am_pm,isGlucose:!1},{value:e.date,isGlucose:!1},{value:e.dosage||"-",isGlucose:!1},{value:e.glucose_levels["+0"]||"-",isGlucose:!0},{value:e.glucose_levels["+1"]||"-",isGlucose:!0},{value:e.glucose_levels["+2"]||"-",isGlucose:!0},{value:e.glucose_levels["+3"]||"-",isGlucose:!0},{value:e.glucose_levels["+4"]||"-",isGlucose:!0},{value:e.glucose_levels["+5"]||"-",isGlucose:!0},{value:e.glucose_levels["+6"]||"-",isGlucose:!0},{value:e.glucose_levels["+7"]||"-",isGlucose:!0},{value:e.glucose_levels["+8"]||"-",isGlucose:!0},{value:e.glucose_levels["+9"]||"-",isGlucose:!0},{value:e.glucose_levels["+10"]||"-",isGlucose:!0},{value:e.glucose_levels["+11"]||"-",isGlucose:!0},{value:e.kcal_intake.toFixed(1),isGlucose:!1}].forEach(e=>{const n=document.createElement("td");if(n.textContent=e.value,e.isGlucose&&"-"!==e.value){const t=function(e){if(!e||"-"===e)return{background:"",color:""};const t=parseFloat(e);return t>=500?{background:"#000000",color:"#FFFFFF"}:t>=400?{background:"#FF0000",color:"#FFFFFF"}:t>=300?{background:"#FF00FF",color:"#FFFFFF"}:t>=200?{background:"#FFB6FF",color:"#000000"}:t>100?{background:"#98fab2",color:"#000000"}:t>=60?{background:"#6eb882",color:"#000000"}:{background:"#FFFF00",color:"#FF0000"}}(e.value);n.style.backgroundColor=t.background,n.style.color=t.color}t.appendChild(n)}),t.addEventListener("click",()=>function(e){const t=e=>e&&"-"!==e?r(e).toTimeString().slice(0,5):"-";document.getElementById("overlay-dose-time").textContent=t(e.dose_time),document.getElementById("overlay-intake-time").textContent=t(e.intake_time),document.getElementById("overlay-nutritions").textContent=e.nutrition||"-",document.getElementById("overlay-supplements").textContent=e.grouped_supplements||"-",document.getElementById("overlay-events").textContent=e.grouped_events||"-";document.getElementById("summaryOverlay").style.display="flex"}(e)),i.appendChild(t)}})}catch(e){console.error("Failed to load summary:",e)}}async function T(){try{const t=await fetch(`${e}/nutrition`),n=await t.json(),a=document.getElementById("nutritionListBody");a.innerHTML="",n.forEach(e=>{const t=document.createElement("tr");t.innerHTML=`\n                <td>${e.id}</td>\n                <td>${e.nutrition_name}</td>\n                <td>${e.kcal}</td>\n                <td>${e.weight}</td>\n                <td>${e.kcal_per_gram.toFixed(4)}</td>\n            `,a.appendChild(t)})}catch(e){console.error("Failed to load nutrition list:",e)}}async function x(){const t=document.getElementById("cv-end-date").value;try{const n=await fetch(`${e}/dashboard/cv-charts?end_date=${t}&tz=${encodeURIComponent(m())}`),a=await n.json();A("cvChart7d12h",a.cv_7d_12h,b),A("cvChart30d48h",a.cv_30d_48h,v),A("cvChart30d5d",a.cv_30d_5d,h)}catch(e){console.error("Failed to load CV charts:",e)}}function A(e,t,n){const a=document.getElementById(e).getContext("2d");n&&n.destroy();const o=Math.max(...t.map(e=>e.cv||0),100),i=new Chart(a,{type:"line",data:{labels:t.map(e=>e.label),datasets:[{label:"CV (%)",data:t.map(e=>e.cv),borderColor:"#667eea",backgroundColor:"rgba(102, 126, 234, 0.1)",tension:.1}]},options:{responsive:!0,maintainAspectRatio:!0,scales:{x:{ticks:{display:!1},grid:{display:!1}},y:{beginAtZero:!0,max:Math.max(o,40),title:{display:!0,text:"CV (%)"}}},plugins:{legend:{display:!1},annotation:{annotations:{greenBand:{type:"box",yMin:0,yMax:25,backgroundColor:"rgba(0, 255, 0, 0.3)",borderWidth:0,drawTime:"beforeDatasetsDraw"},yellowBand:{type:"box",yMin:25,yMax:35,backgroundColor:"rgba(255, 255, 0, 0.3)",borderWidth:0,drawTime:"beforeDatasetsDraw"},redBand:{type:"box",yMin:35,yMax:Math.max(o,45),backgroundColor:"rgba(255, 0, 0, 0.3)",borderWidth:0,drawTime:"beforeDatasetsDraw"}}}}}});"cvChart7d12h"===e?b=i:"cvChart30d48h"===e?v=i:"cvChart30d5d"===e&&(h=i)}async function x(){const t=document.getElementById("cv-end-date").value;try{const n=await fetch(`${e}/dashboard/cv-charts?end_date=${t}&tz=${encodeURIComponent(m())}`),a=await n.json();A("cvChart7d12h",a.cv_7d_12h,b),A("cvChart30d48h",a.cv_30d_48h,v),A("cvChart30d5d",a.cv_30d_5d,h)}catch(e){console.error("Failed to load CV charts:",e)}}async function M(){const t=document.getElementById("risk-end-date").value;try{const n=await fetch(`${e}/dashboard/risk-metrics?end_date=${t}&tz=${encodeURIComponent(m())}`),a=await n.json();q("lbgiChart7d12h",a.lbgi_7d_12h,f,"LBGI",[3.5,7],["rgba(0, 255, 0, 0.3)","rgba(255, 255, 0, 0.3)","rgba(255, 0, 0, 0.3)"]),q("lbgiChart30d48h",a.lbgi_30d_48h,E,"LBGI",[3.5,7],["rgba(0, 255, 0, 0.3)","rgba(255, 255, 0, 0.3)","rgba(255, 0, 0, 0.3)"]),q("lbgiChart30d5d",a.lbgi_30d_5d,$,"LBGI",[3.5,7],["rgba(0, 255, 0, 0.3)","rgba(255, 255, 0, 0.3)","rgba(255, 0, 0, 0.3)"]),q("hbgiChart7d12h",a.hbgi_7d_12h,_,"HBGI",[6,12],["rgba(0, 255, 0, 0.3)","rgba(255, 255, 0, 0.3)","rgba(255, 0, 0, 0.3)"]),q("hbgiChart30d48h",a.hbgi_30d_48h,I,"HBGI",[6,12],["rgba(0, 255, 0, 0.3)","rgba(255, 255, 0, 0.3)","rgba(255, 0, 0, 0.3)"]),q("hbgiChart30d5d",a.hbgi_30d_5d,k,"HBGI",[6,12],["rgba(0, 255, 0, 0.3)","rgba(255, 255, 0, 0.3)","rgba(255, 0, 0, 0.3)"]),q("adrrChart7d12h",a.adrr_7d_12h,w,"ADRR",[25,50],["rgba(0, 255, 0, 0.3)","rgba(255, 255, 0, 0.3)","rgba(255, 0, 0, 0.3)"]),q("adrrChart30d48h",a.adrr_30d_48h,C,"ADRR",[25,50],["rgba(0, 255, 0, 0.3)","rgba(255, 255, 0, 0.3)","rgba(255, 0, 0, 0.3)"]),q("adrrChart30d5d",a.adrr_30d_5d,B,"ADRR",[25,50],["rgba(0, 255, 0, 0.3)","rgba(255, 255, 0, 0.3)","rgba(255, 0, 0, 0.3)"])}catch(e){console.error("Failed to load risk metrics:",e)}}function q(e,t,n,a,o,i){const l=document.getElementById(e).getContext("2d");n&&n.destroy();const s=Math.max(...t.map(e=>e.value||0),1.5*o[1]),d=new Chart(l,{type:"line",data:{labels:t.map(e=>e.label),datasets:[{label:a,data:t.map(e=>e.value),borderColor:"#667eea",backgroundColor:"rgba(102, 126, 234, 0.1)",tension:.1,spanGaps:!0}]},options:{responsive:!0,maintainAspectRatio:!0,scales:{x:{ticks:{display:!1},grid:{display:!1}},y:{beginAtZero:!0,max:s,title:{display:!0,text:a}}},plugins:{legend:{display:!1},annotation:{annotations:{greenBand:{type:"box",yMin:0,yMax:o[0],backgroundColor:i[0],borderWidth:0,drawTime:"beforeDatasetsDraw"},yellowBand:{type:"box",yMin:o[0],yMax:o[1],backgroundColor:i[1],borderWidth:0,drawTime:"beforeDatasetsDraw"},redBand:{type:"box",yMin:o[1],yMax:s,backgroundColor:i[2],borderWidth:0,drawTime:"beforeDatasetsDraw"}}}}}});"lbgiChart7d12h"===e?f=d:"lbgiChart30d48h"===e?E=d:"lbgiChart30d5d"===e?$=d:"hbgiChart7d12h"===e?_=d:"hbgiChart30d48h"===e?I=d:"hbgiChart30d5d"===e?k=d:"adrrChart7d12h"===e?w=d:"adrrChart30d48h"===e?C=d:"adrrChart30d5d"===e&&(B=d)}function D(e,t){const n=t.warnings||["Unable to generate prediction"];e.innerHTML=`\n        <div class="prediction-error">\n            <p><strong>Cannot Generate Prediction</strong></p>\n            <p>${n.join(". ")}</p>\n            ${t.basis?`<p style="margin-top:10px; font-size:0.9em;">Data points available: ${t.basis.data_points}</p>`:""}\n        </div>\n    `}async function H(){try{const t=await fetch(`${e}/nutrition`),n=await t.json();document.querySelectorAll(".nutrition-select").forEach(e=>{N(e,n)})}catch(e){console.error("Failed to load nutrition options:",e)}}async function R(t){try{const n=await fetch(`${e}/nutrition`);N(t,await n.json())}catch(e){console.error("Failed to load nutrition options:",e)}}function N(e,t){e.innerHTML='<option value="">Select nutrition...</option>',t.forEach(t=>{const n=document.createElement("option");n.value=t.id,n.textContent=`${t.nutrition_name} (${t.kcal_per_gram.toFixed(4)} kcal/g)`,e.appendChild(n)})}async function G(){try{const t=await fetch(`${e}/supplements`),n=await t.json();document.querySelectorAll(".supplement-select").forEach(e=>{U(e,n)})}catch(e){console.error("Failed to load supplement options:",e)}}async function j(t){try{const n=await fetch(`${e}/supplements`);U(t,await n.json())}catch(e){console.error("Failed to load supplement options:",e)}}function U(e,t){e.innerHTML='<option value="">Select supplement...</option>',t.forEach(t=>{const n=document.createElement("option");n.value=t.id,n.textContent=t.supplement_name,n.dataset.defaultAmount=t.default_amount,e.appendChild(n)}),e.addEventListener("change",function(){const e=this.options[this.selectedIndex].dataset.defaultAmount;if(e){this.closest(".supplement-item").querySelector('input[name="supplement_amount[]"]').value=e}})}async function O(){try{const t=await fetch(`${e}/supplements`),n=await t.json(),a=document.getElementById("supplements-list");if(0===n.length)return void(a.innerHTML="<p>No supplements found.</p>");let o='<div class="table-wrapper"><table class="audit-table"><thead><tr><th>ID</th><th>Supplement Name</th><th>Default Amount</th><th>Actions</th></tr></thead><tbody>';n.forEach(e=>{o+=`\n                <tr>\n                    <td>${e.id}</td>\n                    <td>${p(e.supplement_name)}</td>\n                    <td>${e.default_amount}</td>\n                    <td>\n                        <button class="edit-btn" data-id="${e.id}" data-name="${p(e.supplement_name)}" data-amount="${e.default_amount}">Edit</button>\n                        <button class="delete-btn" data-id="${e.id}">Delete</button>\n                    </td>\n                </tr>\n            `}),o+="</tbody></table></div>",a.innerHTML=o,a.querySelectorAll(".edit-btn").forEach(t=>{t.addEventListener("click",()=>async function(t,n,a){const o=prompt("Enter supplement name:",n);if(null===o)return;const i=prompt("Enter default amount:",a);if(null===i)return;try{(await fetch(`${e}/supplements/${t}`,{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify({supplement_name:o,default_amount:parseFloat(i)})})).ok?O():alert("Failed to update supplement")}catch(e){console.error("Failed to update supplement:",e),alert("Failed to update supplement")}}(t.dataset.id,t.dataset.name,t.dataset.amount))}),a.querySelectorAll(".delete-btn").forEach(t=>{t.addEventListener("click",()=>async function(t){if(!confirm("Are you sure you want to delete this supplement?"))return;try{(await fetch(`${e}/supplements/${t}`,{method:"DELETE"})).ok?O():alert("Failed to delete supplement")}catch(e){console.error("Failed to delete supplement:",e),alert("Failed to delete supplement")}}(t.dataset.id))})}catch(e){console.error("Failed to load supplements list:",e)}}async function z(e,t){P++;const n=document.createElement("div");n.className="nutrition-item",n.innerHTML=`\n        <h4>Nutrition Item ${P}</h4>\n        <label>Nutrition: \n            <select name="nutrition_id[]" class="nutrition-select" required>\n                <option value="">Select nutrition...</option>\n            </select>\n        </label>\n        <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1" value="${t.nutrition_amount}"></label>\n        <button type="button" class="remove-nutrition-btn">Remove</button>\n    `,e.appendChild(n),await R(n.querySelector(".nutrition-select")),n.querySelector(".nutrition-select").value=t.nutrition_id}async function Y(e,t){W++;const n=document.createElement("div");n.className="supplement-item nutrition-item",n.innerHTML=`\n        <h4>Supplement Item ${W}</h4>\n        <label>Supplement: \n            <select name="supplement_id[]" class="supplement-select" required>\n                <option value="">Select supplement...</option>\n            </select>\n        </label>\n        <label>Amount: <input type="number" name="supplement_amount[]" required min="0" step="0.1" value="${t.supplement_amount}"></label>\n        <button type="button" class="remove-supplement-btn">Remove</button>\n    `,e.appendChild(n),await j(n.querySelector(".supplement-select")),n.querySelector(".supplement-select").value=t.supplement_id}document.addEventListener("DOMContentLoaded",()=>{const e=document.getElementById("summaryOverlay");e&&e.addEventListener("click",t=>{t.target===e&&(document.getElementById("summaryOverlay").style.display="none")})});let P=1,W=1;function V(){document.getElementById("add-nutrition-btn").addEventListener("click",Z),document.getElementById("add-supplement-btn").addEventListener("click",J),document.getElementById("nutrition-items-container").addEventListener("click",e=>{e.target.matches(".remove-nutrition-btn")&&(e.target.closest(".nutrition-item").remove(),function(){const e=document.querySelectorAll("#nutrition-items-container .nutrition-item");e.forEach((e,t)=>{e.querySelector("h4").textContent=`Nutrition Item ${t+1}`}),P=e.length}())}),document.getElementById("supplement-items-container").addEventListener("click",e=>{e.target.matches(".remove-supplement-btn")&&(e.target.closest(".supplement-item").remove(),Q(),function(){const e=document.querySelectorAll("#supplement-items-container .supplement-item");e.forEach((e,t)=>{e.querySelector("h4").textContent=`Supplement Item ${t+1}`}),W=e.length}())})}function Z(){P++;const e=document.getElementById("nutrition-items-container"),t=document.createElement("div");t.className="nutrition-item",t.innerHTML=`\n        <h4>Nutrition Item ${P}</h4>\n        <label>Nutrition: \n            <select name="nutrition_id[]" class="nutrition-select" required>\n                <option value="">Select nutrition...</option>\n            </select>\n        </label>\n        <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1"></label>\n        <button type="button" class="remove-nutrition-btn">Remove</button>\n    `,e.appendChild(t),R(t.querySelector(".nutrition-select")),K()}function J(){W++;const e=document.getElementById("supplement-items-container"),t=document.createElement("div");t.className="supplement-item nutrition-item",t.innerHTML=`\n        <h4>Supplement Item ${W}</h4>\n        <label>Supplement: \n            <select name="supplement_id[]" class="supplement-select" required>\n                <option value="">Select supplement...</option>\n            </select>\n        </label>\n        <label>Amount: <input type="number" name="supplement_amount[]" required min="0" step="0.1"></label>\n        <button type="button" class="remove-supplement-btn">Remove</button>\n    `,e.appendChild(t),j(t.querySelector(".supplement-select")),Q()}function K(){document.querySelectorAll("#nutrition-items-container .nutrition-item").forEach(e=>{e.querySelector(".remove-nutrition-btn").style.display="inline-block"})}function Q(){document.querySelectorAll("#supplement-items-container .supplement-item").forEach(e=>{e.querySelector(".remove-supplement-btn").style.display="inline-block"})}async function X(a){a.preventDefault();const i=a.target.querySelector('button[type="submit"]');s(i);const l=new FormData(a.target),r=o(l.get("timestamp"));if(window.currentEditingIntakeId){const t=l.get("nutrition_id[]"),a=l.get("nutrition_amount[]");if(!t)return d(i),void n("intake-message",!1,"Please select a nutrition item");const o={timestamp:r,nutrition_id:parseInt(t),nutrition_amount:parseFloat(a)};try{const t=await fetch(`${e}/intake/${window.currentEditingIntakeId}`,{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify(o)});if(d(i),t.ok)n("intake-message",!0,"Record updated successfully!"),oe(),ae();else{n("intake-message",!1,(await t.json()).error||"Update failed")}}catch(e){d(i),n("intake-message",!1,"Network error: "+e.message)}return}const c=l.getAll("nutrition_id[]"),u=l.getAll("nutrition_amount[]"),m=l.getAll("supplement_id[]"),p=l.getAll("supplement_amount[]"),g=c.filter(e=>e).length,y=m.filter(e=>e).length;if(g+y===0)return d(i),void n("intake-message",!1,"Please add at least one nutrition or supplement item");let b=!0,v=[];for(let e=0;e<c.length;e++)if(c[e]){const n={timestamp:r,nutrition_id:parseInt(c[e]),nutrition_amount:parseFloat(u[e])},a=await t("/intake",n);a.success||(b=!1,v.push(`Nutrition Item ${e+1}: ${a.message}`))}for(let e=0;e<m.length;e++)if(m[e]){const n={timestamp:r,supplement_id:parseInt(m[e]),supplement_amount:parseFloat(p[e])},a=await t("/supplement-intake",n);a.success||(b=!1,v.push(`Supplement Item ${e+1}: ${a.message}`))}if(d(i),b){n("intake-message",!0,`Successfully submitted ${g+y} item(s)!`),ee(),ae(),ie()}else n("intake-message",!1,"Some items failed: "+v.join(", "))}function ee(){document.getElementById("intakeForm").reset();document.getElementById("nutrition-items-container").innerHTML='\n        <div class="nutrition-item">\n            <h4>Nutrition Item 1</h4>\n            <label>Nutrition: \n                <select name="nutrition_id[]" class="nutrition-select" required>\n                    <option value="">Select nutrition...</option>\n                </select>\n            </label>\n            <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1"></label>\n            <button type="button" class="remove-nutrition-btn" style="display:none;">Remove</button>\n        </div>\n    ';document.getElementById("supplement-items-container").innerHTML='\n        <div class="supplement-item nutrition-item">\n            <h4>Supplement Item 1</h4>\n            <label>Supplement: \n                <select name="supplement_id[]" class="supplement-select" required>\n                    <option value="">Select supplement...</option>\n                </select>\n            </label>\n            <label>Amount: <input type="number" name="supplement_amount[]" required min="0" step="0.1"></label>\n            <button type="button" class="remove-supplement-btn">Remove</button>\n        </div>\n    ',P=1,W=1,document.getElementById("add-nutrition-btn").style.display="inline-block",document.getElementById("add-supplement-btn").style.display="inline-block";const e=document.querySelector('#intakeForm button[type="submit"]');e.textContent="Submit All",e.classList.remove("update-mode");const t=document.getElementById("cancel-edit-btn");t&&t.remove(),window.currentEditingIntakeId=null,H(),G()}async function te(){const t=document.getElementById("glucose-start-filter").value,n=document.getElementById("glucose-end-filter").value;let a=`${e}/glucose?tz=${encodeURIComponent(m())}`;t&&n&&(a+=`&start_date=${t}&end_date=${n}`);const i=await fetch(a),l=await i.json(),s=document.getElementById("glucose-audit-body");s.innerHTML="",l.forEach(e=>{const t=document.createElement("tr");t.innerHTML=`\n            <td>${e.id}</td>\n            <td>${u(e.timestamp)}</td>\n            <td>${e.level}</td>\n            <td>\n                <button class="edit-btn" data-id="${e.id}" data-ts="${e.timestamp}" data-level="${e.level}">Edit</button>\n                <button class="delete-btn" data-id="${e.id}">Delete</button>\n            </td>\n        `,s.appendChild(t)}),s.querySelectorAll(".edit-btn").forEach(t=>{t.addEventListener("click",()=>async function(t,n,a){const i=prompt("Enter new timestamp (local time, YYYY-MM-DDTHH:MM):",c(n)),l=prompt("Enter new glucose level:",a);if(i&&l){(await fetch(`${e}/glucose/${t}`,{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify({timestamp:o(i),level:parseInt(l)})})).ok?(alert("Record updated successfully!"),te()):alert("Failed to update record")}}(t.dataset.id,t.dataset.ts,t.dataset.level))}),s.querySelectorAll(".delete-btn").forEach(t=>{t.addEventListener("click",()=>async function(t){if(confirm("Are you sure you want to delete this record?")){(await fetch(`${e}/glucose/${t}`,{method:"DELETE"})).ok?(alert("Record deleted successfully!"),te()):alert("Failed to delete record")}}(t.dataset.id))})}async function ne(){const t=document.getElementById("insulin-start-filter").value,n=document.getElementById("insulin-end-filter").value;let a=`${e}/insulin?tz=${encodeURIComponent(m())}`;t&&n&&(a+=`&start_date=${t}&end_date=${n}`);const i=await fetch(a),l=await i.json(),s=document.getElementById("insulin-audit-body");s.innerHTML="",l.forEach(e=>{const t=document.createElement("tr");t.innerHTML=`\n            <td>${e.id}</td>\n            <td>${u(e.timestamp)}</td>\n            <td>${e.level}</td>\n            <td>\n                <button class="edit-btn" data-id="${e.id}" data-ts="${e.timestamp}" data-level="${e.level}">Edit</button>\n                <button class="delete-btn" data-id="${e.id}">Delete</button>\n            </td>\n        `,s.appendChild(t)}),s.querySelectorAll(".edit-btn").forEach(t=>{t.addEventListener("click",()=>async function(t,n,a){const i=prompt("Enter new timestamp (local time, YYYY-MM-DDTHH:MM):",c(n)),l=prompt("Enter new insulin level:",a);if(i&&l){(await fetch(`${e}/insulin/${t}`,{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify({timestamp:o(i),level:parseFloat(l)})})).ok?(alert("Record updated successfully!"),ne()):alert("Failed to update record")}}(t.dataset.id,t.dataset.ts,t.dataset.level))}),s.querySelectorAll(".delete-btn").forEach(t=>{t.addEventListener("click",()=>async function(t){if(confirm("Are you sure you want to delete this record?")){(await fetch(`${e}/insulin/${t}`,{method:"DELETE"})).ok?(alert("Record deleted successfully!"),ne()):alert("Failed to delete record")}}(t.dataset.id))})}async function ae(){const t=document.getElementById("intake-start-filter").value,n=document.getElementById("intake-end-filter").value;let a=`${e}/intake?tz=${encodeURIComponent(m())}`;t&&n&&(a+=`&start_date=${t}&end_date=${n}`);const o=await fetch(a),i=await o.json(),l=document.getElementById("intake-audit-body");l.innerHTML="",i.forEach(e=>{const t=document.createElement("tr");t.innerHTML=`\n            <td>${e.id}</td>\n            <td>${u(e.timestamp)}</td>\n            <td>${e.nutrition_name}</td>\n            <td>${e.nutrition_amount}</td>\n            <td>${e.nutrition_kcal.toFixed(1)}</td>\n            <td>\n                <button class="edit-btn"\n                    data-id="${e.id}"\n                    data-ts="${e.timestamp}"\n                    data-nid="${e.nutrition_id}"\n                    data-name="${p(e.nutrition_name)}"\n                    data-amount="${e.nutrition_amount}">Edit</button>\n                <button class="delete-btn" data-id="${e.id}">Delete</button>\n            </td>\n        `,l.appendChild(t)}),l.querySelectorAll(".edit-btn").forEach(e=>{e.addEventListener("click",()=>async function(e,t,n,a,o){window.currentEditingIntakeId=e;document.getElementById("nutrition-items-container").innerHTML='\n        <div class="nutrition-item">\n            <h4>Nutrition Item 1</h4>\n            <label>Nutrition: \n                <select name="nutrition_id[]" class="nutrition-select" required>\n                    <option value="">Select nutrition...</option>\n                </select>\n            </label>\n            <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1"></label>\n            <button type="button" class="remove-nutrition-btn" style="display:none;">Remove</button>\n        </div>\n    ';document.getElementById("supplement-items-container").innerHTML="",document.getElementById("add-nutrition-btn").style.display="none",document.getElementById("add-supplement-btn").style.display="none",await H();document.querySelector(".nutrition-select").value=n;document.getElementById("intake-timestamp").value=c(t);document.querySelector('input[name="nutrition_amount[]"]').value=o;const i=document.querySelector('#intakeForm button[type="submit"]');if(i.textContent="Update",i.classList.add("update-mode"),!document.getElementById("cancel-edit-btn")){const e=document.createElement("button");e.type="button",e.id="cancel-edit-btn",e.textContent="Cancel Edit",e.className="secondary-btn",e.addEventListener("click",oe),i.parentNode.insertBefore(e,i.nextSibling)}document.getElementById("intake").scrollIntoView({behavior:"smooth",block:"start"})}(e.dataset.id,e.dataset.ts,e.dataset.nid,e.dataset.name,e.dataset.amount))}),l.querySelectorAll(".delete-btn").forEach(t=>{t.addEventListener("click",()=>async function(t){if(confirm("Are you sure you want to delete this record?")){(await fetch(`${e}/intake/${t}`,{method:"DELETE"})).ok?(alert("Record deleted successfully!"),ae()):alert("Failed to delete record")}}(t.dataset.id))})}function oe(){window.currentEditingIntakeId=null,ee(),document.getElementById("add-nutrition-btn").style.display="inline-block",document.getElementById("add-supplement-btn").style.display="inline-block";const e=document.querySelector('#intakeForm button[type="submit"]');e.textContent="Submit All",e.classList.remove("update-mode");const t=document.getElementById("cancel-edit-btn");t&&t.remove()}async function ie(){const t=document.getElementById("supplement-intake-start-filter").value,n=document.getElementById("supplement-intake-end-filter").value;let a=`${e}/supplement-intake?tz=${encodeURIComponent(m())}`;t&&n&&(a+=`&start_date=${t}&end_date=${n}`);const o=await fetch(a),i=await o.json(),l=document.getElementById("supplement-intake-audit-body");l.innerHTML="",i.forEach(e=>{const t=document.createElement("tr");t.innerHTML=`\n            <td>${e.id}</td>\n            <td>${u(e.timestamp)}</td>\n            <td>${e.supplement_name}</td>\n            <td>${e.supplement_amount}</td>\n            <td>\n                <button class="delete-btn" data-id="${e.id}">Delete</button>\n            </td>\n        `,l.appendChild(t)}),l.querySelectorAll(".delete-btn").forEach(t=>{t.addEventListener("click",()=>async function(t){if(confirm("Are you sure you want to delete this record?")){(await fetch(`${e}/supplement-intake/${t}`,{method:"DELETE"})).ok?(alert("Record deleted successfully!"),ie()):alert("Failed to delete record")}}(t.dataset.id))})}async function le(){const t=document.getElementById("event-start-filter").value,n=document.getElementById("event-end-filter").value;let a=`${e}/event?tz=${encodeURIComponent(m())}`;t&&n&&(a+=`&start_date=${t}&end_date=${n}`);const o=await fetch(a),i=await o.json(),l=document.getElementById("event-audit-body");l.innerHTML="",i.forEach(e=>{const t=document.createElement("tr");t.innerHTML=`\n            <td>${e.id}</td>\n            <td>${u(e.timestamp)}</td>\n            <td>${e.event_name}</td>\n            <td>${e.event_notes||""}</td>\n            <td>\n                <button class="delete-btn" data-id="${e.id}">Delete</button>\n            </td>\n        `,l.appendChild(t)}),l.querySelectorAll(".delete-btn").forEach(t=>{t.addEventListener("click",()=>async function(t){if(confirm("Are you sure you want to delete this record?")){(await fetch(`${e}/event/${t}`,{method:"DELETE"})).ok?(alert("Record deleted successfully!"),le()):alert("Failed to delete record")}}(t.dataset.id))})}async function se(){const t=await fetch(`${e}/nutrition`),n=await t.json(),a=document.getElementById("nutrition-audit-body");a.innerHTML="",n.forEach(e=>{const t=document.createElement("tr");t.innerHTML=`\n            <td>${e.id}</td>\n            <td>${e.nutrition_name}</td>\n            <td>${e.kcal}</td>\n            <td>${e.weight}</td>\n            <td>${e.kcal_per_gram.toFixed(4)}</td>\n            <td>\n                <button class="delete-btn" data-id="${e.id}">Delete</button>\n            </td>\n        `,a.appendChild(t)}),a.querySelectorAll(".delete-btn").forEach(t=>{t.addEventListener("click",()=>async function(t){if(confirm("Are you sure you want to delete this nutrition item?")){(await fetch(`${e}/nutrition/${t}`,{method:"DELETE"})).ok?(alert("Record deleted successfully!"),se(),T()):alert("Failed to delete record")}}(t.dataset.id))})}document.addEventListener("DOMContentLoaded",function(){g(),document.getElementById("glucoseForm").addEventListener("submit",async e=>{e.preventDefault();const a=e.target.querySelector('button[type="submit"]');s(a);const i=new FormData(e.target),l={timestamp:o(i.get("timestamp")),level:parseInt(i.get("level"))},r=await t("/glucose",l);d(a),n("glucose-message",r.success,r.message),r.success&&(e.target.reset(),te())}),document.getElementById("insulinForm").addEventListener("submit",async e=>{e.preventDefault();const a=e.target.querySelector('button[type="submit"]');s(a);const i=new FormData(e.target),l={timestamp:o(i.get("timestamp")),level:parseFloat(i.get("level"))},r=await t("/insulin",l);d(a),n("insulin-message",r.success,r.message),r.success&&(e.target.reset(),ne())}),document.getElementById("intakeForm").addEventListener("submit",X),document.getElementById("supplementsForm").addEventListener("submit",async e=>{e.preventDefault();const a=e.target.querySelector('button[type="submit"]');s(a);const o=new FormData(e.target),i={supplement_name:o.get("supplement_name"),default_amount:parseFloat(o.get("default_amount"))},l=await t("/supplements",i);d(a),n("supplements-message",l.success,l.message),l.success&&(e.target.reset(),e.target.querySelector('input[name="default_amount"]').value="1",O())}),document.getElementById("eventForm").addEventListener("submit",async e=>{e.preventDefault();const a=e.target.querySelector('button[type="submit"]');s(a);const i=new FormData(e.target),l={timestamp:o(i.get("timestamp")),event_name:i.get("event_name"),event_notes:i.get("event_notes")},r=await t("/event",l);d(a),n("event-message",r.success,r.message),r.success&&(e.target.reset(),le())}),document.getElementById("nutritionForm").addEventListener("submit",async e=>{e.preventDefault();const a=e.target.querySelector('button[type="submit"]');s(a);const o=new FormData(e.target),i={nutrition_name:o.get("nutrition_name"),kcal:parseFloat(o.get("kcal")),weight:parseFloat(o.get("weight"))},l=await t("/nutrition",i);d(a),n("nutrition-message",l.success,l.message),l.success&&(e.target.reset(),T(),se())}),V(),function(){const e=new Date,t=e.getFullYear(),n=String(e.getMonth()+1).padStart(2,"0"),a=String(e.getDate()).padStart(2,"0");document.getElementById("chart-start-date").value=`${t}-01-01`,document.getElementById("chart-end-date").value=`${t}-12-31`;const o=new Date(t,e.getMonth()+1,0).getDate();document.getElementById("summary-start-date").value=`${t}-${n}-01`,document.getElementById("summary-end-date").value=`${t}-${n}-${o}`,document.getElementById("cv-end-date").value=`${t}-${n}-${a}`,document.getElementById("risk-end-date").value=`${t}-${n}-${a}`}(),document.getElementById("update-glucose-chart-btn").addEventListener("click",S),document.getElementById("update-cv-btn").addEventListener("click",x),document.getElementById("update-risk-btn").addEventListener("click",M),document.getElementById("update-summary-btn").addEventListener("click",F),document.getElementById("reset-glucose-ts-btn").addEventListener("click",()=>l("glucose-timestamp")),document.getElementById("reset-insulin-ts-btn").addEventListener("click",()=>l("insulin-timestamp")),document.getElementById("reset-intake-ts-btn").addEventListener("click",()=>l("intake-timestamp")),document.getElementById("reset-event-ts-btn").addEventListener("click",()=>l("event-timestamp")),document.getElementById("filter-glucose-btn").addEventListener("click",te),document.getElementById("filter-insulin-btn").addEventListener("click",ne),document.getElementById("filter-intake-btn").addEventListener("click",ae),document.getElementById("filter-supplement-intake-btn").addEventListener("click",ie),document.getElementById("filter-event-btn").addEventListener("click",le),L(),i()});
\ No newline at end of file
+const API_BASE='/api';
+if(typeof module!=='undefined'&&module.exports){
+module.exports={API_BASE};
+}
+async function submitData(endpoint,data){
+try{
+const response=await fetch(API_BASE+endpoint,{
+method:'POST',
+headers:{'Content-Type':'application/json'},
+body:JSON.stringify(data)
+});
+if(response.ok){
+return{success:true,message:'Data submitted successfully!'};
+}else{
+const error=await response.json();
+return{success:false,message:error.error||'Submission failed'};
+}
+}catch(err){
+return{success:false,message:'Network error: '+err.message};
+}
+}
+function showMessage(elementId,success,message){
+const msgEl=document.getElementById(elementId);
+msgEl.className='message';
+msgEl.textContent=message;
+msgEl.classList.add(success?'success':'error');
+setTimeout(()=>msgEl.classList.add('show'),10);
+const timeout=success?5000:8000;
+setTimeout(()=>{
+msgEl.classList.remove('show');
+setTimeout(()=>{
+msgEl.textContent='';
+msgEl.className='message';
+},300);
+},timeout);
+}
+function getCurrentTimestamp(){
+const now=new Date();
+const year=now.getFullYear();
+const month=String(now.getMonth()+1).padStart(2,'0');
+const day=String(now.getDate()).padStart(2,'0');
+const hours=String(now.getHours()).padStart(2,'0');
+const minutes=String(now.getMinutes()).padStart(2,'0');
+return`${year}-${month}-${day}T${hours}:${minutes}`;
+}
+function toDbTimestamp(datetimeLocal){
+return new Date(datetimeLocal).toISOString().replace('T',' ').slice(0,19);
+}
+function initializeDateInputs(){
+const now=new Date();
+const year=now.getFullYear();
+const month=String(now.getMonth()+1).padStart(2,'0');
+const day=String(now.getDate()).padStart(2,'0');
+document.getElementById('chart-start-date').value=`${year}-01-01`;
+document.getElementById('chart-end-date').value=`${year}-12-31`;
+const lastDay=new Date(year,now.getMonth()+1,0).getDate();
+document.getElementById('summary-start-date').value=`${year}-${month}-01`;
+document.getElementById('summary-end-date').value=`${year}-${month}-${lastDay}`;
+document.getElementById('cv-end-date').value=`${year}-${month}-${day}`;
+document.getElementById('risk-end-date').value=`${year}-${month}-${day}`;
+}
+function setCurrentTimestamp(){
+const datetimeLocal=getCurrentTimestamp();
+document.querySelectorAll('input[type="datetime-local"]').forEach(input=>{
+if(!input.value){
+input.value=datetimeLocal;
+}
+});
+}
+function resetToNow(inputId){
+const input=document.getElementById(inputId);
+if(input){
+const timestamp=getCurrentTimestamp();
+input.value=timestamp;
+}
+}
+function setButtonLoading(button,loadingText='Submitting...'){
+button.dataset.originalText=button.textContent;
+button.textContent=loadingText;
+button.disabled=true;
+button.classList.add('submitting');
+}
+function resetButton(button){
+if(button.dataset.originalText){
+button.textContent=button.dataset.originalText;
+delete button.dataset.originalText;
+}
+button.disabled=false;
+button.classList.remove('submitting');
+}
+function utcDbToDate(ts){
+return new Date(ts.replace(' ','T')+'Z');
+}
+function toInputTimestamp(dbTimestamp){
+const d=utcDbToDate(dbTimestamp);
+const year=d.getFullYear();
+const month=String(d.getMonth()+1).padStart(2,'0');
+const day=String(d.getDate()).padStart(2,'0');
+const hours=String(d.getHours()).padStart(2,'0');
+const minutes=String(d.getMinutes()).padStart(2,'0');
+return`${year}-${month}-${day}T${hours}:${minutes}`;
+}
+function formatTimestamp(utcStr){
+return utcDbToDate(utcStr).toLocaleString();
+}
+function getClientTz(){
+return Intl.DateTimeFormat().resolvedOptions().timeZone;
+}
+function escapeHtml(text){
+const div=document.createElement('div');
+div.textContent=text;
+return div.innerHTML;
+}
+function initializeTabs(){
+document.querySelectorAll('.tab-btn').forEach(btn=>{
+btn.addEventListener('click',()=>{
+const targetTab=btn.getAttribute('data-tab');
+switchTab(targetTab);
+});
+});
+}
+function switchTab(targetTab){
+document.querySelectorAll('.tab-btn').forEach(b=>b.classList.remove('active'));
+document.querySelectorAll('.tab-content').forEach(c=>c.classList.remove('active'));
+document.querySelector(`[data-tab="${targetTab}"]`).classList.add('active');
+document.getElementById(targetTab).classList.add('active');
+loadTabData(targetTab);
+setTimeout(setCurrentTimestamp,100);
+}
+function loadTabData(tab){
+switch(tab){
+case'dashboard':
+loadDashboard();
+break;
+case'intake':
+loadNutritionOptions();
+loadSupplementOptions();
+loadIntakeAudit();
+loadSupplementIntakeAudit();
+autofillPreviousIntake();
+break;
+case'supplements':
+loadSupplementsList();
+break;
+case'nutrition':
+loadNutritionList();
+loadNutritionAudit();
+break;
+case'event':
+loadEventAudit();
+break;
+case'glucose':
+loadGlucoseAudit();
+break;
+case'insulin':
+loadInsulinAudit();
+break;
+}
+}
+let glucoseChart=null;
+let cvChart7d12h=null;
+let cvChart30d48h=null;
+let cvChart30d5d=null;
+let lbgiChart7d12h=null;
+let lbgiChart30d48h=null;
+let lbgiChart30d5d=null;
+let hbgiChart7d12h=null;
+let hbgiChart30d48h=null;
+let hbgiChart30d5d=null;
+let adrrChart7d12h=null;
+let adrrChart30d48h=null;
+let adrrChart30d5d=null;
+function getGlucoseColor(level){
+if(!level||level==='-')return{background:'',color:''};
+const glucose=parseFloat(level);
+if(glucose>=500){
+return{background:'#000000',color:'#FFFFFF'};
+}else if(glucose>=400){
+return{background:'#FF0000',color:'#FFFFFF'};
+}else if(glucose>=300){
+return{background:'#FF00FF',color:'#FFFFFF'};
+}else if(glucose>=200){
+return{background:'#FFB6FF',color:'#000000'};
+}else if(glucose>100){
+return{background:'#98fab2',color:'#000000'};
+}else if(glucose>=60){
+return{background:'#6eb882',color:'#000000'};
+}else{
+return{background:'#FFFF00',color:'#FF0000'};
+}
+}
+async function loadDashboard(){
+loadNutritionList();
+const params=new URLSearchParams({
+chart_start_date:document.getElementById('chart-start-date').value,
+chart_end_date:document.getElementById('chart-end-date').value,
+summary_start_date:document.getElementById('summary-start-date').value,
+summary_end_date:document.getElementById('summary-end-date').value,
+cv_end_date:document.getElementById('cv-end-date').value,
+risk_end_date:document.getElementById('risk-end-date').value,
+lookback_days:30,
+tz:getClientTz()
+});
+try{
+const response=await fetch(`${API_BASE}/dashboard/bundle?${params}`);
+if(!response.ok){
+throw new Error('Failed to fetch dashboard bundle');
+}
+const data=await response.json();
+renderGlucoseChart(data.glucose_chart);
+renderSummary(data.summary);
+renderCVCharts(data.cv_charts);
+renderRiskMetrics(data.risk_metrics);
+renderPrediction(data.prediction);
+}catch(err){
+console.error('Failed to load dashboard:',err);
+}
+}
+async function loadGlucoseChart(){
+const startDate=document.getElementById('chart-start-date').value;
+const endDate=document.getElementById('chart-end-date').value;
+try{
+const response=await fetch(`${API_BASE}/dashboard/glucose-chart?start_date=${startDate}&end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
+const data=await response.json();
+renderGlucoseChart(data);
+}catch(err){
+console.error('Failed to load glucose chart:',err);
+}
+}
+function renderGlucoseChart(data){
+const ctx=document.getElementById('glucoseChart').getContext('2d');
+if(glucoseChart){
+glucoseChart.destroy();
+}
+glucoseChart=new Chart(ctx,{
+type:'line',
+data:{
+labels:data.map(d=>d.week),
+datasets:[
+{
+label:'Glucose (mg/dL)',
+data:data.map(d=>d.glucose_mean),
+borderColor:'#667eea',
+backgroundColor:'rgba(102, 126, 234, 0.1)',
+tension:0.1,
+yAxisID:'yAxisGlucose'
+},
+{
+label:'Insulin (units)',
+data:data.map(d=>d.insulin_mean),
+borderColor:'#f6993f',
+backgroundColor:'rgba(246, 153, 63, 0.1)',
+tension:0.1,
+yAxisID:'yAxisInsulin'
+}
+]
+},
+options:{
+responsive:true,
+maintainAspectRatio:true,
+interaction:{
+mode:'index',
+intersect:false
+},
+scales:{
+yAxisGlucose:{
+type:'linear',
+position:'left',
+beginAtZero:false,
+title:{
+display:true,
+text:'Glucose (mg/dL)'
+}
+},
+yAxisInsulin:{
+type:'linear',
+position:'right',
+beginAtZero:false,
+title:{
+display:true,
+text:'Insulin (units)'
+},
+grid:{
+drawOnChartArea:false
+}
+}
+},
+plugins:{
+legend:{
+display:true,
+position:'top'
+}
+}
+}
+});
+}
+async function loadSummary(){
+const startDate=document.getElementById('summary-start-date').value;
+const endDate=document.getElementById('summary-end-date').value;
+try{
+const response=await fetch(`${API_BASE}/dashboard/summary?start_date=${startDate}&end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
+const data=await response.json();
+renderSummary(data);
+}catch(err){
+console.error('Failed to load summary:',err);
+}
+}
+function renderSummary(data){
+const tbody=document.getElementById('summaryBody');
+tbody.innerHTML='';
+data.forEach(row=>{
+if(row){
+const tr=document.createElement('tr');
+const cells=[
+{value:row.am_pm,isGlucose:false},
+{value:row.date,isGlucose:false},
+{value:row.dosage||'-',isGlucose:false},
+{value:row.glucose_levels['+0']||'-',isGlucose:true},
+{value:row.glucose_levels['+1']||'-',isGlucose:true},
+{value:row.glucose_levels['+2']||'-',isGlucose:true},
+{value:row.glucose_levels['+3']||'-',isGlucose:true},
+{value:row.glucose_levels['+4']||'-',isGlucose:true},
+{value:row.glucose_levels['+5']||'-',isGlucose:true},
+{value:row.glucose_levels['+6']||'-',isGlucose:true},
+{value:row.glucose_levels['+7']||'-',isGlucose:true},
+{value:row.glucose_levels['+8']||'-',isGlucose:true},
+{value:row.glucose_levels['+9']||'-',isGlucose:true},
+{value:row.glucose_levels['+10']||'-',isGlucose:true},
+{value:row.glucose_levels['+11']||'-',isGlucose:true},
+{value:row.kcal_intake.toFixed(1),isGlucose:false}
+];
+cells.forEach(cell=>{
+const td=document.createElement('td');
+td.textContent=cell.value;
+if(cell.isGlucose&&cell.value!=='-'){
+const colors=getGlucoseColor(cell.value);
+td.style.backgroundColor=colors.background;
+td.style.color=colors.color;
+}
+tr.appendChild(td);
+});
+tr.addEventListener('click',()=>showSummaryOverlay(row));
+tbody.appendChild(tr);
+}
+});
+}
+function showSummaryOverlay(row){
+const formatTime=(timestamp)=>{
+if(!timestamp||timestamp==='-')return'-';
+return utcDbToDate(timestamp).toTimeString().slice(0,5);
+};
+document.getElementById('overlay-dose-time').textContent=formatTime(row.dose_time);
+document.getElementById('overlay-intake-time').textContent=formatTime(row.intake_time);
+document.getElementById('overlay-nutritions').textContent=row.nutrition||'-';
+document.getElementById('overlay-supplements').textContent=row.grouped_supplements||'-';
+document.getElementById('overlay-events').textContent=row.grouped_events||'-';
+const overlay=document.getElementById('summaryOverlay');
+overlay.style.display='flex';
+}
+function hideSummaryOverlay(){
+const overlay=document.getElementById('summaryOverlay');
+overlay.style.display='none';
+}
+document.addEventListener('DOMContentLoaded',()=>{
+const overlay=document.getElementById('summaryOverlay');
+if(overlay){
+overlay.addEventListener('click',(e)=>{
+if(e.target===overlay){
+hideSummaryOverlay();
+}
+});
+}
+});
+async function loadNutritionList(){
+try{
+const response=await fetch(`${API_BASE}/nutrition`);
+const data=await response.json();
+const tbody=document.getElementById('nutritionListBody');
+tbody.innerHTML='';
+data.forEach(item=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+                <td>${item.id}</td>
+                <td>${item.nutrition_name}</td>
+                <td>${item.kcal}</td>
+                <td>${item.weight}</td>
+                <td>${item.kcal_per_gram.toFixed(4)}</td>
+            `;
+tbody.appendChild(tr);
+});
+}catch(err){
+console.error('Failed to load nutrition list:',err);
+}
+}
+async function loadCVCharts(){
+const endDate=document.getElementById('cv-end-date').value;
+try{
+const response=await fetch(`${API_BASE}/dashboard/cv-charts?end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
+const data=await response.json();
+renderCVCharts(data);
+}catch(err){
+console.error('Failed to load CV charts:',err);
+}
+}
+function renderCVCharts(data){
+renderCVChart('cvChart7d12h',data.cv_7d_12h,cvChart7d12h);
+renderCVChart('cvChart30d48h',data.cv_30d_48h,cvChart30d48h);
+renderCVChart('cvChart30d5d',data.cv_30d_5d,cvChart30d5d);
+}
+function renderCVChart(canvasId,data,chartInstance){
+const ctx=document.getElementById(canvasId).getContext('2d');
+if(chartInstance){
+chartInstance.destroy();
+}
+const maxCV=Math.max(...data.map(d=>d.cv||0),100);
+const chart=new Chart(ctx,{
+type:'line',
+data:{
+labels:data.map(d=>d.label),
+datasets:[{
+label:'CV (%)',
+data:data.map(d=>d.cv),
+borderColor:'#667eea',
+backgroundColor:'rgba(102, 126, 234, 0.1)',
+tension:0.1
+}]
+},
+options:{
+responsive:true,
+maintainAspectRatio:true,
+scales:{
+x:{
+ticks:{
+display:false
+},
+grid:{
+display:false
+}
+},
+y:{
+beginAtZero:true,
+max:Math.max(maxCV,40),
+title:{
+display:true,
+text:'CV (%)'
+}
+}
+},
+plugins:{
+legend:{
+display:false
+},
+annotation:{
+annotations:{
+greenBand:{
+type:'box',
+yMin:0,
+yMax:25,
+backgroundColor:'rgba(0, 255, 0, 0.3)',
+borderWidth:0,
+drawTime:'beforeDatasetsDraw'
+},
+yellowBand:{
+type:'box',
+yMin:25,
+yMax:35,
+backgroundColor:'rgba(255, 255, 0, 0.3)',
+borderWidth:0,
+drawTime:'beforeDatasetsDraw'
+},
+redBand:{
+type:'box',
+yMin:35,
+yMax:Math.max(maxCV,45),
+backgroundColor:'rgba(255, 0, 0, 0.3)',
+borderWidth:0,
+drawTime:'beforeDatasetsDraw'
+}
+}
+}
+}
+}
+});
+if(canvasId==='cvChart7d12h'){
+cvChart7d12h=chart;
+}else if(canvasId==='cvChart30d48h'){
+cvChart30d48h=chart;
+}else if(canvasId==='cvChart30d5d'){
+cvChart30d5d=chart;
+}
+}
+async function loadRiskMetrics(){
+const endDate=document.getElementById('risk-end-date').value;
+try{
+const response=await fetch(`${API_BASE}/dashboard/risk-metrics?end_date=${endDate}&tz=${encodeURIComponent(getClientTz())}`);
+const data=await response.json();
+renderRiskMetrics(data);
+}catch(err){
+console.error('Failed to load risk metrics:',err);
+}
+}
+function renderRiskMetrics(data){
+renderRiskChart('lbgiChart7d12h',data.lbgi_7d_12h,lbgiChart7d12h,'LBGI',
+[3.5,7],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('lbgiChart30d48h',data.lbgi_30d_48h,lbgiChart30d48h,'LBGI',
+[3.5,7],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('lbgiChart30d5d',data.lbgi_30d_5d,lbgiChart30d5d,'LBGI',
+[3.5,7],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('hbgiChart7d12h',data.hbgi_7d_12h,hbgiChart7d12h,'HBGI',
+[6,12],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('hbgiChart30d48h',data.hbgi_30d_48h,hbgiChart30d48h,'HBGI',
+[6,12],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('hbgiChart30d5d',data.hbgi_30d_5d,hbgiChart30d5d,'HBGI',
+[6,12],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('adrrChart7d12h',data.adrr_7d_12h,adrrChart7d12h,'ADRR',
+[25,50],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('adrrChart30d48h',data.adrr_30d_48h,adrrChart30d48h,'ADRR',
+[25,50],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+renderRiskChart('adrrChart30d5d',data.adrr_30d_5d,adrrChart30d5d,'ADRR',
+[25,50],['rgba(0, 255, 0, 0.3)','rgba(255, 255, 0, 0.3)','rgba(255, 0, 0, 0.3)']);
+}
+function renderRiskChart(canvasId,data,chartInstance,metricName,thresholds,colors){
+const ctx=document.getElementById(canvasId).getContext('2d');
+if(chartInstance){
+chartInstance.destroy();
+}
+const maxValue=Math.max(...data.map(d=>d.value||0),thresholds[1]*1.5);
+const chart=new Chart(ctx,{
+type:'line',
+data:{
+labels:data.map(d=>d.label),
+datasets:[{
+label:metricName,
+data:data.map(d=>d.value),
+borderColor:'#667eea',
+backgroundColor:'rgba(102, 126, 234, 0.1)',
+tension:0.1,
+spanGaps:true
+}]
+},
+options:{
+responsive:true,
+maintainAspectRatio:true,
+scales:{
+x:{
+ticks:{
+display:false
+},
+grid:{
+display:false
+}
+},
+y:{
+beginAtZero:true,
+max:maxValue,
+title:{
+display:true,
+text:metricName
+}
+}
+},
+plugins:{
+legend:{
+display:false
+},
+annotation:{
+annotations:{
+greenBand:{
+type:'box',
+yMin:0,
+yMax:thresholds[0],
+backgroundColor:colors[0],
+borderWidth:0,
+drawTime:'beforeDatasetsDraw'
+},
+yellowBand:{
+type:'box',
+yMin:thresholds[0],
+yMax:thresholds[1],
+backgroundColor:colors[1],
+borderWidth:0,
+drawTime:'beforeDatasetsDraw'
+},
+redBand:{
+type:'box',
+yMin:thresholds[1],
+yMax:maxValue,
+backgroundColor:colors[2],
+borderWidth:0,
+drawTime:'beforeDatasetsDraw'
+}
+}
+}
+}
+}
+});
+if(canvasId==='lbgiChart7d12h'){
+lbgiChart7d12h=chart;
+}else if(canvasId==='lbgiChart30d48h'){
+lbgiChart30d48h=chart;
+}else if(canvasId==='lbgiChart30d5d'){
+lbgiChart30d5d=chart;
+}else if(canvasId==='hbgiChart7d12h'){
+hbgiChart7d12h=chart;
+}else if(canvasId==='hbgiChart30d48h'){
+hbgiChart30d48h=chart;
+}else if(canvasId==='hbgiChart30d5d'){
+hbgiChart30d5d=chart;
+}else if(canvasId==='adrrChart7d12h'){
+adrrChart7d12h=chart;
+}else if(canvasId==='adrrChart30d48h'){
+adrrChart30d48h=chart;
+}else if(canvasId==='adrrChart30d5d'){
+adrrChart30d5d=chart;
+}
+}
+async function loadPrediction(){
+const container=document.getElementById('predictionContent');
+try{
+const response=await fetch(`${API_BASE}/dashboard/prediction?lookback_days=30&tz=${encodeURIComponent(getClientTz())}`);
+if(!response.ok){
+throw new Error('Failed to fetch prediction');
+}
+const data=await response.json();
+renderPrediction(data);
+}catch(error){
+console.error('Error loading prediction:',error);
+container.innerHTML=`
+            <div class="prediction-error">
+                <p><strong>Unable to load prediction</strong></p>
+                <p>${error.message}</p>
+            </div>
+        `;
+}
+}
+function renderPrediction(data){
+const container=document.getElementById('predictionContent');
+if(data.error){
+displayPredictionError(container,data);
+return;
+}
+displayPrediction(container,data);
+}
+function displayPrediction(container,data){
+const{prediction,next_window,basis,warnings}=data;
+if(!prediction){
+displayPredictionError(container,data);
+return;
+}
+const confidenceClass=`confidence-${prediction.confidence.toLowerCase()}`;
+const confidenceDots=getConfidenceDots(prediction.confidence);
+let html=`
+        <div class="prediction-box">
+            <div class="prediction-item">
+                <h3>📊 Predicted Glucose</h3>
+                <div class="prediction-value">${prediction.glucose} mg/dL</div>
+                <div class="prediction-range">Range: ${prediction.glucose_range[0]} - ${prediction.glucose_range[1]} mg/dL</div>
+            </div>
+            <div class="prediction-item">
+                <h3>💉 Recommended Insulin</h3>
+                <div class="prediction-value">
+                    ${prediction.insulin_recommended!==null?prediction.insulin_recommended+' units':'N/A'}
+                </div>
+                ${prediction.insulin_recommended===null?'<div class="prediction-range">Insufficient data</div>':''}
+            </div>
+        </div>
+        
+        <div class="prediction-confidence">
+            <div>Time Window: <strong>${next_window}</strong></div>
+            <div class="confidence-level ${confidenceClass}">
+                Confidence: ${prediction.confidence}
+            </div>
+            <div class="confidence-dots">${confidenceDots}</div>
+        </div>
+        
+        <div class="prediction-basis">
+            Based on ${basis.data_points} glucose readings over ${basis.lookback_days} days
+            ${basis.recent_cv!==null?`(CV: ${basis.recent_cv}%)`:''}
+        </div>
+    `;
+if(warnings&&warnings.length>0){
+html+=`
+            <div class="prediction-warnings">
+                <h4>⚠️ Warnings</h4>
+                <ul>
+                    ${warnings.map(w=>`<li>${escapeHtml(w)}</li>`).join('')}
+                </ul>
+            </div>
+        `;
+}
+html+=`
+        <div class="prediction-disclaimer">
+            This prediction is for informational purposes only. Always verify with actual glucose readings and consult your veterinarian for dosing decisions.
+        </div>
+    `;
+container.innerHTML=html;
+}
+function displayPredictionError(container,data){
+const warnings=data.warnings||['Unable to generate prediction'];
+container.innerHTML=`
+        <div class="prediction-error">
+            <p><strong>Cannot Generate Prediction</strong></p>
+            <p>${warnings.join('. ')}</p>
+            ${data.basis?`<p style="margin-top:10px; font-size:0.9em;">Data points available: ${data.basis.data_points}</p>`:''}
+        </div>
+    `;
+}
+function getConfidenceDots(confidence){
+switch(confidence){
+case'High':
+return'●●●●●';
+case'Medium':
+return'●●●○○';
+case'Low':
+return'●○○○○';
+default:
+return'○○○○○';
+}
+}
+async function loadNutritionOptions(){
+try{
+const response=await fetch(`${API_BASE}/nutrition`);
+const data=await response.json();
+const selects=document.querySelectorAll('.nutrition-select');
+selects.forEach(select=>{
+populateNutritionSelect(select,data);
+});
+}catch(err){
+console.error('Failed to load nutrition options:',err);
+}
+}
+async function loadNutritionOptionsForSelect(selectElement){
+try{
+const response=await fetch(`${API_BASE}/nutrition`);
+const data=await response.json();
+populateNutritionSelect(selectElement,data);
+}catch(err){
+console.error('Failed to load nutrition options:',err);
+}
+}
+function populateNutritionSelect(select,data){
+select.innerHTML='<option value="">Select nutrition...</option>';
+data.forEach(item=>{
+const option=document.createElement('option');
+option.value=item.id;
+option.textContent=`${item.nutrition_name} (${item.kcal_per_gram.toFixed(4)} kcal/g)`;
+select.appendChild(option);
+});
+}
+async function loadSupplementOptions(){
+try{
+const response=await fetch(`${API_BASE}/supplements`);
+const data=await response.json();
+const selects=document.querySelectorAll('.supplement-select');
+selects.forEach(select=>{
+populateSupplementSelect(select,data);
+});
+}catch(err){
+console.error('Failed to load supplement options:',err);
+}
+}
+async function loadSupplementOptionsForSelect(selectElement){
+try{
+const response=await fetch(`${API_BASE}/supplements`);
+const data=await response.json();
+populateSupplementSelect(selectElement,data);
+}catch(err){
+console.error('Failed to load supplement options:',err);
+}
+}
+function populateSupplementSelect(select,data){
+select.innerHTML='<option value="">Select supplement...</option>';
+data.forEach(item=>{
+const option=document.createElement('option');
+option.value=item.id;
+option.textContent=item.supplement_name;
+option.dataset.defaultAmount=item.default_amount;
+select.appendChild(option);
+});
+select.addEventListener('change',function(){
+const selectedOption=this.options[this.selectedIndex];
+const defaultAmount=selectedOption.dataset.defaultAmount;
+if(defaultAmount){
+const amountInput=this.closest('.supplement-item').querySelector('input[name="supplement_amount[]"]');
+amountInput.value=defaultAmount;
+}
+});
+}
+async function loadSupplementsList(){
+try{
+const response=await fetch(`${API_BASE}/supplements`);
+const data=await response.json();
+const container=document.getElementById('supplements-list');
+if(data.length===0){
+container.innerHTML='<p>No supplements found.</p>';
+return;
+}
+let html='<div class="table-wrapper"><table class="audit-table"><thead><tr><th>ID</th><th>Supplement Name</th><th>Default Amount</th><th>Actions</th></tr></thead><tbody>';
+data.forEach(item=>{
+html+=`
+                <tr>
+                    <td>${item.id}</td>
+                    <td>${escapeHtml(item.supplement_name)}</td>
+                    <td>${item.default_amount}</td>
+                    <td>
+                        <button class="edit-btn" data-id="${item.id}" data-name="${escapeHtml(item.supplement_name)}" data-amount="${item.default_amount}">Edit</button>
+                        <button class="delete-btn" data-id="${item.id}">Delete</button>
+                    </td>
+                </tr>
+            `;
+});
+html+='</tbody></table></div>';
+container.innerHTML=html;
+container.querySelectorAll('.edit-btn').forEach(btn=>{
+btn.addEventListener('click',()=>editSupplement(btn.dataset.id,btn.dataset.name,btn.dataset.amount));
+});
+container.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteSupplement(btn.dataset.id));
+});
+}catch(err){
+console.error('Failed to load supplements list:',err);
+}
+}
+async function autofillPreviousIntake(){
+try{
+const response=await fetch(`${API_BASE}/intake/previous-window?tz=${encodeURIComponent(getClientTz())}`);
+const data=await response.json();
+const nutritionData=data.nutrition||[];
+const supplementData=data.supplements||[];
+await populatePreviousNutritionItems(nutritionData);
+await populatePreviousSupplementItems(supplementData);
+}catch(err){
+console.error('Failed to autofill previous intake:',err);
+}
+}
+async function populatePreviousNutritionItems(nutritionData){
+const container=document.getElementById('nutrition-items-container');
+container.innerHTML='';
+nutritionItemCount=0;
+if(nutritionData.length===0){
+addEmptyNutritionItem(container);
+}else{
+for(const item of nutritionData){
+await addPreviousNutritionItem(container,item);
+}
+}
+updateNutritionRemoveButtons();
+}
+async function populatePreviousSupplementItems(supplementData){
+const container=document.getElementById('supplement-items-container');
+container.innerHTML='';
+supplementItemCount=0;
+if(supplementData.length===0){
+addEmptySupplementItem(container);
+}else{
+for(const item of supplementData){
+await addPreviousSupplementItem(container,item);
+}
+}
+updateSupplementRemoveButtons();
+}
+function addEmptyNutritionItem(container){
+nutritionItemCount=1;
+const newItem=document.createElement('div');
+newItem.className='nutrition-item';
+newItem.innerHTML=`
+        <h4>Nutrition Item 1</h4>
+        <label>Nutrition: 
+            <select name="nutrition_id[]" class="nutrition-select" required>
+                <option value="">Select nutrition...</option>
+            </select>
+        </label>
+        <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1"></label>
+        <button type="button" class="remove-nutrition-btn">Remove</button>
+    `;
+container.appendChild(newItem);
+loadNutritionOptionsForSelect(newItem.querySelector('.nutrition-select'));
+}
+async function addPreviousNutritionItem(container,item){
+nutritionItemCount++;
+const newItem=document.createElement('div');
+newItem.className='nutrition-item';
+newItem.innerHTML=`
+        <h4>Nutrition Item ${nutritionItemCount}</h4>
+        <label>Nutrition: 
+            <select name="nutrition_id[]" class="nutrition-select" required>
+                <option value="">Select nutrition...</option>
+            </select>
+        </label>
+        <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1" value="${item.nutrition_amount}"></label>
+        <button type="button" class="remove-nutrition-btn">Remove</button>
+    `;
+container.appendChild(newItem);
+await loadNutritionOptionsForSelect(newItem.querySelector('.nutrition-select'));
+newItem.querySelector('.nutrition-select').value=item.nutrition_id;
+}
+function addEmptySupplementItem(container){
+supplementItemCount=1;
+const newItem=document.createElement('div');
+newItem.className='supplement-item nutrition-item';
+newItem.innerHTML=`
+        <h4>Supplement Item 1</h4>
+        <label>Supplement: 
+            <select name="supplement_id[]" class="supplement-select" required>
+                <option value="">Select supplement...</option>
+            </select>
+        </label>
+        <label>Amount: <input type="number" name="supplement_amount[]" required min="0" step="0.1"></label>
+        <button type="button" class="remove-supplement-btn">Remove</button>
+    `;
+container.appendChild(newItem);
+loadSupplementOptionsForSelect(newItem.querySelector('.supplement-select'));
+}
+async function addPreviousSupplementItem(container,item){
+supplementItemCount++;
+const newItem=document.createElement('div');
+newItem.className='supplement-item nutrition-item';
+newItem.innerHTML=`
+        <h4>Supplement Item ${supplementItemCount}</h4>
+        <label>Supplement: 
+            <select name="supplement_id[]" class="supplement-select" required>
+                <option value="">Select supplement...</option>
+            </select>
+        </label>
+        <label>Amount: <input type="number" name="supplement_amount[]" required min="0" step="0.1" value="${item.supplement_amount}"></label>
+        <button type="button" class="remove-supplement-btn">Remove</button>
+    `;
+container.appendChild(newItem);
+await loadSupplementOptionsForSelect(newItem.querySelector('.supplement-select'));
+newItem.querySelector('.supplement-select').value=item.supplement_id;
+}
+let nutritionItemCount=1;
+let supplementItemCount=1;
+function initializeDynamicItems(){
+document.getElementById('add-nutrition-btn').addEventListener('click',addNutritionItem);
+document.getElementById('add-supplement-btn').addEventListener('click',addSupplementItem);
+document.getElementById('nutrition-items-container').addEventListener('click',e=>{
+if(e.target.matches('.remove-nutrition-btn')){
+e.target.closest('.nutrition-item').remove();
+renumberNutritionItems();
+}
+});
+document.getElementById('supplement-items-container').addEventListener('click',e=>{
+if(e.target.matches('.remove-supplement-btn')){
+e.target.closest('.supplement-item').remove();
+updateSupplementRemoveButtons();
+renumberSupplementItems();
+}
+});
+}
+function addNutritionItem(){
+nutritionItemCount++;
+const container=document.getElementById('nutrition-items-container');
+const newItem=document.createElement('div');
+newItem.className='nutrition-item';
+newItem.innerHTML=`
+        <h4>Nutrition Item ${nutritionItemCount}</h4>
+        <label>Nutrition: 
+            <select name="nutrition_id[]" class="nutrition-select" required>
+                <option value="">Select nutrition...</option>
+            </select>
+        </label>
+        <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1"></label>
+        <button type="button" class="remove-nutrition-btn">Remove</button>
+    `;
+container.appendChild(newItem);
+loadNutritionOptionsForSelect(newItem.querySelector('.nutrition-select'));
+updateNutritionRemoveButtons();
+}
+function addSupplementItem(){
+supplementItemCount++;
+const container=document.getElementById('supplement-items-container');
+const newItem=document.createElement('div');
+newItem.className='supplement-item nutrition-item';
+newItem.innerHTML=`
+        <h4>Supplement Item ${supplementItemCount}</h4>
+        <label>Supplement: 
+            <select name="supplement_id[]" class="supplement-select" required>
+                <option value="">Select supplement...</option>
+            </select>
+        </label>
+        <label>Amount: <input type="number" name="supplement_amount[]" required min="0" step="0.1"></label>
+        <button type="button" class="remove-supplement-btn">Remove</button>
+    `;
+container.appendChild(newItem);
+loadSupplementOptionsForSelect(newItem.querySelector('.supplement-select'));
+updateSupplementRemoveButtons();
+}
+function updateNutritionRemoveButtons(){
+const items=document.querySelectorAll('#nutrition-items-container .nutrition-item');
+items.forEach(item=>{
+const removeBtn=item.querySelector('.remove-nutrition-btn');
+removeBtn.style.display='inline-block';
+});
+}
+function updateSupplementRemoveButtons(){
+const items=document.querySelectorAll('#supplement-items-container .supplement-item');
+items.forEach(item=>{
+const removeBtn=item.querySelector('.remove-supplement-btn');
+removeBtn.style.display='inline-block';
+});
+}
+function renumberNutritionItems(){
+const items=document.querySelectorAll('#nutrition-items-container .nutrition-item');
+items.forEach((item,index)=>{
+item.querySelector('h4').textContent=`Nutrition Item ${index+1}`;
+});
+nutritionItemCount=items.length;
+}
+function renumberSupplementItems(){
+const items=document.querySelectorAll('#supplement-items-container .supplement-item');
+items.forEach((item,index)=>{
+item.querySelector('h4').textContent=`Supplement Item ${index+1}`;
+});
+supplementItemCount=items.length;
+}
+function initializeForms(){
+document.getElementById('glucoseForm').addEventListener('submit',async(e)=>{
+e.preventDefault();
+const submitBtn=e.target.querySelector('button[type="submit"]');
+setButtonLoading(submitBtn);
+const formData=new FormData(e.target);
+const data={
+timestamp:toDbTimestamp(formData.get('timestamp')),
+level:parseInt(formData.get('level'))
+};
+const result=await submitData('/glucose',data);
+resetButton(submitBtn);
+showMessage('glucose-message',result.success,result.message);
+if(result.success){
+e.target.reset();
+loadGlucoseAudit();
+}
+});
+document.getElementById('insulinForm').addEventListener('submit',async(e)=>{
+e.preventDefault();
+const submitBtn=e.target.querySelector('button[type="submit"]');
+setButtonLoading(submitBtn);
+const formData=new FormData(e.target);
+const data={
+timestamp:toDbTimestamp(formData.get('timestamp')),
+level:parseFloat(formData.get('level'))
+};
+const result=await submitData('/insulin',data);
+resetButton(submitBtn);
+showMessage('insulin-message',result.success,result.message);
+if(result.success){
+e.target.reset();
+loadInsulinAudit();
+}
+});
+document.getElementById('intakeForm').addEventListener('submit',handleIntakeSubmit);
+document.getElementById('supplementsForm').addEventListener('submit',async(e)=>{
+e.preventDefault();
+const submitBtn=e.target.querySelector('button[type="submit"]');
+setButtonLoading(submitBtn);
+const formData=new FormData(e.target);
+const data={
+supplement_name:formData.get('supplement_name'),
+default_amount:parseFloat(formData.get('default_amount'))
+};
+const result=await submitData('/supplements',data);
+resetButton(submitBtn);
+showMessage('supplements-message',result.success,result.message);
+if(result.success){
+e.target.reset();
+e.target.querySelector('input[name="default_amount"]').value='1';
+loadSupplementsList();
+}
+});
+document.getElementById('eventForm').addEventListener('submit',async(e)=>{
+e.preventDefault();
+const submitBtn=e.target.querySelector('button[type="submit"]');
+setButtonLoading(submitBtn);
+const formData=new FormData(e.target);
+const data={
+timestamp:toDbTimestamp(formData.get('timestamp')),
+event_name:formData.get('event_name'),
+event_notes:formData.get('event_notes')
+};
+const result=await submitData('/event',data);
+resetButton(submitBtn);
+showMessage('event-message',result.success,result.message);
+if(result.success){
+e.target.reset();
+loadEventAudit();
+}
+});
+document.getElementById('nutritionForm').addEventListener('submit',async(e)=>{
+e.preventDefault();
+const submitBtn=e.target.querySelector('button[type="submit"]');
+setButtonLoading(submitBtn);
+const formData=new FormData(e.target);
+const data={
+nutrition_name:formData.get('nutrition_name'),
+kcal:parseFloat(formData.get('kcal')),
+weight:parseFloat(formData.get('weight'))
+};
+const result=await submitData('/nutrition',data);
+resetButton(submitBtn);
+showMessage('nutrition-message',result.success,result.message);
+if(result.success){
+e.target.reset();
+loadNutritionList();
+loadNutritionAudit();
+}
+});
+}
+async function handleIntakeSubmit(e){
+e.preventDefault();
+const submitBtn=e.target.querySelector('button[type="submit"]');
+setButtonLoading(submitBtn);
+const formData=new FormData(e.target);
+const timestamp=toDbTimestamp(formData.get('timestamp'));
+if(window.currentEditingIntakeId){
+const nutritionId=formData.get('nutrition_id[]');
+const nutritionAmount=formData.get('nutrition_amount[]');
+if(!nutritionId){
+resetButton(submitBtn);
+showMessage('intake-message',false,'Please select a nutrition item');
+return;
+}
+const data={
+timestamp:timestamp,
+nutrition_id:parseInt(nutritionId),
+nutrition_amount:parseFloat(nutritionAmount)
+};
+try{
+const response=await fetch(`${API_BASE}/intake/${window.currentEditingIntakeId}`,{
+method:'PUT',
+headers:{'Content-Type':'application/json'},
+body:JSON.stringify(data)
+});
+resetButton(submitBtn);
+if(response.ok){
+showMessage('intake-message',true,'Record updated successfully!');
+cancelIntakeEdit();
+loadIntakeAudit();
+}else{
+const error=await response.json();
+showMessage('intake-message',false,error.error||'Update failed');
+}
+}catch(err){
+resetButton(submitBtn);
+showMessage('intake-message',false,'Network error: '+err.message);
+}
+return;
+}
+const nutritionIds=formData.getAll('nutrition_id[]');
+const nutritionAmounts=formData.getAll('nutrition_amount[]');
+const supplementIds=formData.getAll('supplement_id[]');
+const supplementAmounts=formData.getAll('supplement_amount[]');
+const filledNutrition=nutritionIds.filter(id=>id).length;
+const filledSupplements=supplementIds.filter(id=>id).length;
+if(filledNutrition+filledSupplements===0){
+resetButton(submitBtn);
+showMessage('intake-message',false,'Please add at least one nutrition or supplement item');
+return;
+}
+const operations=[];
+const labels=[];
+for(let i=0;i<nutritionIds.length;i++){
+if(nutritionIds[i]){
+operations.push({
+op:'create',
+resource:'intake',
+data:{
+timestamp:timestamp,
+nutrition_id:parseInt(nutritionIds[i]),
+nutrition_amount:parseFloat(nutritionAmounts[i])
+}
+});
+labels.push(`Nutrition Item ${i+1}`);
+}
+}
+for(let i=0;i<supplementIds.length;i++){
+if(supplementIds[i]){
+operations.push({
+op:'create',
+resource:'supplement-intake',
+data:{
+timestamp:timestamp,
+supplement_id:parseInt(supplementIds[i]),
+supplement_amount:parseFloat(supplementAmounts[i])
+}
+});
+labels.push(`Supplement Item ${i+1}`);
+}
+}
+let allSuccess=true;
+let messages=[];
+try{
+const response=await fetch(`${API_BASE}/batch`,{
+method:'POST',
+headers:{'Content-Type':'application/json'},
+body:JSON.stringify({operations})
+});
+if(!response.ok){
+const error=await response.json();
+allSuccess=false;
+messages=(error.results||[]).map(r=>`${labels[r.index]}: ${r.error}`);
+if(messages.length===0){
+messages.push(error.error||'Submission failed');
+}
+}
+}catch(err){
+allSuccess=false;
+messages.push('Network error: '+err.message);
+}
+resetButton(submitBtn);
+if(allSuccess){
+const totalItems=filledNutrition+filledSupplements;
+showMessage('intake-message',true,`Successfully submitted ${totalItems} item(s)!`);
+resetIntakeForm();
+loadIntakeAudit();
+loadSupplementIntakeAudit();
+}else{
+showMessage('intake-message',false,'Nothing was saved: '+messages.join(', '));
+}
+}
+function resetIntakeForm(){
+document.getElementById('intakeForm').reset();
+const nutritionContainer=document.getElementById('nutrition-items-container');
+nutritionContainer.innerHTML=`
+        <div class="nutrition-item">
+            <h4>Nutrition Item 1</h4>
+            <label>Nutrition: 
+                <select name="nutrition_id[]" class="nutrition-select" required>
+                    <option value="">Select nutrition...</option>
+                </select>
+            </label>
+            <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1"></label>
+            <button type="button" class="remove-nutrition-btn" style="display:none;">Remove</button>
+        </div>
+    `;
+const supplementContainer=document.getElementById('supplement-items-container');
+supplementContainer.innerHTML=`
+        <div class="supplement-item nutrition-item">
+            <h4>Supplement Item 1</h4>
+            <label>Supplement: 
+                <select name="supplement_id[]" class="supplement-select" required>
+                    <option value="">Select supplement...</option>
+                </select>
+            </label>
+            <label>Amount: <input type="number" name="supplement_amount[]" required min="0" step="0.1"></label>
+            <button type="button" class="remove-supplement-btn">Remove</button>
+        </div>
+    `;
+nutritionItemCount=1;
+supplementItemCount=1;
+document.getElementById('add-nutrition-btn').style.display='inline-block';
+document.getElementById('add-supplement-btn').style.display='inline-block';
+const submitBtn=document.querySelector('#intakeForm button[type="submit"]');
+submitBtn.textContent='Submit All';
+submitBtn.classList.remove('update-mode');
+const cancelBtn=document.getElementById('cancel-edit-btn');
+if(cancelBtn){
+cancelBtn.remove();
+}
+window.currentEditingIntakeId=null;
+loadNutritionOptions();
+loadSupplementOptions();
+}
+const AUDIT_PAGE_SIZE=100;
+async function fetchAuditPage(resource,filterPrefix,next){
+const startDate=next?next.startDate:document.getElementById(`${filterPrefix}-start-filter`).value;
+const endDate=next?next.endDate:document.getElementById(`${filterPrefix}-end-filter`).value;
+let url=`${API_BASE}/${resource}?tz=${encodeURIComponent(getClientTz())}&limit=${AUDIT_PAGE_SIZE}`;
+if(startDate&&endDate){
+url+=`&start_date=${startDate}&end_date=${endDate}`;
+}
+if(next){
+url+=`&cursor=${encodeURIComponent(next.cursor)}`;
+}
+const response=await fetch(url);
+const page=await response.json();
+page.next=page.next_cursor?{cursor:page.next_cursor,startDate,endDate}:null;
+return page;
+}
+function appendAuditRows(tbody,page,renderRow,bindRows,loadMore){
+const previousLoadMore=tbody.querySelector('.load-more-row');
+if(previousLoadMore){
+previousLoadMore.remove();
+}
+const rows=document.createDocumentFragment();
+page.items.forEach(record=>rows.appendChild(renderRow(record)));
+bindRows(rows);
+tbody.appendChild(rows);
+if(page.next){
+const tr=document.createElement('tr');
+tr.className='load-more-row';
+const td=document.createElement('td');
+td.colSpan=tbody.closest('table').querySelectorAll('thead th').length;
+const btn=document.createElement('button');
+btn.type='button';
+btn.textContent='Load more';
+btn.addEventListener('click',()=>loadMore(page.next));
+td.appendChild(btn);
+tr.appendChild(td);
+tbody.appendChild(tr);
+}
+}
+async function loadGlucoseAudit(){
+document.getElementById('glucose-audit-body').innerHTML='';
+await appendGlucoseAuditPage(null);
+}
+async function appendGlucoseAuditPage(next){
+const page=await fetchAuditPage('glucose','glucose',next);
+const tbody=document.getElementById('glucose-audit-body');
+appendAuditRows(tbody,page,record=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+            <td>${record.id}</td>
+            <td>${formatTimestamp(record.timestamp)}</td>
+            <td>${record.level}</td>
+            <td>
+                <button class="edit-btn" data-id="${record.id}" data-ts="${record.timestamp}" data-level="${record.level}">Edit</button>
+                <button class="delete-btn" data-id="${record.id}">Delete</button>
+            </td>
+        `;
+return tr;
+},rows=>{
+rows.querySelectorAll('.edit-btn').forEach(btn=>{
+btn.addEventListener('click',()=>editGlucose(btn.dataset.id,btn.dataset.ts,btn.dataset.level));
+});
+rows.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteGlucose(btn.dataset.id));
+});
+},appendGlucoseAuditPage);
+}
+async function editGlucose(id,timestamp,level){
+const newTimestamp=prompt('Enter new timestamp (local time, YYYY-MM-DDTHH:MM):',toInputTimestamp(timestamp));
+const newLevel=prompt('Enter new glucose level:',level);
+if(newTimestamp&&newLevel){
+const response=await fetch(`${API_BASE}/glucose/${id}`,{
+method:'PUT',
+headers:{'Content-Type':'application/json'},
+body:JSON.stringify({
+timestamp:toDbTimestamp(newTimestamp),
+level:parseInt(newLevel)
+})
+});
+if(response.ok){
+alert('Record updated successfully!');
+loadGlucoseAudit();
+}else{
+alert('Failed to update record');
+}
+}
+}
+async function deleteGlucose(id){
+if(confirm('Are you sure you want to delete this record?')){
+const response=await fetch(`${API_BASE}/glucose/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+alert('Record deleted successfully!');
+loadGlucoseAudit();
+}else{
+alert('Failed to delete record');
+}
+}
+}
+async function loadInsulinAudit(){
+document.getElementById('insulin-audit-body').innerHTML='';
+await appendInsulinAuditPage(null);
+}
+async function appendInsulinAuditPage(next){
+const page=await fetchAuditPage('insulin','insulin',next);
+const tbody=document.getElementById('insulin-audit-body');
+appendAuditRows(tbody,page,record=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+            <td>${record.id}</td>
+            <td>${formatTimestamp(record.timestamp)}</td>
+            <td>${record.level}</td>
+            <td>
+                <button class="edit-btn" data-id="${record.id}" data-ts="${record.timestamp}" data-level="${record.level}">Edit</button>
+                <button class="delete-btn" data-id="${record.id}">Delete</button>
+            </td>
+        `;
+return tr;
+},rows=>{
+rows.querySelectorAll('.edit-btn').forEach(btn=>{
+btn.addEventListener('click',()=>editInsulin(btn.dataset.id,btn.dataset.ts,btn.dataset.level));
+});
+rows.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteInsulin(btn.dataset.id));
+});
+},appendInsulinAuditPage);
+}
+async function editInsulin(id,timestamp,level){
+const newTimestamp=prompt('Enter new timestamp (local time, YYYY-MM-DDTHH:MM):',toInputTimestamp(timestamp));
+const newLevel=prompt('Enter new insulin level:',level);
+if(newTimestamp&&newLevel){
+const response=await fetch(`${API_BASE}/insulin/${id}`,{
+method:'PUT',
+headers:{'Content-Type':'application/json'},
+body:JSON.stringify({
+timestamp:toDbTimestamp(newTimestamp),
+level:parseFloat(newLevel)
+})
+});
+if(response.ok){
+alert('Record updated successfully!');
+loadInsulinAudit();
+}else{
+alert('Failed to update record');
+}
+}
+}
+async function deleteInsulin(id){
+if(confirm('Are you sure you want to delete this record?')){
+const response=await fetch(`${API_BASE}/insulin/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+alert('Record deleted successfully!');
+loadInsulinAudit();
+}else{
+alert('Failed to delete record');
+}
+}
+}
+async function loadIntakeAudit(){
+document.getElementById('intake-audit-body').innerHTML='';
+await appendIntakeAuditPage(null);
+}
+async function appendIntakeAuditPage(next){
+const page=await fetchAuditPage('intake','intake',next);
+const tbody=document.getElementById('intake-audit-body');
+appendAuditRows(tbody,page,record=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+            <td>${record.id}</td>
+            <td>${formatTimestamp(record.timestamp)}</td>
+            <td>${record.nutrition_name}</td>
+            <td>${record.nutrition_amount}</td>
+            <td>${record.nutrition_kcal.toFixed(1)}</td>
+            <td>
+                <button class="edit-btn"
+                    data-id="${record.id}"
+                    data-ts="${record.timestamp}"
+                    data-nid="${record.nutrition_id}"
+                    data-name="${escapeHtml(record.nutrition_name)}"
+                    data-amount="${record.nutrition_amount}">Edit</button>
+                <button class="delete-btn" data-id="${record.id}">Delete</button>
+            </td>
+        `;
+return tr;
+},rows=>{
+rows.querySelectorAll('.edit-btn').forEach(btn=>{
+btn.addEventListener('click',()=>editIntake(
+btn.dataset.id,btn.dataset.ts,btn.dataset.nid,
+btn.dataset.name,btn.dataset.amount
+));
+});
+rows.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteIntake(btn.dataset.id));
+});
+},appendIntakeAuditPage);
+}
+async function editIntake(id,timestamp,nutritionId,nutritionName,nutritionAmount){
+window.currentEditingIntakeId=id;
+const nutritionContainer=document.getElementById('nutrition-items-container');
+nutritionContainer.innerHTML=`
+        <div class="nutrition-item">
+            <h4>Nutrition Item 1</h4>
+            <label>Nutrition: 
+                <select name="nutrition_id[]" class="nutrition-select" required>
+                    <option value="">Select nutrition...</option>
+                </select>
+            </label>
+            <label>Amount (gram): <input type="number" name="nutrition_amount[]" required min="0" step="0.1"></label>
+            <button type="button" class="remove-nutrition-btn" style="display:none;">Remove</button>
+        </div>
+    `;
+const supplementContainer=document.getElementById('supplement-items-container');
+supplementContainer.innerHTML='';
+document.getElementById('add-nutrition-btn').style.display='none';
+document.getElementById('add-supplement-btn').style.display='none';
+await loadNutritionOptions();
+const nutritionSelect=document.querySelector('.nutrition-select');
+nutritionSelect.value=nutritionId;
+const timestampInput=document.getElementById('intake-timestamp');
+timestampInput.value=toInputTimestamp(timestamp);
+const amountInput=document.querySelector('input[name="nutrition_amount[]"]');
+amountInput.value=nutritionAmount;
+const submitBtn=document.querySelector('#intakeForm button[type="submit"]');
+submitBtn.textContent='Update';
+submitBtn.classList.add('update-mode');
+if(!document.getElementById('cancel-edit-btn')){
+const cancelBtn=document.createElement('button');
+cancelBtn.type='button';
+cancelBtn.id='cancel-edit-btn';
+cancelBtn.textContent='Cancel Edit';
+cancelBtn.className='secondary-btn';
+cancelBtn.addEventListener('click',cancelIntakeEdit);
+submitBtn.parentNode.insertBefore(cancelBtn,submitBtn.nextSibling);
+}
+document.getElementById('intake').scrollIntoView({behavior:'smooth',block:'start'});
+}
+function cancelIntakeEdit(){
+window.currentEditingIntakeId=null;
+resetIntakeForm();
+document.getElementById('add-nutrition-btn').style.display='inline-block';
+document.getElementById('add-supplement-btn').style.display='inline-block';
+const submitBtn=document.querySelector('#intakeForm button[type="submit"]');
+submitBtn.textContent='Submit All';
+submitBtn.classList.remove('update-mode');
+const cancelBtn=document.getElementById('cancel-edit-btn');
+if(cancelBtn){
+cancelBtn.remove();
+}
+}
+async function deleteIntake(id){
+if(confirm('Are you sure you want to delete this record?')){
+const response=await fetch(`${API_BASE}/intake/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+alert('Record deleted successfully!');
+loadIntakeAudit();
+}else{
+alert('Failed to delete record');
+}
+}
+}
+async function loadSupplementIntakeAudit(){
+document.getElementById('supplement-intake-audit-body').innerHTML='';
+await appendSupplementIntakeAuditPage(null);
+}
+async function appendSupplementIntakeAuditPage(next){
+const page=await fetchAuditPage('supplement-intake','supplement-intake',next);
+const tbody=document.getElementById('supplement-intake-audit-body');
+appendAuditRows(tbody,page,record=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+            <td>${record.id}</td>
+            <td>${formatTimestamp(record.timestamp)}</td>
+            <td>${record.supplement_name}</td>
+            <td>${record.supplement_amount}</td>
+            <td>
+                <button class="delete-btn" data-id="${record.id}">Delete</button>
+            </td>
+        `;
+return tr;
+},rows=>{
+rows.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteSupplementIntake(btn.dataset.id));
+});
+},appendSupplementIntakeAuditPage);
+}
+async function deleteSupplementIntake(id){
+if(confirm('Are you sure you want to delete this record?')){
+const response=await fetch(`${API_BASE}/supplement-intake/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+alert('Record deleted successfully!');
+loadSupplementIntakeAudit();
+}else{
+alert('Failed to delete record');
+}
+}
+}
+async function loadEventAudit(){
+document.getElementById('event-audit-body').innerHTML='';
+await appendEventAuditPage(null);
+}
+async function appendEventAuditPage(next){
+const page=await fetchAuditPage('event','event',next);
+const tbody=document.getElementById('event-audit-body');
+appendAuditRows(tbody,page,record=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+            <td>${record.id}</td>
+            <td>${formatTimestamp(record.timestamp)}</td>
+            <td>${record.event_name}</td>
+            <td>${record.event_notes||''}</td>
+            <td>
+                <button class="delete-btn" data-id="${record.id}">Delete</button>
+            </td>
+        `;
+return tr;
+},rows=>{
+rows.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteEvent(btn.dataset.id));
+});
+},appendEventAuditPage);
+}
+async function deleteEvent(id){
+if(confirm('Are you sure you want to delete this record?')){
+const response=await fetch(`${API_BASE}/event/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+alert('Record deleted successfully!');
+loadEventAudit();
+}else{
+alert('Failed to delete record');
+}
+}
+}
+async function loadNutritionAudit(){
+const response=await fetch(`${API_BASE}/nutrition`);
+const data=await response.json();
+const tbody=document.getElementById('nutrition-audit-body');
+tbody.innerHTML='';
+data.forEach(record=>{
+const tr=document.createElement('tr');
+tr.innerHTML=`
+            <td>${record.id}</td>
+            <td>${record.nutrition_name}</td>
+            <td>${record.kcal}</td>
+            <td>${record.weight}</td>
+            <td>${record.kcal_per_gram.toFixed(4)}</td>
+            <td>
+                <button class="delete-btn" data-id="${record.id}">Delete</button>
+            </td>
+        `;
+tbody.appendChild(tr);
+});
+tbody.querySelectorAll('.delete-btn').forEach(btn=>{
+btn.addEventListener('click',()=>deleteNutritionItem(btn.dataset.id));
+});
+}
+async function deleteNutritionItem(id){
+if(confirm('Are you sure you want to delete this nutrition item?')){
+const response=await fetch(`${API_BASE}/nutrition/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+alert('Record deleted successfully!');
+loadNutritionAudit();
+loadNutritionList();
+}else{
+alert('Failed to delete record');
+}
+}
+}
+async function editSupplement(id,name,defaultAmount){
+const newName=prompt('Enter supplement name:',name);
+if(newName===null)return;
+const newAmount=prompt('Enter default amount:',defaultAmount);
+if(newAmount===null)return;
+try{
+const response=await fetch(`${API_BASE}/supplements/${id}`,{
+method:'PUT',
+headers:{'Content-Type':'application/json'},
+body:JSON.stringify({supplement_name:newName,default_amount:parseFloat(newAmount)})
+});
+if(response.ok){
+loadSupplementsList();
+}else{
+alert('Failed to update supplement');
+}
+}catch(err){
+console.error('Failed to update supplement:',err);
+alert('Failed to update supplement');
+}
+}
+async function deleteSupplement(id){
+if(!confirm('Are you sure you want to delete this supplement?')){
+return;
+}
+try{
+const response=await fetch(`${API_BASE}/supplements/${id}`,{
+method:'DELETE'
+});
+if(response.ok){
+loadSupplementsList();
+}else{
+alert('Failed to delete supplement');
+}
+}catch(err){
+console.error('Failed to delete supplement:',err);
+alert('Failed to delete supplement');
+}
+}
+function initializeApp(){
+initializeTabs();
+initializeForms();
+initializeDynamicItems();
+initializeDateInputs();
+document.getElementById('update-glucose-chart-btn').addEventListener('click',loadGlucoseChart);
+document.getElementById('update-cv-btn').addEventListener('click',loadCVCharts);
+document.getElementById('update-risk-btn').addEventListener('click',loadRiskMetrics);
+document.getElementById('update-summary-btn').addEventListener('click',loadSummary);
+document.getElementById('reset-glucose-ts-btn').addEventListener('click',()=>resetToNow('glucose-timestamp'));
+document.getElementById('reset-insulin-ts-btn').addEventListener('click',()=>resetToNow('insulin-timestamp'));
+document.getElementById('reset-intake-ts-btn').addEventListener('click',()=>resetToNow('intake-timestamp'));
+document.getElementById('reset-event-ts-btn').addEventListener('click',()=>resetToNow('event-timestamp'));
+document.getElementById('filter-glucose-btn').addEventListener('click',loadGlucoseAudit);
+document.getElementById('filter-insulin-btn').addEventListener('click',loadInsulinAudit);
+document.getElementById('filter-intake-btn').addEventListener('click',loadIntakeAudit);
+document.getElementById('filter-supplement-intake-btn').addEventListener('click',loadSupplementIntakeAudit);
+document.getElementById('filter-event-btn').addEventListener('click',loadEventAudit);
+loadDashboard();
+setCurrentTimestamp();
+}
+document.addEventListener('DOMContentLoaded',initializeApp);
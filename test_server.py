@@ -686,7 +686,720 @@ class TestGlucoseAPI(unittest.TestCase):
         self.assertEqual(status, 200)
         self.assertTrue(response.get('success'))
 
+    def test_33_glucose_series_window_slicing(self):
+        """GlucoseSeries windows match a brute-force scan, boundaries inclusive"""
+        from server import GlucoseSeries, calculate_cv_data
+        from datetime import datetime
+
+        rows = [(f'2026-02-20 {h:02d}:{m:02d}:00', 80 + h * 3 + m // 10)
+                for h in range(24) for m in (0, 15, 30, 45)]
+        windows = [('a', '2026-02-20 05:00:00', '2026-02-20 17:00:00'),
+                   ('b', '2026-02-20 17:00:00', '2026-02-21 05:00:00'),
+                   ('empty', '2026-02-22 00:00:00', '2026-02-22 12:00:00')]
+
+        series = GlucoseSeries(list(reversed(rows)))  # unsorted input is sorted
+        for _, start, end in windows:
+            expected = [(datetime.strptime(ts, '%Y-%m-%d %H:%M:%S'), level)
+                        for ts, level in rows if start <= ts <= end]
+            self.assertEqual(series.window(start, end), expected)
+
+        self.assertEqual(calculate_cv_data(series, windows), calculate_cv_data(rows, windows))
+        self.assertIsNone(calculate_cv_data(series, windows)[2]['cv'])
+
+    def test_34_fused_window_metrics_match_individual_calculators(self):
+        """calculate_window_metrics agrees with calculate_cv/lbgi/hbgi on the same window"""
+        from server import (calculate_window_metrics, calculate_cv, calculate_lbgi,
+                            calculate_hbgi, calculate_time_weighted_mean)
+        from datetime import datetime
+
+        test_data = [
+            (datetime(2026, 2, 20, 8, 0), 45),
+            (datetime(2026, 2, 20, 9, 0), 110),
+            (datetime(2026, 2, 20, 10, 30), 310),
+            (datetime(2026, 2, 20, 11, 0), 95),
+        ]
+        metrics = calculate_window_metrics(test_data)
+        self.assertAlmostEqual(metrics['mean'], calculate_time_weighted_mean(test_data))
+        self.assertAlmostEqual(metrics['cv'], calculate_cv(test_data))
+        self.assertAlmostEqual(metrics['lbgi'], calculate_lbgi(test_data))
+        self.assertAlmostEqual(metrics['hbgi'], calculate_hbgi(test_data))
+        self.assertAlmostEqual(metrics['adrr'], metrics['lbgi'] + metrics['hbgi'])
+
+        single = calculate_window_metrics(test_data[:1])
+        self.assertIsNone(single['cv'])
+        self.assertIsNotNone(single['lbgi'])
+        self.assertIsNone(calculate_window_metrics([])['adrr'])
+
+    def test_35_risk_contribution_table(self):
+        """Risk table lookups equal the exact risk function, with exact fallback out of range"""
+        from server import risk_contributions, calculate_risk_function
+
+        def exact(g):
+            f = calculate_risk_function(g)
+            return (10 * f ** 2 if f < 0 else 0.0, 10 * f ** 2 if f > 0 else 0.0)
+
+        for g in (10, 40, 112, 113, 250, 800):
+            self.assertEqual(risk_contributions(g), exact(g))
+        for g in (5, 801, 1200, 95.5):
+            self.assertEqual(risk_contributions(g), exact(g))
+
+    def test_36_insulin_glucose_pairing_picks_nearest_reading(self):
+        """Each dose pairs with its nearest glucose reading within 2 hours"""
+        from server import pair_insulin_with_glucose
+        glucose = [('2026-03-21 05:00:00', 100), ('2026-03-21 06:50:00', 150),
+                   ('2026-03-21 07:10:00', 200), ('2026-03-21 12:00:00', 90)]
+        insulin = [('2026-03-21 04:00:00', 1.0),   # only 05:00 in range
+                   ('2026-03-21 07:00:00', 2.0),   # tie 06:50/07:10 -> earlier
+                   ('2026-03-21 07:05:00', 3.0),   # nearest is 07:10, not first in range
+                   ('2026-03-21 09:30:00', 4.0),   # nothing within 2h
+                   ('2026-03-21 13:00:00', 5.0)]   # after the last reading
+        self.assertEqual(pair_insulin_with_glucose(insulin, glucose), [
+            ('2026-03-21 04:00:00', 1.0, '2026-03-21 05:00:00', 100),
+            ('2026-03-21 07:00:00', 2.0, '2026-03-21 06:50:00', 150),
+            ('2026-03-21 07:05:00', 3.0, '2026-03-21 07:10:00', 200),
+            ('2026-03-21 13:00:00', 5.0, '2026-03-21 12:00:00', 90),
+        ])
+        self.assertEqual(pair_insulin_with_glucose(insulin, []), [])
+
+    def test_37_dashboard_response_cache(self):
+        """Repeated dashboard reads hit the cache; a glucose write invalidates them"""
+        path = '/api/dashboard/cv-charts?end_date=2026-03-21&tz=UTC'
+        _, before = self.make_request('GET', '/api/metrics')
+        status, first = self.make_request('GET', path)
+        self.assertEqual(status, 200)
+        # Same params in a different order share the entry
+        _, second = self.make_request('GET', '/api/dashboard/cv-charts?tz=UTC&end_date=2026-03-21')
+        self.assertEqual(second, first)
+        _, after = self.make_request('GET', '/api/metrics')
+        cache = after['response_cache']
+        self.assertEqual(cache['hits'], before['response_cache']['hits'] + 1)
+        self.assertIn('/api/dashboard/cv-charts', cache['endpoints'])
+
+        self.make_request('POST', '/api/glucose', {'timestamp': '2026-03-21 10:00:00', 'level': 123})
+        self.make_request('GET', path)
+        _, final = self.make_request('GET', '/api/metrics')
+        self.assertEqual(final['response_cache']['hits'], cache['hits'])
+        self.assertGreater(final['response_cache']['invalidations'], cache['invalidations'])
+
+    def test_38_conditional_get_returns_304(self):
+        """GET responses carry ETags; a matching If-None-Match yields 304 without a body"""
+        def get(path, etag=None):
+            conn = HTTPConnection(self.host, self.port)
+            conn.request('GET', path, headers={'If-None-Match': etag} if etag else {})
+            response = conn.getresponse()
+            body = response.read()
+            conn.close()
+            return response, body
+
+        for path in ('/api/nutrition', '/api/dashboard/risk-metrics?end_date=2026-03-21&tz=UTC',
+                     '/static/index.html'):
+            response, body = get(path)
+            self.assertEqual(response.status, 200)
+            etag = response.getheader('ETag')
+            self.assertTrue(etag and etag.startswith('"'), path)
+            self.assertEqual(response.getheader('Cache-Control'), 'no-cache')
+
+            response, body = get(path, etag)
+            self.assertEqual(response.status, 304, path)
+            self.assertEqual(body, b'')
+            self.assertEqual(response.getheader('ETag'), etag)
+
+        response, _ = get('/static/index.html')
+        self.assertIsNotNone(response.getheader('Last-Modified'))
+
+        # A write changes the dashboard ETag
+        response, _ = get('/api/dashboard/risk-metrics?end_date=2026-03-21&tz=UTC')
+        etag = response.getheader('ETag')
+        self.make_request('POST', '/api/glucose', {'timestamp': '2026-03-21 11:00:00', 'level': 140})
+        response, _ = get('/api/dashboard/risk-metrics?end_date=2026-03-21&tz=UTC', etag)
+        self.assertEqual(response.status, 200)
+        self.assertNotEqual(response.getheader('ETag'), etag)
+
+    def test_39_gzip_negotiation(self):
+        """Large /api/* bodies are gzipped only when Accept-Encoding allows it"""
+        import gzip
+        path = '/api/dashboard/cv-charts?end_date=2026-03-21&tz=UTC'
+
+        def get(accept_encoding=None):
+            conn = HTTPConnection(self.host, self.port)
+            conn.request('GET', path, headers={'Accept-Encoding': accept_encoding} if accept_encoding else {})
+            response = conn.getresponse()
+            body = response.read()
+            conn.close()
+            return response, body
+
+        plain, plain_body = get()
+        self.assertIsNone(plain.getheader('Content-Encoding'))
+        self.assertEqual(plain.getheader('Vary'), 'Accept-Encoding')
+        self.assertEqual(int(plain.getheader('Content-Length')), len(plain_body))
+
+        zipped, zipped_body = get('br, gzip;q=0.8')
+        self.assertEqual(zipped.getheader('Content-Encoding'), 'gzip')
+        self.assertEqual(int(zipped.getheader('Content-Length')), len(zipped_body))
+        self.assertLess(len(zipped_body), len(plain_body))
+        self.assertEqual(gzip.decompress(zipped_body), plain_body)
+        self.assertEqual(zipped.getheader('ETag'), plain.getheader('ETag')[:-1] + '-gzip"')
+
+        refused, _ = get('gzip;q=0, identity')
+        self.assertIsNone(refused.getheader('Content-Encoding'))
+
+        # Small bodies stay uncompressed
+        conn = HTTPConnection(self.host, self.port)
+        conn.request('GET', '/api/supplements', headers={'Accept-Encoding': 'gzip'})
+        response = conn.getresponse()
+        response.read()
+        conn.close()
+        self.assertIsNone(response.getheader('Content-Encoding'))
+
+    def test_40_precompressed_hashed_static_assets(self):
+        """index.html references a hashed bundle served immutable, gzip-precompressed"""
+        import gzip
+        import re
+
+        def get(path, headers=None):
+            conn = HTTPConnection(self.host, self.port)
+            conn.request('GET', path, headers=headers or {})
+            response = conn.getresponse()
+            body = response.read()
+            conn.close()
+            return response, body
+
+        _, index = get('/static/index.html')
+        bundle = re.search(r'js/release/app\.[0-9a-f]{12}\.min\.js', index.decode()).group(0)
+
+        plain, plain_body = get(f'/static/{bundle}')
+        self.assertEqual(plain.status, 200)
+        self.assertIn('immutable', plain.getheader('Cache-Control'))
+        self.assertEqual(plain.getheader('Vary'), 'Accept-Encoding')
+        self.assertIsNone(plain.getheader('Content-Encoding'))
+
+        zipped, zipped_body = get(f'/static/{bundle}', {'Accept-Encoding': 'gzip'})
+        self.assertEqual(zipped.getheader('Content-Encoding'), 'gzip')
+        self.assertIn('javascript', zipped.getheader('Content-Type'))
+        self.assertEqual(int(zipped.getheader('Content-Length')), len(zipped_body))
+        self.assertEqual(gzip.decompress(zipped_body), plain_body)
+
+        # Second read comes from the in-memory cache
+        get(f'/static/{bundle}')
+        _, metrics = self.make_request('GET', '/api/metrics')
+        self.assertGreater(metrics['static_cache']['hits'], 0)
+
+    def test_41_dashboard_bundle_matches_individual_endpoints(self):
+        """The bundle returns every dashboard section as the individual endpoints do"""
+        self.make_request('POST', '/api/glucose', {'timestamp': '2026-02-03 08:00:00', 'level': 120})
+        self.make_request('POST', '/api/glucose', {'timestamp': '2026-02-03 12:00:00', 'level': 180})
+        self.make_request('POST', '/api/insulin', {'timestamp': '2026-02-03 08:05:00', 'level': 6})
+
+        tz = 'Asia/Taipei'
+        status, bundle = self.make_request(
+            'GET', f'/api/dashboard/bundle?tz={tz}'
+                   '&chart_start_date=2026-01-01&chart_end_date=2026-12-31'
+                   '&summary_start_date=2026-02-01&summary_end_date=2026-02-28'
+                   '&cv_end_date=2026-02-10&risk_end_date=2026-02-05')
+        self.assertEqual(status, 200)
+
+        sections = {
+            'glucose_chart': f'/api/dashboard/glucose-chart?tz={tz}&start_date=2026-01-01&end_date=2026-12-31',
+            'summary': f'/api/dashboard/summary?tz={tz}&start_date=2026-02-01&end_date=2026-02-28',
+            'cv_charts': f'/api/dashboard/cv-charts?tz={tz}&end_date=2026-02-10',
+            'risk_metrics': f'/api/dashboard/risk-metrics?tz={tz}&end_date=2026-02-05',
+        }
+        for name, path in sections.items():
+            status, data = self.make_request('GET', path)
+            self.assertEqual(status, 200)
+            self.assertEqual(bundle[name], data, name)
+
+        self.assertIn('next_window', bundle['prediction'])
+
+        status, _ = self.make_request('GET', '/api/dashboard/bundle')
+        self.assertEqual(status, 400)
+
+    def test_42_batch_write(self):
+        """POST /api/batch applies a multi-item intake in one request with per-item results"""
+        self.make_request('POST', '/api/nutrition', {'nutrition_name': 'Batch Kibble', 'kcal': 350, 'weight': 100})
+        self.make_request('POST', '/api/supplements', {'supplement_name': 'Batch Fish Oil', 'default_amount': 1})
+        _, nutrition = self.make_request('GET', '/api/nutrition')
+        nutrition_id = [n['id'] for n in nutrition if n['nutrition_name'] == 'Batch Kibble'][0]
+        _, supplements = self.make_request('GET', '/api/supplements')
+        supplement_id = [s['id'] for s in supplements if s['supplement_name'] == 'Batch Fish Oil'][0]
+
+        timestamp = '2026-02-04 07:30:00'
+        operations = [
+            {'op': 'create', 'resource': 'intake',
+             'data': {'nutrition_id': nutrition_id, 'timestamp': timestamp, 'nutrition_amount': amount}}
+            for amount in (10, 20, 30)
+        ] + [
+            {'op': 'create', 'resource': 'supplement-intake',
+             'data': {'timestamp': timestamp, 'supplement_id': supplement_id, 'supplement_amount': 2}}
+        ]
+        status, data = self.make_request('POST', '/api/batch', {'operations': operations})
+        self.assertEqual(status, 200)
+        self.assertEqual([r['status'] for r in data['results']], [201] * 4)
+        self.assertAlmostEqual(data['results'][2]['nutrition_kcal'], 105.0, places=2)
+
+        _, intakes = self.make_request('GET', '/api/intake?start_date=2026-02-04&end_date=2026-02-04')
+        self.assertEqual(sum(1 for i in intakes if i['nutrition_name'] == 'Batch Kibble'), 3)
+
+        # One bad item rejects the whole batch
+        status, data = self.make_request('POST', '/api/batch', {'operations': [
+            operations[0],
+            {'op': 'create', 'resource': 'intake', 'data': {'timestamp': timestamp}},
+            {'op': 'drop', 'resource': 'glucose'},
+        ]})
+        self.assertEqual(status, 400)
+        self.assertEqual([r['index'] for r in data['results']], [1, 2])
+        _, intakes = self.make_request('GET', '/api/intake?start_date=2026-02-04&end_date=2026-02-04')
+        self.assertEqual(sum(1 for i in intakes if i['nutrition_name'] == 'Batch Kibble'), 3)
+
+        # Mixed integer and string nutrition ids are rejected per operation, not with a 500
+        status, data = self.make_request('POST', '/api/batch', {'operations': [
+            operations[0],
+            {**operations[0], 'data': {**operations[0]['data'], 'nutrition_id': 'x'}},
+        ]})
+        self.assertEqual(status, 400)
+        self.assertEqual([r['index'] for r in data['results']], [1])
+
+        status, _ = self.make_request('POST', '/api/batch', {'operations': []})
+        self.assertEqual(status, 400)
+
+    def test_43_streaming_ingest(self):
+        """POST /api/ingest/<table> streams chunked NDJSON and CSV bodies beyond MAX_BODY_BYTES"""
+        def post(path, body, headers):
+            conn = HTTPConnection(self.host, self.port)
+            conn.request('POST', path, body, headers, encode_chunked=not isinstance(body, bytes))
+            response = conn.getresponse()
+            data = json.loads(response.read().decode())
+            conn.close()
+            return response.status, data
+
+        start = datetime(2025, 6, 1)
+        lines = (json.dumps({'timestamp': str(start + timedelta(minutes=i)), 'level': 100 + i % 50}) + '\n'
+                 for i in range(3000))
+        status, report = post('/api/ingest/glucose', (line.encode() for line in lines),
+                              {'Content-Type': 'application/x-ndjson'})
+        self.assertEqual(status, 200)
+        self.assertEqual((report['inserted'], report['rejected']), (3000, 0))
+
+        csv_body = b'timestamp,level\n2025-06-10 08:00:00,2.5\n2025-06-10 20:00:00,abc\n'
+        status, report = post('/api/ingest/insulin', csv_body, {'Content-Type': 'text/csv'})
+        self.assertEqual(status, 200)
+        self.assertEqual((report['inserted'], report['rejected']), (1, 1))
+        self.assertEqual(report['rejects'][0]['line'], 3)
+
+        # A zero level would break the risk function (log(0)), so it is rejected
+        zero_body = b'{"timestamp": "2025-06-11 08:00:00", "level": 0}\n'
+        status, report = post('/api/ingest/glucose', zero_body, {'Content-Type': 'application/x-ndjson'})
+        self.assertEqual(status, 200)
+        self.assertEqual((report['inserted'], report['rejected']), (0, 1))
+
+        _, glucose = self.make_request('GET', '/api/glucose?start_date=2025-06-01&end_date=2025-06-03')
+        self.assertEqual(len(glucose), 3000)
+
+        status, _ = post('/api/ingest/event', b'', {})
+        self.assertEqual(status, 404)
+
+    def test_44_streaming_export(self):
+        """GET /api/export/<table> streams chunked NDJSON/CSV filtered like the list endpoints"""
+        def get(path):
+            conn = HTTPConnection(self.host, self.port)
+            conn.request('GET', path)
+            response = conn.getresponse()
+            body = response.read().decode()
+            conn.close()
+            return response, body
+
+        response, body = get('/api/export/glucose?format=ndjson&start_date=2025-06-01&end_date=2025-06-03')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader('Transfer-Encoding'), 'chunked')
+        self.assertEqual(response.getheader('Content-Type'), 'application/x-ndjson')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(len(rows), 3000)
+        self.assertEqual(rows[0]['timestamp'], '2025-06-01 00:00:00')
+        self.assertEqual([r['timestamp'] for r in rows], sorted(r['timestamp'] for r in rows))
+
+        response, body = get('/api/export/insulin?start_date=2025-06-10&end_date=2025-06-10')
+        self.assertIn('text/csv', response.getheader('Content-Type'))
+        lines = body.splitlines()
+        self.assertEqual(lines[0], 'id,timestamp,level')
+        self.assertEqual(lines[1].split(',')[1:], ['2025-06-10 08:00:00', '2.5'])
+        self.assertEqual(len(lines), 2)
+
+        response, _ = get('/api/export/nutrition?format=ndjson')
+        self.assertEqual(response.status, 200)
+        response, _ = get('/api/export/glucose_hourly')
+        self.assertEqual(response.status, 404)
+        response, _ = get('/api/export/glucose?format=xml')
+        self.assertEqual(response.status, 400)
+        response, _ = get('/api/export/glucose?start_date=bad&end_date=2025-06-10')
+        self.assertEqual(response.status, 400)
+
+    def test_45_keyset_pagination(self):
+        """?limit/&cursor pages a list newest-first on (timestamp, id) with no gaps or repeats"""
+        # Rows sharing a timestamp must not be split or duplicated across pages
+        for level in (91, 92, 93):
+            self.make_request('POST', '/api/glucose', {'timestamp': '2025-06-02 12:00:00', 'level': level})
+
+        path = '/api/glucose?start_date=2025-06-01&end_date=2025-06-03'
+        _, everything = self.make_request('GET', path)
+
+        pages, cursor = [], None
+        while True:
+            status, page = self.make_request('GET', f'{path}&limit=700' + (f'&cursor={cursor}' if cursor else ''))
+            self.assertEqual(status, 200)
+            self.assertEqual(page['limit'], 700)
+            self.assertLessEqual(len(page['items']), 700)
+            pages.append(page['items'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        self.assertEqual(len(pages), 5)
+        self.assertEqual([r for items in pages for r in items], everything)
+        keys = [(r['timestamp'], r['id']) for items in pages for r in items]
+        self.assertEqual(keys, sorted(keys, reverse=True))
+
+        status, page = self.make_request('GET', '/api/intake?start_date=2026-02-04&end_date=2026-02-04&limit=2')
+        self.assertEqual((status, len(page['items'])), (200, 2))
+        status, page = self.make_request('GET', f"/api/intake?start_date=2026-02-04&end_date=2026-02-04"
+                                                f"&limit=2&cursor={page['next_cursor']}")
+        self.assertEqual((len(page['items']), page['next_cursor']), (1, None))
+
+        status, _ = self.make_request('GET', f'{path}&limit=10&cursor=not-a-cursor')
+        self.assertEqual(status, 400)
+        status, _ = self.make_request('GET', f'{path}&limit=0')
+        self.assertEqual(status, 400)
+
+    def test_46_keep_alive(self):
+        """HTTP/1.1 responses of every kind are length-delimited and reuse one connection"""
+        conn = HTTPConnection(self.host, self.port, timeout=5)
+        requests = [
+            ('GET', '/api/glucose', None),
+            ('OPTIONS', '/api/glucose', None),
+            ('GET', '/', None),                             # 301 redirect
+            ('GET', '/static/missing.png', None),           # static 404
+            ('GET', '/api/glucose?limit=0', None),           # JSON error
+            ('POST', '/api/glucose', json.dumps({'timestamp': '2025-07-01 08:00:00', 'level': 100})),
+            ('GET', '/api/export/glucose?start_date=2025-07-01&end_date=2025-07-01', None),  # chunked
+            ('GET', '/api/metrics', None),
+        ]
+        conn.connect()
+        sock = conn.sock
+        statuses = []
+        for method, path, body in requests:
+            conn.request(method, path, body, {'Content-Type': 'application/json'} if body else {})
+            response = conn.getresponse()
+            response.read()
+            statuses.append(response.status)
+            self.assertTrue(response.getheader('Content-Length') or response.getheader('Transfer-Encoding'))
+            self.assertIsNone(response.getheader('Connection'))
+            self.assertIs(conn.sock, sock, path)
+        self.assertEqual(statuses, [200, 200, 301, 404, 400, 201, 200, 200])
+
+        # An oversized body is never read, so that connection is closed
+        conn.request('POST', '/api/glucose', b'x' * (64 * 1024 + 1))
+        response = conn.getresponse()
+        response.read()
+        self.assertEqual((response.status, response.getheader('Connection')), (413, 'close'))
+        conn.close()
+
+    def test_47_prometheus_metrics(self):
+        """/metrics exposes per-route request counters, latency histograms and pool gauges"""
+        conn = HTTPConnection(self.host, self.port, timeout=5)
+        for path in ('/api/glucose', '/api/glucose/999999', '/api/no-such-thing'):
+            conn.request('GET', path)
+            conn.getresponse().read()
+        conn.request('FOO', '/api/glucose')
+        conn.getresponse().read()
+        conn.close()
+        conn = HTTPConnection(self.host, self.port, timeout=5)
+        conn.request('GET', '/metrics')
+        response = conn.getresponse()
+        text = response.read().decode()
+        conn.close()
+        self.assertEqual(response.status, 200)
+        self.assertTrue(response.getheader('Content-Type').startswith('text/plain; version=0.0.4'))
+
+        self.assertRegex(text, r'glucose_http_requests_total\{method="GET",route="/api/glucose",status="200"\} [1-9]')
+        self.assertIn('route="/api/glucose/{id}",status="404"', text)
+        self.assertIn('route="other",status="404"', text)
+        self.assertNotIn('/999999', text)
+        self.assertIn('glucose_http_requests_total{method="other",route="/api/glucose",status="501"}', text)
+        self.assertNotIn('FOO', text)
+        self.assertRegex(text, r'glucose_http_request_duration_seconds_bucket\{method="GET",route="/api/glucose",le="\+Inf"\} [1-9]')
+        self.assertIn('# TYPE glucose_http_response_size_bytes histogram', text)
+        # Bounds are exact, not rounded to 6 significant digits
+        self.assertIn('route="/api/glucose",le="16777216"}', text)
+        self.assertIn('route="/api/glucose",le="0.0025"}', text)
+        self.assertIn('glucose_http_requests_in_flight{method="GET",route="/metrics"} 1', text)
+        self.assertRegex(text, r'glucose_executor_queue_depth \d+')
+        self.assertRegex(text, r'glucose_db_pool_wait_seconds_count\{role="writer"\} \d+')
+
+        # Every metric family is declared once and its samples are contiguous
+        families = [line.split()[2] for line in text.splitlines() if line.startswith('# TYPE')]
+        self.assertEqual(len(families), len(set(families)))
+        families_seen = []
+        for line in text.splitlines():
+            if line and not line.startswith('#'):
+                name = line.split('{')[0].split()[0]
+                for suffix in ('_bucket', '_sum', '_count'):
+                    if name.endswith(suffix) and name[:-len(suffix)] in families:
+                        name = name[:-len(suffix)]
+                if not families_seen or families_seen[-1] != name:
+                    self.assertNotIn(name, families_seen)
+                    families_seen.append(name)
+        self.assertEqual(families_seen, families)
+
+
+
+
+# =============================================================================
+# Integration tests for the asyncio engine (SERVER_ENGINE=asyncio)
+# =============================================================================
+
+class TestAsyncEngine(unittest.TestCase):
+    """Same handlers behind AsyncGlucoseServer, with a deliberately tiny worker pool."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_db = 'test_glucose_async.db'
+        cls.port = 8002
+        cls.host = 'localhost'
+
+        if os.path.exists(cls.test_db):
+            os.remove(cls.test_db)
+        conn = sqlite3.connect(cls.test_db)
+        create_schema(conn)
+        conn.close()
+
+        server_env = os.environ.copy()
+        server_env.update({'DB_PATH': cls.test_db, 'PORT': str(cls.port), 'MTLS_ENABLED': 'false',
+                           'SERVER_ENGINE': 'asyncio', 'MAX_WORKERS': '2', 'REQUEST_TIMEOUT': '2',
+                           'KEEPALIVE_TIMEOUT': '1', 'KEEPALIVE_MAX_REQUESTS': '3'})
+        cls.server_process = subprocess.Popen(
+            ['python3', 'server.py'],
+            env=server_env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+
+        for i in range(10):
+            time.sleep(0.5)
+            try:
+                conn = HTTPConnection(cls.host, cls.port, timeout=1)
+                conn.request('GET', '/api/glucose')
+                conn.getresponse()
+                conn.close()
+                break
+            except OSError:
+                if i == 9:
+                    cls.server_process.kill()
+                    _, stderr = cls.server_process.communicate(timeout=1)
+                    print(f"Async server failed to start. stderr: {stderr.decode()}")
+                    raise RuntimeError("Async test server failed to start")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server_process.terminate()
+        cls.server_process.wait()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(cls.test_db + suffix):
+                os.remove(cls.test_db + suffix)
+
+    def request(self, method, path, body=None, headers=None):
+        conn = HTTPConnection(self.host, self.port, timeout=5)
+        conn.request(method, path, body, headers or {}, encode_chunked=body is not None and not isinstance(body, (bytes, str)))
+        response = conn.getresponse()
+        data = response.read()
+        conn.close()
+        return response, data
+
+    def test_handlers_work_through_the_engine(self):
+        """JSON CRUD, chunked ingest and chunked export behave as on the threading engine."""
+        response, _ = self.request('POST', '/api/glucose',
+                                   json.dumps({'timestamp': '2026-01-05 08:00:00', 'level': 110}),
+                                   {'Content-Type': 'application/json'})
+        self.assertEqual(response.status, 201)
+
+        lines = (json.dumps({'timestamp': f'2026-01-05 09:{m:02d}:00', 'level': 120}).encode() + b'\n'
+                 for m in range(60))
+        response, data = self.request('POST', '/api/ingest/glucose', lines, {'Content-Type': 'application/x-ndjson'})
+        self.assertEqual((response.status, json.loads(data)['inserted']), (200, 60))
 
+        response, data = self.request('GET', '/api/export/glucose?format=ndjson&start_date=2026-01-05&end_date=2026-01-05')
+        self.assertEqual(response.getheader('Transfer-Encoding'), 'chunked')
+        self.assertEqual(len(data.decode().splitlines()), 61)
+
+        response, data = self.request('GET', '/api/glucose?start_date=2026-01-05&end_date=2026-01-05&limit=5')
+        self.assertEqual(len(json.loads(data)['items']), 5)
+        response, _ = self.request('GET', '/api/nope')
+        self.assertEqual(response.status, 404)
+
+        # Executor gauges describe the engine's handler pool
+        response, data = self.request('GET', '/metrics')
+        self.assertIn('glucose_executor_max_workers 2\n', data.decode())
+
+    def test_idle_connections_do_not_hold_workers(self):
+        """Many stalled clients (more than MAX_WORKERS) do not delay other requests."""
+        import socket
+        stalled = [socket.create_connection((self.host, self.port)) for _ in range(20)]
+        try:
+            for sock in stalled[:10]:
+                sock.sendall(b'GET /api/glucose HTTP/1.1\r\nHost: localhost\r\n')  # head never finished
+            started = time.monotonic()
+            response, _ = self.request('GET', '/api/metrics')
+            self.assertEqual(response.status, 200)
+            self.assertLess(time.monotonic() - started, 2)
+        finally:
+            for sock in stalled:
+                sock.close()
+
+    def test_clients_that_stop_reading_release_workers(self):
+        """A response write to a client that stops reading times out instead of pinning a worker."""
+        import socket
+        conn = sqlite3.connect(self.test_db)
+        conn.executemany('INSERT INTO glucose (timestamp, level) VALUES (?, 100)',
+                         ((str(datetime(2027, 1, 1) + timedelta(seconds=i)),) for i in range(300000)))
+        conn.commit()
+        conn.close()
+
+        stalled = []
+        try:
+            for _ in range(2):  # one per worker
+                sock = socket.socket()
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+                sock.connect((self.host, self.port))
+                sock.sendall(b'GET /api/export/glucose?format=ndjson&start_date=2027-01-01&end_date=2027-12-31 '
+                             b'HTTP/1.1\r\nHost: localhost\r\n\r\n')
+                stalled.append(sock)
+            time.sleep(4)  # past REQUEST_TIMEOUT
+            started = time.monotonic()
+            response, _ = self.request('GET', '/api/glucose?limit=1')
+            self.assertEqual(response.status, 200)
+            self.assertLess(time.monotonic() - started, 2)
+        finally:
+            for sock in stalled:
+                sock.close()
+            conn = sqlite3.connect(self.test_db)
+            conn.execute("DELETE FROM glucose WHERE timestamp >= '2027-01-01'")
+            conn.commit()
+            conn.close()
+
+    def test_keep_alive_limits(self):
+        """A connection serves KEEPALIVE_MAX_REQUESTS requests and is closed after KEEPALIVE_TIMEOUT idle."""
+        conn = HTTPConnection(self.host, self.port, timeout=5)
+        connections = []
+        for _ in range(3):
+            conn.request('GET', '/api/glucose')
+            response = conn.getresponse()
+            response.read()
+            connections.append(conn.sock)
+        self.assertIsNone(connections[-1])  # closed after Connection: close
+        self.assertIs(connections[0], connections[1])
+        self.assertEqual(response.getheader('Connection'), 'close')
+
+        import socket
+        with socket.create_connection((self.host, self.port), timeout=5) as sock:
+            sock.sendall(b'GET /api/glucose HTTP/1.1\r\nHost: localhost\r\n\r\n')
+            started = time.monotonic()
+            while sock.recv(65536):
+                pass
+            self.assertLess(time.monotonic() - started, 3)
+
+
+# =============================================================================
+# Unit tests for ResponseCache (no DB)
+# =============================================================================
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        from server import DataVersions, ResponseCache
+        self.versions = DataVersions()
+        self.cache = ResponseCache(self.versions, max_entries=3, max_bytes=10)
+        self.make_key = ResponseCache.make_key
+
+    def test_key_ignores_param_order_and_raw_tz(self):
+        a = self.make_key('/x', 'UTC', {'end_date': ['2026-03-21'], 'tz': ['UTC'], 'a': ['1']})
+        b = self.make_key('/x', 'UTC', {'a': ['1'], 'end_date': ['2026-03-21']})
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, self.make_key('/x', 'Asia/Taipei', {'a': ['1'], 'end_date': ['2026-03-21']}))
+
+    def test_write_to_dependency_invalidates(self):
+        key = self.make_key('/x', 'UTC', {})
+        self.cache.put(key, b'1', ('glucose',), self.versions.snapshot(('glucose',)))
+        self.assertEqual(self.cache.get(key), b'1')
+        self.versions.bump('intake')
+        self.assertEqual(self.cache.get(key), b'1')
+        self.versions.bump('glucose')
+        self.assertIsNone(self.cache.get(key))
+
+        # A body computed before a concurrent write is never served
+        stale_versions = self.versions.snapshot(('glucose',))
+        self.versions.bump('glucose')
+        self.cache.put(key, b'2', ('glucose',), stale_versions)
+        self.assertIsNone(self.cache.get(key))
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 2))
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_lru_eviction_by_entries_and_bytes(self):
+        keys = [self.make_key('/x', 'UTC', {'n': [str(i)]}) for i in range(4)]
+        for key in keys[:3]:
+            self.cache.put(key, b'abc', (), ())
+        self.cache.get(keys[0])                    # keys[1] is now least recently used
+        self.cache.put(keys[3], b'abc', (), ())    # exceeds 3 entries
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertEqual(self.cache.get(keys[0]), b'abc')
+        self.cache.put(keys[1], b'abcd', (), ())   # 3 * 3 + 4 > 10 bytes
+        self.assertIsNone(self.cache.get(keys[2]))
+        self.assertEqual(self.cache.stats()['bytes'], 10)
+        self.cache.put(keys[2], b'x' * 11, (), ())  # larger than the whole budget
+        self.assertIsNone(self.cache.get(keys[2]))
+        self.assertEqual(self.cache.stats()['entries'], 3)
+
+
+# =============================================================================
+# Unit tests for TLS handshake checks and telemetry (mocked SSL objects)
+# =============================================================================
+
+class TestTLSHandshakes(unittest.TestCase):
+
+    @staticmethod
+    def ssl_object(resumed, not_after='Jan  1 00:00:00 2099 GMT', cn='phone'):
+        request = MagicMock()
+        request.session_reused = resumed
+        request.cipher.return_value = ('TLS_AES_256_GCM_SHA384', 'TLSv1.3', 256)
+        request.getpeercert.return_value = {'subject': ((('commonName', cn),),), 'notAfter': not_after}
+        return request
+
+    def test_resumed_session_rechecks_certificate(self):
+        import ssl
+        from server import check_resumed_certificate
+        check_resumed_certificate(self.ssl_object(False, not_after='Jan  1 00:00:00 2000 GMT'))
+        check_resumed_certificate(self.ssl_object(True))
+        with self.assertRaises(ssl.SSLError):
+            check_resumed_certificate(self.ssl_object(True, not_after='Jan  1 00:00:00 2000 GMT'))
+        request = self.ssl_object(True)
+        request.getpeercert.return_value = {}
+        with self.assertRaises(ssl.SSLError):
+            check_resumed_certificate(request)
+
+    def test_handshakes_recorded_by_kind(self):
+        import server
+        stats = server.HandshakeStats()
+        with patch.object(server, 'tls_handshakes', stats):
+            server.log_client_certificate(self.ssl_object(False), ('10.0.0.2', 5000), 0.020)
+            server.log_client_certificate(self.ssl_object(True), ('10.0.0.2', 5001), 0.002)
+            server.log_client_certificate(self.ssl_object(True, cn='laptop'), ('10.0.0.3', 5000), 0.004)
+            server.log_client_certificate(self.ssl_object(True, cn='laptop'), ('10.0.0.3', 5001))
+        result = stats.stats()
+        self.assertEqual((result['full']['count'], result['resumed']['count']), (1, 3))
+        self.assertEqual((result['full']['avg_ms'], result['resumed']['avg_ms']), (20.0, 3.0))
+        self.assertEqual(result['resumed']['max_ms'], 4.0)
+        self.assertEqual(result['resumption_rate'], 0.75)
+        self.assertEqual(result['ciphers'], {'TLS_AES_256_GCM_SHA384': 4})
+        self.assertEqual(result['clients'], {'laptop': {'full': 0, 'resumed': 2},
+                                             'phone': {'full': 1, 'resumed': 1}})
 
 
 # =============================================================================
@@ -762,6 +1475,40 @@ class TestConnectionPool(unittest.TestCase):
                 pass
         self.assertIn('exhausted', str(ctx.exception))
 
+    @patch('server.sqlite3.connect')
+    def test_checkout_instrumentation(self, mock_connect):
+        """Wait/hold histograms, peak use, exhaustion and the longest holder's site and route."""
+        import server
+        from server import ConnectionPool
+        mock_connect.return_value = MagicMock()
+        pool = ConnectionPool(':memory:', size=2, timeout=0.01)
+
+        def slow_holder():
+            with pool.connection():
+                time.sleep(0.1)
+
+        server.request_context.route = 'GET /api/dashboard/summary'
+        try:
+            with pool.connection(), pool.connection():
+                with self.assertRaises(RuntimeError):
+                    with pool.connection():
+                        pass
+            slow_holder()
+        finally:
+            server.request_context.route = None
+
+        stats = pool.stats()
+        self.assertEqual((stats['checkouts'], stats['peak_in_use'], stats['in_use']), (3, 2, 0))
+        self.assertEqual(stats['exhausted'], 1)
+        self.assertEqual(stats['hold_ms']['count'], 3)
+        self.assertEqual(stats['wait_ms']['buckets'][-1], ['+Inf', 3])
+        self.assertGreaterEqual(stats['hold_ms']['p99'], 100)
+        longest = stats['longest_hold']
+        self.assertIn('slow_holder', longest['site'])
+        self.assertEqual(longest['route'], 'GET /api/dashboard/summary')
+        self.assertGreaterEqual(longest['hold_ms'], 100)
+        self.assertEqual(len(stats['sites']), 2)
+
 
 # =============================================================================
 # Unit tests for DataAccess methods (temp file DB, no subprocess/HTTP)
@@ -864,6 +1611,300 @@ class TestDataAccessUnit(unittest.TestCase):
         self.assertEqual(g, 1)
         self.assertEqual(i, 1)
 
+    def _hourly_rows(self):
+        from server import execute_query
+        return execute_query('SELECT hour, level_sum, level_count, level_min, level_max '
+                             'FROM glucose_hourly ORDER BY hour')
+
+    def test_glucose_hourly_rollup_tracks_writes(self):
+        """create/update/delete keep glucose_hourly equal to a full rebuild."""
+        from server import DataAccess, execute_query, get_db_connection, rebuild_rollups
+        DataAccess.create_glucose('2026-03-21 08:05:00', 100)
+        DataAccess.create_glucose('2026-03-21 08:55:00', 140)
+        DataAccess.create_glucose('2026-03-21 09:10:00', 60)
+        self.assertEqual(self._hourly_rows(), [('2026-03-21 08:00:00', 240.0, 2, 100.0, 140.0),
+                                               ('2026-03-21 09:00:00', 60.0, 1, 60.0, 60.0)])
+
+        moved_id = execute_query('SELECT id FROM glucose WHERE level = 140', fetch_one=True)[0]
+        DataAccess.update_glucose(moved_id, '2026-03-21 10:00:00', 150)
+        deleted_id = execute_query('SELECT id FROM glucose WHERE level = 60', fetch_one=True)[0]
+        DataAccess.delete_record('glucose', deleted_id)
+        incremental = self._hourly_rows()
+        self.assertEqual(incremental, [('2026-03-21 08:00:00', 100.0, 1, 100.0, 100.0),
+                                       ('2026-03-21 10:00:00', 150.0, 1, 150.0, 150.0)])
+
+        with get_db_connection() as conn:
+            rebuild_rollups(conn)
+        self.assertEqual(self._hourly_rows(), incremental)
+
+    def test_glucose_levels_from_window_start_uses_rollup(self):
+        """Hourly buckets match raw AVG() for hour-aligned and half-hour-offset windows."""
+        from server import DataAccess, get_db_connection, get_glucose_levels_from_window_start
+        for minute, level in ((0, 90), (20, 110), (45, 200), (90, 75), (700, 300), (725, 55)):
+            ts = datetime(2026, 3, 21, 5, 0) + timedelta(minutes=minute)
+            DataAccess.create_glucose(ts.strftime('%Y-%m-%d %H:%M:%S'), level)
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            for start in (datetime(2026, 3, 21, 5, 0), datetime(2026, 3, 21, 4, 30)):
+                expected = {}
+                for hour in range(12):
+                    bucket = (start + timedelta(hours=hour), start + timedelta(hours=hour + 1))
+                    cursor.execute('SELECT AVG(level) FROM glucose WHERE timestamp >= ? AND timestamp < ?',
+                                   tuple(b.strftime('%Y-%m-%d %H:%M:%S') for b in bucket))
+                    avg = cursor.fetchone()[0]
+                    expected[f'+{hour}'] = round(avg, 1) if avg else None
+                self.assertEqual(get_glucose_levels_from_window_start(cursor, start), expected)
+
+    def test_build_summary_timesheet_buckets_day_and_night(self):
+        """One query per table, rows bucketed into the right Day/Night windows."""
+        from server import DataAccess, get_db_connection, build_summary_timesheet
+        nutrition_id = self._insert_nutrition(kcal=50, weight=100)
+        DataAccess.create_intake(nutrition_id, '2026-03-21 06:00:00', 100.0)   # Day
+        DataAccess.create_intake(nutrition_id, '2026-03-21 18:00:00', 200.0)   # Night
+        DataAccess.create_insulin('2026-03-21 05:30:00', 1.0)
+        DataAccess.create_insulin('2026-03-21 07:30:00', 2.0)                  # latest in Day
+        DataAccess.create_event('2026-03-22 04:59:59', 'Vet visit')            # Night (before 05:00)
+        DataAccess.create_glucose('2026-03-21 05:10:00', 120)
+        DataAccess.create_glucose('2026-03-21 05:40:00', 140)
+
+        with get_db_connection() as conn:
+            rows = build_summary_timesheet(conn.cursor(), '2026-03-21', '2026-03-22', 'UTC')
+
+        self.assertEqual([(r['am_pm'], r['date']) for r in rows],
+                         [('☀️', '2026-03-21'), ('🌙', '2026-03-21')])
+        day, night = rows
+        self.assertEqual(day['dosage'], 2.0)
+        self.assertEqual(day['dose_time'], '2026-03-21 07:30:00')
+        self.assertEqual(day['intake_time'], '2026-03-21 06:00:00')
+        self.assertAlmostEqual(day['kcal_intake'], 50.0)
+        self.assertEqual(day['glucose_levels']['+0'], 130.0)
+        self.assertIsNone(day['glucose_levels']['+1'])
+        self.assertEqual(night['grouped_events'], 'Vet visit')
+        self.assertAlmostEqual(night['kcal_intake'], 100.0)
+        self.assertIsNone(night['dosage'])
+
+    def test_glucose_chart_stores_closed_weeks_and_invalidates_on_write(self):
+        """Closed weeks are served from weekly_rollup; writes drop the stale week."""
+        from datetime import datetime
+        from server import (DataAccess, execute_query, build_glucose_chart,
+                            calculate_weekly_mean_both)
+        # 2026/W12 is Mon 2026-03-16 .. Sun 2026-03-22; 2026/W13 is partially in range
+        for ts, level in [('2026-03-16 00:00:00', 100), ('2026-03-18 00:00:00', 200),
+                          ('2026-03-23 00:00:00', 90), ('2026-03-24 00:00:00', 110),
+                          ('2026-03-26 00:00:00', 300)]:
+            DataAccess.create_glucose(ts, level)
+        DataAccess.create_insulin('2026-03-17 00:00:00', 2.0)
+        DataAccess.create_insulin('2026-03-19 00:00:00', 4.0)
+        start, end, now = '2026-03-16 00:00:00', '2026-03-25 00:00:00', datetime(2026, 4, 1)
+
+        def expected():
+            rows = {t: execute_query(f'SELECT timestamp, level FROM {t} WHERE timestamp '
+                                     'BETWEEN ? AND ? ORDER BY timestamp', (start, end))
+                    for t in ('glucose', 'insulin')}
+            return calculate_weekly_mean_both(rows['glucose'], rows['insulin'])
+
+        chart = build_glucose_chart(start, end, now=now)
+        self.assertEqual(chart, expected())
+        self.assertEqual(chart[1], {'week': '2026/W13', 'glucose_mean': 100.0, 'insulin_mean': None})
+        self.assertEqual(execute_query('SELECT series, week, reading_count FROM weekly_rollup '
+                                       'ORDER BY series'),
+                         [('glucose', '2026/W12', 2), ('insulin', '2026/W12', 2)])
+
+        DataAccess.create_glucose('2026-03-20 00:00:00', 200)
+        self.assertEqual(execute_query('SELECT series FROM weekly_rollup'), [('insulin',)])
+        chart = build_glucose_chart(start, end, now=now)
+        self.assertEqual(chart, expected())
+        self.assertEqual(chart[0]['glucose_mean'], 175.0)
+
+    def test_prediction_state_matches_full_recompute(self):
+        """prediction_daily stays in sync with writes; both prediction paths agree."""
+        from datetime import datetime, timedelta, timezone
+        from server import (DataAccess, execute_query, get_db_connection,
+                            predict_next_window, rebuild_prediction_daily)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        fmt = '%Y-%m-%d %H:%M:%S'
+        for i in range(60):
+            DataAccess.create_glucose((now - timedelta(hours=i * 8)).strftime(fmt), 80 + (i * 37) % 200)
+        for i in range(0, 60, 5):
+            DataAccess.create_insulin((now - timedelta(hours=i * 8, minutes=50)).strftime(fmt), 1.0 + i / 10)
+        glucose_id = execute_query('SELECT id FROM glucose ORDER BY timestamp LIMIT 1', fetch_one=True)[0]
+        DataAccess.update_glucose(glucose_id, (now - timedelta(hours=41)).strftime(fmt), 250)
+        insulin_id = execute_query('SELECT id FROM insulin ORDER BY timestamp LIMIT 1', fetch_one=True)[0]
+        DataAccess.delete_record('insulin', insulin_id)
+
+        for lookback_days in (3, 14, 30):
+            incremental = predict_next_window(lookback_days, 'UTC')
+            self.assertEqual(incremental, predict_next_window(lookback_days, 'UTC', full_recompute=True))
+        self.assertGreater(incremental['basis']['paired_doses'], 0)
+
+        state = execute_query('SELECT day, glucose_count, insulin_count, pair_count '
+                              'FROM prediction_daily ORDER BY day')
+        with get_db_connection() as conn:
+            rebuild_prediction_daily(conn)
+        self.assertEqual(execute_query('SELECT day, glucose_count, insulin_count, pair_count '
+                                       'FROM prediction_daily ORDER BY day'), state)
+
+    def test_apply_batch_is_atomic_and_refreshes_rollups(self):
+        """apply_batch commits mixed operations together, or nothing on any error."""
+        from server import (BatchError, DataAccess, execute_query, get_db_connection,
+                            rebuild_rollups)
+        nutrition_id = self._insert_nutrition(kcal=52, weight=100)
+        DataAccess.create_glucose('2026-03-21 08:05:00', 100)
+        glucose_id = execute_query('SELECT id FROM glucose', fetch_one=True)[0]
+
+        results = DataAccess.apply_batch([
+            {'op': 'create', 'resource': 'intake',
+             'data': {'nutrition_id': nutrition_id, 'timestamp': '2026-03-21 08:00:00', 'nutrition_amount': 200}},
+            {'op': 'create', 'resource': 'intake',
+             'data': {'nutrition_id': nutrition_id, 'timestamp': '2026-03-21 08:00:00', 'nutrition_amount': 50}},
+            {'op': 'create', 'resource': 'glucose', 'data': {'timestamp': '2026-03-21 09:10:00', 'level': 60}},
+            {'op': 'update', 'resource': 'glucose', 'id': glucose_id,
+             'data': {'timestamp': '2026-03-21 10:00:00', 'level': 150}},
+        ])
+        self.assertEqual([r['status'] for r in results], [201, 201, 201, 200])
+        self.assertAlmostEqual(results[0]['nutrition_kcal'], 104.0, places=2)
+        self.assertEqual(execute_query('SELECT COUNT(*) FROM intake', fetch_one=True)[0], 2)
+        incremental = self._hourly_rows()
+        with get_db_connection() as conn:
+            rebuild_rollups(conn)
+        self.assertEqual(self._hourly_rows(), incremental)
+
+        with self.assertRaises(BatchError) as ctx:
+            DataAccess.apply_batch([
+                {'op': 'delete', 'resource': 'glucose', 'id': glucose_id},
+                {'op': 'create', 'resource': 'intake',
+                 'data': {'nutrition_id': 99999, 'timestamp': '2026-03-21 08:00:00', 'nutrition_amount': 1}},
+            ])
+        self.assertEqual(ctx.exception.errors, {1: 'Nutrition not found'})
+        self.assertEqual(execute_query('SELECT COUNT(*) FROM glucose', fetch_one=True)[0], 2)
+
+    def test_ingest_streams_chunked_rows_in_bounded_batches(self):
+        """Chunked NDJSON is split across chunk boundaries and inserted in batches."""
+        import io
+        from server import (execute_query, get_db_connection, ingest_rows, iter_body_lines,
+                            iter_ingest_rows, rebuild_rollups)
+        lines = b''.join(json.dumps({'timestamp': f'2026-03-21 {h:02d}:15:00', 'level': 100 + h}).encode() + b'\n'
+                         for h in range(5))
+        lines += b'{"timestamp": "2026-03-21T08:00:00+08:00", "level": 90}\nnot json\n{"level": 5}\n'
+        # Chunk boundaries deliberately fall mid-line
+        chunked = b''.join(b'%x\r\n%s\r\n' % (len(lines[i:i + 7]), lines[i:i + 7])
+                           for i in range(0, len(lines), 7)) + b'0\r\n\r\n'
+
+        rows = iter_ingest_rows(iter_body_lines(io.BytesIO(chunked), {'Transfer-Encoding': 'chunked'}),
+                                'ndjson')
+        report = ingest_rows('glucose', rows, batch_rows=2)
+        self.assertEqual((report['received'], report['inserted'], report['rejected'], report['batches']),
+                         (8, 6, 2, 3))
+        self.assertEqual([r['line'] for r in report['rejects']], [7, 8])
+        self.assertEqual(execute_query("SELECT level FROM glucose WHERE timestamp = '2026-03-21 00:00:00'"),
+                         [(90,)])
+
+        incremental = self._hourly_rows()
+        with get_db_connection() as conn:
+            rebuild_rollups(conn)
+        self.assertEqual(self._hourly_rows(), incremental)
+
+    def test_ingest_reports_committed_batches_when_the_socket_fails(self):
+        """A socket error mid-body is reported as aborted, with the rows read so far inserted."""
+        from server import execute_query, ingest_rows
+
+        def rows():
+            for minute in range(5):
+                yield minute + 1, {'timestamp': f'2026-03-22 08:{minute:02d}:00', 'level': 100}
+            raise TimeoutError('timed out')
+
+        report = ingest_rows('glucose', rows(), batch_rows=2)
+        self.assertEqual((report['received'], report['inserted'], report['batches']), (5, 5, 3))
+        self.assertEqual(report['aborted'], 'timed out')
+        self.assertEqual(execute_query("SELECT COUNT(*) FROM glucose WHERE timestamp LIKE '2026-03-22%'"),
+                         [(5,)])
+
+    def test_iter_export_fetches_bounded_batches(self):
+        """iter_export yields fetchmany-sized batches in timestamp order and returns its connection."""
+        from server import DataAccess
+        for minute in (30, 10, 20, 40, 50):
+            DataAccess.create_glucose(f'2026-03-21 08:{minute}:00', 100 + minute)
+        batches = list(DataAccess.iter_export('glucose', '2026-03-21', '2026-03-21', 'UTC', fetch_rows=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual([row[2] for batch in batches for row in batch], [110, 120, 130, 140, 150])
+        self.assertEqual(self.pool._pool.qsize(), 2)
+
+    def test_reads_use_read_only_pool_while_writer_is_busy(self):
+        """Queries go to query_only readers and do not wait for a checked-out writer."""
+        import server
+        from server import ConnectionPool, DataAccess, build_glucose_chart, get_db_connection, get_read_connection
+        readers = ConnectionPool(self.db_path, size=1, read_only=True)
+        with patch('server._db_read_pool', readers):
+            DataAccess.create_glucose('2026-03-02 08:00:00', 110)
+            with get_read_connection() as conn:
+                with self.assertRaises(sqlite3.OperationalError):
+                    conn.execute("INSERT INTO glucose (timestamp, level) VALUES ('2026-03-02 09:00:00', 1)")
+                self.assertEqual(conn.execute('PRAGMA query_only').fetchone()[0], 1)
+
+            with get_db_connection(), get_db_connection():   # the whole writer pool is taken
+                rows = DataAccess.get_list_with_filter(
+                    'SELECT id, timestamp, level FROM glucose WHERE timestamp BETWEEN ? AND ?',
+                    '2026-03-02', '2026-03-02', 'UTC')
+                self.assertEqual([row[2] for row in rows], [110])
+
+            # Missing weekly rollups are materialized through the writer, not the reader
+            DataAccess.create_glucose('2026-03-02 10:00:00', 110)
+            chart = build_glucose_chart('2026-03-02 00:00:00', '2026-03-09 00:00:00',
+                                        now=datetime(2026, 3, 20))
+            self.assertEqual(chart[0]['glucose_mean'], 110)
+            self.assertEqual(server.execute_query('SELECT COUNT(*) FROM weekly_rollup', fetch_one=True)[0], 2)
+
+
+    def test_connection_profiles_apply_per_role(self):
+        """Each pool applies its CONNECTION_PROFILES role to new connections and reports the effect."""
+        from server import CONNECTION_PROFILES, ConnectionPool
+        profile = CONNECTION_PROFILES['standard']
+        reader = ConnectionPool(self.db_path, size=1, read_only=True, pragmas=profile['reader']).settings()
+        writer = ConnectionPool(self.db_path, size=1, pragmas=profile['writer']).settings()
+        self.assertEqual((reader['cache_size'], reader['temp_store'], reader['query_only']), (-65536, 2, 1))
+        self.assertGreater(reader['mmap_size'], 0)
+        self.assertEqual((writer['synchronous'], writer['busy_timeout'], writer['query_only']), (1, 10000, 0))
+        minimal = ConnectionPool(self.db_path, size=1, pragmas=CONNECTION_PROFILES['minimal']['writer'])
+        self.assertEqual(minimal.settings()['synchronous'], 2)  # SQLite default (FULL)
+
+    def test_group_commit_coalesces_concurrent_writes(self):
+        """Concurrent writes share commits; a failing write is rolled back alone and raises to its caller."""
+        import server
+        from concurrent.futures import ThreadPoolExecutor
+        from server import DataAccess, GroupCommitWriter, execute_query
+        writer = GroupCommitWriter(window_ms=50, max_ops=8).start()
+        try:
+            with patch('server.group_writer', writer):
+                with ThreadPoolExecutor(max_workers=10) as pool:
+                    futures = [pool.submit(DataAccess.create_glucose, f'2026-03-03 08:{m:02d}:00', 100 + m)
+                               for m in range(20)]
+                    bad = pool.submit(DataAccess.create_intake, 999, '2026-03-03 08:00:00', 10)
+                    for future in futures:
+                        future.result()
+                    with self.assertRaises(ValueError):
+                        bad.result()
+                stats = writer.stats()
+        finally:
+            writer.stop()
+        self.assertEqual(execute_query('SELECT COUNT(*) FROM glucose', fetch_one=True)[0], 20)
+        self.assertEqual(execute_query('SELECT COUNT(*) FROM intake', fetch_one=True)[0], 0)
+        self.assertEqual(stats['writes'], 21)
+        self.assertLess(stats['groups'], 21)
+        self.assertLessEqual(stats['max_group_size'], 8)
+        # Derived tables were maintained inside the shared transactions
+        self.assertEqual(execute_query('SELECT SUM(level_count) FROM glucose_hourly', fetch_one=True)[0], 20)
+
+    def test_stopped_group_writer_refuses_work(self):
+        """Writes that reach a stopping writer commit directly instead of waiting forever."""
+        from server import DataAccess, GroupCommitWriter, execute_query
+        writer = GroupCommitWriter().start()
+        writer.stop()
+        self.assertIsNone(writer.submit(lambda cursor: None))
+        with patch('server.group_writer', writer):
+            DataAccess.create_glucose('2026-03-04 08:00:00', 100)
+        self.assertEqual(execute_query('SELECT COUNT(*) FROM glucose', fetch_one=True)[0], 1)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)